@@ -138,6 +138,24 @@ class TestCategorical:
         assert cat.contains("\\w", regex=True).all()
         assert cat.endswith("ing \\d", regex=True).all()
 
+    def test_dictionary_encoded_strings(self):
+        strings = ak.array(["Host-A ", "host-b", "HOST-A", "Host-A ", "host-b", "host-c"] * 3)
+        cat = strings.dictionary_encode()
+        assert isinstance(cat, Categorical)
+        assert cat.to_list() == strings.to_list()
+        assert strings.dictionary_encode(max_cardinality_ratio=0.1) is strings
+
+        assert (cat == strings).all()
+        assert (cat[3:8] == strings[3:8]).all()
+        assert cat.contains_any(["-b", "c"]).to_list() == strings.contains_any(["-b", "c"]).to_list()
+        assert cat.get_lengths().to_list() == strings.get_lengths().to_list()
+        assert strings[cat.argsort()].to_list() == sorted(strings.to_list())
+        for method in "lower", "upper", "title", "capitalize", "strip":
+            result = getattr(cat, method)()
+            assert result.to_list() == getattr(strings, method)().to_list()
+            # labels mapped to the same label are merged
+            assert result.unique().size == getattr(strings, method)().unique().size
+
     def test_group(self):
         non_unique_cat = self.non_unique_cat
         grouped = non_unique_cat[non_unique_cat.group()]
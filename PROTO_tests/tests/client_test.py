@@ -168,3 +168,157 @@ class TestClient:
 
         err_msg = "Error: Command 'connect' is not supported for multidimensional arrays"
         cm.match(err_msg)  #   Asserts the error msg matches the expected value
+
+    def test_client_batch(self):
+        """
+        Tests that commands queued within ak.batch() are executed in a single
+        request and that futures can be chained as arguments.
+        """
+        a = ak.arange(10)
+        with ak.batch() as b:
+            x = b.submit("binopvs1D", {"op": "*", "a": a, "dtype": "int64", "value": 2})
+            y = b.submit("binopvv1D", {"op": "+", "a": x, "b": a}, post=ak.create_pdarray)
+            assert not y.done()
+            assert 2 == len(b)
+
+        assert x.done() and y.done()
+        assert (3 * a).to_list() == y.result().to_list()
+
+        # pdarray operations are queued, and accessing their dtype flushes the batch
+        idx = ak.arange(3)
+        with ak.batch() as b:
+            x = a * 2
+            y = (x + a) - x
+            y[idx] = x[idx]
+            assert 5 == len(b)
+            assert not hasattr(y, "not_an_attribute")
+            assert 5 == len(b)
+            assert ak.int64 == y.dtype
+            assert 0 == len(b)
+        assert [0, 2, 4, 3, 4, 5, 6, 7, 8, 9] == y.to_list()
+
+        with pytest.raises(RuntimeError):
+            with ak.batch() as b:
+                b.submit("binopvv1D", {"op": "+", "a": a, "b": "not_a_symbol"})
+
+        # a failed batch is reported on exit, not by the attributes of the arrays it creates
+        with pytest.raises(RuntimeError):
+            with ak.batch() as b:
+                x = b.submit("binopvv1D", {"op": "+", "a": a, "b": "not_a_symbol"})
+                y = a + 1
+                assert not hasattr(y, "dtype")
+        with pytest.raises(RuntimeError):
+            x.result()
+
+    def test_async_client(self):
+        """
+        Tests that the asyncio client can have several requests in flight and
+        matches each reply to its request.
+        """
+        import asyncio
+
+        from arkouda import aio
+
+        async def run():
+            await aio.connect(server=pytest.server, port=pytest.port)
+            try:
+                a = ak.arange(10)
+                replies = await asyncio.gather(
+                    aio.generic_msg("noop"),
+                    aio.generic_msg("ruok"),
+                    aio.generic_msg("binopvs1D", {"op": "+", "a": a, "dtype": "int64", "value": 1}),
+                    aio.generic_msg("noop"),
+                )
+                assert replies[0] == "noop" and replies[1] == "imok" and replies[3] == "noop"
+                assert ak.create_pdarray(replies[2]).to_list() == list(range(1, 11))
+
+                with pytest.raises(RuntimeError):
+                    await aio.generic_msg("binopvv1D", {"op": "+", "a": a, "b": "not_a_symbol"})
+            finally:
+                # disconnecting does not shut down the server for the synchronous client
+                aio.channel.disconnect()
+                aio.channel = None
+
+        asyncio.run(run())
+
+    def test_profile(self):
+        """
+        Tests that ak.profile records the phases of each command sent within it.
+        """
+        with ak.profile() as prof:
+            a = ak.arange(10)
+            (a + 1).to_ndarray()
+            ak.client._no_op()
+            ak.client._no_op()
+        ak.client._no_op()
+
+        assert "noop" in prof.commands and "tondarray1D" in prof.commands
+        assert 2 == len(prof.latencies("noop"))
+        assert (prof.latencies(phase="total") > 0).all()
+        assert (prof.latencies(phase="server") >= 0).all()
+
+        df = prof.to_dataframe()
+        assert 2 == df.loc["noop", "count"]
+        assert {"mean_serialize", "mean_wire", "mean_server", "mean_decode", "p99"} <= set(df.columns)
+
+        counts, edges = prof.histogram("noop", bins=4)
+        assert 2 == counts.sum() and 5 == len(edges)
+
+        with pytest.raises(ValueError):
+            prof.latencies(phase="network")
+
+    def test_pooled_channel(self):
+        """
+        Tests that threads can issue concurrent requests over a ZmqPoolChannel.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        previous = ak.client.channel
+        pooled = ak.client.ZmqPoolChannel(
+            user=ak.client.username, server=pytest.server, port=pytest.port, pool_size=3
+        )
+        ak.connect(access_channel=pooled)
+        try:
+            a = ak.arange(100)
+
+            def work(i):
+                return ak.client._no_op(), (a + i).sum()
+
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                results = list(executor.map(work, range(24)))
+            assert all(r[0] == "noop" for r in results)
+            assert [r[1] for r in results] == [4950 + 100 * i for i in range(24)]
+            assert pooled._created <= 3
+        finally:
+            pooled.disconnect()
+            ak.client.channel = previous
+
+    def test_deferred_delete(self):
+        """
+        Tests that pdarrays going out of scope are deleted by the server along
+        with the next request, or in bulk once deleteBatchSize are queued.
+        """
+        before = len(ak.list_symbol_table())
+        arrays = [ak.arange(10) for _ in range(5)]
+        names = [a.name for a in arrays]
+        del arrays
+        assert set(names) <= set(ak.client._pending_deletes)
+        # the deletions are piggybacked on the list_symbol_table request
+        assert not set(names) & set(ak.list_symbol_table())
+        assert before == len(ak.list_symbol_table())
+
+        arrays = [ak.arange(10) for _ in range(6)]
+        ak.client.deleteBatchSize = 3
+        try:
+            del arrays
+            assert 0 == len(ak.client._pending_deletes)
+        finally:
+            ak.client.deleteBatchSize = ak.client.deleteBatchSizeDefVal
+
+        # registered arrays are not deleted
+        a = ak.arange(10).register("deferred_delete_test")
+        name = a.name
+        del a
+        ak.client.flush_deletes()
+        assert name in ak.list_symbol_table()
+        ak.unregister("deferred_delete_test")
@@ -690,6 +690,23 @@ class TestDataFrame:
         assert_frame_equal(pd_result4, ak_result4.to_pandas(retain_index=True))
         assert isinstance(ak_result4, ak.dataframe.DataFrame)
 
+    def test_gb_agg(self):
+        ak_df = self.build_ak_df_example2()
+        pd_df = ak_df.to_pandas(retain_index=True)
+
+        ak_result = ak_df.groupby("key1").agg({"count": ["sum", "max"], "nums": "mean"})
+        pd_result = pd_df.groupby("key1").agg({"count": ["sum", "max"], "nums": "mean"})
+        pd_result.columns = ["count_sum", "count_max", "nums"]
+        assert_frame_equal(ak_result.to_pandas(retain_index=True), pd_result)
+
+        ak_result = ak_df.groupby(["key1", "key2"]).agg(["sum", "min"])
+        assert_frame_equal(
+            ak_result.to_pandas(retain_index=True)[["count_sum", "count_min"]],
+            pd_df.groupby(["key1", "key2"])["count"]
+            .agg(["sum", "min"])
+            .rename(columns=lambda c: f"count_{c}"),
+        )
+
     def test_gb_aggregations_numeric_types(self):
         ak_df = self.build_ak_df_example_numeric_types()
         pd_df = ak_df.to_pandas(retain_index=True)
@@ -853,6 +870,26 @@ class TestDataFrame:
         with pytest.raises(TypeError):
             df.sort_values(by=1)
 
+    def test_nlargest_nsmallest(self):
+        df = self.build_ak_df()
+        ref_df = self.build_pd_df()
+        for columns in ["amount", ["userID", "day"], ["userName", "amount"], ["day", "userName", "ui"]]:
+            keys = [columns] if isinstance(columns, str) else columns
+            for n in [0, 1, 3, 6, 10]:
+                # equal rows are kept in the order they appear, like keep="first"
+                ref = ref_df.sort_values(by=keys, kind="stable").head(n)
+                assert_frame_equal(ref, df.nsmallest(n, columns).to_pandas(retain_index=True))
+                ref = ref_df.sort_values(by=keys, ascending=False, kind="stable").head(n)
+                assert_frame_equal(ref, df.nlargest(n, columns).to_pandas(retain_index=True))
+
+        s = ak.Series(ak.array([3, 1, 4, 1, 5, 9, 2, 6]))
+        assert s.nlargest(3).to_list() == [9, 6, 5]
+        assert s.nsmallest(3).to_list() == [1, 1, 2]
+        assert s.nsmallest(3).index.to_list() == [1, 3, 6]
+
+        with pytest.raises(TypeError):
+            df.nlargest(2, 1)
+
     def test_sort_index(self):
         ak_df = self.build_ak_df_example_numeric_types()
         ak_df["string"] = ak.array(
@@ -1107,6 +1144,57 @@ class TestDataFrame:
                     # assert_frame_equal(sorted_ak.to_pandas()[sorted_column_names],
                     # sorted_pd[sorted_column_names])
 
+    def test_presorted_merge(self):
+        left_df = ak.DataFrame({"key": ak.array([0, 1, 1, 3, 5]), "a": ak.arange(5)})
+        right_df = ak.DataFrame({"key": ak.array([1, 2, 3, 3]), "b": ak.arange(4) * 10})
+        l_pd, r_pd = left_df.to_pandas(), right_df.to_pandas()
+        for how in "inner", "left", "right", "outer":
+            # both sides are sorted on key, so the merge comes out in key order
+            ak_merge = ak.merge(left_df, right_df, on="key", how=how)
+            pd_merge = pd.merge(l_pd, r_pd, on="key", how=how, sort=True)
+            assert ak_merge["key"].to_list() == pd_merge["key"].to_list()
+            for col in "a", "b":
+                assert np.allclose(ak_merge[col].to_ndarray(), pd_merge[col].to_numpy(), equal_nan=True)
+
+    def test_groupby_cache(self):
+        df = ak.DataFrame({"a": ak.array([1, 2, 1, 3]), "b": ak.array([4, 5, 4, 6])})
+        gb = df.GroupBy("a")
+        # the same keys reuse the grouping
+        assert df.groupby(["a"], use_series=False) is gb
+        assert df.GroupBy("a", dropna=False) is not gb
+        assert df.GroupBy(["a", "b"]) is not gb
+        assert df.drop_duplicates(["a"])["a"].to_list() == [1, 2, 3]
+        assert df.GroupBy("a") is gb
+
+        # replacing, modifying or deleting a column drops its groupings
+        df["a"] = ak.array([3, 2, 3, 1])
+        assert df.GroupBy("a") is not gb
+        assert df.GroupBy("a").size()[1].to_list() == [1, 1, 2]
+        df[0] = {"a": 2, "b": 4}
+        assert df.GroupBy("a").size()[1].to_list() == [1, 2, 1]
+        gb = df.GroupBy("b")
+        del df["b"]
+        df["b"] = ak.array([7, 7, 8, 8])
+        assert df.GroupBy("b").size()[1].to_list() == [2, 2]
+
+        # so does modifying a column's pdarray in place, through any reference to it
+        a = df["a"]
+        df.GroupBy("a")
+        a[0] = 1
+        assert df.GroupBy("a").size()[1].to_list() == [2, 1, 1]
+        a += 1
+        assert df.drop_duplicates(["a"])["a"].to_list() == [2, 3, 4]
+        a.fill(5)
+        assert df.GroupBy("a").size()[1].to_list() == [4]
+        shallow = df.copy(deep=False)
+        shallow["b"][1] = 8
+        assert df.GroupBy("b").size()[1].to_list() == [1, 3]
+
+        s = ak.Series(ak.array([1, 1, 2]))
+        assert s.value_counts().values.to_list() == [2, 1]
+        s[2] = 1
+        assert s.value_counts().values.to_list() == [3]
+
     def test_isna_notna(self):
         df = ak.DataFrame(
             {
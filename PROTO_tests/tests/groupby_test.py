@@ -969,3 +969,113 @@ class TestGroupBy:
         expected_nuniq = [8, 3]
         assert expected_unique_keys == unique_keys.to_list()
         assert expected_nuniq == nuniq.to_list()
+
+    def test_agg(self):
+        keys = ak.array([0, 1, 0, 1, 2])
+        a = ak.array([1, 2, 3, 4, 5])
+        b = ak.array([1.0, 0.5, 2.0, 0.5, 4.0])
+        s = ak.array(["x", "y", "x", "z", "w"])
+        g = ak.GroupBy(keys)
+
+        df = g.agg(
+            {"a": a, "b": b, "s": s}, {"a": ["sum", "max", "argmin"], "b": "mean", "s": "nunique"}
+        )
+        assert ["a_sum", "a_max", "a_argmin", "b", "s"] == df.columns.values
+        assert df.index.to_list() == [0, 1, 2]
+        for col, op, vals in [("a_sum", "sum", a), ("a_max", "max", a), ("a_argmin", "argmin", a)]:
+            assert df[col].to_list() == g.aggregate(vals, op)[1].to_list()
+        assert df["b"].to_list() == g.mean(b)[1].to_list()
+        assert df["s"].to_list() == [1, 2, 1]
+
+        df = g.agg({"a": a, "b": b}, ["min", "std"])
+        assert ["a_min", "a_std", "b_min", "b_std"] == df.columns.values
+        assert np.allclose(df["b_std"].to_ndarray(), g.std(b)[1].to_ndarray(), equal_nan=True)
+
+        with pytest.raises(ValueError):
+            g.agg({"a": a}, "median_value")
+        with pytest.raises(KeyError):
+            g.agg({"a": a}, {"c": "sum"})
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_hash_groupby(self, size):
+        i = ak.randint(0, 10, size, seed=pytest.seed)
+        s = ak.random_strings_uniform(1, 3, size, characters="abc", seed=pytest.seed)
+        v = ak.arange(size)
+        for keys in ([i], [i, s]):
+            g_sort = ak.GroupBy(keys)
+            g_hash = ak.GroupBy(keys, method="hash")
+            assert g_hash.ngroups == g_sort.ngroups
+            # hash groups are in order of first occurrence
+            assert ak.is_sorted(g_hash.permutation[g_hash.segments])
+            for op in ("sum", "count", "min"):
+                hk, hv = g_hash.aggregate(v, op)
+                sk, sv = g_sort.aggregate(v, op)
+                if len(keys) == 1:
+                    hk, sk = [hk], [sk]
+                assert to_tuple_dict(hk, hv) == to_tuple_dict(sk, sv)
+        # too many keys to hash: grouped by sorting, still in order of first occurrence
+        k = ak.randint(0, 2**20, 2**18, seed=pytest.seed)
+        g_hash = ak.GroupBy(k, method="hash")
+        assert g_hash.ngroups == ak.GroupBy(k).ngroups
+        assert ak.is_sorted(g_hash.permutation[g_hash.segments])
+        assert (g_hash.unique_keys == k[g_hash.permutation[g_hash.segments]]).all()
+        assert ak.GroupBy(ak.zeros(0, dtype=ak.int64), method="hash").ngroups == 0
+        with pytest.raises(ValueError):
+            ak.GroupBy(i, method="radix")
+
+    def test_equality_reductions(self):
+        keys = ak.array([0, 1, 0, 1, 0, 1, 0, 1])
+        g = ak.GroupBy(keys)
+        int_vals = ak.array([4, 3, 5, 3, 5, 2, 6, 2])
+        for vals in (
+            int_vals,
+            ak.cast(int_vals, ak.float64),
+            int_vals > 3,
+            ak.array(["d", "c", "e", "c", "e", "b", "f", "b"]),
+        ):
+            df = pd.DataFrame({"k": keys.to_ndarray(), "v": vals.to_ndarray()})
+            expected = df.groupby("k")["v"]
+            assert g.nunique(vals)[1].to_list() == expected.nunique().to_list()
+            assert g.first(vals)[1].to_list() == expected.first().to_list()
+            # of several modes, the first to occur is returned
+            assert (
+                g.mode(vals)[1].to_list()
+                == expected.agg(lambda s: s.value_counts(sort=False).idxmax()).to_list()
+            )
+            if isinstance(vals, ak.pdarray):
+                unique = g.unique(vals)[1].to_list()
+                assert unique == [sorted(set(u)) for u in expected.agg(list).to_list()]
+
+        # float values are compared including NaN
+        _, n = g.nunique(ak.array([np.nan, 1.0, np.nan, 1.0, 2.0, 1.0, 2.0, 1.0]))
+        assert n.to_list() == [2, 1]
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_incremental_groupby(self, size):
+        keys = ak.randint(0, 20, size, seed=pytest.seed)
+        vals = {
+            "i": ak.randint(-100, 100, size, seed=pytest.seed),
+            "f": ak.randint(0, 1, size, dtype=ak.float64, seed=pytest.seed),
+        }
+        bounds = [0, size // 3, size // 2, size]
+        igb = ak.IncrementalGroupBy()
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            igb.update(keys[lo:hi], {name: v[lo:hi] for name, v in vals.items()})
+        assert igb.nrows == size
+
+        g = ak.GroupBy(keys)
+        assert igb.unique_keys.to_list() == g.unique_keys.to_list()
+        assert igb.size()[1].to_list() == g.size()[1].to_list()
+        for name, v in vals.items():
+            assert igb.count(name)[1].to_list() == g.count(v)[1].to_list()
+            assert igb.min(name)[1].to_list() == g.min(v)[1].to_list()
+            assert igb.max(name)[1].to_list() == g.max(v)[1].to_list()
+            for op in ("sum", "mean", "var", "std"):
+                assert np.allclose(
+                    getattr(igb, op)(name)[1].to_ndarray(), g.aggregate(v, op)[1].to_ndarray()
+                )
+
+        with pytest.raises(ValueError):
+            igb.update(keys, {"i": vals["i"]})
+        with pytest.raises(TypeError):
+            igb.update(keys, {"i": vals["i"], "f": vals["f"] > 0.5})
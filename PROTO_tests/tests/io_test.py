@@ -2,6 +2,7 @@ import copy
 import glob
 import os
 import tempfile
+import time
 from typing import List, Mapping, Union
 
 import h5py
@@ -10,7 +11,7 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 import arkouda as ak
 import arkouda.array_api as Array
@@ -769,6 +770,128 @@ class TestParquet:
                 else:
                     assert (read == vals).all()
 
+    def test_read_filters(self, par_test_base_tmp):
+        # sorted timestamps and small row groups so most row groups are skipped
+        n = 10_000
+        pddf = pd.DataFrame(
+            {
+                "ts": np.arange(n),
+                "val": np.random.uniform(-100, 100, n),
+                "flag": np.arange(n) % 3 == 0,
+                "name": [f"s{i % 7}" for i in range(n)],
+            }
+        )
+        filters_list = [
+            [("ts", ">=", 2500), ("ts", "<", 4000)],
+            [("ts", "in", [5, 17, 9999]), ("flag", "==", False)],
+            [("val", ">", 50.0), ("name", "in", ["s1", "s3"])],
+            [("name", "not in", ["s0"]), ("ts", "!=", 3)],
+            [("ts", ">", n)],
+        ]
+        with tempfile.TemporaryDirectory(dir=par_test_base_tmp) as tmp_dirname:
+            file_path = f"{tmp_dirname}/filtered.parquet"
+            pddf.to_parquet(file_path, row_group_size=500)
+            for filters in filters_list:
+                expected = pddf
+                for col, op, val in filters:
+                    expected = expected[
+                        {
+                            "==": expected[col] == val,
+                            "!=": expected[col] != val,
+                            "<": expected[col] < val,
+                            ">": expected[col] > val,
+                            ">=": expected[col] >= val,
+                            "in": expected[col].isin(val),
+                            "not in": ~expected[col].isin(val),
+                        }[op]
+                    ]
+                read = ak.read_parquet(file_path, datasets=["val", "name"], filters=filters)
+                assert sorted(read.keys()) == ["name", "val"]
+                assert read["val"].to_list() == expected["val"].to_list()
+                assert read["name"].to_list() == expected["name"].to_list()
+
+            with pytest.raises(ValueError):
+                ak.read_parquet(file_path, filters=[("ts", "=", 1)])
+            with pytest.raises(TypeError):
+                ak.read_parquet(file_path, filters=[("ts", "in", 1)])
+
+    def test_partitioned_read_write(self, par_test_base_tmp):
+        n = 1000
+        df = ak.DataFrame(
+            {
+                "date": ak.array([f"2024-01-{d:02}" for d in np.arange(n) % 10 + 1]),
+                "hour": ak.arange(n) % 3,
+                "val": ak.arange(n),
+            }
+        )
+        pddf = df.to_pandas()
+        with tempfile.TemporaryDirectory(dir=par_test_base_tmp) as tmp_dirname:
+            path = f"{tmp_dirname}/dataset"
+            df.to_parquet(path, partition_cols=["date", "hour"])
+            assert sorted(os.listdir(path)) == [f"date=2024-01-{d:02}" for d in range(1, 11)]
+            assert sorted(os.listdir(f"{path}/date=2024-01-01")) == ["hour=0", "hour=1", "hour=2"]
+            # each partition is written to a single file
+            assert os.listdir(f"{path}/date=2024-01-01/hour=0") == ["part.parquet"]
+
+            read = ak.DataFrame(ak.read_parquet(path)).sort_values("val")
+            assert read.columns.values == ["val", "date", "hour"]
+            assert read["val"].to_list() == pddf["val"].to_list()
+            assert read["date"].to_list() == pddf["date"].to_list()
+            assert read["hour"].to_list() == pddf["hour"].to_list()
+
+            filters = [("date", ">=", "2024-01-03"), ("date", "<", "2024-01-06"), ("hour", "in", [0, 2])]
+            expected = pddf[
+                (pddf["date"] >= "2024-01-03")
+                & (pddf["date"] < "2024-01-06")
+                & pddf["hour"].isin([0, 2])
+            ]
+            read = ak.read_parquet(path, datasets=["val", "hour"], filters=filters + [("val", "<", 500)])
+            assert sorted(read.keys()) == ["hour", "val"]
+            perm = ak.argsort(read["val"])
+            assert read["val"][perm].to_list() == expected["val"][expected["val"] < 500].to_list()
+
+            read = ak.read_parquet(path, filters=[("date", "==", "2025-01-01")])
+            assert all(col.size == 0 for col in read.values())
+            assert read["val"].dtype == ak.int64 and isinstance(read["date"], ak.Strings)
+
+            with pytest.raises(ValueError):
+                cols = {"date": df["date"], "val": df["val"]}
+                ak.to_parquet(cols, path, mode="append", partition_cols=["date"])
+
+    def test_checkpoint(self, par_test_base_tmp):
+        a = ak.arange(100).register("ckpt_a")
+        s = ak.random_strings_uniform(1, 5, 100, seed=1).register("ckpt_s")
+        df = ak.DataFrame({"x": ak.arange(10), "y": ak.Categorical(ak.array(["a", "b"] * 5))})
+        df.register("ckpt_df")
+        expected = {"ckpt_a": a.to_list(), "ckpt_s": s.to_list(), "ckpt_df": df.to_pandas()}
+        with tempfile.TemporaryDirectory(dir=par_test_base_tmp) as tmp_dirname:
+            path = f"{tmp_dirname}/ckpt"
+            ak.checkpoint(path)
+            # the objects may be unregistered and deleted while they are written
+            ak.unregister_all(["ckpt_a", "ckpt_s", "ckpt_df"])
+            del a, s, df
+            status = ak.checkpoint_status()
+            while status["state"] == "running":
+                time.sleep(0.1)
+                status = ak.checkpoint_status()
+            assert status["state"] == "done" and status["errors"] == []
+            assert status["written"] == status["total"]
+            assert status["bytes_written"] == status["total_bytes"]
+
+            restored = ak.restore_checkpoint(path)
+            try:
+                assert sorted(restored) == ["ckpt_a", "ckpt_df", "ckpt_s"]
+                assert restored["ckpt_a"].to_list() == expected["ckpt_a"]
+                assert restored["ckpt_s"].to_list() == expected["ckpt_s"]
+                assert_frame_equal(restored["ckpt_df"].to_pandas(), expected["ckpt_df"])
+                assert ak.is_registered("ckpt_df")
+            finally:
+                ak.unregister_all(list(restored))
+
+            # a checkpoint without a manifest did not finish
+            with pytest.raises(RuntimeError):
+                ak.restore_checkpoint(f"{tmp_dirname}/missing")
+
     @pytest.mark.optional_parquet
     def test_against_standard_files(self):
         datadir = "resources/parquet-testing"
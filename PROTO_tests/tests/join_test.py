@@ -195,6 +195,56 @@ class TestJoin:
         )
         assert cat_left[left].to_list() == cat_right[right].to_list()
 
+    def test_hash_join(self):
+        left = ak.array([0, 1, 2, 1, 4])
+        right = ak.array([1, 3, 1, 0])
+        l_np, r_np = left.to_ndarray(), right.to_ndarray()
+        for how in "inner", "left", "right", "outer":
+            l, r = ak.join.hash_join(left, right, how=how)
+            pairs = [(i, j) for i in range(l_np.size) for j in range(r_np.size) if l_np[i] == r_np[j]]
+            if how in ("left", "outer"):
+                pairs += [(i, -1) for i in range(l_np.size) if l_np[i] not in r_np]
+                pairs.sort()
+            if how in ("right", "outer"):
+                pairs += [(-1, j) for j in range(r_np.size) if r_np[j] not in l_np]
+            # ordered by left index, then right index, then unmatched right rows
+            assert list(zip(l.to_list(), r.to_list())) == pairs
+
+        str_l, str_r = ak.join.hash_join(
+            [ak.cast(left, ak.str_), left], [ak.cast(right, ak.str_), right], how="outer"
+        )
+        assert str_l.to_list() == l.to_list()
+        assert str_r.to_list() == r.to_list()
+
+        with pytest.raises(ValueError):
+            ak.join.hash_join(left, right, how="cross")
+
+    def test_merge_join(self):
+        left = ak.array([0, 1, 1, 2, 4, 4])
+        right = ak.array([1, 1, 3, 4, 5])
+        l_np, r_np = left.to_ndarray(), right.to_ndarray()
+        for how in "inner", "left", "right", "outer":
+            l, r = ak.join.merge_join(left, right, how=how)
+            pairs = [(i, j) for i in range(l_np.size) for j in range(r_np.size) if l_np[i] == r_np[j]]
+            if how in ("left", "outer"):
+                pairs += [(i, -1) for i in range(l_np.size) if l_np[i] not in r_np]
+            if how in ("right", "outer"):
+                pairs += [(-1, j) for j in range(r_np.size) if r_np[j] not in l_np]
+            # ordered by value, then left index, then right index
+            pairs.sort(key=lambda p: (l_np[p[0]] if p[0] >= 0 else r_np[p[1]], p))
+            assert list(zip(l.to_list(), r.to_list())) == pairs
+
+        # sorted inputs take the merge path with the same pairs
+        l, r = ak.join.inner_join(left, right)
+        hash_l, hash_r = ak.join.hash_join(left, right)
+        assert l.to_list() == hash_l.to_list()
+        assert r.to_list() == hash_r.to_list()
+
+        with pytest.raises(ValueError):
+            ak.join.merge_join(left[::-1], right)
+        with pytest.raises(TypeError):
+            ak.join.merge_join(left, ak.cast(right, ak.float64))
+
     def test_lookup(self):
         keys = ak.arange(5)
         values = 10 * keys
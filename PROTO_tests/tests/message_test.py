@@ -1,10 +1,18 @@
 import json
+import struct
 
 import pytest
 
 import arkouda as ak
-from arkouda.client import _json_args_to_str
-from arkouda.message import MessageFormat, MessageType, ReplyMessage, RequestMessage
+from arkouda.client import _json_args_to_str, _packed_args
+from arkouda.message import (
+    PACKED_MAGIC,
+    MessageEncoding,
+    MessageFormat,
+    MessageType,
+    ReplyMessage,
+    RequestMessage,
+)
 
 
 class TestMessage:
@@ -60,7 +68,7 @@ class TestMessage:
 
         dict_msg = (
             '{{"user": "user1", "token": {}, "cmd": "connect", "format": "STRING", "args": "",'
-            ' "size": -1}}'
+            ' "size": -1, "request_id": "", "deletes": ""}}'
         )
         assert dict_msg.format('"token"') == json.dumps(msg.asdict())
         assert dict_msg.format('""') == json.dumps(min_msg.asdict())
@@ -79,6 +87,13 @@ class TestMessage:
 
         newMsg = ReplyMessage.fromdict({"msg": "normal result", "msgType": "NORMAL", "user": "user"})
         assert msg == newMsg
+        assert 0.0 == newMsg.exec_time
+
+        timedMsg = ReplyMessage.fromdict(
+            {"msg": "normal result", "msgType": "NORMAL", "user": "user", "exec_time": 0.5}
+        )
+        assert msg == timedMsg
+        assert 0.5 == timedMsg.exec_time
 
         assert "ReplyMessage(msg='normal result', msgType=NORMAL, user='user')" == str(newMsg)
         assert "ReplyMessage(msg='normal result', msgType=NORMAL, user='user')" == repr(newMsg)
@@ -86,6 +101,46 @@ class TestMessage:
         with pytest.raises(ValueError):
             ReplyMessage.fromdict({"msg": "normal result", "msgType": "NORMAL"})
 
+    def test_message_encoding(self):
+        assert MessageEncoding.JSON == MessageEncoding("json")
+        assert MessageEncoding.PACKED == MessageEncoding("packed")
+        assert "packed" == str(MessageEncoding.PACKED)
+        assert "packed" == repr(MessageEncoding.PACKED)
+
+        with pytest.raises(ValueError):
+            MessageEncoding("msgpack")
+
+    def test_packed_request_msg(self):
+        size, args = _packed_args({"array": "id_1", "start": 3})
+        assert 2 == size
+        msg = RequestMessage(
+            user="user1", cmd="cmd", args=args, size=size, request_id="7", deletes="id_2 id_3"
+        )
+
+        def packed_str(s):
+            return struct.pack("<I", len(s)) + s.encode()
+
+        header = ["user1", "", "cmd", "STRING", "7", "id_2 id_3"]
+        expected = PACKED_MAGIC + b"".join(packed_str(s) for s in header)
+        expected += struct.pack("<I", 2)
+        expected += b"".join(packed_str(s) for s in ["array", "str", "id_1", "start", "int64", "3"])
+        assert expected == msg.pack()
+
+        with pytest.raises(TypeError):
+            RequestMessage(user="user1", cmd="cmd", args="[]").pack()
+
+    def test_packed_reply_msg(self):
+        reply = PACKED_MAGIC + b"\x01" + struct.pack("<I", 4) + b"user" + struct.pack("<I", 0)
+        reply += struct.pack("<I", 5) + b"0.125" + "warning ü".encode()
+        msg = ReplyMessage.unpack(reply)
+        assert ReplyMessage(msg="warning ü", msgType=MessageType.WARNING, user="user") == msg
+        assert 0.125 == msg.exec_time
+
+        with pytest.raises(ValueError):
+            ReplyMessage.unpack(b'{"msg": "normal result"}')
+        with pytest.raises(ValueError):
+            ReplyMessage.unpack(PACKED_MAGIC + b"\x00" + struct.pack("<I", 100) + b"user")
+
 
 class TestJSONArgs:
     # TODO numpy dtypes are not supported by json, we probably want to add an issue to handle this
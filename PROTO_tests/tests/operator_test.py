@@ -908,3 +908,43 @@ class TestOperator:
         assert a1.equals(a1_cpy)
         assert not a1.equals(a2)
         assert not a1.equals(a3)
+
+    def test_lazy_fused_arithmetic(self):
+        size = 100
+        np_a = np.arange(size)
+        np_b = np.random.randint(1, 10, size)
+        np_c = np.random.uniform(-1, 1, size)
+        a, b, c = ak.array(np_a), ak.array(np_b), ak.array(np_c)
+
+        expr = (ak.lazy(a) * b + c) / 2
+        assert isinstance(expr, ak.LazyArray)
+        assert expr.dtype == ak.float64
+        assert np.allclose(expr.evaluate().to_ndarray(), (np_a * np_b + np_c) / 2)
+        assert expr.evaluate() is expr.evaluate()
+
+        # integer expressions keep integer semantics
+        int_expr = -(ak.lazy(a) // b) + a % 7 - 3
+        assert int_expr.dtype == ak.int64
+        assert int_expr.to_ndarray().tolist() == (-(np_a // np_b) + np_a % 7 - 3).tolist()
+
+        # pdarrays on the left are absorbed into the expression
+        assert isinstance(b * ak.lazy(a), ak.LazyArray)
+
+        # operations that cannot be fused fall back to pdarray operators
+        cmp = ak.lazy(a) + 1 > 50
+        assert isinstance(cmp, ak.pdarray)
+        assert cmp.to_list() == (np_a + 1 > 50).tolist()
+        assert (a == ak.lazy(a) * 1).all()
+        assert ((ak.lazy(a) + 1) & 6).to_list() == ((np_a + 1) & 6).tolist()
+        assert (1 << (ak.lazy(a) % 8)).to_list() == (1 << (np_a % 8)).tolist()
+
+        # deep expressions are split to fit the server stack
+        deep = ak.lazy(a)
+        np_deep = np_a.copy()
+        for i in range(40):
+            deep = 1 + (deep * 1)
+            np_deep = 1 + (np_deep * 1)
+        assert deep.to_ndarray().tolist() == np_deep.tolist()
+
+        with pytest.raises(TypeError):
+            ak.lazy(ak.array([True, False]))
@@ -777,3 +777,71 @@ class TestPdarrayCreation:
         n_empty_ones = empty_ones.to_ndarray()
         new_empty_ones = ak.array(n_empty_ones)
         assert empty_ones.to_list() == new_empty_ones.to_list()
+
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.float64, ak.uint64, ak.bool_])
+    def test_to_ndarray_chunked(self, dtype, tmp_path):
+        a = ak.array(np.arange(103) % 7, dtype=dtype)
+        expected = a.to_ndarray()
+
+        chunks = list(a.iter_chunks(10))
+        assert [len(c) for c in chunks] == [10] * 10 + [3]
+        assert np.array_equal(np.concatenate(chunks), expected)
+
+        assert np.array_equal(a.to_ndarray(chunk_size=10), expected)
+
+        out = np.memmap(tmp_path / "chunked.dat", dtype=expected.dtype, mode="w+", shape=(103,))
+        assert a.to_ndarray(chunk_size=10, out=out) is out
+        assert np.array_equal(out, expected)
+
+        with pytest.raises(ValueError):
+            a.to_ndarray(out=np.empty(10, dtype=expected.dtype))
+        with pytest.raises(ValueError):
+            list(a.iter_chunks(0))
+
+    def test_to_ndarray_chunked_bypasses_max_transfer(self):
+        a = ak.arange(1000)
+        max_transfer = ak.client.maxTransferBytes
+        ak.client.maxTransferBytes = 800
+        try:
+            with pytest.raises(RuntimeError):
+                a.to_ndarray()
+            assert a.to_ndarray(chunk_size=100).tolist() == list(range(1000))
+            with pytest.raises(RuntimeError):
+                a.to_ndarray(chunk_size=101)
+        finally:
+            ak.client.maxTransferBytes = max_transfer
+
+    def test_bigint_iter_chunks(self):
+        a = ak.array([2**200 + i for i in range(25)], dtype=ak.bigint)
+        assert np.concatenate(list(a.iter_chunks(10))).tolist() == a.to_list()
+        assert a.to_ndarray(chunk_size=10).tolist() == a.to_list()
+
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.float64, ak.uint64, ak.bool_, ak.uint8])
+    def test_array_chunked_upload(self, dtype, tmp_path):
+        np_a = (np.arange(103) % 7).astype(dtype)
+        assert ak.array(np_a, chunk_size=10).to_list() == np_a.tolist()
+
+        # non-contiguous and wrong-endian inputs are copied one chunk at a time
+        assert ak.array(np_a[::2], chunk_size=10).to_list() == np_a[::2].tolist()
+        swapped = np_a.astype(np_a.dtype.newbyteorder("S"))
+        assert ak.array(swapped, chunk_size=10).to_list() == np_a.tolist()
+
+        mm = np.memmap(tmp_path / "upload.dat", dtype=np_a.dtype, mode="w+", shape=np_a.shape)
+        mm[:] = np_a
+        assert ak.array(mm, chunk_size=10).to_list() == np_a.tolist()
+
+    def test_array_chunked_upload_bypasses_max_transfer(self):
+        np_a = np.arange(1000)
+        max_transfer = ak.client.maxTransferBytes
+        ak.client.maxTransferBytes = 800
+        try:
+            with pytest.raises(RuntimeError):
+                ak.array(np_a)
+            assert ak.array(np_a, chunk_size=100).to_list() == np_a.tolist()
+            assert ak.array(np_a.reshape(10, 100), chunk_size=100).to_ndarray().tolist() == (
+                np_a.reshape(10, 100).tolist()
+            )
+            with pytest.raises(RuntimeError):
+                ak.array(np_a, chunk_size=101)
+        finally:
+            ak.client.maxTransferBytes = max_transfer
@@ -181,6 +181,23 @@ class TestRegex:
         assert [2, 2, 2, 2, 2] == actual_starts.to_list()
         assert [8, 8, 8, 8, 8] == actual_lens.to_list()
 
+    def test_cached_matchers(self):
+        from arkouda.matcher import _matcher_cache
+
+        strings = ak.array([f"{i} string {i}" for i in range(5)])
+        same_entry = ak.Strings(strings.entry, strings.nbytes)
+        strings.find_locations("\\d")
+        assert same_entry.cached_regex_patterns() == ["\\d"]
+        assert same_entry._get_matcher("\\d", create=False) is strings._get_matcher("\\d")
+
+        same_entry.purge_cached_regex_patterns()
+        assert strings.cached_regex_patterns() == []
+
+        strings.search("string")
+        name = strings.entry.name
+        del strings, same_entry
+        assert all(key[0] != name for key in _matcher_cache)
+
     def test_regex_findall(self):
         strings = ak.array([f"{i} string {i}" for i in range(1, 6)])
         expected_matches = ["1", "1", "2", "2", "3", "3", "4", "4", "5", "5"]
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 import arkouda as ak
@@ -91,3 +92,89 @@ class TestSort:
         pos_arr = np.array([3.14, np.inf, np.nan, np.inf, 7.7, 0.0, 3.14, 8])
         for npa in neg_arr, pos_arr:
             assert np.allclose(np.sort(npa), ak.sort(ak.array(npa), algo).to_ndarray(), equal_nan=True)
+
+    @pytest.mark.parametrize("algo", SortingAlgorithm)
+    def test_strings_argsort(self, algo):
+        # strings tied on their first 8 and 16 bytes, prefixes of each other and the empty string
+        words = ["", "b", "a", "ab", "abcdefgh", "abcdefg", "abcdefghi", "abcdefghijklmnopq"]
+        words += ["abcdefghijklmnop", "abcdefghijklmnoq", "zz", "abcdefgh", "", "b"]
+        strings = ak.array(words + [f"string {i % 37}" for i in range(500)])
+        perm = ak.argsort(strings, algo)
+        assert strings[perm].to_list() == sorted(strings.to_list())
+
+    @pytest.mark.parametrize("dtype", ["int64", "float64", "uint64", "bool", "str", "Categorical"])
+    def test_argpartition(self, dtype):
+        words = [f"shared prefix {i % 13}" for i in range(300)] + [str(i % 29) for i in range(300)]
+        if dtype == "str":
+            pda = ak.array(words)
+        elif dtype == "Categorical":
+            pda = ak.Categorical(ak.array(words))
+        elif dtype == "bool":
+            pda = ak.randint(0, 2, 600, dtype=ak.bool_)
+        else:
+            pda = make_ak_arrays(dtype)
+        values = pda.to_list() if dtype in ["str", "Categorical"] else pda.to_ndarray().tolist()
+        expected = sorted(values)
+        for kth in [0, 1, 17, len(values) // 2, len(values) - 1, -3]:
+            parted = pda[ak.argpartition(pda, kth)]
+            parted = (
+                parted.to_list() if dtype in ["str", "Categorical"] else parted.to_ndarray().tolist()
+            )
+            pivot = expected[kth]
+            assert parted[kth] == pivot
+            assert all(v <= pivot for v in parted[:kth])
+            assert all(v >= pivot for v in parted[kth:])
+            assert sorted(parted) == expected
+
+        with pytest.raises(ValueError):
+            ak.argpartition(pda, len(values))
+
+    @pytest.mark.parametrize("max_select_k", [100000, 5])
+    def test_argpartition_nan(self, max_select_k, monkeypatch):
+        # past max_select_k, the array is sorted instead
+        monkeypatch.setattr(ak.sorting, "max_select_k", max_select_k)
+        a = np.random.rand(500)
+        a[::9] = np.nan
+        pda = ak.array(a)
+        expected = np.sort(a)
+        for kth in [0, 10, 250, 440, 450, 499]:
+            perm = ak.argpartition(pda, kth).to_ndarray()
+            # NaNs are placed last, and none are dropped
+            assert np.array_equal(np.sort(perm), np.arange(a.size))
+            parted = a[perm]
+            if np.isnan(expected[kth]):
+                assert np.isnan(parted[kth:]).all()
+            else:
+                assert parted[kth] == expected[kth]
+                assert (parted[:kth] <= expected[kth]).all()
+                assert np.isnan(parted[kth:]).sum() == np.isnan(a).sum()
+                assert (parted[kth:][~np.isnan(parted[kth:])] >= expected[kth]).all()
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    @pytest.mark.parametrize("max_select_k", [100000, 5])
+    def test_argtopk(self, ascending, max_select_k, monkeypatch):
+        monkeypatch.setattr(ak.sorting, "max_select_k", max_select_k)
+        words = [f"shared prefix {i % 13}" for i in range(300)] + [str(i % 29) for i in range(300)]
+        np.random.shuffle(words)
+        cols = {
+            "i": ak.randint(0, 7, 600),
+            "s": ak.array(words),
+            "c": ak.Categorical(ak.array(words)),
+            "f": ak.array(np.where(np.arange(600) % 7 == 0, np.nan, np.random.rand(600))),
+        }
+        df = pd.DataFrame(
+            {k: v.to_list() if k in ["s", "c"] else v.to_ndarray() for k, v in cols.items()}
+        )
+        df["pos"] = np.arange(600)
+        for keys in [["s"], ["c"], ["i", "s"], ["c", "i", "f"], ["f"]]:
+            # equal rows are kept in the order they appear, and NaNs are last
+            expected = df.sort_values(keys + ["pos"], ascending=[ascending] * len(keys) + [True])
+            for k in [0, 1, 10, 100, 600, 1000]:
+                idx = ak.argtopk([cols[key] for key in keys], k, ascending=ascending)
+                assert idx.to_list() == expected["pos"].to_list()[:k]
+
+        assert ak.argtopk(cols["s"], 5).to_list() == ak.argtopk([cols["s"]], 5).to_list()
+        with pytest.raises(ValueError):
+            ak.argtopk(cols["i"], -1)
+        with pytest.raises(ValueError):
+            ak.argtopk([cols["i"], cols["s"][:10]], 5)
@@ -1,3 +1,4 @@
+import re
 from collections import Counter, namedtuple
 from typing import List
 
@@ -209,6 +210,25 @@ class TestString:
         self._contains_help(strings, test_strings, np.str_(delim))
         self._contains_help(strings, test_strings, str.encode(str(delim)))
 
+    def test_contains_any_match_set(self):
+        test_strings = ["GET /index", "POST /login", "GET /login", "PUT /file.txt", "", "DELETE /a.b"]
+        strings = ak.array(test_strings)
+        patterns = ["GET", "login", "PUT", ".b", "in", "login"]
+
+        expected = [[i for i, p in enumerate(patterns) if p in s] for s in test_strings]
+        assert strings.contains_any(patterns).to_list() == [len(e) > 0 for e in expected]
+        assert strings.match_set(patterns).to_list() == expected
+
+        regexes = ["^[A-Z]+ /l", "\\.[a-z]+$", "T /"]
+        expected = [[i for i, p in enumerate(regexes) if re.search(p, s)] for s in test_strings]
+        assert strings.contains_any(regexes, regex=True).to_list() == [len(e) > 0 for e in expected]
+        assert strings.match_set(regexes, regex=True).to_list() == expected
+
+        with pytest.raises(ValueError):
+            strings.match_set([])
+        with pytest.raises(TypeError):
+            strings.contains_any("GET")
+
     @staticmethod
     def _starts_with_help(strings, test_strings, delim):
         if isinstance(delim, bytes):
@@ -871,6 +891,12 @@ class TestString:
         nd1 = s1.to_ndarray()
         assert nd1.tolist() == v1
 
+    def test_tondarray_chunked(self):
+        v1 = ["münchen", "zürich", "abc", "123", ""] * 7
+        s1 = ak.array(v1)
+        assert s1.to_ndarray(chunk_size=4).tolist() == v1
+        assert s1.to_ndarray(chunk_size=1000).tolist() == v1
+
     def test_inferred_type(self):
         a = ak.array(["a", "b", "c"])
         assert a.inferred_type == "string"
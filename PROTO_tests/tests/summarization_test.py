@@ -37,3 +37,25 @@ class TestSummarization:
 
     def testAll(self):
         assert self.na.all() == self.pda.all()
+
+    def testCacheReductions(self):
+        pda = ak.array(self.na).cache_reductions()
+        assert self.na.max() == pda.max() == pda.max()
+        assert self.na.sum() == ak.sum(pda) == ak.sum(pda)
+        assert pda.is_sorted()
+
+        # in-place modifications invalidate the cache
+        pda[0] = 20
+        assert 20 == pda.max()
+        assert not pda.is_sorted()
+        pda += 1
+        assert 21 == pda.max()
+        pda.fill(3)
+        assert 3 == pda.max() and 30 == pda.sum()
+        view = pda.reshape((2, 5))
+        view[1, 4] = 40
+        assert 40 == pda.max()
+
+        pda.cache_reductions(False)
+        assert pda._reduction_cache is None
+        assert 3 == pda.min()
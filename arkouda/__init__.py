@@ -10,6 +10,7 @@ from arkouda.client import *
 from arkouda.client_dtypes import *
 from arkouda.dtypes import *
 from arkouda.pdarrayclass import *
+from arkouda.lazyarray import *
 from arkouda.sorting import *
 from arkouda.pdarraysetops import *
 from arkouda.pdarraycreation import *
@@ -0,0 +1,326 @@
+"""
+Asynchronous (asyncio-compatible) Arkouda client API.
+
+The functions in this module mirror ``arkouda.client.connect``,
+``disconnect`` and ``generic_msg``, but are coroutines backed by a
+``zmq.asyncio`` DEALER socket. Each request is sent with its request id as
+the envelope of the message, which the server's REP socket returns with the
+reply, so several independent requests may be in flight at once and
+awaited concurrently without blocking the event loop.
+
+Examples
+--------
+>>> import asyncio
+>>> from arkouda import aio
+>>> async def main():
+...     await aio.connect()
+...     config, status = await asyncio.gather(aio.generic_msg("getconfig"), aio.generic_msg("ruok"))
+...     await aio.disconnect()
+>>> asyncio.run(main())
+
+Notes
+-----
+The Arkouda server executes requests one at a time; concurrency here means
+the client can keep issuing and awaiting requests while earlier ones run.
+pdarrays built from replies obtained through this module are deleted via
+the synchronous client (``ak.connect``), if it is connected.
+"""
+
+import asyncio
+import itertools
+import json
+import warnings
+from typing import Dict, Optional, Tuple, Union, cast
+
+from arkouda.client import Channel, _json_args_to_str, username
+from arkouda.logger import LogLevel, getArkoudaLogger
+from arkouda.message import MessageFormat, MessageType, ReplyMessage, RequestMessage
+
+__all__ = ["AsyncZmqChannel", "connect", "disconnect", "generic_msg"]
+
+logger = getArkoudaLogger(name="Arkouda Async Client", logLevel=LogLevel.INFO)
+
+
+class AsyncZmqChannel(Channel):
+    """
+    The AsyncZmqChannel class implements the Channel methods as coroutines
+    over a ZMQ DEALER socket. Requests are tagged with a request id and
+    replies are matched to the awaiting request by their id as they arrive,
+    so the reply to a request whose coroutine timed out or was cancelled is
+    discarded rather than received by another request.
+    """
+
+    __slots__ = ("socket", "timeout", "_ids", "_pending", "_reader", "_send_lock")
+
+    # the task receiving replies while requests are pending
+    _reader: Optional[asyncio.Task]
+    _send_lock: asyncio.Lock
+
+    def _next_request_id(self) -> str:
+        return str(next(self._ids))
+
+    async def _send(
+        self,
+        frames,
+        request_id: str,
+        recv_binary: bool,
+    ) -> Union[str, memoryview]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (recv_binary, future)
+        try:
+            # the request id is the envelope, which the server's REP socket
+            # returns ahead of the empty delimiter frame of the reply
+            async with self._send_lock:
+                envelope = [request_id.encode(), b""]
+                await self.socket.send_multipart(envelope + frames, copy=False)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._recv_loop())
+            if self.timeout > 0:
+                return await asyncio.wait_for(future, self.timeout)
+            return await future
+        finally:
+            # a late reply to a request that timed out or was cancelled is discarded
+            self._pending.pop(request_id, None)
+
+    async def _recv_loop(self) -> None:
+        """
+        Receive replies while requests are pending, resolving the future of
+        the request each reply corresponds to
+        """
+        while self._pending:
+            frames = await self.socket.recv_multipart(copy=False)
+            request_id = frames[0].bytes.decode()
+            recv_binary, future = self._pending.pop(request_id, (False, None))
+            if future is None or future.done():
+                # the awaiting coroutine timed out or was cancelled
+                continue
+            try:
+                reply = self._parse_reply(frames[-1], request_id, recv_binary)
+                future.set_result(reply)
+            except Exception as e:
+                future.set_exception(e)
+
+    @staticmethod
+    def _parse_reply(
+        frame,
+        request_id: str,
+        recv_binary: bool,
+    ) -> Union[str, memoryview]:
+        if recv_binary:
+            view = frame.buffer
+            # raise errors sent back from the server
+            if bytes(view[0 : len(b"Error:")]) == b"Error:":
+                raise RuntimeError(frame.bytes.decode())
+            return view
+
+        raw_message = frame.bytes.decode()
+        try:
+            values = json.loads(raw_message)
+            return_message = ReplyMessage.fromdict(values)
+        except json.decoder.JSONDecodeError:
+            raise ValueError(f"Return message is not valid JSON: {raw_message}")
+        if values.get("request_id", request_id) != request_id:
+            raise ValueError(
+                f"Reply for request {values['request_id']} received for request {request_id}"
+            )
+        # raise errors or warnings sent back from the server
+        if return_message.msgType == MessageType.ERROR:
+            raise RuntimeError(return_message.msg)
+        elif return_message.msgType == MessageType.WARNING:
+            warnings.warn(return_message.msg)
+        return return_message.msg
+
+    async def send_string_message(  # type: ignore[override]
+        self,
+        cmd: str,
+        recv_binary: bool = False,
+        args: Optional[str] = None,
+        size: int = -1,
+        request_id: Optional[str] = None,
+    ) -> Union[str, memoryview]:
+        request_id = request_id if request_id else self._next_request_id()
+        message = RequestMessage(
+            user=username,
+            token=self.token,
+            cmd=cmd,
+            format=MessageFormat.STRING,
+            args=args,
+            size=size,
+            request_id=request_id,
+        )
+        logger.debug(f"sending message {json.dumps(message.asdict())}")
+        frames = [json.dumps(message.asdict()).encode()]
+        return await self._send(frames, request_id, recv_binary)
+
+    async def send_binary_message(  # type: ignore[override]
+        self,
+        cmd: str,
+        payload: memoryview,
+        recv_binary: bool = False,
+        args: Optional[str] = None,
+        size: int = -1,
+        request_id: Optional[str] = None,
+    ) -> Union[str, memoryview]:
+        request_id = request_id if request_id else self._next_request_id()
+        message = RequestMessage(
+            user=username,
+            token=self.token,
+            cmd=cmd,
+            format=MessageFormat.BINARY,
+            args=args,
+            size=size,
+            request_id=request_id,
+        )
+        logger.debug(f"sending message {message}")
+        return await self._send(
+            [f"{json.dumps(message.asdict())}BINARY_PAYLOAD".encode(), payload],
+            request_id,
+            recv_binary,
+        )
+
+    def connect(self, timeout: int = 0) -> None:
+        import zmq
+        import zmq.asyncio
+
+        context = zmq.asyncio.Context.instance()
+        self.socket = context.socket(zmq.DEALER)
+        self.timeout = timeout
+        self._ids = itertools.count()
+        # the reply type and future of each request awaiting its reply, by request id
+        self._pending: Dict[str, Tuple[bool, asyncio.Future]] = {}
+        self._reader = None
+        self._send_lock = asyncio.Lock()
+
+        logger.debug(f"ZMQ version: {zmq.zmq_version()}")
+
+        try:
+            self.socket.connect(self.url)
+        except Exception as e:
+            raise ConnectionError(e)
+
+    def disconnect(self) -> None:
+        try:
+            self.socket.disconnect(self.url)
+            self.socket.close(linger=0)
+        except Exception as e:
+            raise RuntimeError(e)
+
+
+# Global async Channel object reference
+channel: Optional[AsyncZmqChannel] = None
+
+
+async def connect(
+    server: str = "localhost",
+    port: int = 5555,
+    timeout: int = 0,
+    access_token: Optional[str] = None,
+    connect_url: Optional[str] = None,
+) -> str:
+    """
+    Connect the asynchronous client to a running arkouda server.
+
+    Parameters
+    ----------
+    server : str, optional
+        The hostname of the server (must be visible to the current
+        machine). Defaults to `localhost`.
+    port : int, optional
+        The port of the server. Defaults to 5555.
+    timeout : int, optional
+        The timeout in seconds for each request. Defaults to 0 seconds,
+        which is interpreted as no timeout.
+    access_token : str, optional
+        The token used to connect to an existing socket to enable access to
+        an Arkouda server where authentication is enabled. Defaults to None.
+    connect_url : str, optional
+        The complete url in the format of tcp://server:port?token=<token_value>
+        where the token is optional
+
+    Returns
+    -------
+    str
+        The connect message sent back by the server
+
+    Raises
+    ------
+    ConnectionError
+        Raised if there's an error in connecting to the Arkouda server
+    RuntimeError
+        Raised if there is a server-side error
+    """
+    global channel
+
+    channel = AsyncZmqChannel(
+        user=username,
+        server=server,
+        port=port,
+        token=access_token,
+        connect_url=connect_url,
+    )
+    channel.connect(timeout)
+    return_message = cast(str, await channel.send_string_message(cmd="connect"))
+    logger.debug(f"[Python] Received response: {return_message}")
+    return return_message
+
+
+async def disconnect() -> None:
+    """
+    Disconnect the asynchronous client from the Arkouda server
+
+    Raises
+    ------
+    ConnectionError
+        Raised if there's an error disconnecting from the Arkouda server
+    """
+    global channel
+
+    if channel is None:
+        logger.info("not connected; cannot disconnect")
+        return
+    return_message = await channel.send_string_message(cmd="disconnect")
+    logger.debug(f"[Python] Received response: {str(return_message)}")
+    try:
+        channel.disconnect()
+    except Exception as e:
+        raise ConnectionError(e)
+    channel = None
+
+
+async def generic_msg(
+    cmd: str,
+    args: Optional[Dict] = None,
+    payload: Optional[memoryview] = None,
+    send_binary: bool = False,
+    recv_binary: bool = False,
+) -> Union[str, memoryview]:
+    """
+    Coroutine that sends a binary or string message composed of a command and
+    corresponding arguments to the arkouda_server and returns the response.
+    See ``arkouda.client.generic_msg`` for a description of the parameters.
+
+    Returns
+    -------
+    Union[str, memoryview]
+        The string or binary return message
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the client is not connected to the server or if
+        there is a server-side error thrown
+    """
+    if channel is None:
+        raise RuntimeError("async client is not connected to a server")
+
+    size, msg_args = _json_args_to_str(args)
+    if send_binary:
+        assert payload is not None
+        return await channel.send_binary_message(
+            cmd=cmd, payload=payload, recv_binary=recv_binary, args=msg_args, size=size
+        )
+    else:
+        assert payload is None
+        return await channel.send_string_message(
+            cmd=cmd, args=msg_args, size=size, recv_binary=recv_binary
+        )
@@ -271,6 +271,7 @@ class ArrayView:
                         "value": self.base.format_other(value),
                     },
                 )
+                self.base._invalidate_reduction_cache()
         elif isinstance(key, list):
             raise NotImplementedError("Setting via slicing and advanced indexing is not yet supported")
         else:
@@ -498,15 +498,15 @@ class Categorical:
         return f"array({self.__str__()})"
 
     @typechecked
-    def _binop(self, other: Union[Categorical, str_scalars], op: str_scalars) -> pdarray:
+    def _binop(self, other: Union[Categorical, Strings, str_scalars], op: str_scalars) -> pdarray:
         """
         Executes the requested binop on this Categorical instance and returns
         the results within a pdarray object.
 
         Parameters
         ----------
-        other : Union[Categorical,str_scalars]
-            the other object is a Categorical object or string scalar
+        other : Union[Categorical,Strings,str_scalars]
+            the other object is a Categorical object, Strings object or string scalar
         op : str_scalars
             name of the binary operation to be performed
 
@@ -542,6 +542,8 @@ class Categorical:
             else:
                 tmpself, tmpother = self.standardize_categories((self, other))
                 return tmpself.codes._binop(tmpother.codes, op)
+        elif isinstance(other, Strings):
+            return self.categories[self.codes]._binop(other, op)
         else:
             raise NotImplementedError(
                 "Operations between Categorical and non-Categorical not yet implemented."
@@ -549,15 +551,15 @@ class Categorical:
             )
 
     @typechecked
-    def _r_binop(self, other: Union[Categorical, str_scalars], op: str_scalars) -> pdarray:
+    def _r_binop(self, other: Union[Categorical, Strings, str_scalars], op: str_scalars) -> pdarray:
         """
         Executes the requested reverse binop on this Categorical instance and
         returns the results within a pdarray object.
 
         Parameters
         ----------
-        other : Union[Categorical,str_scalars]
-            the other object is a Categorical object or string scalar
+        other : Union[Categorical,Strings,str_scalars]
+            the other object is a Categorical object, Strings object or string scalar
         op : str_scalars
             name of the binary operation to be performed
 
@@ -740,6 +742,155 @@ class Categorical:
         categories_ends_with = self.categories.endswith(substr, regex)
         return categories_ends_with[self.codes]
 
+    @typechecked
+    def contains_any(
+        self, patterns: Sequence[Union[bytes, str_scalars]], regex: bool = False
+    ) -> pdarray:
+        """
+        Check whether each element contains any of the given substrings.
+
+        Parameters
+        ----------
+        patterns : Sequence[Union[bytes, str_scalars]]
+            The substrings to search for
+        regex: bool
+            Indicates whether patterns are regular expressions
+            Note: only handles regular expressions supported by re2
+            (does not support lookaheads/lookbehinds)
+
+        Returns
+        -------
+        pdarray, bool
+            True for elements that contain any of the patterns, False otherwise
+
+        See Also
+        --------
+        Categorical.contains, Strings.contains_any
+
+        Notes
+        -----
+        This method can be significantly faster than the corresponding method
+        on Strings objects, because it searches the unique category labels
+        instead of the full array.
+        """
+        return self.categories.contains_any(patterns, regex)[self.codes]
+
+    def get_lengths(self) -> pdarray:
+        """
+        Return the length of each element in the array.
+
+        Returns
+        -------
+        pdarray, int
+            The length of each element
+
+        Notes
+        -----
+        The lengths of the unique category labels are computed and broadcast
+        to the elements by their codes.
+        """
+        return self.categories.get_lengths()[self.codes]
+
+    def _map_categories(self, func) -> Categorical:
+        """
+        Apply a Strings to Strings function to the category labels, merging the
+        categories whose labels it maps to the same label. The N/A value is kept.
+        """
+        mapped = where(self.categories == self.NAvalue, self.categories, func(self.categories))
+        g = GroupBy(mapped)
+        new_codes = g.broadcast(arange(g.unique_keys.size), permute=True)
+        return Categorical.from_codes(new_codes[self.codes], g.unique_keys, NAvalue=self.NAvalue)
+
+    def lower(self) -> Categorical:
+        """
+        Return a new Categorical with all uppercase characters replaced with
+        their lowercase equivalent, converting only the unique category labels.
+
+        Returns
+        -------
+        Categorical
+            Categorical with all uppercase characters replaced with their
+            lowercase equivalent
+
+        See Also
+        --------
+        Strings.lower
+        """
+        return self._map_categories(Strings.lower)
+
+    def upper(self) -> Categorical:
+        """
+        Return a new Categorical with all lowercase characters replaced with
+        their uppercase equivalent, converting only the unique category labels.
+
+        Returns
+        -------
+        Categorical
+            Categorical with all lowercase characters replaced with their
+            uppercase equivalent
+
+        See Also
+        --------
+        Strings.upper
+        """
+        return self._map_categories(Strings.upper)
+
+    def title(self) -> Categorical:
+        """
+        Return a new Categorical in titlecase, converting only the unique
+        category labels.
+
+        Returns
+        -------
+        Categorical
+            Categorical with the first character of each word uppercase and
+            the rest lowercase
+
+        See Also
+        --------
+        Strings.title
+        """
+        return self._map_categories(Strings.title)
+
+    def capitalize(self) -> Categorical:
+        """
+        Return a new Categorical with the first character uppercase and the
+        rest lowercase, converting only the unique category labels.
+
+        Returns
+        -------
+        Categorical
+            Categorical with the first character of each element uppercase
+            and the rest lowercase
+
+        See Also
+        --------
+        Strings.capitalize
+        """
+        return self._map_categories(Strings.capitalize)
+
+    @typechecked
+    def strip(self, chars: Optional[Union[bytes, str_scalars]] = "") -> Categorical:
+        """
+        Return a new Categorical with all leading and trailing occurrences of
+        the characters in chars removed, stripping only the unique category labels.
+
+        Parameters
+        ----------
+        chars
+            the set of characters to be removed, whitespace by default
+
+        Returns
+        -------
+        Categorical
+            Categorical with the leading and trailing characters in chars removed
+
+        See Also
+        --------
+        Strings.strip
+        """
+        return self._map_categories(lambda categories: categories.strip(chars))
+
     @typechecked
     def in1d(self, test: Union[Strings, Categorical]) -> pdarray:
         """
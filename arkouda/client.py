@@ -1,14 +1,38 @@
+import atexit
 import json
 import os
+import struct
+import sys
+import threading
+import time
 import warnings
+from collections import deque
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict, List, Mapping, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 import pyfiglet  # type: ignore
 
 from arkouda import __version__, io_util, security
 from arkouda.logger import LogLevel, getArkoudaLogger
 from arkouda.message import (
+    PACKED_MAGIC,
+    MessageEncoding,
     MessageFormat,
     MessageType,
     ParameterObject,
@@ -29,6 +53,11 @@ __all__ = [
     "print_server_commands",
     "generate_history",
     "ruok",
+    "batch",
+    "Batch",
+    "BatchFuture",
+    "profile",
+    "CommandProfile",
 ]
 
 username = security.get_username()
@@ -45,6 +74,9 @@ sparrayIterThresh = sparrayIterThreshDefVal
 
 maxTransferBytesDefVal = 2**30
 maxTransferBytes = maxTransferBytesDefVal
+# number of deferred deletions queued before they are sent in a bulk delete request
+deleteBatchSizeDefVal = 256
+deleteBatchSize = deleteBatchSizeDefVal
 # maximum number of capture group for regex
 regexMaxCaptures: int = -1
 # unit conversion for get_mem_used
@@ -207,17 +239,18 @@ if mode == ClientMode.UI:
 # reset settings to default values
 def set_defaults() -> None:
     """
-    Sets client variables including verbose, maxTransferBytes and
-    pdarrayIterThresh to default values.
+    Sets client variables including verbose, maxTransferBytes,
+    pdarrayIterThresh and deleteBatchSize to default values.
 
     Returns
     -------
     None
     """
-    global verbose, maxTransferBytes, pdarrayIterThresh
+    global verbose, maxTransferBytes, pdarrayIterThresh, deleteBatchSize
     verbose = verboseDefVal
     pdarrayIterThresh = pdarrayIterThreshDefVal
     maxTransferBytes = maxTransferBytesDefVal
+    deleteBatchSize = deleteBatchSizeDefVal
 
 
 class ChannelType(Enum):
@@ -227,6 +260,7 @@ class ChannelType(Enum):
     """
 
     ZMQ = "ZMQ"
+    ZMQ_POOL = "ZMQ_POOL"
     GRPC = "GRPC"
     ASYNC_GRPC = "ASYNC_GRPC"
     STREAMING_GRPC = "STREAMING_GRPC"
@@ -260,9 +294,18 @@ class Channel:
         Token used to connect to the arkouda_server if authentication is enabled
     logger : ArkoudaLogger
         ArkoudaLogger used for logging
+    encoding : MessageEncoding
+        Encoding of requests and string replies, negotiated at connect time
+    last_timing : Tuple[float, float, float], optional
+        The time.perf_counter() values at which the last request was sent and
+        its reply received, and the server execution time reported in the reply.
+        Used by profile(); None if the Channel implementation does not record it.
     """
 
-    __slots__ = ("url", "user", "token", "logger")
+    __slots__ = ("url", "user", "token", "logger", "encoding", "last_timing")
+
+    # the message encodings the Channel implementation can send and receive
+    supported_encodings: Tuple[MessageEncoding, ...] = (MessageEncoding.JSON,)
 
     def __init__(
         self,
@@ -290,6 +333,8 @@ class Channel:
         self.user = user
         self._set_access_token(server, port, token)
         self.logger = getArkoudaLogger(name="Arkouda Client")
+        self.encoding = MessageEncoding.JSON
+        self.last_timing: Optional[Tuple[float, float, float]] = None
 
     def _set_url(self, server: str, port: int, connect_url: Optional[str] = None) -> None:
         """
@@ -374,9 +419,10 @@ class Channel:
         self,
         cmd: str,
         recv_binary: bool = False,
-        args: Optional[str] = None,
+        args: Optional[Union[str, bytes]] = None,
         size: int = -1,
         request_id: Optional[str] = None,
+        deletes: Optional[str] = None,
     ) -> Union[str, memoryview]:
         """
         Generates a RequestMessage encapsulating command and requesting
@@ -389,13 +435,17 @@ class Channel:
             The name of the command to be executed by the Arkouda server
         recv_binary : bool, defaults to False
             Indicates if the return message will be a string or binary data
-        args : str, defaults to None
-            A delimited string containing 1..n command arguments
+        args : str or bytes, defaults to None
+            A delimited string containing 1..n command arguments, or the
+            packed arguments if the Channel uses the packed encoding
         size : int
             Default -1
             Number of parameters contained in args. Only set if args is json.
         request_id: str, defaults to None
             Specifies an identifier for each request submitted to Arkouda
+        deletes: str, defaults to None
+            Space-delimited names of server objects to be deleted before the
+            command is executed
 
         Returns
         -------
@@ -422,9 +472,10 @@ class Channel:
         cmd: str,
         payload: memoryview,
         recv_binary: bool = False,
-        args: Optional[str] = None,
+        args: Optional[Union[str, bytes]] = None,
         size: int = -1,
         request_id: Optional[str] = None,
+        deletes: Optional[str] = None,
     ) -> Union[str, memoryview]:
         """
         Generates a RequestMessage encapsulating command and requesting user information,
@@ -440,10 +491,14 @@ class Channel:
             object on the Arkouda server
         recv_binary : bool, defaults to False
             Indicates if the return message will be a string or binary data
-        args : str, default=None
-            A delimited string containing 1..n command arguments
+        args : str or bytes, default=None
+            A delimited string containing 1..n command arguments, or the
+            packed arguments if the Channel uses the packed encoding
         request_id: str, defaults to None
             Specifies an identifier for each request submitted to Arkouda
+        deletes: str, defaults to None
+            Space-delimited names of server objects to be deleted before the
+            command is executed
 
         Returns
         -------
@@ -499,34 +554,70 @@ class ZmqChannel(Channel):
 
     __slots__ = "socket"
 
+    supported_encodings = (MessageEncoding.JSON, MessageEncoding.PACKED)
+
+    def _recv_packed_reply(self, sent: float) -> str:
+        raw_message = self.socket.recv()
+        received = time.perf_counter()
+        if not raw_message.startswith(PACKED_MAGIC):
+            # requests that could not be parsed are answered in JSON
+            return_message = ReplyMessage.fromdict(json.loads(raw_message))
+        else:
+            return_message = ReplyMessage.unpack(raw_message)
+        self.last_timing = (sent, received, return_message.exec_time)
+
+        # raise errors or warnings sent back from the server
+        if return_message.msgType == MessageType.ERROR:
+            raise RuntimeError(return_message.msg)
+        elif return_message.msgType == MessageType.WARNING:
+            warnings.warn(return_message.msg)
+        return return_message.msg
+
     def send_string_message(
         self,
         cmd: str,
         recv_binary: bool = False,
-        args: Optional[str] = None,
+        args: Optional[Union[str, bytes]] = None,
         size: int = -1,
         request_id: Optional[str] = None,
+        deletes: Optional[str] = None,
     ) -> Union[str, memoryview]:
         message = RequestMessage(
-            user=username, token=self.token, cmd=cmd, format=MessageFormat.STRING, args=args, size=size
+            user=username,
+            token=self.token,
+            cmd=cmd,
+            format=MessageFormat.STRING,
+            args=args,
+            size=size,
+            request_id=request_id,
+            deletes=deletes,
         )
-        # Note - Size is a placeholder here because Binary msg not yet support json args and
-        # request_id is a noop for now
-        logger.debug(f"sending message {json.dumps(message.asdict())}")
-
-        self.socket.send_string(json.dumps(message.asdict()))
+        if isinstance(args, bytes):
+            logger.debug(f"sending packed message {cmd}")
+            self.socket.send(message.pack())
+        else:
+            # Note - Size is a placeholder here because Binary msg not yet support json args
+            logger.debug(f"sending message {json.dumps(message.asdict())}")
+            self.socket.send_string(json.dumps(message.asdict()))
+        sent = time.perf_counter()
 
         if recv_binary:
             frame = self.socket.recv(copy=False)
+            # the server does not report its execution time with binary replies
+            self.last_timing = (sent, time.perf_counter(), 0.0)
             view = frame.buffer
             # raise errors sent back from the server
             if bytes(view[0 : len(b"Error:")]) == b"Error:":
                 raise RuntimeError(frame.bytes.decode())
             return view
+        elif isinstance(args, bytes):
+            return self._recv_packed_reply(sent)
         else:
             raw_message = self.socket.recv_string()
+            received = time.perf_counter()
             try:
                 return_message = ReplyMessage.fromdict(json.loads(raw_message))
+                self.last_timing = (sent, received, return_message.exec_time)
 
                 # raise errors or warnings sent back from the server
                 if return_message.msgType == MessageType.ERROR:
@@ -544,33 +635,51 @@ class ZmqChannel(Channel):
         cmd: str,
         payload: memoryview,
         recv_binary: bool = False,
-        args: Optional[str] = None,
+        args: Optional[Union[str, bytes]] = None,
         size: int = -1,
         request_id: Optional[str] = None,
+        deletes: Optional[str] = None,
     ) -> Union[str, memoryview]:
-        # Note - Size is a placeholder here because Binary msg not yet support json args and
-        # request_id is a noop for now
+        # Note - Size is a placeholder here because Binary msg not yet support json args
         message = RequestMessage(
-            user=username, token=self.token, cmd=cmd, format=MessageFormat.BINARY, args=args, size=size
+            user=username,
+            token=self.token,
+            cmd=cmd,
+            format=MessageFormat.BINARY,
+            args=args,
+            size=size,
+            request_id=request_id,
+            deletes=deletes,
         )
         import zmq
 
         self.logger.debug(f"sending message {message}")
 
-        self.socket.send(f"{json.dumps(message.asdict())}BINARY_PAYLOAD".encode(), flags=zmq.SNDMORE)
+        if isinstance(args, bytes):
+            # the packed request carries its format, so the payload needs no marker
+            self.socket.send(message.pack(), flags=zmq.SNDMORE)
+        else:
+            self.socket.send(f"{json.dumps(message.asdict())}BINARY_PAYLOAD".encode(), flags=zmq.SNDMORE)
         self.socket.send(payload, copy=False)
+        sent = time.perf_counter()
 
         if recv_binary:
             frame = self.socket.recv(copy=False)
+            # the server does not report its execution time with binary replies
+            self.last_timing = (sent, time.perf_counter(), 0.0)
             view = frame.buffer
             # raise errors sent back from the server
             if bytes(view[0 : len(b"Error:")]) == b"Error:":
                 raise RuntimeError(frame.bytes.decode())
             return view
+        elif isinstance(args, bytes):
+            return self._recv_packed_reply(sent)
         else:
             raw_message = self.socket.recv_string()
+            received = time.perf_counter()
             try:
                 return_message = ReplyMessage.fromdict(json.loads(raw_message))
+                self.last_timing = (sent, received, return_message.exec_time)
 
                 # raise errors or warnings sent back from the server
                 if return_message.msgType == MessageType.ERROR:
@@ -610,6 +719,172 @@ class ZmqChannel(Channel):
             raise RuntimeError(e)
 
 
+class ZmqPoolChannel(ZmqChannel):
+    """
+    The ZmqPoolChannel class is a thread-safe ZmqChannel backed by a pool of
+    ZMQ REQ sockets. Each request checks out a socket for the duration of the
+    request/reply exchange, so concurrent threads can issue independent
+    requests without sharing a socket. Threads block while all pool_size
+    sockets are checked out.
+
+    Sockets are created lazily; a socket interrupted mid-exchange (e.g., by
+    a timeout or KeyboardInterrupt) is closed rather than returned to the pool.
+    """
+
+    __slots__ = (
+        "pool_size",
+        "timeout",
+        "_context",
+        "_idle",
+        "_created",
+        "_generation",
+        "_cond",
+        "_local",
+    )
+
+    def __init__(
+        self,
+        user: str,
+        server: str = "localhost",
+        port: int = 5555,
+        token: Optional[str] = None,
+        connect_url: Optional[str] = None,
+        pool_size: int = 8,
+    ) -> None:
+        """
+        See ``Channel`` for the description of the other parameters.
+
+        pool_size : int, optional
+            The maximum number of sockets, and thus of concurrent requests.
+            Defaults to 8.
+        """
+        import threading
+
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be positive, got {pool_size}")
+        self._local = threading.local()
+        super().__init__(user=user, server=server, port=port, token=token, connect_url=connect_url)
+        self.pool_size = pool_size
+        self.timeout = 0
+        self._context = None
+        self._idle: List[Tuple[int, Any]] = []
+        self._created = 0
+        self._generation = 0
+        self._cond = threading.Condition()
+
+    @property  # type: ignore[override]
+    def socket(self):
+        """
+        The socket checked out by the current thread
+        """
+        checked_out = getattr(self._local, "socket", None)
+        if checked_out is None:
+            raise RuntimeError("no socket is checked out by the current thread")
+        return checked_out[1]
+
+    @property  # type: ignore[override]
+    def last_timing(self) -> Optional[Tuple[float, float, float]]:
+        """
+        The timing of the last request sent by the current thread
+        """
+        return getattr(self._local, "last_timing", None)
+
+    @last_timing.setter
+    def last_timing(self, timing: Optional[Tuple[float, float, float]]) -> None:
+        self._local.last_timing = timing
+
+    def _new_socket(self):
+        import zmq
+
+        socket = cast(zmq.Context, self._context).socket(zmq.REQ)
+        if self.timeout > 0:
+            socket.setsockopt(zmq.SNDTIMEO, self.timeout * 1000)
+            socket.setsockopt(zmq.RCVTIMEO, self.timeout * 1000)
+        try:
+            socket.connect(self.url)
+        except Exception as e:
+            socket.close(linger=0)
+            raise ConnectionError(e)
+        return socket
+
+    def _acquire(self) -> Tuple[int, Any]:
+        with self._cond:
+            if self._context is None:
+                raise RuntimeError("channel is not connected")
+            while not self._idle and self._created >= self.pool_size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+            generation = self._generation
+        try:
+            return generation, self._new_socket()
+        except BaseException:
+            with self._cond:
+                if generation == self._generation:
+                    self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, checked_out: Tuple[int, Any], reusable: bool) -> None:
+        generation, socket = checked_out
+        with self._cond:
+            if generation == self._generation and reusable:
+                self._idle.append(checked_out)
+            else:
+                socket.close(linger=0)
+                if generation == self._generation:
+                    self._created -= 1
+            self._cond.notify()
+
+    def _send(self, send, *args, **kwargs) -> Union[str, memoryview]:
+        checked_out = self._acquire()
+        self._local.socket = checked_out
+        reusable = False
+        try:
+            reply = send(*args, **kwargs)
+            reusable = True
+            return reply
+        except (RuntimeError, ValueError):
+            # raised after a complete reply was received, e.g. for server-side errors
+            reusable = True
+            raise
+        finally:
+            self._local.socket = None
+            self._release(checked_out, reusable)
+
+    def send_string_message(self, *args, **kwargs) -> Union[str, memoryview]:
+        return self._send(super().send_string_message, *args, **kwargs)
+
+    def send_binary_message(self, *args, **kwargs) -> Union[str, memoryview]:
+        return self._send(super().send_binary_message, *args, **kwargs)
+
+    def connect(self, timeout: int = 0) -> None:
+        import zmq
+
+        logger.debug(f"ZMQ version: {zmq.zmq_version()}")
+        with self._cond:
+            if self._context is None:
+                self._context = zmq.Context()
+            self.timeout = timeout
+            self._close_idle()
+        # check that the server is reachable by creating the first socket
+        self._release(self._acquire(), True)
+
+    def _close_idle(self) -> None:
+        # sockets checked out when the pool is reset are closed when released
+        for _, socket in self._idle:
+            socket.close(linger=0)
+        self._idle = []
+        self._created = 0
+        self._generation += 1
+        self._cond.notify_all()
+
+    def disconnect(self) -> None:
+        with self._cond:
+            self._close_idle()
+
+
 # Global Channel object reference
 channel = None
 
@@ -645,7 +920,8 @@ def get_channel(
     -------
     Channel
         The Channel implementation configured with the ARKOUDA_CHANNEL_TYPE
-        env variable
+        env variable. For ZMQ_POOL, the ARKOUDA_CHANNEL_POOL_SIZE env variable
+        sets the maximum number of sockets.
 
     Raises
     ------
@@ -654,6 +930,15 @@ def get_channel(
     """
     if channelType == ChannelType.ZMQ:
         return ZmqChannel(server=server, port=port, user=username, token=token, connect_url=connect_url)
+    elif channelType == ChannelType.ZMQ_POOL:
+        return ZmqPoolChannel(
+            server=server,
+            port=port,
+            user=username,
+            token=token,
+            connect_url=connect_url,
+            pool_size=int(os.getenv("ARKOUDA_CHANNEL_POOL_SIZE", "8")),
+        )
     else:
         raise EnvironmentError(f"Invalid channelType {channelType}")
 
@@ -665,6 +950,7 @@ def connect(
     access_token: Optional[str] = None,
     connect_url: Optional[str] = None,
     access_channel: Optional[Channel] = None,
+    request_encoding: Optional[str] = None,
 ) -> None:
     """
     Connect to a running arkouda server.
@@ -687,6 +973,11 @@ def connect(
         where the token is optional
     access_channel : Channel, optional
         The desired Channel implementation that differs from the default ZmqChannel
+    request_encoding : str, optional
+        The preferred encoding of requests and replies, either "json" or
+        "packed". Defaults to the ARKOUDA_REQUEST_ENCODING env variable, or
+        "json" if it is unset, so the packed encoding is opt-in. It is only
+        used if both the Channel and the server support it.
 
     Returns
     -------
@@ -697,7 +988,8 @@ def connect(
     ConnectionError
         Raised if there's an error in connecting to the Arkouda server
     ValueError
-        Raised if there's an error in parsing the connect_url parameter
+        Raised if there's an error in parsing the connect_url parameter or
+        request_encoding is not a valid encoding
     RuntimeError
         Raised if there is a server-side error
 
@@ -741,9 +1033,28 @@ def connect(
             RuntimeWarning,
         )
     regexMaxCaptures = serverConfig["regexMaxCaptures"]  # type: ignore
+    channel.encoding = _negotiate_encoding(
+        MessageEncoding(
+            request_encoding
+            if request_encoding
+            else os.getenv("ARKOUDA_REQUEST_ENCODING", str(MessageEncoding.JSON)).lower()
+        ),
+        channel,
+    )
     clientLogger.info(return_message)
 
 
+def _negotiate_encoding(preferred: MessageEncoding, channel: Channel) -> MessageEncoding:
+    """
+    Returns the preferred message encoding if both the channel and the
+    connected server support it, falling back to JSON otherwise.
+    """
+    server_encodings = cast(Mapping, serverConfig).get("requestEncodings", [str(MessageEncoding.JSON)])
+    if preferred in channel.supported_encodings and str(preferred) in server_encodings:
+        return preferred
+    return MessageEncoding.JSON
+
+
 def _parse_url(url: str) -> Tuple[str, int, Optional[str]]:
     """
     Parses the url in the following format if authentication enabled:
@@ -859,7 +1170,9 @@ def disconnect() -> None:
         # send disconnect message to server
         message = "disconnect"
         logger.debug(f"[Python] Sending request: {message}")
-        return_message = cast(str, cast(Channel, channel).send_string_message(message))
+        return_message = cast(
+            str, cast(Channel, channel).send_string_message(message, deletes=_drain_deletes())
+        )
         logger.debug(f"[Python] Received response: {return_message}")
         try:
             cast(Channel, channel).disconnect()
@@ -901,6 +1214,8 @@ def shutdown() -> None:
     logger.debug(f"[Python] Sending request: {message}")
     return_message = cast(str, cast(Channel, channel).send_string_message(message))
     logger.debug(f"[Python] Received response: {return_message}")
+    # the server deletes all objects when it shuts down
+    _pending_deletes.clear()
 
     try:
         cast(Channel, channel).disconnect()
@@ -949,17 +1264,75 @@ def _json_args_to_str(json_obj: Optional[Dict] = None) -> Tuple[int, str]:
     return len(j), json.dumps(j)
 
 
+def _packed_args(json_obj: Optional[Dict] = None) -> Tuple[int, bytes]:
+    """
+    Convert Python Dictionary into the packed encoding of command arguments:
+    the number of parameters as a little-endian uint32 followed by each packed
+    ParameterObject.
+
+    Parameters
+    ----------
+    json_obj : dict = None
+        Python dictionary of key:val representing command arguments
+
+    Return
+    ------
+    Tuple - the number of parameters found and the packed bytes
+
+    Raises
+    ------
+    TypeError
+        - Keys are a type other than str
+        - A list contains values of multiple types.
+    """
+    if json_obj is None:
+        return 0, struct.pack("<I", 0)
+    params = []
+    for key, val in json_obj.items():
+        if not isinstance(key, str):
+            raise TypeError(f"Argument keys are required to be str. Found {type(key)}")
+        params.append(ParameterObject.factory(key, val).packed)
+    return len(params), struct.pack("<I", len(params)) + b"".join(params)
+
+
+@overload
+def generic_msg(
+    cmd: str,
+    args: Optional[Dict] = ...,
+    payload: Optional[memoryview] = ...,
+    send_binary: bool = ...,
+    recv_binary: bool = ...,
+    defer: Literal[False] = ...,
+) -> Union[str, memoryview]: ...
+
+
+@overload
+def generic_msg(
+    cmd: str,
+    args: Optional[Dict] = ...,
+    payload: Optional[memoryview] = ...,
+    send_binary: bool = ...,
+    recv_binary: bool = ...,
+    defer: bool = ...,
+) -> Union[str, memoryview, "BatchFuture"]: ...
+
+
 def generic_msg(
     cmd: str,
     args: Optional[Dict] = None,
     payload: Optional[memoryview] = None,
     send_binary: bool = False,
     recv_binary: bool = False,
-) -> Union[str, memoryview]:
+    defer: bool = False,
+) -> Union[str, memoryview, "BatchFuture"]:
     """
     Sends a binary or string message composed of a command and corresponding
     arguments to the arkouda_server, returning the response sent by the server.
 
+    Within a ``with ak.batch()`` block, commands are queued in the batch if
+    defer is True, and otherwise the batch is flushed before the command is
+    sent.
+
     Parameters
     ----------
     cmd : str
@@ -972,11 +1345,16 @@ def generic_msg(
         Indicates if the message to be sent is a string or binary
     recv_binary : bool
         Indicates if the return message will be a string or binary
+    defer : bool
+        Indicates if the command may be queued in the active batch, which
+        requires the reply to be a string that is only passed to
+        create_pdarray or ignored
 
     Returns
     -------
-    Union[str, memoryview]
-        The string or binary return message
+    Union[str, memoryview, BatchFuture]
+        The string or binary return message, or the BatchFuture for the reply
+        if the command was queued
 
     Raises
     ------
@@ -997,24 +1375,596 @@ def generic_msg(
     if not connected:
         raise RuntimeError("client is not connected to a server")
 
-    size, msg_args = _json_args_to_str(args)
+    active = _active_batch()
+    if active is not None:
+        if defer and not send_binary and not recv_binary:
+            return active.submit(cmd, args)
+        # the command may use the results of the queued commands
+        active.flush()
+
+    start = time.perf_counter()
+    msg_args: Union[str, bytes]
+    if cast(Channel, channel).encoding == MessageEncoding.PACKED:
+        size, msg_args = _packed_args(args)
+    else:
+        size, msg_args = _json_args_to_str(args)
+    encoded = time.perf_counter()
 
+    # deferred deletions are piggybacked on the request and done by the server first
+    deletes = _drain_deletes()
+    _request_state.active = True
     try:
         if send_binary:
             assert payload is not None
-            return cast(Channel, channel).send_binary_message(
-                cmd=cmd, payload=payload, recv_binary=recv_binary, args=msg_args, size=size
+            reply = cast(Channel, channel).send_binary_message(
+                cmd=cmd,
+                payload=payload,
+                recv_binary=recv_binary,
+                args=msg_args,
+                size=size,
+                deletes=deletes,
             )
         else:
             assert payload is None
-            return cast(Channel, channel).send_string_message(
-                cmd=cmd, args=msg_args, size=size, recv_binary=recv_binary
+            reply = cast(Channel, channel).send_string_message(
+                cmd=cmd, args=msg_args, size=size, recv_binary=recv_binary, deletes=deletes
             )
     except KeyboardInterrupt as e:
         # if the user interrupts during command execution, the socket gets out
         # of sync reset the socket before raising the interrupt exception
         cast(Channel, channel).connect(timeout=0)
         raise e
+    finally:
+        _request_state.active = False
+
+    if _profiles:
+        _record_timing(cmd, start, encoded, time.perf_counter())
+    return reply
+
+
+# names of server objects whose deletion is deferred until the next request
+_pending_deletes: Deque[str] = deque()
+# tracks whether a thread is mid-request, when deferred deletions must not be flushed
+_request_state = threading.local()
+
+
+def _drain_deletes() -> str:
+    """
+    Empties the queue of deferred deletions, returning the queued names as a
+    space-delimited string.
+    """
+    names = []
+    try:
+        while True:
+            names.append(_pending_deletes.popleft())
+    except IndexError:
+        pass
+    return " ".join(names)
+
+
+def _defer_delete(name: str) -> None:
+    """
+    Queues the deletion of a server object, e.g., a pdarray that has gone
+    out of scope. Queued deletions are sent along with the next request and
+    done by the server before it executes the command, so deleting an object
+    does not cost a round trip. Once deleteBatchSize deletions are queued,
+    they are sent in a single bulk delete request.
+
+    Parameters
+    ----------
+    name : str
+        The name of the server object to delete
+    """
+    if not name:
+        return
+    active = _active_batch()
+    if active is not None and len(active) > 0:
+        # the commands queued in the batch may use the object, so it is deleted after they run
+        active._deletes.append(name)
+        return
+    _pending_deletes.append(name)
+    if (
+        len(_pending_deletes) >= deleteBatchSize
+        and not getattr(_request_state, "active", False)
+        and not sys.is_finalizing()
+    ):
+        flush_deletes()
+
+
+def flush_deletes() -> None:
+    """
+    Sends the deferred deletions of server objects, e.g., pdarrays that
+    have gone out of scope, to the server in a single request. Deferred
+    deletions are otherwise sent along with the next request.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    RuntimeError
+        Raised if there is a server-side error thrown
+    """
+    if connected and _pending_deletes:
+        generic_msg(cmd="delete", args={"names": _drain_deletes()})
+
+
+@atexit.register
+def _flush_deletes_at_exit() -> None:
+    try:
+        flush_deletes()
+    except Exception:
+        pass
+
+
+class CommandProfile:
+    """
+    The CommandProfile class holds the latencies, in seconds, of the commands
+    sent to the server while the profile() context it was returned by is
+    active. The latency of each command is broken down into phases:
+
+    - serialize: encoding the request on the client
+    - wire: transfer of the request and reply, and any server time not
+      spent executing the command (e.g., parsing the request)
+    - server: command execution time reported by the server
+    - decode: decoding the reply on the client
+    - total: the sum of the above
+
+    Servers do not report an execution time with binary replies (e.g.,
+    to_ndarray), so for those the execution time is included in wire.
+    """
+
+    PHASES = ("serialize", "wire", "server", "decode", "total")
+
+    __slots__ = ("_timings",)
+
+    def __init__(self) -> None:
+        self._timings: Dict[str, List[Tuple[float, float, float, float, float]]] = {}
+
+    def record(self, cmd: str, serialize: float, wire: float, server: float, decode: float) -> None:
+        """
+        Record the latency of one command, in seconds per phase
+        """
+        self._timings.setdefault(cmd, []).append(
+            (serialize, wire, server, decode, serialize + wire + server + decode)
+        )
+
+    @property
+    def commands(self) -> List[str]:
+        """
+        The names of the profiled commands, in the order first sent
+        """
+        return list(self._timings)
+
+    def latencies(self, cmd: Optional[str] = None, phase: str = "total"):
+        """
+        Return the latencies of a phase of a command.
+
+        Parameters
+        ----------
+        cmd : str, optional
+            The command name. Defaults to all commands.
+        phase : str
+            One of "serialize", "wire", "server", "decode" or "total"
+
+        Returns
+        -------
+        np.ndarray
+            The latencies in seconds, in the order the commands were sent
+
+        Raises
+        ------
+        ValueError
+            Raised if phase is not a valid phase
+        KeyError
+            Raised if cmd was not profiled
+        """
+        import numpy as np
+
+        if phase not in self.PHASES:
+            raise ValueError(f"phase must be one of {self.PHASES}, got {phase}")
+        col = self.PHASES.index(phase)
+        timings = (
+            self._timings[cmd]
+            if cmd is not None
+            else [t for times in self._timings.values() for t in times]
+        )
+        return np.array([t[col] for t in timings], dtype=np.float64)
+
+    def histogram(self, cmd: Optional[str] = None, phase: str = "total", bins: int = 10):
+        """
+        Compute a histogram of the latencies of a phase of a command.
+
+        Parameters
+        ----------
+        cmd : str, optional
+            The command name. Defaults to all commands.
+        phase : str
+            One of "serialize", "wire", "server", "decode" or "total"
+        bins : int
+            The number of equal-width bins
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The counts and the bin edges, in seconds, as returned by np.histogram
+        """
+        import numpy as np
+
+        return np.histogram(self.latencies(cmd, phase), bins=bins)
+
+    def to_dataframe(self, percentiles: Sequence[float] = (50, 90, 99)):
+        """
+        Summarize the profile per command.
+
+        Parameters
+        ----------
+        percentiles : Sequence[float]
+            The percentiles of the total latency to report
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by command, with the number of calls, the total time, the
+            mean time of each phase and the requested percentiles of the total
+            latency, in seconds, sorted by descending total time
+        """
+        import numpy as np
+        import pandas as pd
+
+        columns = (
+            ["count", "time"]
+            + [f"mean_{phase}" for phase in self.PHASES]
+            + [f"p{p:g}" for p in percentiles]
+        )
+        rows = []
+        for cmd, timings in self._timings.items():
+            times = np.array(timings, dtype=np.float64)
+            total = times[:, -1]
+            rows.append(
+                [len(timings), total.sum()]
+                + list(times.mean(axis=0))
+                + list(np.percentile(total, percentiles) if len(percentiles) else [])
+            )
+        df = pd.DataFrame(rows, index=pd.Index(self.commands, name="cmd"), columns=columns)
+        return df.sort_values("time", ascending=False)
+
+    def __str__(self) -> str:
+        return self.to_dataframe().to_string()
+
+
+# Active CommandProfiles, which record each command sent to the server
+_profiles: List[CommandProfile] = []
+
+
+def _record_timing(cmd: str, start: float, encoded: float, end: float) -> None:
+    """
+    Record the latency of a command sent to the server in the active profiles
+    """
+    timing = getattr(channel, "last_timing", None)
+    if timing is None:
+        # the channel does not record its timing; attribute all of it to the wire
+        serialize, wire, server, decode = encoded - start, end - encoded, 0.0, 0.0
+    else:
+        sent, received, server = timing
+        serialize, decode = sent - start, end - received
+        wire = max(received - sent - server, 0.0)
+    for p in _profiles:
+        p.record(cmd, serialize, wire, server, decode)
+
+
+@contextmanager
+def profile(print_summary: bool = False) -> Iterator[CommandProfile]:
+    """
+    Context manager that profiles the latency of every command sent to the
+    server within it.
+
+    Parameters
+    ----------
+    print_summary : bool
+        If True, print the summary of the profile per command on exit
+
+    Yields
+    ------
+    CommandProfile
+        The profile, which records the client serialization, wire, server
+        execution and client decode time of each command
+
+    Examples
+    --------
+    >>> with ak.profile() as prof:
+    ...     a = ak.arange(10**6)
+    ...     b = (a * 2).sum()
+    >>> prof.to_dataframe()
+    >>> counts, edges = prof.histogram("binopvs1D")
+    """
+    p = CommandProfile()
+    _profiles.append(p)
+    try:
+        yield p
+    finally:
+        _profiles.remove(p)
+        if print_summary:
+            clientLogger.info(str(p))
+
+
+class BatchFuture:
+    """
+    The BatchFuture class is a placeholder for the reply to a command queued
+    within a Batch. It is resolved when the Batch it belongs to is flushed.
+
+    A BatchFuture may be passed as an argument to a subsequently submitted
+    command, in which case it refers to the symbol (e.g., pdarray) created
+    by the command it represents.
+
+    Attributes
+    ----------
+    cmd : str
+        The server-side command the future corresponds to
+    dtype : str
+        The element type of the symbol created by the command, if known
+    """
+
+    __slots__ = ("cmd", "dtype", "_index", "_batch", "_post", "_done", "_reply", "_result")
+
+    def __init__(
+        self,
+        cmd: str,
+        index: int,
+        post: Optional[Callable[[str], Any]] = None,
+        dtype: str = "",
+        batch: Optional["Batch"] = None,
+    ) -> None:
+        self.cmd = cmd
+        self.dtype = dtype
+        self._index = index
+        self._batch = batch
+        self._post = post
+        self._done = False
+        self._reply: Optional[str] = None
+        self._result: Any = None
+
+    @property
+    def name(self) -> str:
+        """
+        The server-side name of the symbol created by the command, or a
+        placeholder resolved by the server if the batch has not been flushed
+        """
+        if self._done:
+            fields = cast(str, self._reply).split()
+            if len(fields) > 1 and fields[0] == "created":
+                return fields[1]
+        return f"__batch_ref_{self._index}__"
+
+    def done(self) -> bool:
+        """
+        Returns True if the batch containing this future has been executed
+        """
+        return self._done
+
+    def wait(self) -> None:
+        """
+        Flushes the batch containing this future if it has not been executed
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the command was not executed, e.g., because the batch
+            was discarded or an earlier command in it failed
+        """
+        if not self._done and self._batch is not None:
+            self._batch.flush()
+        if not self._done:
+            raise RuntimeError(f"batched command {self.cmd} was not executed")
+
+    def result(self) -> Any:
+        """
+        Returns the reply to the command, converted by the post-processing
+        function supplied at submission, if any
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the batch containing this future has not been executed,
+            from the error of the batch if it failed
+        """
+        if not self._done:
+            error = self._batch._error if self._batch is not None else None
+            raise RuntimeError(f"batched command {self.cmd} has not been executed") from error
+        return self._result
+
+    def _resolve(self, reply: str) -> None:
+        self._reply = reply
+        self._done = True
+        self._result = self._post(reply) if self._post is not None else reply
+
+    def __repr__(self) -> str:
+        state = "done" if self._done else "pending"
+        return f"BatchFuture(cmd={self.cmd}, {state})"
+
+
+class Batch:
+    """
+    The Batch class queues commands client-side and sends them to the
+    Arkouda server as a single multi-command message, so a pipeline of
+    n commands costs one round trip instead of n.
+
+    Commands are queued with submit, which returns a BatchFuture. Futures
+    may be used as arguments to later commands in the same batch. The
+    queued commands are executed in submission order when the batch is
+    flushed, either explicitly or on exiting a ``with ak.batch()`` block.
+
+    Within a ``with ak.batch()`` block, pdarray binary and in-place
+    operators, and indexing and assignment with a pdarray index, are queued
+    as well. Operations that create a pdarray return one whose name refers
+    to the queued command. Its shape is known, but accessing its dtype or
+    itemsize flushes the batch. Every other command flushes the batch
+    before it is sent, so the commands run in order.
+
+    Notes
+    -----
+    Only commands that send and receive string messages may be batched.
+    Execution stops at the first failing command; futures for that command
+    and the ones after it remain unresolved. The error is raised from flush,
+    on exiting the ``with ak.batch()`` block, and by BatchFuture.result,
+    but not by accessing the attributes of an array the batch creates,
+    which raises AttributeError instead.
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple[RequestMessage, BatchFuture]] = []
+        # deletions deferred while commands were queued
+        self._deletes: List[str] = []
+        # the error of the first failed flush, raised again on exiting the with block
+        self._error: Optional[Exception] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self,
+        cmd: str,
+        args: Optional[Dict] = None,
+        post: Optional[Callable[[str], Any]] = None,
+        dtype: str = "",
+    ) -> BatchFuture:
+        """
+        Queue a command for execution when the batch is flushed
+
+        Parameters
+        ----------
+        cmd : str
+            The server-side command to be executed
+        args : dict, optional
+            The command arguments, which may include BatchFutures
+        post : Callable[[str], Any], optional
+            Function used to convert the reply string to the future's result,
+            e.g. ``ak.create_pdarray``
+        dtype : str, optional
+            The element type of the symbol created by the command, sent to
+            the server when the future is used as an argument
+
+        Returns
+        -------
+        BatchFuture
+            The future resolved with the reply when the batch is flushed
+        """
+        size, msg_args = _json_args_to_str(args)
+        future = BatchFuture(cmd, len(self._pending), post=post, dtype=dtype, batch=self)
+        message = RequestMessage(
+            user=username,
+            token=cast(Channel, channel).token if channel is not None else None,
+            cmd=cmd,
+            format=MessageFormat.STRING,
+            args=msg_args,
+            size=size,
+        )
+        self._pending.append((message, future))
+        return future
+
+    def flush(self) -> None:
+        """
+        Send all queued commands to the server in one message and resolve
+        their futures
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the client is not connected or a batched command fails
+        ValueError
+            Raised if the server reply cannot be parsed
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            repMsg = cast(
+                str,
+                generic_msg(
+                    cmd="batch",
+                    args={"requests": [json.dumps(message.asdict()) for message, _ in pending]},
+                ),
+            )
+        except RuntimeError as e:
+            if self._error is None:
+                self._error = e
+            raise
+        finally:
+            self._release_deletes()
+        try:
+            replies = json.loads(repMsg)
+        except json.decoder.JSONDecodeError:
+            raise ValueError(f"Batch reply is not valid JSON: {repMsg}")
+        for (_, future), reply in zip(pending, replies):
+            future._resolve(reply)
+
+    def __enter__(self) -> "Batch":
+        # the queued commands of an enclosing batch cannot be referred to from this one
+        enclosing = _active_batch()
+        if enclosing is not None:
+            enclosing.flush()
+        _batch_state.active = getattr(_batch_state, "active", None), self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _batch_state.active = _batch_state.active[0]
+        if exc_type is None:
+            self.flush()
+            if self._error is not None:
+                raise RuntimeError(f"batched command failed: {self._error}") from self._error
+        else:
+            self._pending = []
+            self._release_deletes()
+
+    def _release_deletes(self) -> None:
+        """
+        Queues the deletions deferred while commands were queued in the batch
+        for the next request
+        """
+        deletes, self._deletes = self._deletes, []
+        for name in deletes:
+            _defer_delete(name)
+
+
+# for each thread, the state of the enclosing batch with block, if any, paired
+# with the Batch of the innermost with block being executed
+_batch_state = threading.local()
+
+
+def _active_batch() -> Optional[Batch]:
+    """
+    Returns the Batch of the innermost ``with ak.batch()`` block of the
+    current thread, if any
+    """
+    active = getattr(_batch_state, "active", None)
+    return active[1] if active is not None else None
+
+
+def batch() -> Batch:
+    """
+    Create a Batch for submitting several commands in a single round trip
+
+    Returns
+    -------
+    Batch
+        The Batch, which is flushed on exiting a with block
+
+    Examples
+    --------
+    >>> a = ak.arange(10)
+    >>> with ak.batch():
+    ...     b = a * 2
+    ...     c = (b + a) - b
+    >>> c
+    array([0 1 2 3 4 5 6 7 8 9])
+    >>> with ak.batch() as b:
+    ...     x = b.submit("binopvs1D", {"op": "*", "a": a, "dtype": "int64", "value": 2})
+    ...     y = b.submit("binopvv1D", {"op": "+", "a": x, "b": a}, post=ak.create_pdarray)
+    >>> y.result()
+    array([0 3 6 9 12 15 18 21 24 27])
+    """
+    return Batch()
 
 
 def get_config() -> Mapping[str, Union[str, int, float]]:
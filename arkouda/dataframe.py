@@ -24,9 +24,9 @@ from arkouda.dtypes import int64 as akint64
 from arkouda.dtypes import uint64 as akuint64
 from arkouda.groupbyclass import GROUPBY_REDUCTION_TYPES
 from arkouda.groupbyclass import GroupBy as akGroupBy
-from arkouda.groupbyclass import unique
+from arkouda.groupbyclass import _GroupByCache, unique
 from arkouda.index import Index, MultiIndex
-from arkouda.join import inner_join
+from arkouda.join import _merge_joinable, hash_join, merge_join
 from arkouda.numeric import cast as akcast
 from arkouda.numeric import cumsum, where
 from arkouda.pdarrayclass import RegistrationError, pdarray
@@ -35,7 +35,7 @@ from arkouda.pdarraysetops import concatenate, in1d, intersect1d
 from arkouda.row import Row
 from arkouda.segarray import SegArray
 from arkouda.series import Series
-from arkouda.sorting import argsort, coargsort
+from arkouda.sorting import argsort, argtopk, coargsort
 from arkouda.strings import Strings
 from arkouda.timeclass import Datetime, Timedelta
 
@@ -166,6 +166,65 @@ class DataFrameGroupBy:
 
         return aggop
 
+    def agg(self, func, skipna=True, ddof=1):
+        """
+        Aggregate columns with one or more operations, with the grouped column(s)
+        values as keys. Each column is permuted once, and all of the aggregations
+        are computed by the server in a single request.
+
+        Parameters
+        ----------
+        func : str, list of str, or dict of str to (list of) str
+            The name(s) of the operation(s) to apply to every numeric column other
+            than the grouped column(s), or, if a dict, the name(s) of the
+            operation(s) to apply to each column by name.
+        skipna : bool, default=True
+            Whether NaN values are skipped.
+        ddof : int, default=1
+            "Delta Degrees of Freedom" used in calculating var and std.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            One column per (column, operation) pair, labeled with the name of the
+            column if a single operation is given for it as a str, and
+            <column>_<operation> otherwise.
+
+        See Also
+        --------
+        arkouda.groupbyclass.GroupBy.agg
+
+        Examples
+        --------
+        >>> df = ak.DataFrame({"k": ak.array([0, 1, 0, 1]), "a": ak.array([1, 2, 3, 4]),
+        ...                    "b": ak.array([1.0, 0.5, 2.0, 0.5])})
+        >>> df.groupby("k").agg({"a": ["sum", "max"], "b": "mean"})
+           a_sum  a_max     b
+        k
+        0      4      3  1.5
+        1      6      4  0.5 (2 rows x 3 columns)
+        """
+        key_names = [self.gb_key_names] if isinstance(self.gb_key_names, str) else self.gb_key_names
+        if isinstance(func, dict):
+            colnames = list(func.keys())
+        else:
+            colnames = [
+                c
+                for c in self.df.data.keys()
+                if c not in key_names and self.df.data[c].dtype in [akfloat64, akint64, akuint64, bigint]
+            ]
+        data = self.gb._aggregate_many(
+            {c: self.df.data[c] for c in colnames}, func, skipna=skipna, ddof=ddof
+        )
+
+        keys = self.gb.unique_keys
+        keys = list(keys) if isinstance(keys, (list, tuple)) else [keys]
+        if not self.as_index:
+            return DataFrame({**dict(zip(key_names, keys)), **data})
+        if len(key_names) == 1:
+            return DataFrame(data, index=Index(keys[0], name=key_names[0]))
+        return DataFrame(data, index=MultiIndex(keys, names=key_names))
+
     def size(self, as_series=None, sort_index=True):
         """
         Compute the size of each value as the total number of rows, including NaN values.
@@ -866,6 +925,8 @@ class DataFrame(UserDict):
     def __init__(self, initialdata=None, index=None, columns=None):
         super().__init__()
         self.registered_name = None
+        # groupings of the columns, reused by groupby and drop_duplicates
+        self._groupby_cache = _GroupByCache()
 
         if isinstance(initialdata, DataFrame):
             # Copy constructor
@@ -992,6 +1053,7 @@ class DataFrame(UserDict):
     def __delitem__(self, key):
         # This function is a backdoor to messing up the indices and columns.
         # I needed to reimplement it to prevent bad behavior
+        self._groupby_cache.invalidate(self.data[key])
         UserDict.__delitem__(self, key)
         self._columns.remove(key)
 
@@ -1089,6 +1151,7 @@ class DataFrame(UserDict):
                     # maintaining to prevent adding index column
                     if k == "index":
                         continue
+                    self._groupby_cache.invalidate(self[k])
                     self[k][key] = v
 
         # Set a single column in the dataframe using a an arkouda array
@@ -1102,6 +1165,8 @@ class DataFrame(UserDict):
                 raise ValueError(f"Expected size {self._nrows} but received size {value.size}.")
             else:
                 self._empty = False
+                if key in self.data:
+                    self._groupby_cache.invalidate(self.data[key])
                 UserDict.__setitem__(self, key, value)
                 # Update the index values
                 if key not in self._columns:
@@ -1459,6 +1524,7 @@ class DataFrame(UserDict):
         idx_list.append(self.index.index[(last_idx + 1) :])
 
         idx_to_keep = concatenate(idx_list)
+        self._groupby_cache.clear()
         for key in self.keys():
             # using the UserDict.__setitem__ here because we know all the columns are being
             # reset to the same size
@@ -1616,14 +1682,14 @@ class DataFrame(UserDict):
         if len(subset) == 1:
             if not subset[0] in self.data:
                 raise KeyError(f"{subset[0]} is not a column in the DataFrame.")
-            gp = akGroupBy(self.data[subset[0]])
+            gp = self._groupby_cache.get([self.data[subset[0]]])
 
         else:
             for col in subset:
                 if col not in self.data:
                     raise KeyError(f"{subset[0]} is not a column in the DataFrame.")
 
-            gp = akGroupBy([self.data[col] for col in subset])
+            gp = self._groupby_cache.get([self.data[col] for col in subset])
 
         if keep == "last":
             _segment_ends = concatenate([gp.segments[1:] - 1, array([gp.permutation.size - 1])])
@@ -2331,6 +2397,7 @@ class DataFrame(UserDict):
                         f"Incompatible types for column {key}: {type(self[key])} vs {type(other[key])}"
                     ) from e
             self.data = tmp_data
+            self._groupby_cache.clear()
 
         # Clean up
         self.update_nrows()
@@ -2624,6 +2691,14 @@ class DataFrame(UserDict):
         --------
         arkouda.GroupBy
 
+        Notes
+        -----
+        The DataFrame keeps the groupings of the last few sets of keys, which
+        are reused by later calls to GroupBy, groupby and drop_duplicates with
+        the same columns, and dropped when a column is replaced or deleted. A
+        column modified in place through the array itself, rather than through
+        the DataFrame, should be reassigned to the DataFrame to drop them.
+
         Examples
         --------
 
@@ -2668,15 +2743,13 @@ class DataFrame(UserDict):
 
         self.update_nrows()
         if isinstance(keys, str):
-            cols = self.data[keys]
+            cols = [self.data[keys]]
         elif not isinstance(keys, (list, tuple)):
             raise TypeError("keys must be a column name or a list/tuple of column names")
-        elif len(keys) == 1:
-            cols = self.data[keys[0]]
         else:
             cols = [self.data[col] for col in keys]
 
-        gb = akGroupBy(cols, dropna=dropna)
+        gb = self._groupby_cache.get(cols, dropna=dropna)
         if use_series:
             gb = DataFrameGroupBy(gb, self, gb_key_names=keys, as_index=as_index)
         return gb
@@ -3238,6 +3311,7 @@ class DataFrame(UserDict):
         columns=None,
         compression: Optional[str] = None,
         convert_categoricals: bool = False,
+        partition_cols: Optional[List[str]] = None,
     ):
         """
         Save DataFrame to disk as parquet, preserving column names.
@@ -3257,6 +3331,11 @@ class DataFrame(UserDict):
             Parquet requires all columns to be the same size and Categoricals
             don't satisfy that requirement.
             If set, write the equivalent Strings in place of any Categorical columns.
+        partition_cols : list of str (Optional), default=None
+            Columns to partition the data by. The rows of each distinct
+            combination of their values are written to their own ``col=value``
+            directory under path, which ``read_parquet`` reads back as a
+            partitioned dataset, skipping partitions ruled out by its filters.
         Returns
         -------
         None
@@ -3270,7 +3349,8 @@ class DataFrame(UserDict):
         -----
         This method saves one file per locale of the arkouda server. All
         files are prefixed by the path argument and suffixed by their
-        locale number.
+        locale number. With partition_cols, path is the directory of the
+        partitions, each holding one file per locale.
 
         See Also
         ---------
@@ -3299,6 +3379,11 @@ class DataFrame(UserDict):
         |  1 |   4 |   2 |
         +----+-----+-----+
 
+        >>> df = ak.DataFrame({"date": ["2024-01-01", "2024-01-02"], "A": [1, 2]})
+        >>> df.to_parquet(my_path + "/my_dataset", partition_cols=["date"])
+        >>> ak.read_parquet(my_path + "/my_dataset", filters=[("date", "==", "2024-01-02")])
+        {'A': array([2]), 'date': array(['2024-01-02'])}
+
         """
         from arkouda.io import to_parquet
 
@@ -3314,6 +3399,7 @@ class DataFrame(UserDict):
             prefix_path=path,
             compression=compression,
             convert_categoricals=convert_categoricals,
+            partition_cols=partition_cols,
         )
 
     @typechecked
@@ -3887,6 +3973,101 @@ class DataFrame(UserDict):
             raise TypeError("Column name(s) must be str or list/tuple of str")
         return self[i]
 
+    def _topk(self, n, columns, ascending):
+        if isinstance(columns, str):
+            columns = [columns]
+        elif not isinstance(columns, (list, tuple)):
+            raise TypeError("Column name(s) must be str or list/tuple of str")
+        if self._empty:
+            return self
+        return self[argtopk([self[col] for col in columns], n, ascending=ascending)]
+
+    def nlargest(self, n, columns):
+        """
+        Return the first `n` rows ordered by `columns` in descending order,
+        without sorting the whole DataFrame.
+
+        Rows with equal values in `columns` are kept in the order they appear
+        in the DataFrame, like keep="first" in pandas.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to return.
+        columns : str or list/tuple of str
+            The name(s) of the column(s) to order by.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The first `n` rows ordered by `columns` in descending order.
+
+        See Also
+        --------
+        nsmallest, sort_values, arkouda.sorting.argtopk
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({'col1': [2, 9, 1, 9], 'col2': ['b', 'a', 'c', 'd']})
+        >>> df.nlargest(2, 'col1')
+
+        +----+--------+--------+
+        |    |   col1 | col2   |
+        +====+========+========+
+        |  1 |      9 | a      |
+        +----+--------+--------+
+        |  3 |      9 | d      |
+        +----+--------+--------+
+
+        """
+        return self._topk(n, columns, ascending=False)
+
+    def nsmallest(self, n, columns):
+        """
+        Return the first `n` rows ordered by `columns` in ascending order,
+        without sorting the whole DataFrame.
+
+        Rows with equal values in `columns` are kept in the order they appear
+        in the DataFrame, like keep="first" in pandas.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to return.
+        columns : str or list/tuple of str
+            The name(s) of the column(s) to order by.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The first `n` rows ordered by `columns` in ascending order.
+
+        See Also
+        --------
+        nlargest, sort_values, arkouda.sorting.argtopk
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({'col1': [2, 9, 1, 9], 'col2': ['b', 'a', 'c', 'd']})
+        >>> df.nsmallest(2, ['col1', 'col2'])
+
+        +----+--------+--------+
+        |    |   col1 | col2   |
+        +====+========+========+
+        |  2 |      1 | c      |
+        +----+--------+--------+
+        |  0 |      2 | b      |
+        +----+--------+--------+
+
+        """
+        return self._topk(n, columns, ascending=True)
+
     def apply_permutation(self, perm):
         """
         Apply a permutation to an entire DataFrame.  The operation is done in
@@ -4136,6 +4317,14 @@ class DataFrame(UserDict):
         --------
         arkouda.GroupBy
 
+        Notes
+        -----
+        The DataFrame keeps the groupings of the last few sets of keys, which
+        are reused by later calls to GroupBy, groupby and drop_duplicates with
+        the same columns, and dropped when a column is replaced or deleted. A
+        column modified in place through the array itself, rather than through
+        the DataFrame, should be reassigned to the DataFrame to drop them.
+
         Examples
         --------
 
@@ -4542,10 +4731,10 @@ class DataFrame(UserDict):
             Must be "inner", "left", or "right".
         left_suffix: str, default = "_x"
             A string indicating the suffix to add to columns from the left dataframe for overlapping
-            column names in both left and right. Defaults to "_x". Only used when how is "inner".
+            column names in both left and right. Defaults to "_x".
         right_suffix: str, default = "_y"
             A string indicating the suffix to add to columns from the right dataframe for overlapping
-            column names in both left and right. Defaults to "_y". Only used when how is "inner".
+            column names in both left and right. Defaults to "_y".
         convert_ints: bool = True
             If True, convert columns with missing int values (due to the join) to float64.
             This is to match pandas.
@@ -4617,17 +4806,17 @@ class DataFrame(UserDict):
         >>> left_df.merge(right_df, on = "col1", how = "left")
 
         +----+--------+----------+----------+
-        |    |   col1 |   col2_y |   col2_x |
+        |    |   col1 |   col2_x |   col2_y |
         +====+========+==========+==========+
         |  0 |      0 |        0 |        0 |
         +----+--------+----------+----------+
-        |  1 |      1 |      nan |       -1 |
+        |  1 |      1 |       -1 |      nan |
         +----+--------+----------+----------+
-        |  2 |      2 |        2 |       -2 |
+        |  2 |      2 |       -2 |        2 |
         +----+--------+----------+----------+
-        |  3 |      3 |      nan |       -3 |
+        |  3 |      3 |       -3 |      nan |
         +----+--------+----------+----------+
-        |  4 |      4 |        4 |       -4 |
+        |  4 |      4 |       -4 |        4 |
         +----+--------+----------+----------+
 
         >>> left_df.merge(right_df, on = "col1", how = "right")
@@ -4649,21 +4838,21 @@ class DataFrame(UserDict):
         >>> left_df.merge(right_df, on = "col1", how = "outer")
 
         +----+--------+----------+----------+
-        |    |   col1 |   col2_y |   col2_x |
+        |    |   col1 |   col2_x |   col2_y |
         +====+========+==========+==========+
         |  0 |      0 |        0 |        0 |
         +----+--------+----------+----------+
-        |  1 |      1 |      nan |       -1 |
+        |  1 |      1 |       -1 |      nan |
         +----+--------+----------+----------+
-        |  2 |      2 |        2 |       -2 |
+        |  2 |      2 |       -2 |        2 |
         +----+--------+----------+----------+
-        |  3 |      3 |      nan |       -3 |
+        |  3 |      3 |       -3 |      nan |
         +----+--------+----------+----------+
-        |  4 |      4 |        4 |       -4 |
+        |  4 |      4 |       -4 |        4 |
         +----+--------+----------+----------+
-        |  5 |      6 |        6 |      nan |
+        |  5 |      6 |      nan |        6 |
         +----+--------+----------+----------+
-        |  6 |      8 |        8 |      nan |
+        |  6 |      8 |      nan |        8 |
         +----+--------+----------+----------+
 
         """
@@ -5851,73 +6040,11 @@ def invert_permutation(perm):
 
 
 @typechecked
-def _inner_join_merge(
-    left: DataFrame,
-    right: DataFrame,
-    on: Union[str, List[str]],
-    col_intersect: Union[str, List[str]],
-    left_suffix: str = "_x",
-    right_suffix: str = "_y",
-    sort: bool = True,
-) -> DataFrame:
-    """
-    Utilizes the ak.join.inner_join function to return an ak
-    DataFrame object containing only rows that are in both
-    the left and right Dataframes, (based on the "on" param),
-    as well as their associated values.
-    Parameters
-    ----------
-    left: DataFrame
-        The Left DataFrame to be joined
-    right: DataFrame
-        The Right DataFrame to be joined
-    on: Optional[Union[str, List[str]]] = None
-        The name or list of names of the DataFrame column(s) to join on.
-        If on is None, this defaults to the intersection of the columns in both DataFrames.
-    left_suffix: str = "_x"
-        A string indicating the suffix to add to columns from the left dataframe for overlapping
-        column names in both left and right. Defaults to "_x"
-    right_suffix: str = "_y"
-        A string indicating the suffix to add to columns from the right dataframe for overlapping
-        column names in both left and right. Defaults to "_y"
-    sort: bool = True
-        If True, DataFrame is returned sorted by "on".
-        Otherwise, the DataFrame is not sorted.
-    Returns
-    -------
-    arkouda.dataframe.DataFrame
-        Inner-Joined Arkouda DataFrame
-    """
-    left_cols, right_cols = left.columns.values.copy(), right.columns.values.copy()
-    if isinstance(on, str):
-        left_inds, right_inds = inner_join(left[on], right[on])
-        new_dict = {on: left[on][left_inds]}
-        left_cols.remove(on)
-        right_cols.remove(on)
-    else:
-        left_inds, right_inds = inner_join([left[col] for col in on], [right[col] for col in on])
-        new_dict = {col: left[col][left_inds] for col in on}
-        for col in on:
-            left_cols.remove(col)
-            right_cols.remove(col)
-
-    for col in left_cols:
-        new_col = col + left_suffix if col in col_intersect else col
-        new_dict[new_col] = left[col][left_inds]
-    for col in right_cols:
-        new_col = col + right_suffix if col in col_intersect else col
-        new_dict[new_col] = right[col][right_inds]
-
-    ret_df = DataFrame(new_dict)
-    if sort is True:
-        ret_df = ret_df.sort_values(on).reset_index()
-    return ret_df
-
-
-def _right_join_merge(
+def _join_merge(
     left: DataFrame,
     right: DataFrame,
     on: Union[str, List[str]],
+    how: str,
     col_intersect: Union[str, List[str]],
     left_suffix: str = "_x",
     right_suffix: str = "_y",
@@ -5925,10 +6052,10 @@ def _right_join_merge(
     sort: bool = True,
 ) -> DataFrame:
     """
-    Utilizes the ak.join.inner_join_merge function to return an
-    ak DataFrame object containing all the rows in the right Dataframe,
-    as well as corresponding rows in the left (based on the "on" param),
-    and all of their associated values.
+    Utilizes the ak.join.hash_join function, or ak.join.merge_join when both
+    DataFrames are already sorted on a single integer "on" column, to return an ak DataFrame
+    object containing the rows of the left and right DataFrames joined
+    as specified by the "how" and "on" params, and their associated values.
     Based on pandas merge functionality.
 
     Parameters
@@ -5937,9 +6064,12 @@ def _right_join_merge(
         The Left DataFrame to be joined
     right: DataFrame
         The Right DataFrame to be joined
-    on: Optional[Union[str, List[str]]] = None
+    on: Union[str, List[str]]
         The name or list of names of the DataFrame column(s) to join on.
-        If on is None, this defaults to the intersection of the columns in both DataFrames.
+    how: str
+        The merge condition, one of "inner", "left", "right" or "outer".
+    col_intersect: Union[str, List[str]]
+        The names of the columns in both DataFrames.
     left_suffix: str = "_x"
         A string indicating the suffix to add to columns from the left dataframe for overlapping
         column names in both left and right. Defaults to "_x"
@@ -5956,144 +6086,53 @@ def _right_join_merge(
     Returns
     -------
     arkouda.dataframe.DataFrame
-        Right-Joined Arkouda DataFrame
+        Joined Arkouda DataFrame
     """
-    in_left = _inner_join_merge(left, right, on, col_intersect, left_suffix, right_suffix, sort=False)
-    in_left_cols, left_cols = in_left.columns.values.copy(), left.columns.values.copy()
-    if isinstance(on, str):
-        left_at_on = left[on]
-        right_at_on = right[on]
-        left_cols.remove(on)
-        in_left_cols.remove(on)
+    on_cols = [on] if isinstance(on, str) else on
+    # Tables already sorted on a single integer key are merged, which leaves them in key order
+    presorted = len(on_cols) == 1 and _merge_joinable(left[on_cols[0]], right[on_cols[0]])
+    if presorted:
+        left_inds, right_inds = merge_join(
+            left[on_cols[0]], right[on_cols[0]], how=how, assume_sorted=True
+        )
     else:
-        left_at_on = [left[col] for col in on]
-        right_at_on = [right[col] for col in on]
-        for col in on:
-            left_cols.remove(col)
-            in_left_cols.remove(col)
-
-    not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
-    for col in not_in_left.columns:
-        if col in left_cols:
-            not_in_left[col + right_suffix] = not_in_left[col]
-            not_in_left = not_in_left.drop(col, axis=1)
-
-    nan_cols = list(set(in_left) - set(not_in_left))
-    for col in nan_cols:
-        if convert_ints is True and in_left[col].dtype == int:
-            in_left[col] = akcast(in_left[col], akfloat64)
-
-        # Create a nan array for all values not in the left df
-        not_in_left[col] = __nulls_like(in_left[col], len(not_in_left))
-    ret_df = DataFrame.append(in_left, not_in_left)
-    if sort is True:
-        ret_df = ret_df.sort_values(on).reset_index()
-    return ret_df
-
-
-def _outer_join_merge(
-    left: DataFrame,
-    right: DataFrame,
-    on: Union[str, List[str]],
-    col_intersect: Union[str, List[str]],
-    left_suffix: str = "_x",
-    right_suffix: str = "_y",
-    convert_ints: bool = True,
-    sort: bool = True,
-) -> DataFrame:
-    """
-    Utilizes the ak.join.inner_join_merge function to return an
-    ak DataFrame object containing all the rows in each DataFrame (based on the "on" param),
-    and all of their associated values.
-    Based on pandas merge functionality.
+        left_inds, right_inds = hash_join(
+            left[on] if isinstance(on, str) else [left[col] for col in on],
+            right[on] if isinstance(on, str) else [right[col] for col in on],
+            how=how,
+        )
 
-    Parameters
-    ----------
-    left: DataFrame
-        The Left DataFrame to be joined
-    right: DataFrame
-        The Right DataFrame to be joined
-    on: Optional[Union[str, List[str]]] = None
-        The name or list of names of the DataFrame column(s) to join on.
-        If on is None, this defaults to the intersection of the columns in both DataFrames.
-    left_suffix: str = "_x"
-        A string indicating the suffix to add to columns from the left dataframe for overlapping
-        column names in both left and right. Defaults to "_x"
-    right_suffix: str = "_y"
-        A string indicating the suffix to add to columns from the right dataframe for overlapping
-        column names in both left and right. Defaults to "_y"
-    convert_ints: bool = True
-        If True, convert columns with missing int values (due to the join) to float64.
-        This is to match pandas.
-        If False, do not convert the column dtypes.
-    sort: bool = True
-        If True, DataFrame is returned sorted by "on".
-        Otherwise, the DataFrame is not sorted.
-    Returns
-    -------
-    arkouda.dataframe.DataFrame
-        Outer-Joined Arkouda DataFrame
-    """
-    inner = _inner_join_merge(left, right, on, col_intersect, left_suffix, right_suffix, sort=False)
-    left_cols, right_cols = (
-        left.columns.values.copy(),
-        right.columns.values.copy(),
-    )
-
-    if isinstance(on, str):
-        left_at_on = left[on]
-        right_at_on = right[on]
-        left_cols.remove(on)
-        right_cols.remove(on)
+    def take(col, inds):
+        # gather col at inds, with nulls where inds is -1
+        missing = inds < 0
+        if not missing.any():
+            return col[inds]
+        if isinstance(col, Categorical):
+            col = col.categories[col.codes]
+        elif convert_ints is True and col.dtype == int:
+            col = akcast(col, akfloat64)
+        padded = concatenate([col, __nulls_like(col, 1)], ordered=True)
+        return padded[where(missing, col.size, inds)]
+
+    # key values come from the left row, or the right row if there is none
+    new_dict = {
+        col: concatenate([left[col], right[col]], ordered=True)[
+            where(left_inds < 0, len(left) + right_inds, left_inds)
+        ]
+        for col in on_cols
+    }
+    for col in left.columns.values:
+        if col not in on_cols:
+            new_col = col + left_suffix if col in col_intersect else col
+            new_dict[new_col] = take(left[col], left_inds)
+    for col in right.columns.values:
+        if col not in on_cols:
+            new_col = col + right_suffix if col in col_intersect else col
+            new_dict[new_col] = take(right[col], right_inds)
 
-    else:
-        left_at_on = [left[col] for col in on]
-        right_at_on = [right[col] for col in on]
-        for col in on:
-            left_cols.remove(col)
-            right_cols.remove(col)
-
-    not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
-    for col in not_in_left.columns:
-        if col in left_cols:
-            not_in_left[col + right_suffix] = not_in_left[col]
-            not_in_left = not_in_left.drop(col, axis=1)
-
-    not_in_right = left[in1d(left_at_on, right_at_on, invert=True)]
-    for col in not_in_right.columns:
-        if col in right_cols:
-            not_in_right[col + left_suffix] = not_in_right[col]
-            not_in_right = not_in_right.drop(col, axis=1)
-
-    left_nan_cols = list(set(inner) - set(not_in_left))
-    right_nan_cols = list(set(inner) - set(not_in_right))
-
-    for col in set(left_nan_cols).union(set(right_nan_cols)):
-        if convert_ints is True and inner[col].dtype == int:
-            inner[col] = akcast(inner[col], akfloat64)
-        if col in left_nan_cols:
-            if convert_ints is True and not_in_right[col].dtype == int:
-                not_in_right[col] = akcast(not_in_right[col], akfloat64)
-            elif col in not_in_left.columns.values:
-                not_in_right[col] = akcast(not_in_right[col], not_in_left[col].dtype)
-        if col in right_nan_cols:
-            if convert_ints is True and not_in_left[col].dtype == int:
-                not_in_left[col] = akcast(not_in_left[col], akfloat64)
-            elif col in not_in_right.columns.values:
-                not_in_left[col] = akcast(not_in_left[col], not_in_right[col].dtype)
-
-    for col in left_nan_cols:
-        # Create a nan array for all values not in the left df
-        not_in_left[col] = __nulls_like(inner[col], len(not_in_left))
-
-    for col in right_nan_cols:
-        # Create a nan array for all values not in the left df
-        not_in_right[col] = __nulls_like(inner[col], len(not_in_right))
-
-    ret_df = DataFrame.append(DataFrame.append(inner, not_in_left), not_in_right)
-    if sort is True:
+    ret_df = DataFrame(new_dict)
+    if sort is True and not presorted:
         ret_df = ret_df.sort_values(on).reset_index()
-
     return ret_df
 
 
@@ -6155,10 +6194,10 @@ def merge(
         Must be one of "inner", "left", "right", or "outer".
     left_suffix: str, default = "_x"
         A string indicating the suffix to add to columns from the left dataframe for overlapping
-        column names in both left and right. Defaults to "_x". Only used when how is "inner".
+        column names in both left and right. Defaults to "_x".
     right_suffix: str, default = "_y"
         A string indicating the suffix to add to columns from the right dataframe for overlapping
-        column names in both left and right. Defaults to "_y". Only used when how is "inner".
+        column names in both left and right. Defaults to "_y".
     convert_ints: bool = True
         If True, convert columns with missing int values (due to the join) to float64.
         This is to match pandas.
@@ -6167,6 +6206,8 @@ def merge(
     sort: bool = True
         If True, DataFrame is returned sorted by "on".
         Otherwise, the DataFrame is not sorted.
+        If both DataFrames are already sorted on a single int64 or uint64 "on"
+        column, they are merged in key order and not sorted again.
     Returns
     -------
     arkouda.dataframe.DataFrame
@@ -6231,17 +6272,17 @@ def merge(
     >>> merge(left_df, right_df, on = "col1", how = "left")
 
     +----+--------+----------+----------+
-    |    |   col1 |   col2_y |   col2_x |
+    |    |   col1 |   col2_x |   col2_y |
     +====+========+==========+==========+
     |  0 |      0 |        0 |        0 |
     +----+--------+----------+----------+
-    |  1 |      1 |      nan |       -1 |
+    |  1 |      1 |       -1 |      nan |
     +----+--------+----------+----------+
-    |  2 |      2 |        2 |       -2 |
+    |  2 |      2 |       -2 |        2 |
     +----+--------+----------+----------+
-    |  3 |      3 |      nan |       -3 |
+    |  3 |      3 |       -3 |      nan |
     +----+--------+----------+----------+
-    |  4 |      4 |        4 |       -4 |
+    |  4 |      4 |       -4 |        4 |
     +----+--------+----------+----------+
 
     >>> merge(left_df, right_df, on = "col1", how = "right")
@@ -6263,21 +6304,21 @@ def merge(
     >>> merge(left_df, right_df, on = "col1", how = "outer")
 
     +----+--------+----------+----------+
-    |    |   col1 |   col2_y |   col2_x |
+    |    |   col1 |   col2_x |   col2_y |
     +====+========+==========+==========+
     |  0 |      0 |        0 |        0 |
     +----+--------+----------+----------+
-    |  1 |      1 |      nan |       -1 |
+    |  1 |      1 |       -1 |      nan |
     +----+--------+----------+----------+
-    |  2 |      2 |        2 |       -2 |
+    |  2 |      2 |       -2 |        2 |
     +----+--------+----------+----------+
-    |  3 |      3 |      nan |       -3 |
+    |  3 |      3 |       -3 |      nan |
     +----+--------+----------+----------+
-    |  4 |      4 |        4 |       -4 |
+    |  4 |      4 |       -4 |        4 |
     +----+--------+----------+----------+
-    |  5 |      6 |        6 |      nan |
+    |  5 |      6 |      nan |        6 |
     +----+--------+----------+----------+
-    |  6 |      8 |        8 |      nan |
+    |  6 |      8 |      nan |        8 |
     +----+--------+----------+----------+
 
     """
@@ -6291,43 +6332,21 @@ def merge(
         ):
             raise ValueError("All columns of a multi-column merge must be pdarrays")
 
-    if how == "inner":
-        return _inner_join_merge(left, right, on, col_intersect, left_suffix, right_suffix, sort=sort)
-    elif how == "right":
-        return _right_join_merge(
-            left,
-            right,
-            on,
-            col_intersect,
-            left_suffix,
-            right_suffix,
-            convert_ints=convert_ints,
-            sort=sort,
-        )
-    elif how == "left":
-        return _right_join_merge(
-            right,
-            left,
-            on,
-            col_intersect,
-            right_suffix,
-            left_suffix,
-            convert_ints=convert_ints,
-            sort=sort,
-        )
-    elif how == "outer":
+    if how == "outer":
         warn(
             "Outer joins should not be performed on large data sets as they may require "
             "prohibitive amounts of memory.",
             UserWarning,
         )
-        return _outer_join_merge(
-            right,
+    if how in ("inner", "left", "right", "outer"):
+        return _join_merge(
             left,
+            right,
             on,
+            how,
             col_intersect,
-            right_suffix,
             left_suffix,
+            right_suffix,
             convert_ints=convert_ints,
             sort=sort,
         )
@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Dict,
     List,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -18,6 +19,7 @@ from arkouda.dtypes import dtype as akdtype
 
 if TYPE_CHECKING:
     from arkouda.categorical import Categorical
+    from arkouda.dataframe import DataFrame
 
 import numpy as np
 from typeguard import typechecked
@@ -30,13 +32,13 @@ from arkouda.dtypes import int64 as akint64
 from arkouda.dtypes import int_scalars
 from arkouda.dtypes import uint64 as akuint64
 from arkouda.logger import getArkoudaLogger
-from arkouda.pdarrayclass import RegistrationError, create_pdarray, is_sorted, pdarray
-from arkouda.pdarraycreation import arange, full
+from arkouda.pdarrayclass import RegistrationError, create_pdarray, pdarray
+from arkouda.pdarraycreation import arange, full, zeros
 from arkouda.random import default_rng
-from arkouda.sorting import argsort, sort
+from arkouda.sorting import argsort, coargsort, sort
 from arkouda.strings import Strings
 
-__all__ = ["unique", "GroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES"]
+__all__ = ["unique", "GroupBy", "IncrementalGroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES"]
 
 groupable_element_type = Union[pdarray, Strings, "Categorical"]
 groupable = Union[groupable_element_type, Sequence[groupable_element_type]]
@@ -68,6 +70,7 @@ def unique(
     return_groups: bool = False,
     assume_sorted: bool = False,
     return_indices: bool = False,
+    method: str = "sort",
 ) -> Union[groupable, Tuple[groupable, pdarray, pdarray, int]]:
     """
     Find the unique elements of an array.
@@ -87,11 +90,17 @@ def unique(
     return_indices: bool, optional
         Only applicable if return_groups is True.
         If True, return unique key indices along with other groups
+    method: str, optional
+        How the unique values are found: "sort" (the default) sorts the values,
+        while "hash" groups them with hash tables, which is faster when there
+        are few unique values. Ignored if assume_sorted is True.
 
     Returns
     -------
     unique : (list of) pdarray, Strings, or Categorical
-        The unique values. If input dtype is int64, return values will be sorted.
+        The unique values. If input dtype is int64 and method is "sort", return
+        values will be sorted. If method is "hash", they are in order of first
+        occurrence.
     permutation : pdarray, optional
         Permutation that groups equivalent values together (only when return_groups=True)
     segments : pdarray, optional
@@ -101,6 +110,8 @@ def unique(
     ------
     TypeError
         Raised if pda is not a pdarray or Strings object
+    ValueError
+        Raised if method is not "sort" or "hash"
     RuntimeError
         Raised if the pdarray or Strings dtype is unsupported
 
@@ -118,6 +129,8 @@ def unique(
     """
     from arkouda.categorical import Categorical as Categorical_
 
+    if method not in ("sort", "hash"):
+        raise ValueError(f"method must be 'sort' or 'hash', not {method}")
     if not return_groups and hasattr(pda, "unique"):
         return cast(Categorical_, pda).unique()
 
@@ -126,23 +139,34 @@ def unique(
     keynames = [k.name for k in grouping_keys]
     keytypes = [k.objType for k in grouping_keys]
     effectiveKeys = len(grouping_keys)
-    repMsg = generic_msg(
-        cmd="unique",
-        args={
-            "returnGroupStr": return_groups,
-            "assumeSortedStr": assume_sorted,
-            "nstr": effectiveKeys,
-            "keynames": keynames,
-            "keytypes": keytypes,
-        },
-    )
-    if return_groups:
-        parts = cast(str, repMsg).split("+")
-        permutation = create_pdarray(cast(str, parts[0]))
-        segments = create_pdarray(cast(str, parts[1]))
-        unique_key_indices = create_pdarray(cast(str, parts[2]))
+    if method == "hash" and not assume_sorted:
+        # grouping by hash always creates the groups
+        parts = cast(
+            str,
+            generic_msg(
+                cmd="hashGroupBy",
+                args={"nstr": effectiveKeys, "keynames": keynames, "keytypes": keytypes},
+            ),
+        ).split("+")
+        permutation, segments, unique_key_indices = (create_pdarray(p) for p in parts)
     else:
-        unique_key_indices = create_pdarray(cast(str, repMsg))
+        repMsg = generic_msg(
+            cmd="unique",
+            args={
+                "returnGroupStr": return_groups,
+                "assumeSortedStr": assume_sorted,
+                "nstr": effectiveKeys,
+                "keynames": keynames,
+                "keytypes": keytypes,
+            },
+        )
+        if return_groups:
+            parts = cast(str, repMsg).split("+")
+            permutation = create_pdarray(cast(str, parts[0]))
+            segments = create_pdarray(cast(str, parts[1]))
+            unique_key_indices = create_pdarray(cast(str, parts[2]))
+        else:
+            unique_key_indices = create_pdarray(cast(str, repMsg))
 
     if nkeys == 1 and not isinstance(pda, Sequence):
         unique_keys = pda[unique_key_indices]
@@ -208,6 +232,13 @@ class GroupBy:
         The array to group by value, or if list, the column arrays to group by row
     assume_sorted : bool
         If True, assume keys is already sorted (Default: False)
+    method : str
+        How the groups are found: "sort" (the default) sorts the keys, while
+        "hash" groups them with hash tables instead, which is faster when there
+        are few groups. With "hash", unique_keys are in order of first
+        occurrence rather than sorted, and the server sorts the keys instead
+        when a locale holds more distinct keys than its
+        ARKOUDA_SERVER_HASH_GROUPBY_MAX_GROUPS setting (65536 by default).
 
     Attributes
     ----------
@@ -253,6 +284,13 @@ class GroupBy:
 
     Reductions = GROUPBY_REDUCTION_TYPES
 
+    # reductions that only compare values for equality, so values other than
+    # numeric pdarrays can be reduced through the index of each distinct value
+    _equality_reductions = frozenset(["nunique", "first", "mode", "unique"])
+
+    # reductions returning more than one array, which agg requests separately
+    _unfused_reductions = frozenset(["unique"])
+
     objType = "GroupBy"
 
     def __init__(
@@ -260,6 +298,7 @@ class GroupBy:
         keys: Optional[groupable] = None,
         assume_sorted: bool = False,
         dropna: bool = True,
+        method: str = "sort",
         **kwargs,
     ):
         from arkouda.numeric import isnan
@@ -337,6 +376,7 @@ class GroupBy:
                 return_groups=True,
                 return_indices=True,
                 assume_sorted=self.assume_sorted,
+                method=method,
             )
         self.length = self.permutation.size
         self.ngroups = self.segments.size
@@ -637,15 +677,13 @@ class GroupBy:
         if operator not in self.Reductions:
             raise ValueError(f"Unsupported reduction: {operator}\nMust be one of {self.Reductions}")
 
-        # TO DO: remove once logic is ported over to Chapel
-        if operator == "nunique":
-            return self.nunique(values)
         if operator == "first":
+            # gathering the first row of each group is O(ngroups), unlike permuting the values
             return self.first(cast(groupable_element_type, values))
-        if operator == "mode":
-            return self.mode(values)
-        if operator == "unique":
-            return self.unique(values)
+        if operator in self._equality_reductions and (
+            not isinstance(values, pdarray) or values.dtype == bigint
+        ):
+            return self._aggregate_by_index(values, operator)
 
         # All other aggregations operate on pdarray
         if cast(pdarray, values).size != self.length:
@@ -667,6 +705,11 @@ class GroupBy:
             },
         )
         self.logger.debug(repMsg)
+        if operator == "unique":
+            from arkouda.segarray import SegArray
+
+            segments, unique_values = cast(str, repMsg).split("+")
+            return self.unique_keys, SegArray(create_pdarray(segments), create_pdarray(unique_values))
         if operator.startswith("arg"):
             return (
                 self.unique_keys,
@@ -675,6 +718,180 @@ class GroupBy:
         else:
             return self.unique_keys, create_pdarray(repMsg)
 
+    def _aggregate_by_index(self, values: groupable, operator: str) -> Tuple[groupable, groupable]:
+        """
+        Compute an equality reduction of values the server cannot reduce
+        directly, e.g. Strings or a sequence of arrays, by numbering the
+        distinct values in sorted order, reducing their numbers, and looking
+        the results up in the sorted distinct values.
+        """
+        from arkouda.categorical import Categorical
+        from arkouda.segarray import SegArray
+
+        if operator == "unique" and (
+            isinstance(values, (Strings, Categorical))
+            or (
+                isinstance(values, Sequence)
+                and any([isinstance(v, (Strings, Categorical)) for v in values])
+            )
+        ):
+            raise TypeError("Groupby.unique not supported on Strings or Categorical")
+
+        g = GroupBy(values)
+        if g.length != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        if isinstance(g.unique_keys, (list, tuple)):
+            order = coargsort(list(g.unique_keys))
+            distinct = [k[order] for k in g.unique_keys]
+        else:
+            order = argsort(g.unique_keys)
+            distinct = g.unique_keys[order]
+        rank = zeros(g.ngroups, dtype=akint64)
+        rank[order] = arange(g.ngroups)
+        _, result = self.aggregate(g.broadcast(rank, permute=True), operator)
+
+        def lookup(idx: pdarray) -> groupable:
+            return [d[idx] for d in distinct] if isinstance(distinct, list) else distinct[idx]
+
+        if operator == "mode":
+            return self.unique_keys, lookup(cast(pdarray, result))
+        if operator == "unique":
+            result = cast(SegArray, result)
+            unique_values = lookup(result.values)
+            if isinstance(unique_values, list):
+                return self.unique_keys, [SegArray(result.segments, uv) for uv in unique_values]
+            return self.unique_keys, SegArray(result.segments, unique_values)
+        return self.unique_keys, result
+
+    def agg(
+        self,
+        values: Mapping[str, groupable],
+        operators: Union[str, Sequence[str], Mapping[str, Union[str, Sequence[str]]]],
+        skipna: bool = True,
+        ddof: int_scalars = 1,
+    ) -> DataFrame:
+        """
+        Apply several reductions to several arrays of values, returning the
+        aggregates in a DataFrame indexed by the unique keys. Each array of
+        values is permuted into grouped order once, and all reductions are
+        computed by the server in a single request, instead of one request
+        and one permutation per (array, operator) pair as with aggregate.
+
+        Parameters
+        ----------
+        values : Mapping[str, groupable]
+            The arrays of values to group and reduce, by name
+        operators : str, Sequence[str], or Mapping[str, str or Sequence[str]]
+            The names of the reduction operators to apply to all of values,
+            or to each array of values by name
+        skipna: bool
+            boolean which determines if NANs should be skipped
+        ddof : int_scalars
+            "Delta Degrees of Freedom" used in calculating var and std
+
+        Returns
+        -------
+        DataFrame
+            One column per (array, operator) pair, labeled with the name of the
+            array if a single operator is given for it as a str, and
+            <name>_<operator> otherwise
+
+        Raises
+        ------
+        KeyError
+            Raised if operators names an array not in values
+        ValueError
+            Raised if an array of values does not have the size of the keys or
+            if an operator is not in the GroupBy.Reductions array
+        RuntimeError
+            Raised if a requested operator is not supported for the values dtype
+
+        See Also
+        --------
+        aggregate
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1]))
+        >>> g.agg({"a": ak.array([1, 2, 3, 4]), "b": ak.array([1.0, 0.5, 2.0, 0.5])},
+        ...       {"a": ["sum", "max"], "b": "mean"})
+           a_sum  a_max     b
+        0      4      3  1.5
+        1      6      4  0.5 (2 rows x 3 columns)
+        """
+        from arkouda.dataframe import DataFrame
+        from arkouda.index import Index, MultiIndex
+
+        if not isinstance(self.unique_keys, Sequence):
+            index = Index(self.unique_keys)
+        elif len(self.unique_keys) == 1:
+            index = Index(self.unique_keys[0])
+        else:
+            index = MultiIndex(list(self.unique_keys))
+        return DataFrame(self._aggregate_many(values, operators, skipna, ddof), index=index)
+
+    def _aggregate_many(
+        self,
+        values: Mapping[str, groupable],
+        operators: Union[str, Sequence[str], Mapping[str, Union[str, Sequence[str]]]],
+        skipna: bool = True,
+        ddof: int_scalars = 1,
+    ) -> Dict[str, groupable]:
+        """
+        Compute the aggregates of agg, returning them by column label. Each
+        pdarray of values is permuted once, and its reductions are done with
+        those of the other pdarrays by a single multiSegmentedReduction
+        request. Other reductions fall back to aggregate.
+        """
+        if isinstance(operators, str) or not isinstance(operators, Mapping):
+            operators = {name: operators for name in values}
+        labels, requests = [], []
+        for name, ops in operators.items():
+            if name not in values:
+                raise KeyError(f"No values named {name}")
+            for op in [ops] if isinstance(ops, str) else ops:
+                op = op.lower()
+                if op not in self.Reductions:
+                    raise ValueError(f"Unsupported reduction: {op}\nMust be one of {self.Reductions}")
+                labels.append(name if isinstance(ops, str) else f"{name}_{op}")
+                requests.append((name, op))
+
+        aggregates: List = [None] * len(requests)
+        permuted: Dict[str, pdarray] = {}
+        fused = []
+        for i, (name, op) in enumerate(requests):
+            vals = values[name]
+            if (
+                op in self._unfused_reductions
+                # first gathers one row per group rather than permuting the values
+                or op == "first"
+                or not isinstance(vals, pdarray)
+                or (op in self._equality_reductions and vals.dtype == bigint)
+            ):
+                aggregates[i] = self.aggregate(vals, op, skipna=skipna, ddof=ddof)[1]
+                continue
+            if name not in permuted:
+                if vals.size != self.length:
+                    raise ValueError("Attempt to group array using key array of different length")
+                permuted[name] = vals if self.assume_sorted else vals[cast(pdarray, self.permutation)]
+            fused.append(i)
+
+        if fused:
+            repMsg = generic_msg(
+                cmd="multiSegmentedReduction",
+                args={
+                    "values": [permuted[requests[i][0]] for i in fused],
+                    "ops": [requests[i][1] for i in fused],
+                    "segments": self.segments,
+                    "skip_nan": skipna,
+                    "ddof": ddof,
+                },
+            )
+            for i, msg in zip(fused, cast(str, repMsg).split("+")):
+                agg = create_pdarray(msg)
+                aggregates[i] = self.permutation[agg] if requests[i][1].startswith("arg") else agg
+        return dict(zip(labels, aggregates))
+
     def sum(self, values: pdarray, skipna: bool = True) -> Tuple[groupable, pdarray]:
         """
         Using the permutation stored in the GroupBy instance, group
@@ -1202,25 +1419,6 @@ class GroupBy:
         k, v = self.aggregate(values, "argmax")
         return k, cast(pdarray, v)
 
-    def _nested_grouping_helper(self, values: groupable) -> groupable:
-        unique_key_idx = self.broadcast(arange(self.ngroups), permute=True)
-        if hasattr(values, "_get_grouping_keys"):
-            # All single-array groupable types must have a _get_grouping_keys method
-            if isinstance(values, pdarray) and values.dtype == akfloat64:
-                raise TypeError("grouping/uniquing unsupported for float64 arrays")
-            togroup = [unique_key_idx, values]
-        else:
-            # Treat as a sequence of groupable arrays
-            for v in values:
-                if isinstance(v, pdarray) and v.dtype not in [
-                    akint64,
-                    akuint64,
-                    bigint,
-                ]:
-                    raise TypeError("grouping/uniquing unsupported for this dtype")
-            togroup = [unique_key_idx] + list(values)
-        return togroup
-
     def nunique(self, values: groupable) -> Tuple[groupable, pdarray]:
         """
         Using the permutation stored in the GroupBy instance, group another
@@ -1228,7 +1426,7 @@ class GroupBy:
 
         Parameters
         ----------
-        values : pdarray, int64
+        values : (list of) pdarray-like
             The values to group and find unique values
 
         Returns
@@ -1267,22 +1465,7 @@ class GroupBy:
         #    Group (3,3,3) has values [3,4,1] -> 3 unique values
         #    Group (4) has values [4] -> 1 unique value
         """
-        # TO DO: defer to self.aggregate once logic is ported over to Chapel
-        # return self.aggregate(values, "nunique")
-        togroup = self._nested_grouping_helper(values)
-        # Find unique pairs of (key, val)
-        g = GroupBy(togroup)
-        # Group unique pairs again by original key
-        g2 = GroupBy(g.unique_keys[0], assume_sorted=False)
-        # Count number of values per key
-        keyorder, nuniq = g2.size()
-        # The last GroupBy *should* result in sorted key indices, but in case it
-        # doesn't, we need to permute the answer to match the original key order
-        if not is_sorted(keyorder):
-            perm = argsort(keyorder)
-            nuniq = nuniq[perm]
-        # Re-join unique counts with original keys (sorting guarantees same order)
-        return self.unique_keys, nuniq
+        return self.aggregate(values, "nunique")
 
     def any(self, values: pdarray) -> Tuple[Union[pdarray, List[Union[pdarray, Strings]]], pdarray]:
         """
@@ -1632,7 +1815,9 @@ class GroupBy:
         """
         # Index of first value in each segment, in input domain
         first_idx = self.permutation[self.segments]
-        return self.unique_keys, values[first_idx]
+        if hasattr(values, "_get_grouping_keys"):
+            return self.unique_keys, values[first_idx]
+        return self.unique_keys, [v[first_idx] for v in cast(Sequence, values)]
 
     def mode(self, values: groupable) -> Tuple[groupable, groupable]:
         """
@@ -1651,31 +1836,7 @@ class GroupBy:
         result : (list of) pdarray-like
             The most common value of each group
         """
-        togroup = self._nested_grouping_helper(values)
-        # Get value counts for each key group
-        g = GroupBy(togroup)
-        keys_values, value_count = g.size()
-        # Descending rank of first instance of each (key, value) pair
-        first_rank = g.length - g.permutation[g.segments]
-        ki, unique_values = keys_values[0], keys_values[1:]
-        # Find the index of the modal value for each unique key
-        # If more than one modal value, this will get the first one
-        g2 = GroupBy(ki)
-        uki, mode_count = g2.max(value_count)
-        # First value for which value count is maximized
-        _, mode_idx = g2.argmax(first_rank * (value_count == g2.broadcast(mode_count)))
-        # GroupBy should be stable with a single key array, but
-        # if for some reason these unique keys are not in original
-        # order, then permute them accordingly
-        if not cast(pdarray, (uki == arange(self.ngroups))).all():
-            mode_idx = mode_idx[argsort(cast(pdarray, uki))]
-        # Gather values at mode indices
-        if len(unique_values) == 1:
-            # squeeze singletons
-            mode = unique_values[0][mode_idx]
-        else:
-            mode = [uv[mode_idx] for uv in unique_values]
-        return self.unique_keys, mode
+        return self.aggregate(values, "mode")
 
     def sample(
         self,
@@ -1856,41 +2017,7 @@ class GroupBy:
         TypeError
             Raised if values is or contains Strings or Categorical
         """
-        from arkouda import Categorical
-        from arkouda.segarray import SegArray
-
-        if isinstance(values, (Strings, Categorical)) or (
-            isinstance(values, Sequence) and any([isinstance(v, (Strings, Categorical)) for v in values])
-        ):
-            raise TypeError("Groupby.unique not supported on Strings or Categorical")
-
-        togroup = self._nested_grouping_helper(values)
-        # Group to unique (key, value) pairs
-        g = GroupBy(togroup)
-        ki, unique_values = g.unique_keys[0], g.unique_keys[1:]
-        # Group pairs by key
-        g2 = GroupBy(ki)
-        # GroupBy should be stable with a single key array, but
-        # if for some reason these unique keys are not in original
-        # order, then permute them accordingly
-        if not (g2.unique_keys == arange(self.ngroups)).all():
-            perm = argsort(cast(pdarray, g2.unique_keys))
-            reorder = True
-        else:
-            reorder = False
-        # Form a SegArray for each value array
-        # Segments are from grouping by key indices
-        # Values are the unique elements of the values arg
-        if len(unique_values) == 1:
-            # Squeeze singleton results
-            ret = SegArray(g2.segments, unique_values[0])
-            if reorder:
-                ret = ret[perm]
-        else:
-            ret = [SegArray(g2.segments, uv) for uv in unique_values]  # type: ignore
-            if reorder:
-                ret = [r[perm] for r in ret]  # type: ignore
-        return self.unique_keys, ret
+        return self.aggregate(values, "unique")
 
     @typechecked
     def broadcast(
@@ -2266,6 +2393,445 @@ class GroupBy:
         return self.mode(values)
 
 
+def _mutation_count(column: groupable_element_type) -> int:
+    """
+    The number of in-place modifications of the pdarrays holding the values of column
+    """
+    count = getattr(column, "_mutations", 0)
+    for attr in ("values", "codes"):
+        component = getattr(column, attr, None)
+        if isinstance(component, pdarray) and component is not column:
+            count += component._mutations
+    return count
+
+
+class _GroupByCache:
+    """
+    A bounded cache of GroupBy objects, keyed by the identity of their key
+    columns and by dropna, so that repeated operations on the same columns
+    reuse one grouping instead of sorting the columns again.
+
+    The cache holds at most ``maxsize`` groupings, and no more than
+    ``mem_fraction`` of the server memory still available; the least
+    recently used groupings are dropped first. Since columns are matched by
+    identity and by the number of times the pdarrays holding them have been
+    modified in place, a replaced or modified column misses the cache.
+    """
+
+    maxsize = 8
+    mem_fraction = 0.1
+
+    def __init__(self) -> None:
+        # key -> (key columns, GroupBy, bytes), in order of use
+        self._entries: Dict[Tuple, Tuple[Tuple, GroupBy, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, keys: Sequence[groupable_element_type], dropna: bool = True) -> GroupBy:
+        """
+        Return the GroupBy of the key columns, creating it if it is not cached
+        """
+        keys = tuple(keys)
+        ids = tuple(id(k) for k in keys)
+        key = (ids, tuple(_mutation_count(k) for k in keys), dropna)
+        entry = self._entries.pop(key, None)
+        # ids are only reused once the columns are freed, but the entry keeps them alive
+        if entry is not None and all(a is b for a, b in zip(entry[0], keys)):
+            self._entries[key] = entry
+            return entry[1]
+        gb = GroupBy(keys[0] if len(keys) == 1 else list(keys), dropna=dropna)
+        self._put(key, keys, gb)
+        return gb
+
+    def _put(self, key: Tuple, keys: Tuple, gb: GroupBy) -> None:
+        from arkouda.client import get_mem_avail
+
+        # the groupings of the same columns before they were modified are stale
+        for stale in [k for k in self._entries if k[0] == key[0] and k[2] == key[2]]:
+            del self._entries[stale]
+        nbytes = gb.permutation.nbytes + gb.segments.nbytes
+        nbytes += sum(k.nbytes for k in (gb.unique_keys if gb.nkeys > 1 else [gb.unique_keys]))
+        self._entries[key] = (keys, gb, nbytes)
+        limit = self.mem_fraction * (get_mem_avail() + self.nbytes)
+        while self._entries and (len(self._entries) > self.maxsize or self.nbytes > limit):
+            del self._entries[next(iter(self._entries))]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of server bytes held by the cached groupings
+        """
+        return sum(entry[2] for entry in self._entries.values())
+
+    def invalidate(self, column: groupable_element_type) -> None:
+        """
+        Drop the cached groupings that have column as a key
+        """
+        for key in [k for k, entry in self._entries.items() if any(c is column for c in entry[0])]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class IncrementalGroupBy:
+    """
+    Group rows that arrive in batches, keeping mergeable partial aggregates
+    of their values, so that each new batch is folded into the existing
+    groups without regrouping the rows seen before.
+
+    Parameters
+    ----------
+    keys : groupable or GroupBy, optional
+        The keys of the first batch of rows, or a GroupBy of them
+    values : Mapping[str, pdarray], optional
+        The int64, uint64 or float64 values of the first batch of rows to
+        aggregate, by name
+
+    Attributes
+    ----------
+    unique_keys : groupable
+        The keys of the groups seen so far, in grouped order
+    ngroups : int
+        The number of groups seen so far
+    nrows : int
+        The number of rows folded in so far
+
+    Raises
+    ------
+    TypeError
+        Raised if values are not int64, uint64 or float64 pdarrays
+    ValueError
+        Raised if values are not named the same in every batch
+
+    See Also
+    --------
+    GroupBy
+
+    Notes
+    -----
+    For each group and array of values, the count, sum, min, max, mean and
+    sum of squared deviations from the mean are kept, which is enough to
+    merge the sum, count, min, max, mean, var and std of two sets of rows.
+    An update groups the new rows, then groups the concatenated unique keys
+    of the existing groups and of the batch to merge their partial
+    aggregates, so its cost is proportional to the batch size plus the
+    number of groups, rather than to the number of rows seen so far.
+    NaN values are skipped.
+
+    Examples
+    --------
+    >>> igb = ak.IncrementalGroupBy(ak.array([0, 1, 0]), {"v": ak.array([1.0, 2.0, 3.0])})
+    >>> igb.update(ak.array([1, 2]), {"v": ak.array([4.0, 5.0])}).mean("v")
+    (array([0 1 2]), array([2.00000000000000000 3.00000000000000000 5.00000000000000000]))
+    >>> igb.size()
+    (array([0 1 2]), array([2 2 1]))
+    """
+
+    # the reductions of each batch that make up the partial aggregates, var being taken with ddof=0
+    _partials = ["count", "sum", "min", "max", "mean", "var"]
+
+    def __init__(
+        self,
+        keys: Optional[Union[groupable, GroupBy]] = None,
+        values: Optional[Mapping[str, pdarray]] = None,
+    ):
+        self.unique_keys: Optional[groupable] = None
+        self.nrows = 0
+        self._sizes: Optional[pdarray] = None
+        self._partial_aggregates: Dict[str, Dict[str, pdarray]] = {}
+        if keys is not None:
+            self.update(keys, values)
+
+    @property
+    def ngroups(self) -> int:
+        return 0 if self._sizes is None else int(self._sizes.size)
+
+    def update(
+        self, keys: Union[groupable, GroupBy], values: Optional[Mapping[str, pdarray]] = None
+    ) -> IncrementalGroupBy:
+        """
+        Fold a batch of rows into the groups.
+
+        Parameters
+        ----------
+        keys : groupable or GroupBy
+            The keys of the new rows, or a GroupBy of them
+        values : Mapping[str, pdarray], optional
+            The values of the new rows, by name
+
+        Returns
+        -------
+        IncrementalGroupBy
+            This IncrementalGroupBy, updated
+
+        Raises
+        ------
+        TypeError
+            Raised if values are not int64, uint64 or float64 pdarrays
+        ValueError
+            Raised if values are not named as in earlier batches, or differ in
+            size from keys
+        """
+        from arkouda.numeric import where
+
+        values = {} if values is None else values
+        if self._sizes is not None and set(values) != set(self._partial_aggregates):
+            raise ValueError(
+                f"Expected values named {sorted(self._partial_aggregates)}, got {sorted(values)}"
+            )
+        for name, vals in values.items():
+            if not isinstance(vals, pdarray) or vals.dtype not in (akint64, akuint64, akfloat64):
+                raise TypeError(f"Values {name} must be an int64, uint64 or float64 pdarray")
+        g = keys if isinstance(keys, GroupBy) else GroupBy(keys)
+        if g.length == 0:
+            return self
+
+        batch_keys, sizes = g.size()
+        aggregates = g._aggregate_many(values, self._partials, skipna=True, ddof=0)
+        partials = {}
+        for name in values:
+            count = cast(pdarray, aggregates[f"{name}_count"])
+            partials[name] = {
+                "count": count,
+                "sum": cast(pdarray, aggregates[f"{name}_sum"]),
+                "min": cast(pdarray, aggregates[f"{name}_min"]),
+                "max": cast(pdarray, aggregates[f"{name}_max"]),
+                # groups without values contribute nothing to the mean or m2
+                "mean": where(count > 0, aggregates[f"{name}_mean"], 0.0),
+                "m2": where(count > 0, aggregates[f"{name}_var"] * count, 0.0),
+            }
+        self.nrows += int(sizes.sum())
+        if self._sizes is None:
+            self.unique_keys, self._sizes, self._partial_aggregates = batch_keys, sizes, partials
+        else:
+            self._merge(batch_keys, sizes, partials)
+        return self
+
+    def _merge(self, keys: groupable, sizes: pdarray, partials: Dict[str, Dict[str, pdarray]]) -> None:
+        """
+        Merge the partial aggregates of a batch into those of the existing
+        groups, using the pairwise update of the mean and m2 of Chan et al.
+        All of the partials are reduced by one _aggregate_many request.
+        """
+        from arkouda.numeric import where
+        from arkouda.pdarraysetops import concatenate
+
+        def cat(old, new):
+            if isinstance(old, (list, tuple)):
+                return [concatenate([o, n], ordered=False) for o, n in zip(old, new)]
+            return concatenate([old, new], ordered=False)
+
+        g = GroupBy(cat(self.unique_keys, keys))
+        values: Dict[str, groupable] = {"sizes": cat(self._sizes, sizes)}
+        operators: Dict[str, Union[str, List[str]]] = {"sizes": "sum"}
+        for i, (name, new) in enumerate(partials.items()):
+            old = self._partial_aggregates[name]
+            count = cat(old["count"], new["count"])
+            values.update(
+                {
+                    f"{i}_count": count,
+                    f"{i}_count2": count * count,
+                    f"{i}_sum": cat(old["sum"], new["sum"]),
+                    f"{i}_min": cat(old["min"], new["min"]),
+                    f"{i}_max": cat(old["max"], new["max"]),
+                    f"{i}_mean": cat(old["mean"], new["mean"]),
+                    f"{i}_m2": cat(old["m2"], new["m2"]),
+                }
+            )
+            operators.update(
+                {
+                    f"{i}_count": "sum",
+                    f"{i}_count2": "sum",
+                    f"{i}_sum": "sum",
+                    f"{i}_min": "min",
+                    f"{i}_max": "max",
+                    f"{i}_mean": ["min", "max"],
+                    f"{i}_m2": "sum",
+                }
+            )
+        aggregates = g._aggregate_many(values, operators)
+
+        self.unique_keys, self._sizes = g.unique_keys, cast(pdarray, aggregates["sizes"])
+        for i, name in enumerate(partials):
+            count = cast(pdarray, aggregates[f"{i}_count"])
+            merged_sum = cast(pdarray, aggregates[f"{i}_sum"])
+            # a group has at most two partials, whose means differ by max - min and
+            # whose counts multiply to (count**2 - count2) / 2
+            delta = cast(pdarray, aggregates[f"{i}_mean_max"]) - aggregates[f"{i}_mean_min"]
+            cross = (count * count - aggregates[f"{i}_count2"]) / (2 * count)
+            self._partial_aggregates[name] = {
+                "count": count,
+                "sum": merged_sum,
+                "min": cast(pdarray, aggregates[f"{i}_min"]),
+                "max": cast(pdarray, aggregates[f"{i}_max"]),
+                "mean": where(count > 0, merged_sum / count, 0.0),
+                "m2": aggregates[f"{i}_m2"] + where(count > 0, delta * delta * cross, 0.0),
+            }
+
+    def _partial(self, name: str, partial: str) -> pdarray:
+        if name not in self._partial_aggregates:
+            raise KeyError(f"No values named {name}")
+        return self._partial_aggregates[name][partial]
+
+    def size(self) -> Tuple[groupable, pdarray]:
+        """
+        The number of rows in each group.
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        sizes : pdarray, int64
+            The number of rows of each group
+        """
+        return cast(groupable, self.unique_keys), cast(pdarray, self._sizes)
+
+    def count(self, name: str) -> Tuple[groupable, pdarray]:
+        """
+        The number of non-NaN values of each group.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        counts : pdarray, int64
+            The number of values of each group
+        """
+        return cast(groupable, self.unique_keys), self._partial(name, "count")
+
+    def sum(self, name: str) -> Tuple[groupable, pdarray]:
+        """
+        The sum of the values of each group.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        sums : pdarray
+            The sum of the values of each group
+        """
+        return cast(groupable, self.unique_keys), self._partial(name, "sum")
+
+    def min(self, name: str) -> Tuple[groupable, pdarray]:
+        """
+        The minimum of the values of each group.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        minima : pdarray
+            The minimum of the values of each group
+        """
+        return cast(groupable, self.unique_keys), self._partial(name, "min")
+
+    def max(self, name: str) -> Tuple[groupable, pdarray]:
+        """
+        The maximum of the values of each group.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        maxima : pdarray
+            The maximum of the values of each group
+        """
+        return cast(groupable, self.unique_keys), self._partial(name, "max")
+
+    def mean(self, name: str) -> Tuple[groupable, pdarray]:
+        """
+        The mean of the values of each group, or NaN for groups without values.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        means : pdarray, float64
+            The mean of the values of each group
+        """
+        from arkouda.numeric import where
+
+        count = self._partial(name, "count")
+        return cast(groupable, self.unique_keys), where(count > 0, self._partial(name, "mean"), np.nan)
+
+    def var(self, name: str, ddof: int_scalars = 1) -> Tuple[groupable, pdarray]:
+        """
+        The variance of the values of each group, or NaN for groups with no
+        more than ddof values.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+        ddof : int_scalars
+            "Delta Degrees of Freedom" used in calculating var
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        variances : pdarray, float64
+            The variance of the values of each group
+        """
+        from arkouda.numeric import where
+
+        dof = self._partial(name, "count") - ddof
+        return cast(groupable, self.unique_keys), where(
+            dof > 0, self._partial(name, "m2") / where(dof > 0, dof, 1), np.nan
+        )
+
+    def std(self, name: str, ddof: int_scalars = 1) -> Tuple[groupable, pdarray]:
+        """
+        The standard deviation of the values of each group, or NaN for groups
+        with no more than ddof values.
+
+        Parameters
+        ----------
+        name : str
+            The name of the values
+        ddof : int_scalars
+            "Delta Degrees of Freedom" used in calculating std
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        stds : pdarray, float64
+            The standard deviation of the values of each group
+        """
+        from arkouda.pdarrayclass import sqrt
+
+        unique_keys, variances = self.var(name, ddof)
+        return unique_keys, sqrt(variances)
+
+
 def broadcast(
     segments: pdarray,
     values: Union[pdarray, Strings],
@@ -1,9 +1,12 @@
 import glob
 import json
+import operator
 import os
-from typing import Dict, List, Mapping, Optional, Union, cast
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from urllib.parse import quote, unquote
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 from typeguard import typechecked
 
@@ -46,6 +49,9 @@ __all__ = [
     "update_hdf",
     "snapshot",
     "restore",
+    "checkpoint",
+    "checkpoint_status",
+    "restore_checkpoint",
     "receive",
     "receive_dataframe",
 ]
@@ -728,6 +734,179 @@ def read_hdf(
         return _build_objects(rep)
 
 
+_PARQUET_FILTER_OPS = ("==", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _prep_filters(filters: Sequence[Tuple[str, str, Any]]) -> Dict[str, Union[int, List[str]]]:
+    """
+    Validate the filters of a Parquet read and encode them as the arguments
+    sent to the server
+
+    Parameters
+    ----------
+    filters: Sequence[Tuple[str, str, Any]]
+        (column, op, value) conditions the rows read must satisfy
+
+    Returns
+    -------
+    Dict of the filter arguments of the readAllParquet message
+
+    Raises
+    ------
+    ValueError
+        - If an operator is not supported
+    TypeError
+        - If the value of an "in" or "not in" filter is not list-like or the
+          value of another filter is
+    """
+
+    def _encode(v) -> str:
+        # bools are compared to the 1s and 0s of boolean columns
+        if isinstance(v, (bool, np.bool_)):
+            return str(int(v))
+        return str(v)
+
+    cols, ops, counts, values = [], [], [], []
+    for col, op, val in filters:
+        if op not in _PARQUET_FILTER_OPS:
+            raise ValueError(f"Filter operator {op} is not one of {_PARQUET_FILTER_OPS}")
+        if op in ("in", "not in"):
+            if isinstance(val, str) or not hasattr(val, "__iter__"):
+                raise TypeError(f"The value of an '{op}' filter must be list-like, not {type(val)}")
+            vals = [_encode(v) for v in val]
+        else:
+            if not isinstance(val, str) and hasattr(val, "__iter__"):
+                raise TypeError(f"The value of a '{op}' filter must be a scalar, not {type(val)}")
+            vals = [_encode(val)]
+        cols.append(col)
+        ops.append(op)
+        counts.append(len(vals))
+        values.extend(vals)
+    return {
+        "num_filters": len(cols),
+        "filter_cols": cols,
+        "filter_ops": ops,
+        "filter_counts": counts,
+        "filter_values": values,
+    }
+
+
+_PARTITION_FILTER_FUNCS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda v, vals: v in vals,
+    "not in": lambda v, vals: v not in vals,
+}
+
+
+def _list_parquet_dir(path: str) -> List[str]:
+    """
+    List the data files under a directory on the server, or nothing if path
+    is not a directory
+    """
+    return json.loads(cast(str, generic_msg(cmd="lspqDir", args={"path": path})))
+
+
+def _parse_partitions(root: str, files: List[str]) -> Dict[str, list]:
+    """
+    Parse the values of the partition columns of the files of a Hive
+    partitioned dataset from their key=value directories. The values of a
+    column are ints if they all are, floats if they all are and otherwise
+    strings.
+
+    Raises
+    ------
+    ValueError
+        - If the files are not all under the same partition columns
+    """
+    parts: Dict[str, List[str]] = {}
+    for i, f in enumerate(files):
+        pairs = [d.split("=", 1) for d in os.path.relpath(f, root).split(os.sep)[:-1] if "=" in d]
+        if i == 0:
+            parts = {key: [] for key, _ in pairs}
+        if [key for key, _ in pairs] != list(parts):
+            raise ValueError(f"{f} is not partitioned by the columns {list(parts)}")
+        for key, val in pairs:
+            parts[key].append(unquote(val))
+
+    values: Dict[str, list] = {}
+    for key, strs in parts.items():
+        for typ in (int, float, str):
+            try:
+                values[key] = [typ(v) for v in strs]
+                break
+            except ValueError:
+                continue
+    return values
+
+
+def _read_partitioned_parquet(
+    root: str,
+    files: List[str],
+    datasets: Optional[Union[str, List[str]]],
+    filters: Optional[Sequence[Tuple[str, str, Any]]],
+    **kwargs,
+) -> Dict:
+    """
+    Read the files of a Hive partitioned dataset, skipping the partitions
+    ruled out by the filters on partition columns before any file is
+    opened, and add the partition columns to the columns read
+    """
+    partitions = _parse_partitions(root, files)
+    keep = np.ones(len(files), dtype=bool)
+    file_filters = []
+    for col, op, val in filters if filters else []:
+        if col not in partitions:
+            file_filters.append((col, op, val))
+            continue
+        if op not in _PARTITION_FILTER_FUNCS:
+            raise ValueError(f"Filter operator {op} is not one of {_PARQUET_FILTER_OPS}")
+        typ = type(partitions[col][0])
+        val = [typ(v) for v in val] if op in ("in", "not in") else typ(val)
+        keep &= [_PARTITION_FILTER_FUNCS[op](v, val) for v in partitions[col]]
+    # with no partition left read only the schema of one file, for the column types
+    read_idx = np.flatnonzero(keep) if keep.any() else np.arange(1)
+
+    read_files = [files[i] for i in read_idx]
+    if isinstance(datasets, str):
+        datasets = [datasets]
+    part_cols = list(partitions) if datasets is None else [d for d in datasets if d in partitions]
+    file_dsets = (
+        get_datasets(read_files[0], read_nested=kwargs.get("read_nested", True))
+        if datasets is None
+        else [d for d in datasets if d not in partitions]
+    )
+    # the rows of a file are only counted by reading one of its columns
+    extra = [] if file_dsets else get_datasets(read_files[0])[:1]
+    tag_data = kwargs.pop("tag_data", False)
+    if keep.any():
+        objs = dict(
+            read_parquet(
+                read_files, datasets=file_dsets + extra, filters=file_filters, tag_data=True, **kwargs
+            )
+        )
+    else:
+        read_nested = kwargs.pop("read_nested", True)
+        objs = _read_all_parquet(
+            read_files,
+            _prep_datasets(read_files, file_dsets + extra, read_nested=read_nested),
+            file_filters,
+            tag_data=True,
+            schema_only=True,
+            **kwargs,
+        )
+    codes = objs["Filename_Codes"] if tag_data else objs.pop("Filename_Codes")
+    for col in extra:
+        del objs[col]
+    for col in part_cols:
+        objs[col] = array([partitions[col][i] for i in read_idx])[codes]
+    return objs
+
+
 def read_parquet(
     filenames: Union[str, List[str]],
     datasets: Optional[Union[str, List[str]]] = None,
@@ -737,7 +916,8 @@ def read_parquet(
     tag_data: bool = False,
     read_nested: bool = True,
     has_non_float_nulls: bool = False,
-    fixed_len: int = -1
+    fixed_len: int = -1,
+    filters: Optional[Sequence[Tuple[str, str, Any]]] = None,
 ) -> Union[
     Mapping[
         str,
@@ -791,6 +971,17 @@ def read_parquet(
         Default -1. This value can be set for reading Parquet string columns when the
         length of each string is known at runtime. This can allow for skipping byte
         calculation, which can have an impact on performance.
+    filters: Optional Sequence[Tuple[str, str, Any]]
+        Default None. (column, op, value) conditions that every row read must
+        satisfy, where op is one of "==", "!=", "<", "<=", ">", ">=", "in" and
+        "not in" and the value of "in" and "not in" is list-like. Row groups
+        that the statistics of a numeric or boolean column show cannot
+        contain a matching row are skipped without being read. Filtered
+        columns are read even if they are not in `datasets` but are only
+        returned if they are. Strings columns support only "==", "!=", "in"
+        and "not in", and SegArray columns cannot be read with filters.
+        Filters on the partition columns of a partitioned dataset are
+        applied to the partitions before any of their files are opened.
 
     Returns
     -------
@@ -802,13 +993,15 @@ def read_parquet(
     ------
     ValueError
         Raised if all datasets are not present in all parquet files or if one or
-        more of the specified files do not exist
+        more of the specified files do not exist, or if a filter operator is not
+        supported
     RuntimeError
         Raised if one or more of the specified files cannot be opened.
         If `allow_errors` is true this may be raised if no values are returned
         from the server.
     TypeError
-        Raised if we receive an unknown arkouda_type returned from the server
+        Raised if we receive an unknown arkouda_type returned from the server,
+        or if the value of a filter does not match its operator
 
     Notes
     -----
@@ -825,6 +1018,14 @@ def read_parquet(
     and read all of them. Use ``get_datasets`` to show the names of datasets
     to Parquet files.
 
+    If filenames is a directory, like one written by ``to_parquet`` with
+    `partition_cols`, it is read as a Hive partitioned dataset: all the
+    files under it are read and the partition columns, parsed from the
+    ``key=value`` directories the files are in, are added to the columns
+    read. Partition values are ints if all of them are, floats if all of
+    them are and otherwise strings. Partitioned datasets are always read
+    with a single call to the server.
+
     Parquet always recomputes offsets at this time
     This will need to be updated once parquets workflow is updated
 
@@ -838,7 +1039,26 @@ def read_parquet(
     >>> x = ak.read_parquet('path/name_prefix.parquet') # load Parquet
     Read Glob Expression
     >>> x = ak.read_parquet('path/name_prefix*') # Reads Parquet
-    """
+    Read only the rows of a range of timestamps
+    >>> x = ak.read_parquet('path/name_prefix*', filters=[("ts", ">=", 100), ("ts", "<", 200)])
+    Read only the partitions of a range of dates of a partitioned dataset
+    >>> x = ak.read_parquet('path/dataset_dir', filters=[("date", ">=", "2024-01-01")])
+    """
+    if isinstance(filenames, str) and not filenames.endswith("*"):
+        partition_files = _list_parquet_dir(filenames)
+        if partition_files:
+            return _read_partitioned_parquet(
+                filenames,
+                partition_files,
+                datasets,
+                filters,
+                strict_types=strict_types,
+                allow_errors=allow_errors,
+                tag_data=tag_data,
+                read_nested=read_nested,
+                has_non_float_nulls=has_non_float_nulls,
+                fixed_len=fixed_len,
+            )
     if isinstance(filenames, str):
         filenames = [filenames]
     datasets = _prep_datasets(filenames, datasets, read_nested=read_nested)
@@ -856,27 +1076,64 @@ def read_parquet(
                 read_nested=read_nested,
                 has_non_float_nulls=has_non_float_nulls,
                 fixed_len=fixed_len,
+                filters=filters,
             )[dset]
             for dset in datasets
         }
     else:
-        rep_msg = generic_msg(
-            cmd="readAllParquet",
-            args={
-                "strict_types": strict_types,
-                "dset_size": len(datasets),
-                "filename_size": len(filenames),
-                "allow_errors": allow_errors,
-                "dsets": datasets,
-                "filenames": filenames,
-                "tag_data": tag_data,
-                "has_non_float_nulls": has_non_float_nulls,
-                "fixed_len": fixed_len,
-            },
+        return _read_all_parquet(
+            filenames,
+            datasets,
+            filters,
+            strict_types=strict_types,
+            allow_errors=allow_errors,
+            tag_data=tag_data,
+            has_non_float_nulls=has_non_float_nulls,
+            fixed_len=fixed_len,
         )
-        rep = json.loads(rep_msg)  # See GenSymIO._buildReadAllMsgJson for json structure
-        _parse_errors(rep, allow_errors)
-        return _build_objects(rep)
+
+
+def _read_all_parquet(
+    filenames: List[str],
+    datasets: List[str],
+    filters: Optional[Sequence[Tuple[str, str, Any]]],
+    strict_types: bool = True,
+    allow_errors: bool = False,
+    tag_data: bool = False,
+    has_non_float_nulls: bool = False,
+    fixed_len: int = -1,
+    schema_only: bool = False,
+) -> Dict:
+    """
+    Read the datasets of the Parquet files in one request, or with
+    schema_only, only their types, as empty arrays
+    """
+    filter_args = _prep_filters(filters) if filters else {"num_filters": 0}
+    # the filtered columns are needed to filter the rows of the others
+    filter_cols = cast(List[str], filter_args.get("filter_cols", []))
+    extra = [col for col in dict.fromkeys(filter_cols) if col not in datasets]
+    rep_msg = generic_msg(
+        cmd="readAllParquet",
+        args={
+            "strict_types": strict_types,
+            "dset_size": len(datasets) + len(extra),
+            "filename_size": len(filenames),
+            "allow_errors": allow_errors,
+            "dsets": datasets + extra,
+            "filenames": filenames,
+            "tag_data": tag_data,
+            "has_non_float_nulls": has_non_float_nulls,
+            "fixed_len": fixed_len,
+            "schema_only": schema_only,
+            **filter_args,
+        },
+    )
+    rep = json.loads(rep_msg)  # See GenSymIO._buildReadAllMsgJson for json structure
+    _parse_errors(rep, allow_errors)
+    objs = _build_objects(rep)
+    if extra:
+        objs = {k: v for k, v in objs.items() if k not in extra}
+    return objs
 
 
 def read_csv(
@@ -1175,6 +1432,7 @@ def to_parquet(
     mode: str = "truncate",
     compression: Optional[str] = None,
     convert_categoricals: bool = False,
+    partition_cols: Optional[List[str]] = None,
 ) -> None:
     """
     Save multiple named pdarrays to Parquet files.
@@ -1200,6 +1458,12 @@ def to_parquet(
             Parquet requires all columns to be the same size and Categoricals
             don't satisfy that requirement.
             if set, write the equivalent Strings in place of any Categorical columns.
+    partition_cols : list of str (Optional)
+        Default None. Names of columns to partition the data by. Each
+        distinct combination of their values is written to its own
+        ``col=value`` directory under `prefix_path`, without the partition
+        columns, so ``read_parquet`` can skip partitions by their path.
+        Requires columns to be a dictionary and mode 'truncate'.
 
     Returns
     -------
@@ -1208,8 +1472,10 @@ def to_parquet(
     Raises
     ------
     ValueError
-        Raised if (1) the lengths of columns and values differ or (2) the mode
-        is not 'truncate' or 'append'
+        Raised if (1) the lengths of columns and values differ, (2) the mode
+        is not 'truncate' or 'append', or is 'append' with partition_cols, or
+        (3) a partition column is not in columns or every column is a
+        partition column
     RuntimeError
             Raised if a server-side error is thrown saving the pdarray
 
@@ -1227,6 +1493,13 @@ def to_parquet(
     <columns> as new datasets to existing files. If the wrong number of files
     is present or dataset names already exist, a RuntimeError is raised.
 
+    With partition_cols, the files of each partition are written to
+    ``prefix_path/col1=value1/col2=value2/part_LOCALE####.parquet`` in
+    Hive's directory layout, creating the directories as needed. Values are
+    URL-encoded, and Datetime values at midnight are written as dates, as
+    in ``date=2024-01-31``. Files of partitions that are not in the data
+    are left as they are.
+
     Examples
     --------
     >>> a = ak.arange(25)
@@ -1237,9 +1510,19 @@ def to_parquet(
 
     >>> # Save using names instead of mapping
     >>> ak.to_parquet([a, b], 'path/name_prefix', names=['a', 'b'])
+
+    >>> # Save one directory of files per value of b
+    >>> ak.to_parquet({'a': a, 'b': b % 5}, 'path/dataset_dir', partition_cols=['b'])
     """
     if mode.lower() not in ["append", "truncate"]:
         raise ValueError("Allowed modes are 'truncate' and 'append'")
+    if partition_cols:
+        if not isinstance(columns, Mapping):
+            raise ValueError("Partitioned writes require columns to be a dictionary")
+        if mode.lower() != "truncate":
+            raise ValueError("Partitioned writes only support mode 'truncate'")
+        _to_partitioned_parquet(columns, prefix_path, partition_cols, compression, convert_categoricals)
+        return
     if mode.lower() == "append":
         warn(
             "Append has been deprecated when writing Parquet files. "
@@ -1271,6 +1554,80 @@ def to_parquet(
         )
 
 
+def _partition_dirs(keys: Union[pdarray, Strings, Categorical]) -> List[str]:
+    """
+    Format the values of a partition column as the key=value directory
+    names of Hive's layout, without the key
+    """
+    if isinstance(keys, Datetime):
+        vals = keys.to_ndarray()
+        days = vals.astype("datetime64[D]")
+        # write whole days as dates
+        strs = [str(v) for v in (days if (days == vals).all() else vals)]
+    else:
+        strs = [str(v) for v in keys.to_list()]
+    return [quote(v, safe="") for v in strs]
+
+
+def _to_partitioned_parquet(
+    columns: Mapping[str, Union[pdarray, Strings, SegArray, ArrayView]],
+    prefix_path: str,
+    partition_cols: List[str],
+    compression: Optional[str],
+    convert_categoricals: bool,
+) -> None:
+    """
+    Write the rows of each distinct combination of the values of the
+    partition columns to a file of its directory under prefix_path
+    """
+    missing = set(partition_cols) - set(columns)
+    if missing:
+        raise ValueError(f"Partition column(s) not found: {missing}")
+    data = {name: col for name, col in columns.items() if name not in partition_cols}
+    if not data:
+        raise ValueError("At least one column must not be a partition column")
+
+    keys = [columns[name] for name in partition_cols]
+    gb = GroupBy(keys if len(keys) > 1 else keys[0])
+    unique_keys = gb.unique_keys if len(keys) > 1 else [gb.unique_keys]
+    dirs = [[f"{name}={v}" for v in _partition_dirs(k)] for name, k in zip(partition_cols, unique_keys)]
+    filenames = [os.path.join(prefix_path, *part, "part.parquet") for part in zip(*dirs)]
+    names, cols, objtypes = _bulk_write_prep(data, None, convert_categoricals)
+    if any(isinstance(col, SegArray) for col in cols):
+        # the server only writes pdarray and Strings partitions itself, so SegArrays
+        # are written a partition at a time
+        bounds = np.append(gb.segments.to_ndarray(), gb.length)
+        for i, filename in enumerate(filenames):
+            idx = gb.permutation[bounds[i] : bounds[i + 1]]
+            generic_msg(
+                cmd="toParquet_multi",
+                args={
+                    "columns": [col[idx] for col in cols],
+                    "col_names": names,
+                    "col_objtypes": objtypes,
+                    "filename": filename,
+                    "num_cols": len(cols),
+                    "compression": compression,
+                    "create_dirs": True,
+                },
+            )
+        return
+    # each partition is gathered to one locale and written to a single file
+    generic_msg(
+        cmd="toParquetPartitioned",
+        args={
+            "columns": cols,
+            "col_names": names,
+            "col_objtypes": objtypes,
+            "num_cols": len(cols),
+            "compression": compression,
+            "perm": gb.permutation,
+            "segments": gb.segments,
+            "filenames": filenames,
+        },
+    )
+
+
 def to_hdf(
     columns: Union[
         Mapping[str, Union[pdarray, Strings, SegArray, ArrayView]],
@@ -2173,6 +2530,139 @@ def restore(filename):
     return read_hdf(sorted(restore_files))
 
 
+def checkpoint(path: str, compression: Optional[str] = None) -> str:
+    """
+    Start writing all registered objects to Parquet files under a directory
+    in the background. The server keeps serving requests while they are
+    written; use ``checkpoint_status`` to follow the progress.
+
+    Parameters
+    ----------
+    path: str
+        Directory to write the checkpoint to, created if it does not exist
+    compression: str (Optional)
+        Default None
+        Provide the compression type to use when writing the files.
+        Supported values: snappy, gzip, brotli, zstd, lz4
+
+    Returns
+    --------
+    str
+        Message of the number of objects and bytes being written
+
+    Raises
+    ------
+    RuntimeError
+        Raised if a checkpoint is already running or a registered object
+        cannot be written to Parquet
+
+    See Also
+    ---------
+    checkpoint_status, restore_checkpoint, snapshot
+
+    Notes
+    -----
+    Objects are checkpointed as they are when the checkpoint starts:
+    deleting, unregistering or replacing an object does not change what is
+    written for it. Updating a pdarray in place, as with ``a[idx] = v``,
+    before it is written is not isolated from the checkpoint, so such
+    updates should wait for it to finish. A manifest of the objects is
+    written last, so an incomplete checkpoint cannot be restored.
+
+    Examples
+    --------
+    >>> df.register("my_df")
+    >>> ak.checkpoint("path/ckpt")
+    >>> ak.checkpoint_status()["state"]
+    'running'
+    """
+    return cast(str, generic_msg(cmd="checkpoint", args={"path": path, "compression": compression}))
+
+
+def checkpoint_status() -> Dict[str, Union[str, int, float, List[str]]]:
+    """
+    Return the progress of the last checkpoint started
+
+    Returns
+    --------
+    Dict
+        state: "idle", "running", "done" or "failed"
+        path: the directory of the checkpoint
+        total, written: the number of arrays to write and written so far
+        total_bytes, bytes_written: their sizes in bytes
+        elapsed: seconds since the checkpoint started, or that it took
+        errors: the errors of a failed checkpoint
+
+    See Also
+    ---------
+    checkpoint
+    """
+    rep = json.loads(cast(str, generic_msg(cmd="checkpointStatus")))
+    status: Dict[str, Union[str, int, float, List[str]]] = {
+        "state": rep["state"],
+        "path": rep["path"],
+        "elapsed": float(rep["elapsed"]),
+        "errors": json.loads(rep["errors"]),
+    }
+    for key in ("total", "written", "total_bytes", "bytes_written"):
+        status[key] = int(rep[key])
+    return status
+
+
+def restore_checkpoint(path: str) -> Dict:
+    """
+    Read the objects written by ``checkpoint`` and register them again
+    under their names
+
+    Parameters
+    ----------
+    path: str
+        Directory the checkpoint was written to
+
+    Returns
+    --------
+    Dict
+        Mapping of the registered names of the objects to the objects
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the checkpoint has no manifest because it did not finish,
+        or if there is a server-side error reading it
+    RegistrationError
+        Raised if one of the names is already registered
+
+    See Also
+    ---------
+    checkpoint
+    """
+    import re
+
+    from arkouda.util import _build_registered_obj
+
+    # the server wrote the checkpoint, so it reads the manifest
+    manifest = json.loads(cast(str, generic_msg(cmd="checkpointManifest", args={"path": path})))
+    components = json.loads(manifest["components"])
+    objects = json.loads(manifest["objects"])
+
+    # the components are read into new arrays, so rename them in the create messages
+    arrays = {
+        name: read_parquet(os.path.join(path, f"{name}_LOCALE*"), datasets=name)[name]
+        for name in components
+    }
+
+    def rename(create: str) -> str:
+        return re.sub(r"\w+", lambda m: arrays[m[0]].name if m[0] in arrays else m[0], create)
+
+    restored = {}
+    for name, obj in objects.items():
+        rep_msg = json.loads(obj)
+        rep_msg["create"] = rename(rep_msg["create"])
+        # registering keeps the arrays read from being deleted along with their first objects
+        restored[name] = _build_registered_obj(rep_msg).register(name)
+    return restored
+
+
 def receive(hostname: str, port):
     """
     Receive a pdarray sent by `pdarray.transfer()`.
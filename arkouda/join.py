@@ -3,20 +3,20 @@ from typing import Callable, Optional, Sequence, Tuple, Union, cast
 import numpy as np
 from typeguard import typechecked
 
-from arkouda.alignment import right_align
 from arkouda.categorical import Categorical
 from arkouda.client import generic_msg
 from arkouda.dtypes import NUMBER_FORMAT_STRINGS
 from arkouda.dtypes import int64 as akint64
 from arkouda.dtypes import resolve_scalar_dtype
-from arkouda.groupbyclass import GroupBy, broadcast
+from arkouda.dtypes import uint64 as akuint64
+from arkouda.groupbyclass import GroupBy, _get_grouping_keys
 from arkouda.numeric import cumsum
-from arkouda.pdarrayclass import create_pdarray, pdarray
-from arkouda.pdarraycreation import arange, array, ones, zeros
+from arkouda.pdarrayclass import create_pdarray, is_sorted, pdarray
+from arkouda.pdarraycreation import array, ones, zeros
 from arkouda.pdarraysetops import concatenate, in1d
 from arkouda.strings import Strings
 
-__all__ = ["join_on_eq_with_dt", "gen_ranges", "compute_join_size"]
+__all__ = ["join_on_eq_with_dt", "gen_ranges", "compute_join_size", "hash_join", "merge_join"]
 
 predicates = {"true_dt": 0, "abs_dt": 1, "pos_dt": 2}
 
@@ -187,6 +187,188 @@ def compute_join_size(a: pdarray, b: pdarray) -> Tuple[int, int]:
     return nelem, nbytes
 
 
+@typechecked
+def hash_join(
+    left: Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings]]],
+    right: Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings]]],
+    how: str = "inner",
+) -> Tuple[pdarray, pdarray]:
+    """
+    Join the rows of <left> and <right> with equal values in a single server
+    command, returning the indices of the joined left-right pairs.
+
+    Parameters
+    ----------
+    left : pdarray(int64), Strings, Categorical, or Sequence of pdarray
+        The left values to join
+    right : pdarray(int64), Strings, Categorical, or Sequence of pdarray
+        The right values to join
+    how : str
+        The type of join: "inner" (the default) returns only matching pairs,
+        "left" also returns the unmatched left rows, "right" the unmatched
+        right rows, and "outer" both
+
+    Returns
+    -------
+    leftInds : pdarray(int64)
+        The left indices of the joined pairs, or -1 for unmatched right rows
+    rightInds : pdarray(int64)
+        The right indices of the joined pairs, or -1 for unmatched left rows
+
+    Raises
+    ------
+    ValueError
+        Raised if how is not a supported join type, or if left and right do
+        not have the same number of arrays of equal length
+
+    See Also
+    --------
+    inner_join, merge_join
+
+    Notes
+    -----
+    The pairs are ordered by left index, then by right index, followed by the
+    unmatched right rows in order. The server groups the right rows by the
+    hash of their values, then copies the distinct right hashes to every
+    locale to look up the left rows (a broadcast join) if there are few of
+    them, or else sorts them together with the left hashes. As with GroupBy,
+    rows are compared by a 128-bit hash of their values.
+
+    Examples
+    --------
+    >>> left = ak.array([0, 1, 2, 1])
+    >>> right = ak.array([1, 3, 1])
+    >>> ak.join.hash_join(left, right)
+    (array([1 1 3 3]), array([0 2 0 2]))
+    >>> ak.join.hash_join(left, right, how="outer")
+    (array([0 1 1 2 3 3 -1]), array([-1 0 2 -1 0 2 1]))
+    """
+    if how not in ("inner", "left", "right", "outer"):
+        raise ValueError(
+            f"Unexpected value of {how} for how. Must be 'inner', 'left', 'right' or 'outer'"
+        )
+    # Compare Categoricals by their codes, or else by their values
+    if isinstance(left, Categorical) and isinstance(right, Categorical):
+        l, r = Categorical.standardize_categories([left, right])
+        left, right = l.codes, r.codes
+    elif isinstance(left, Categorical):
+        left = left.categories[left.codes]
+    elif isinstance(right, Categorical):
+        right = right.categories[right.codes]
+
+    left_keys, nkeys = _get_grouping_keys(left)
+    right_keys, right_nkeys = _get_grouping_keys(right)
+    if nkeys != right_nkeys:
+        raise ValueError("Left must have same num arrays as right")
+    if any(k.size != left_keys[0].size for k in left_keys) or any(
+        k.size != right_keys[0].size for k in right_keys
+    ):
+        raise ValueError("Multi-array arguments must have equal-length arrays")
+    repMsg = generic_msg(
+        cmd="hashJoin",
+        args={
+            "nkeys": len(left_keys),
+            "leftnames": [k.name for k in left_keys],
+            "lefttypes": [k.objType for k in left_keys],
+            "rightnames": [k.name for k in right_keys],
+            "righttypes": [k.objType for k in right_keys],
+            "how": how,
+        },
+    )
+    left_inds, right_inds = cast(str, repMsg).split("+")
+    return create_pdarray(left_inds), create_pdarray(right_inds)
+
+
+@typechecked
+def merge_join(
+    left: pdarray, right: pdarray, how: str = "inner", assume_sorted: bool = False
+) -> Tuple[pdarray, pdarray]:
+    """
+    Join two sorted arrays by merging them, returning the indices of the
+    joined left-right pairs in the order of their values.
+
+    Parameters
+    ----------
+    left : pdarray(int64 or uint64)
+        The sorted left values to join
+    right : pdarray(int64 or uint64)
+        The sorted right values to join, of the same dtype as left
+    how : str
+        The type of join: "inner" (the default), "left", "right" or "outer",
+        as for hash_join
+    assume_sorted : bool
+        If True, skip checking that left and right are sorted, for callers
+        who already know it. The result is undefined if they are not.
+        Defaults to False.
+
+    Returns
+    -------
+    leftInds : pdarray(int64)
+        The left indices of the joined pairs, or -1 for unmatched right rows
+    rightInds : pdarray(int64)
+        The right indices of the joined pairs, or -1 for unmatched left rows
+
+    Raises
+    ------
+    ValueError
+        Raised if how is not a supported join type, or if left or right is
+        not sorted
+    TypeError
+        Raised if left and right are not both int64 or both uint64
+
+    See Also
+    --------
+    hash_join
+
+    Notes
+    -----
+    Since both sides are sorted, the right rows matching each left row are
+    found by merging each block of left values with the window of right
+    values they span, without sorting or hashing either side. The pairs are
+    ordered by value, then by left index, then by right index, with the
+    unmatched rows of left, right and outer joins placed in value order too,
+    so the result needs no further sorting.
+
+    Examples
+    --------
+    >>> left = ak.array([0, 1, 1, 2])
+    >>> right = ak.array([1, 1, 3])
+    >>> ak.join.merge_join(left, right)
+    (array([1 1 2 2]), array([0 1 0 1]))
+    >>> ak.join.merge_join(left, right, how="outer")
+    (array([0 1 1 2 2 3 -1]), array([-1 0 1 0 1 -1 2]))
+    """
+    if how not in ("inner", "left", "right", "outer"):
+        raise ValueError(
+            f"Unexpected value of {how} for how. Must be 'inner', 'left', 'right' or 'outer'"
+        )
+    if left.dtype != right.dtype or left.dtype not in (akint64, akuint64):
+        raise TypeError(f"Cannot merge join {left.dtype} values with {right.dtype} values")
+    if not assume_sorted and not (is_sorted(left) and is_sorted(right)):
+        raise ValueError("left and right must be sorted")
+    repMsg = generic_msg(
+        cmd="mergeJoin",
+        args={"left": left, "right": right, "how": how},
+    )
+    left_inds, right_inds = cast(str, repMsg).split("+")
+    return create_pdarray(left_inds), create_pdarray(right_inds)
+
+
+def _merge_joinable(left, right) -> bool:
+    """
+    Whether left and right are int64 or uint64 arrays both already sorted,
+    so they can be joined by merge_join rather than hash_join
+    """
+    return (
+        isinstance(left, pdarray)
+        and isinstance(right, pdarray)
+        and left.dtype == right.dtype
+        and left.dtype in (akint64, akuint64)
+        and bool(is_sorted(left))
+        and bool(is_sorted(right))
+    )
+
+
 @typechecked
 def inner_join(
     left: Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings]]],
@@ -230,6 +412,9 @@ def inner_join(
     `assert (left[leftInds] == right[rightInds]).all()`
     `assert wherefunc(whereargs[0][leftInds], whereargs[1][rightInds]).all()`
 
+    If left and right are int64 or uint64 arrays that are both already
+    sorted, they are joined by merge_join instead of hash_join.
+
     """
     from inspect import signature
 
@@ -276,55 +461,18 @@ def inner_join(
         except Exception as e:
             raise ValueError("Error evaluating wherefunc") from e
 
-    # Need dense 0-up right index, to filter out left not in right
-    keep, (denseLeft, denseRight) = right_align(left, right)
-    if keep.sum() == 0:
-        # Intersection is empty
-        return zeros(0, dtype=akint64), zeros(0, dtype=akint64)
-    keep = arange(keep.size)[keep]
-    # GroupBy right
-    byRight = GroupBy(denseRight)
-    # Get segment boundaries (starts, ends) of right for each left item
-    rightSegs = concatenate((byRight.segments, array([denseRight.size])))
-    starts = rightSegs[denseLeft]
-    ends = rightSegs[denseLeft + 1]
-    # gen_ranges for gather of right items
-    fullSegs, ranges = gen_ranges(starts, ends)
-    # Evaluate where clause
-    if wherefunc is None:
-        filtRanges = ranges
-        filtSegs = fullSegs
-        keep12 = keep
+    if isinstance(left, pdarray) and isinstance(right, pdarray) and _merge_joinable(left, right):
+        leftInds, rightInds = merge_join(left, right, assume_sorted=True)
+    else:
+        leftInds, rightInds = hash_join(left, right)
+    if wherefunc is None or whereargs is None:
+        return leftInds, rightInds
+    # Evaluate where clause on the joined pairs
+    if not is_sequence:
+        leftWhere = whereargs[0][leftInds]
+        rightWhere = whereargs[1][rightInds]
     else:
-        if whereargs is not None:
-            if not is_sequence:
-                # Gather right whereargs
-                rightWhere = whereargs[1][byRight.permutation][ranges]
-                # Expand left whereargs
-                keep_where = whereargs[0][keep]
-                keep_where = keep_where.codes if isinstance(keep_where, Categorical) else keep_where
-                leftWhere = broadcast(fullSegs, keep_where, ranges.size)
-            else:
-                # Gather right whereargs
-                rightWhere = [wa[byRight.permutation][ranges] for wa in whereargs[1]]
-                # Expand left whereargs
-                keep_where = [wa[keep] for wa in whereargs[0]]
-                leftWhere = [broadcast(fullSegs, kw, ranges.size) for kw in keep_where]
-            # Evaluate wherefunc and filter ranges, recompute segments
-            whereSatisfied = wherefunc(leftWhere, rightWhere)
-            filtRanges = ranges[whereSatisfied]
-            scan = cumsum(whereSatisfied) - whereSatisfied
-            filtSegsWithZeros = scan[fullSegs]
-            filtSegSizes = concatenate(
-                (
-                    filtSegsWithZeros[1:] - filtSegsWithZeros[:-1],
-                    array([whereSatisfied.sum() - filtSegsWithZeros[-1]]),
-                )
-            )
-            keep2 = filtSegSizes > 0
-            filtSegs = filtSegsWithZeros[keep2]
-            keep12 = keep[keep2]
-    # Gather right inds and expand left inds
-    rightInds = byRight.permutation[filtRanges]
-    leftInds = broadcast(filtSegs, arange(left_size)[keep12], filtRanges.size)
-    return leftInds, rightInds
+        leftWhere = [wa[leftInds] for wa in whereargs[0]]
+        rightWhere = [wa[rightInds] for wa in whereargs[1]]
+    whereSatisfied = wherefunc(leftWhere, rightWhere)
+    return leftInds[whereSatisfied], rightInds[whereSatisfied]
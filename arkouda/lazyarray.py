@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import builtins
+from typing import Dict, List, Optional, Tuple, Union, cast
+
+import numpy as np
+from typeguard import typechecked
+
+from arkouda.client import generic_msg
+from arkouda.dtypes import dtype as akdtype
+from arkouda.dtypes import float64 as akfloat64
+from arkouda.dtypes import int64 as akint64
+from arkouda.dtypes import isSupportedNumber
+from arkouda.logger import getArkoudaLogger
+from arkouda.pdarrayclass import create_pdarray, pdarray
+
+__all__ = ["LazyArray", "lazy"]
+
+logger = getArkoudaLogger(name="lazyarray")
+
+# maximum operand stack depth supported by the server-side fusedEval kernel
+FUSED_MAX_DEPTH = 16
+
+
+class LazyArray:
+    """
+    An unevaluated elementwise arithmetic expression over pdarrays.
+
+    Arithmetic on a LazyArray builds an expression tree on the client instead
+    of executing each operator on the server. Calling evaluate sends the
+    whole expression to the server as a single fused kernel, so that
+    ``(a * b + c) / d`` makes one pass over memory and creates no
+    intermediate arrays. LazyArrays are created with ak.lazy.
+
+    Attributes
+    ----------
+    op : str or None
+        The operator at the root of the expression, None for a leaf
+    operands : tuple
+        The operands of the operator, or the wrapped pdarray for a leaf
+    dtype : dtype
+        The element type of the evaluated result (int64 or float64)
+    size : int
+        The number of elements of the evaluated result
+
+    Notes
+    -----
+    Supported operators are +, -, *, /, //, % and ** along with unary
+    negation, over int64 and float64 pdarrays and scalars of matching size.
+    Operations outside that set, including comparison and bitwise
+    operators, evaluate the expression and fall back to the corresponding
+    pdarray operation.
+    """
+
+    objType = "LazyArray"
+
+    # the operators that are fused into the expression
+    FusedOps = frozenset(["+", "-", "*", "/", "//", "%", "**"])
+
+    __slots__ = ("op", "operands", "dtype", "size", "depth", "_value")
+
+    def __init__(self, op: Optional[str], operands: Tuple, dtype, size: int, depth: int) -> None:
+        self.op = op
+        self.operands = operands
+        self.dtype = dtype
+        self.size = size
+        self.depth = depth
+        self._value: Optional[pdarray] = None
+
+    @staticmethod
+    def _leaf(pda: pdarray) -> LazyArray:
+        return LazyArray(None, (pda,), pda.dtype, pda.size, 1)
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return (self.size,)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"LazyArray({self._expr_str()}, dtype={self.dtype}, size={self.size})"
+
+    def _expr_str(self) -> str:
+        if self.op is None:
+            return cast(pdarray, self.operands[0]).name
+        elif self.op == "neg":
+            return f"-{self._operand_str(self.operands[0])}"
+        left, right = self.operands
+        return f"({self._operand_str(left)} {self.op} {self._operand_str(right)})"
+
+    @staticmethod
+    def _operand_str(operand) -> str:
+        return operand._expr_str() if isinstance(operand, LazyArray) else str(operand)
+
+    def _as_operand(self, other) -> Union[LazyArray, int, float, None]:
+        """
+        Convert other to a LazyArray or fusable scalar, or None if other
+        cannot take part in a fused expression with this LazyArray
+        """
+        if isinstance(other, LazyArray):
+            return other if other.size == self.size else None
+        if isinstance(other, pdarray):
+            if type(other) is pdarray and other.ndim == 1 and other.dtype in (akint64, akfloat64):
+                return LazyArray._leaf(other) if other.size == self.size else None
+            return None
+        if isinstance(other, (builtins.bool, np.bool_)) or not isSupportedNumber(other):
+            return None
+        if isinstance(other, (int, np.integer)):
+            return int(other)
+        if isinstance(other, (float, np.floating)):
+            return float(other)
+        return None
+
+    def _binop(self, other, op: str, reverse: bool = False):
+        operand = self._as_operand(other)
+        left, right = (operand, self) if reverse else (self, operand)
+        if operand is None:
+            return self._pdarray_binop(other, op, reverse)
+
+        is_float = op == "/" or any(
+            (isinstance(x, LazyArray) and x.dtype == akfloat64) or isinstance(x, float)
+            for x in (left, right)
+        )
+        if op == "**" and not is_float:
+            # integer powers are not fused because of their negative exponent handling
+            lhs = left.evaluate() if isinstance(left, LazyArray) else left
+            rhs = right.evaluate() if isinstance(right, LazyArray) else right
+            return lhs**rhs
+
+        depths = [x.depth if isinstance(x, LazyArray) else 1 for x in (left, right)]
+        return LazyArray(
+            op,
+            (left, right),
+            akdtype(akfloat64 if is_float else akint64),
+            self.size,
+            builtins.max(depths[0], depths[1] + 1),
+        )
+
+    def _pdarray_binop(self, other, op: str, reverse: bool = False):
+        """
+        Evaluate the expression, and other if it is a LazyArray, and apply
+        the pdarray operator
+        """
+        lhs, rhs = (other, self.evaluate()) if reverse else (self.evaluate(), other)
+        if isinstance(rhs, LazyArray):
+            rhs = rhs.evaluate()
+        if isinstance(lhs, LazyArray):
+            lhs = lhs.evaluate()
+        return pdarray._binop(lhs, rhs, op) if isinstance(lhs, pdarray) else rhs._r_binop(lhs, op)
+
+    def __add__(self, other):
+        return self._binop(other, "+")
+
+    def __radd__(self, other):
+        return self._binop(other, "+", reverse=True)
+
+    def __sub__(self, other):
+        return self._binop(other, "-")
+
+    def __rsub__(self, other):
+        return self._binop(other, "-", reverse=True)
+
+    def __mul__(self, other):
+        return self._binop(other, "*")
+
+    def __rmul__(self, other):
+        return self._binop(other, "*", reverse=True)
+
+    def __truediv__(self, other):
+        return self._binop(other, "/")
+
+    def __rtruediv__(self, other):
+        return self._binop(other, "/", reverse=True)
+
+    def __floordiv__(self, other):
+        return self._binop(other, "//")
+
+    def __rfloordiv__(self, other):
+        return self._binop(other, "//", reverse=True)
+
+    def __mod__(self, other):
+        return self._binop(other, "%")
+
+    def __rmod__(self, other):
+        return self._binop(other, "%", reverse=True)
+
+    def __pow__(self, other):
+        return self._binop(other, "**")
+
+    def __rpow__(self, other):
+        return self._binop(other, "**", reverse=True)
+
+    def __neg__(self):
+        return LazyArray("neg", (self,), self.dtype, self.size, self.depth)
+
+    # comparison and bitwise operators are not fused
+
+    def __lt__(self, other):
+        return self._pdarray_binop(other, "<")
+
+    def __gt__(self, other):
+        return self._pdarray_binop(other, ">")
+
+    def __le__(self, other):
+        return self._pdarray_binop(other, "<=")
+
+    def __ge__(self, other):
+        return self._pdarray_binop(other, ">=")
+
+    def __eq__(self, other):
+        return self._pdarray_binop(other, "==")
+
+    def __ne__(self, other):
+        return self._pdarray_binop(other, "!=")
+
+    def __and__(self, other):
+        return self._pdarray_binop(other, "&")
+
+    def __rand__(self, other):
+        return self._pdarray_binop(other, "&", reverse=True)
+
+    def __or__(self, other):
+        return self._pdarray_binop(other, "|")
+
+    def __ror__(self, other):
+        return self._pdarray_binop(other, "|", reverse=True)
+
+    def __xor__(self, other):
+        return self._pdarray_binop(other, "^")
+
+    def __rxor__(self, other):
+        return self._pdarray_binop(other, "^", reverse=True)
+
+    def __lshift__(self, other):
+        return self._pdarray_binop(other, "<<")
+
+    def __rlshift__(self, other):
+        return self._pdarray_binop(other, "<<", reverse=True)
+
+    def __rshift__(self, other):
+        return self._pdarray_binop(other, ">>")
+
+    def __rrshift__(self, other):
+        return self._pdarray_binop(other, ">>", reverse=True)
+
+    def _compile(
+        self,
+        tokens: List[str],
+        arrays: Dict[str, pdarray],
+        scalars: List[Union[int, float]],
+        base: int = 0,
+    ) -> None:
+        """
+        Append the postfix tokens of this expression, computed in self.dtype
+        with its result at position base of the server's operand stack.
+        Subexpressions that cannot be computed in that dtype or that do not
+        fit on the operand stack are materialized first.
+        """
+        if self.op is None or self._value is not None:
+            pda = self._value if self._value is not None else cast(pdarray, self.operands[0])
+            if pda.name not in arrays:
+                arrays[pda.name] = pda
+            tokens.append(f"a{list(arrays).index(pda.name)}")
+            return
+        for offset, operand in enumerate(self.operands, start=base):
+            if isinstance(operand, LazyArray):
+                if operand.op is not None and (
+                    # integer subexpressions keep integer semantics, see binopvv
+                    operand.dtype != self.dtype
+                    or offset + builtins.min(operand.depth, 2) > FUSED_MAX_DEPTH
+                ):
+                    operand.evaluate()
+                operand._compile(tokens, arrays, scalars, offset)
+            else:
+                scalars.append(operand)
+                tokens.append(f"s{len(scalars) - 1}")
+        tokens.append(cast(str, self.op))
+
+    def evaluate(self) -> pdarray:
+        """
+        Evaluate the expression on the server with a single fused kernel
+
+        Returns
+        -------
+        pdarray
+            The result of the expression. Evaluating the same LazyArray
+            again returns the same pdarray.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error evaluating the expression
+        """
+        if self._value is not None:
+            return self._value
+        if self.op is None:
+            return cast(pdarray, self.operands[0])
+
+        tokens: List[str] = []
+        arrays: Dict[str, pdarray] = {}
+        scalars: List[Union[int, float]] = []
+        self._compile(tokens, arrays, scalars)
+        logger.debug(f"fused evaluation of {self._expr_str()}")
+        self._value = create_pdarray(
+            generic_msg(
+                cmd="fusedEval",
+                args={
+                    "expr": tokens,
+                    "arrays": list(arrays.values()),
+                    "scalars": scalars,
+                    "dtype": self.dtype.name,
+                },
+            )
+        )
+        return self._value
+
+    def to_ndarray(self) -> np.ndarray:
+        """
+        Evaluate the expression and convert the result to a NumPy ndarray
+
+        Returns
+        -------
+        np.ndarray
+            A numpy ndarray with the same values as the evaluated expression
+        """
+        return self.evaluate().to_ndarray()
+
+
+@typechecked
+def lazy(pda: pdarray) -> LazyArray:
+    """
+    Wrap a pdarray in a LazyArray, so that arithmetic on it is deferred and
+    evaluated on the server as a single fused kernel.
+
+    Parameters
+    ----------
+    pda : pdarray
+        A 1D int64 or float64 pdarray
+
+    Returns
+    -------
+    LazyArray
+        An expression consisting of the pdarray only
+
+    Raises
+    ------
+    TypeError
+        Raised if pda is not an int64 or float64 pdarray
+    ValueError
+        Raised if pda is not one-dimensional
+
+    Examples
+    --------
+    >>> a, b, c = ak.arange(5), ak.ones(5), ak.arange(5) * 2
+    >>> expr = (ak.lazy(a) * b + c) / 2
+    >>> expr
+    LazyArray((((id_1 * id_2) + id_3) / 2), dtype=float64, size=5)
+    >>> expr.evaluate()
+    array([0 1.5 3 4.5 6])
+    """
+    if pda.dtype not in (akint64, akfloat64):
+        raise TypeError(f"lazy evaluation is not supported for dtype {pda.dtype}")
+    if pda.ndim != 1:
+        raise ValueError("lazy evaluation is only supported for one-dimensional pdarrays")
+    return LazyArray._leaf(pda)
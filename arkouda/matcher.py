@@ -1,6 +1,7 @@
 import json
 import re
-from typing import cast
+from collections import OrderedDict
+from typing import List, Optional, Tuple, cast
 
 from arkouda.client import generic_msg
 from arkouda.dtypes import str_scalars
@@ -192,3 +193,43 @@ class Matcher:
             return Strings.from_return_msg("+".join(arrays[0:2])), create_pdarray(arrays[2])
         else:
             return Strings.from_return_msg(repMsg)
+
+
+# The maximum number of Matchers, and so of find_locations results, cached across Strings objects
+matcher_cache_size = 128
+
+# Matchers by (Strings entry name, pattern), least recently used first
+_matcher_cache: "OrderedDict[Tuple[str, str], Matcher]" = OrderedDict()
+
+
+def _get_cached_matcher(parent_entry_name: str, pattern: str, create: bool = True) -> Optional[Matcher]:
+    """
+    Return the cached Matcher of pattern for the Strings entry, creating and caching
+    it if it isn't cached and create is True. The least recently used Matchers are
+    evicted once more than matcher_cache_size are cached.
+    """
+    key = (parent_entry_name, pattern)
+    matcher = _matcher_cache.get(key)
+    if matcher is not None:
+        _matcher_cache.move_to_end(key)
+    elif create:
+        matcher = Matcher(pattern=pattern, parent_entry_name=parent_entry_name)
+        _matcher_cache[key] = matcher
+        while len(_matcher_cache) > max(matcher_cache_size, 0):
+            _matcher_cache.popitem(last=False)
+    return matcher
+
+
+def _cached_patterns(parent_entry_name: str) -> List[str]:
+    """
+    Return the patterns with Matchers cached for the Strings entry
+    """
+    return [pattern for name, pattern in _matcher_cache if name == parent_entry_name]
+
+
+def _purge_matchers(parent_entry_name: str) -> None:
+    """
+    Remove the Matchers cached for the Strings entry
+    """
+    for key in [key for key in _matcher_cache if key[0] == parent_entry_name]:
+        del _matcher_cache[key]
@@ -1,14 +1,37 @@
 from __future__ import annotations
 
 import json
+import struct
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional
-
-from typeguard import typechecked
+from typing import Dict, Optional, Union
 
 from arkouda.dtypes import isSupportedNumber, resolve_scalar_dtype
 
+"""
+Magic bytes prefixing requests and replies in the packed message encoding
+"""
+PACKED_MAGIC = b"AKPK"
+
+
+def _pack_str(s: str) -> bytes:
+    """
+    Encode a string for the packed message encoding as its UTF-8 bytes
+    prefixed by their length as a little-endian uint32.
+    """
+    b = s.encode()
+    return struct.pack("<I", len(b)) + b
+
+
+def _unpack_str(buf: memoryview, pos: int) -> tuple:
+    """
+    Decode a length-prefixed string of the packed message encoding starting
+    at pos, returning the string and the position following it.
+    """
+    (n,) = struct.unpack_from("<I", buf, pos)
+    pos += 4
+    return bytes(buf[pos : pos + n]).decode(), pos + n
+
 
 class ParameterObject:
     __slots__ = ("key", "dtype", "val")
@@ -17,6 +40,9 @@ class ParameterObject:
     dtype: str
     val: str
 
+    # dispatch table of the build functions, created on first use
+    _dispatch: Optional[Dict] = None
+
     def __init__(self, key, dtype, val):
         object.__setattr__(self, "key", key)
         object.__setattr__(self, "dtype", dtype)
@@ -30,8 +56,15 @@ class ParameterObject:
             "val": self.val,
         }
 
+    @property
+    def packed(self) -> bytes:
+        """
+        The parameter in the packed message encoding: key, dtype and val as
+        length-prefixed strings.
+        """
+        return _pack_str(self.key) + _pack_str(self.dtype) + _pack_str(self.val)
+
     @staticmethod
-    @typechecked
     def _build_pdarray_param(key: str, val) -> ParameterObject:
         """
         Create a ParameterObject from a pdarray value
@@ -47,10 +80,13 @@ class ParameterObject:
         -------
         ParameterObject
         """
+        future = getattr(val, "_batch_future", None)
+        if future is not None:
+            # the dtype of an array created in a batch is not known until the batch is flushed
+            return ParameterObject._build_future_param(key, future)
         return ParameterObject(key, str(val.dtype), val.name)
 
     @staticmethod
-    @typechecked
     def _build_sparray_param(key: str, val) -> ParameterObject:
         """
         Create a ParameterObject from a sparray value
@@ -69,7 +105,6 @@ class ParameterObject:
         return ParameterObject(key, str(val.dtype), val.name)
 
     @staticmethod
-    @typechecked
     def _build_strings_param(key: str, val) -> ParameterObject:
         """
         Create a ParameterObject from a Strings value
@@ -90,7 +125,6 @@ class ParameterObject:
         return ParameterObject(key, "str", name)
 
     @staticmethod
-    @typechecked
     def _build_segarray_param(key: str, val) -> ParameterObject:
         """
         Create a ParameterObject from a SegArray value
@@ -109,6 +143,24 @@ class ParameterObject:
         data = json.dumps({"segments": val.segments.name, "values": val.values.name})
         return ParameterObject(key, str(val.values.dtype), data)
 
+    @staticmethod
+    def _build_future_param(key: str, val) -> ParameterObject:
+        """
+        Create a ParameterObject from a BatchFuture value
+
+        Parameters
+        ----------
+        key : str
+            key from the dictionary object
+        val
+            BatchFuture referring to the symbol created by a batched command
+
+        Returns
+        -------
+        ParameterObject
+        """
+        return ParameterObject(key, val.dtype, val.name)
+
     @staticmethod
     def _is_supported_value(val):
         import builtins
@@ -128,7 +180,6 @@ class ParameterObject:
         )
 
     @staticmethod
-    @typechecked
     def _build_tuple_param(key: str, val: tuple) -> ParameterObject:
         """
         Create a ParameterObject from a tuple
@@ -147,7 +198,6 @@ class ParameterObject:
         return ParameterObject._build_list_param(key, list(val))
 
     @staticmethod
-    @typechecked
     def _build_list_param(key: str, val: list) -> ParameterObject:
         """
         Create a ParameterObject from a list
@@ -192,7 +242,6 @@ class ParameterObject:
         return ParameterObject(key, t, json.dumps(data))
 
     @staticmethod
-    @typechecked
     def _build_dict_param(key: str, val: Dict) -> ParameterObject:
         j = []
         for k, v in val.items():
@@ -203,7 +252,6 @@ class ParameterObject:
         return ParameterObject(key, str(dict.__name__), json.dumps(j))
 
     @staticmethod
-    @typechecked
     def _build_gen_param(key: str, val) -> ParameterObject:
         """
         Create a ParameterObject from a single value
@@ -231,10 +279,12 @@ class ParameterObject:
         -------
         Dictionary - mapping the parameter type to the build function
         """
+        from arkouda.client import BatchFuture
         from arkouda.segarray import SegArray
         from arkouda.strings import Strings
 
         return {
+            BatchFuture.__name__: ParameterObject._build_future_param,
             Strings.__name__: ParameterObject._build_strings_param,
             SegArray.__name__: ParameterObject._build_segarray_param,
             list.__name__: ParameterObject._build_list_param,
@@ -261,7 +311,9 @@ class ParameterObject:
         from arkouda.pdarrayclass import pdarray
         from arkouda.sparrayclass import sparray
 
-        dispatch = ParameterObject.generate_dispatch()
+        if ParameterObject._dispatch is None:
+            ParameterObject._dispatch = ParameterObject.generate_dispatch()
+        dispatch = ParameterObject._dispatch
         if isinstance(
             val, pdarray
         ):  # this is done here to avoid multiple dispatch entries for the same type
@@ -301,6 +353,32 @@ class MessageFormat(Enum):
         return self.value
 
 
+"""
+The MessageEncoding enum provides controlled vocabulary for how requests and
+string replies are serialized: JSON, or a compact length-prefixed binary
+encoding (PACKED) which the client uses if the server supports it.
+"""
+
+
+class MessageEncoding(Enum):
+    JSON = "json"
+    PACKED = "packed"
+
+    def __str__(self) -> str:
+        """
+        Overridden method returns value, which is useful in outputting
+        a MessageEncoding object to JSON.
+        """
+        return self.value
+
+    def __repr__(self) -> str:
+        """
+        Overridden method returns value, which is useful in outputting
+        a MessageEncoding object to JSON.
+        """
+        return self.value
+
+
 """
 The MessageType enum provides controlled vocabulary for the message
 type which can be either NORMAL, WARNING, or ERROR.
@@ -335,7 +413,7 @@ context of an Arkouda server request.
 
 @dataclass(frozen=True)
 class RequestMessage:
-    __slots__ = ("user", "token", "cmd", "format", "args", "size")
+    __slots__ = ("user", "token", "cmd", "format", "args", "size", "request_id", "deletes")
 
     user: str
     token: str
@@ -350,8 +428,10 @@ class RequestMessage:
         cmd: str,
         token: Optional[str] = None,
         format: MessageFormat = MessageFormat.STRING,
-        args: Optional[str] = None,
+        args: Optional[Union[str, bytes]] = None,
         size: int = -1,
+        request_id: Optional[str] = None,
+        deletes: Optional[str] = None,
     ) -> None:
         """
         Overridden __init__ method sets instance attributes to
@@ -368,11 +448,17 @@ class RequestMessage:
             The authentication token corresponding to the user
         format : MessageFormat
             The request message format
-        args : str
-            The delimited string containing the command arguments
+        args : str or bytes
+            The delimited string containing the command arguments, or the
+            packed command arguments when using the packed encoding
         size : int
             Value indicating the number of parameters in args
             -1 if args is not json
+        request_id : str, defaults to None
+            Identifier echoed back by the server in the corresponding reply
+        deletes : str, defaults to None
+            Space-delimited names of server objects to be deleted before
+            the command is executed
 
         Returns
         -------
@@ -384,6 +470,8 @@ class RequestMessage:
         object.__setattr__(self, "format", format)
         object.__setattr__(self, "args", args)
         object.__setattr__(self, "size", size)
+        object.__setattr__(self, "request_id", request_id)
+        object.__setattr__(self, "deletes", deletes)
 
     def asdict(self) -> Dict:
         """
@@ -399,6 +487,8 @@ class RequestMessage:
         # args and token logic will not be needed once Chapel supports nulls
         args = self.args if self.args else ""
         token = self.token if self.token else ""
+        request_id = self.request_id if self.request_id else ""
+        deletes = self.deletes if self.deletes else ""
 
         return {
             "user": self.user,
@@ -407,8 +497,42 @@ class RequestMessage:
             "format": str(self.format),
             "args": args,
             "size": self.size,
+            "request_id": request_id,
+            "deletes": deletes,
         }
 
+    def pack(self) -> bytes:
+        """
+        Serializes the RequestMessage in the packed encoding: the magic bytes,
+        then user, token, cmd, format, request_id and deletes as
+        length-prefixed strings, followed by the packed args.
+
+        Returns
+        -------
+        bytes
+            The packed request
+
+        Raises
+        ------
+        TypeError
+            Raised if args is not packed
+        """
+        args = self.args if self.args else struct.pack("<I", 0)
+        if not isinstance(args, bytes):
+            raise TypeError("args must be packed to serialize a request in the packed encoding")
+        return b"".join(
+            (
+                PACKED_MAGIC,
+                _pack_str(self.user),
+                _pack_str(self.token if self.token else ""),
+                _pack_str(self.cmd),
+                _pack_str(str(self.format)),
+                _pack_str(self.request_id if self.request_id else ""),
+                _pack_str(self.deletes if self.deletes else ""),
+                args,
+            )
+        )
+
 
 """
 The ReplyMessage class encapsulates the data and metadata corresponding to
@@ -418,12 +542,37 @@ a message returned by the Arkouda server
 
 @dataclass(frozen=True)
 class ReplyMessage:
-    __slots__ = ("msg", "msgType", "user")
+    __slots__ = ("msg", "msgType", "user", "exec_time")
 
     msg: str
     msgType: MessageType
     user: str
 
+    def __init__(self, msg: str, msgType: MessageType, user: str, exec_time: float = 0.0) -> None:
+        """
+        Overridden __init__ method so that exec_time, which is not compared
+        or included in the repr, is optional.
+
+        Parameters
+        ----------
+        msg : str
+            The reply message
+        msgType : MessageType
+            The reply message type
+        user : str
+            The user the reply corresponds to
+        exec_time : float, defaults to 0.0
+            Seconds the server spent executing the command
+
+        Returns
+        -------
+        None
+        """
+        object.__setattr__(self, "msg", msg)
+        object.__setattr__(self, "msgType", msgType)
+        object.__setattr__(self, "user", user)
+        object.__setattr__(self, "exec_time", exec_time)
+
     @staticmethod
     def fromdict(values: Dict) -> ReplyMessage:
         """
@@ -448,7 +597,53 @@ class ReplyMessage:
         """
         try:
             return ReplyMessage(
-                msg=values["msg"], msgType=MessageType(values["msgType"]), user=values["user"]
+                msg=values["msg"],
+                msgType=MessageType(values["msgType"]),
+                user=values["user"],
+                exec_time=float(values.get("exec_time", 0.0)),
             )
         except KeyError as ke:
             raise ValueError(f"values dict missing {ke} field")
+
+    @staticmethod
+    def unpack(buf: Union[bytes, memoryview]) -> ReplyMessage:
+        """
+        Generates a ReplyMessage from a reply in the packed encoding: the
+        magic bytes, a byte for the message type (0 normal, 1 warning,
+        2 error), user, request id and execution time as length-prefixed
+        strings, and the remaining bytes holding the message.
+
+        Parameters
+        ----------
+        buf : bytes or memoryview
+            The packed reply returned by the Arkouda server
+
+        Returns
+        -------
+        ReplyMessage
+            The ReplyMessage decoded from buf
+
+        Raises
+        ------
+        ValueError
+            Raised if buf is not a packed reply
+        """
+        view = memoryview(buf)
+        if bytes(view[: len(PACKED_MAGIC)]) != PACKED_MAGIC or len(view) < len(PACKED_MAGIC) + 13:
+            raise ValueError("Return message is not a packed reply")
+        try:
+            msg_type = _PACKED_MESSAGE_TYPES[view[len(PACKED_MAGIC)]]
+            user, pos = _unpack_str(view, len(PACKED_MAGIC) + 1)
+            _, pos = _unpack_str(view, pos)
+            exec_time, pos = _unpack_str(view, pos)
+        except (IndexError, struct.error):
+            raise ValueError("Return message is not a packed reply")
+        return ReplyMessage(
+            msg=bytes(view[pos:]).decode(),
+            msgType=msg_type,
+            user=user,
+            exec_time=float(exec_time) if exec_time else 0.0,
+        )
+
+
+_PACKED_MESSAGE_TYPES = (MessageType.NORMAL, MessageType.WARNING, MessageType.ERROR)
@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import builtins
 import json
-from functools import reduce
+import weakref
+from functools import reduce, wraps
 from math import ceil
-from typing import List, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda.client import BatchFuture, _defer_delete, generic_msg
 from arkouda.dtypes import NUMBER_FORMAT_STRINGS, DTypes, bigint
 from arkouda.dtypes import bool_ as akbool
 from arkouda.dtypes import dtype
@@ -385,18 +397,73 @@ class pdarray:
         self.ndim = ndim
         self.shape = shape
         self.itemsize = itemsize
+        # set before max_bits, whose setter clears it
+        self._reduction_cache: Optional[Dict[Tuple, Any]] = None
+        # the number of in-place modifications, which invalidate cached GroupBys of the array
+        self._mutations = 0
         if max_bits:
             self.max_bits = max_bits
 
         self.registered_name: Optional[str] = None
+        # the queued command creating an array in a batch, until the batch is flushed
+        self._batch_future: Optional[BatchFuture] = None
 
     def __del__(self):
         try:
             logger.debug(f"deleting pdarray with name {self.name}")
-            generic_msg(cmd="delete", args={"name": self.name})
+            # an array created in a batch that is not flushed yet is deleted when it is
+            if self._batch_future is None:
+                _defer_delete(self.name)
         except (RuntimeError, AttributeError):
             pass
 
+    @property
+    def dtype(self) -> np.dtype:
+        if self._batch_future is not None:
+            self._wait_batch()
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value: np.dtype) -> None:
+        self._dtype = value
+
+    @property
+    def itemsize(self) -> int_scalars:
+        if self._batch_future is not None:
+            self._wait_batch()
+        return self._itemsize
+
+    @itemsize.setter
+    def itemsize(self, value: int_scalars) -> None:
+        self._itemsize = value
+
+    def _wait_batch(self) -> None:
+        """
+        Flushes the batch the array is created in, whose reply gives its dtype
+        and itemsize
+
+        Raises
+        ------
+        AttributeError
+            Raised if the command creating the array was not executed; the
+            batch error is raised on exiting the batch and by BatchFuture.result
+        """
+        future = cast(BatchFuture, self._batch_future)
+        try:
+            future.wait()
+        except RuntimeError as e:
+            raise AttributeError(f"batched command {future.cmd} creating the array failed") from e
+
+    def _set_batch_reply(self, repMsg: str) -> None:
+        """
+        Sets the name and attributes of an array created in a batch from the
+        reply to the command that created it
+        """
+        (self.name, self.dtype, self.size, self.ndim, self.shape, self.itemsize) = _parse_pdarray_msg(
+            repMsg
+        )
+        self._batch_future = None
+
     def __bool__(self) -> builtins.bool:
         if self.size != 1:
             raise ValueError(
@@ -432,6 +499,51 @@ class pdarray:
         if self.dtype == bigint:
             generic_msg(cmd="set_max_bits", args={"array": self, "max_bits": max_bits})
             self._max_bits = max_bits
+            self._invalidate_reduction_cache()
+
+    def cache_reductions(self, enabled: builtins.bool = True) -> pdarray:
+        """
+        Enable or disable caching the results of scalar reductions of the array,
+        i.e., any, all, is_sorted, sum, prod, min, max, argmin, argmax, mean,
+        var and std. While enabled, each reduction is sent to the server only
+        the first time it is computed. The cache is cleared when the array is
+        modified in place with __setitem__, an op= operator or fill.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to cache reductions. Defaults to True.
+
+        Returns
+        -------
+        pdarray
+            The pdarray itself, to allow chaining
+
+        Notes
+        -----
+        The cache is held by this pdarray object, so modifications made to the
+        underlying server array through another pdarray object referencing it
+        (e.g., one attached to the same registered name) are not detected.
+
+        Examples
+        --------
+        >>> a = ak.arange(10).cache_reductions()
+        >>> a.max()  # computed by the server
+        9
+        >>> a.max()  # returned from the cache
+        9
+        >>> a[0] = 20  # clears the cache
+        >>> a.max()
+        20
+        """
+        self._reduction_cache = {} if enabled else None
+        return self
+
+    def _invalidate_reduction_cache(self) -> None:
+        # called by every in-place modification
+        self._mutations += 1
+        if self._reduction_cache:
+            self._reduction_cache.clear()
 
     def equals(self, other) -> bool:
         """
@@ -531,6 +643,13 @@ class pdarray:
         # For pdarray subclasses like ak.Datetime and ak.Timedelta, defer to child logic
         if type(other) is not pdarray and issubclass(type(other), pdarray):
             return NotImplemented
+        # Defer to lazy expressions so the operation is fused with them
+        from arkouda.lazyarray import LazyArray
+
+        if isinstance(other, LazyArray):
+            if op in LazyArray.FusedOps:
+                return NotImplemented
+            other = other.evaluate()
         if op not in self.BinOps:
             raise ValueError(f"bad operator {op}")
         # pdarray binop pdarray
@@ -539,12 +658,13 @@ class pdarray:
                 x1, x2, tmp_x1, tmp_x2 = broadcast_if_needed(self, other)
             except ValueError:
                 raise ValueError(f"shape mismatch {self.shape} {other.shape}")
-            repMsg = generic_msg(cmd=f"binopvv{x1.ndim}D", args={"op": op, "a": x1, "b": x2})
+            shape = x1.shape
+            repMsg = generic_msg(cmd=f"binopvv{x1.ndim}D", args={"op": op, "a": x1, "b": x2}, defer=True)
             if tmp_x1:
                 del x1
             if tmp_x2:
                 del x2
-            return create_pdarray(repMsg)
+            return create_pdarray(repMsg, shape=shape)
         # pdarray binop scalar
         # If scalar cannot be safely cast, server will infer the return dtype
         dt = resolve_scalar_dtype(other)
@@ -558,8 +678,9 @@ class pdarray:
         repMsg = generic_msg(
             cmd=f"binopvs{self.ndim}D",
             args={"op": op, "a": self, "dtype": dt, "value": other},
+            defer=True,
         )
-        return create_pdarray(repMsg)
+        return create_pdarray(repMsg, shape=self.shape)
 
     # reverse binary operators
     # pdarray binop pdarray: taken care of by binop function
@@ -603,8 +724,9 @@ class pdarray:
         repMsg = generic_msg(
             cmd=f"binopsv{self.ndim}D",
             args={"op": op, "dtype": dt, "value": other, "a": self},
+            defer=True,
         )
-        return create_pdarray(repMsg)
+        return create_pdarray(repMsg, shape=self.shape)
 
     def transfer(self, hostname: str, port: int_scalars):
         """
@@ -793,7 +915,8 @@ class pdarray:
         if isinstance(other, pdarray):
             if self.shape != other.shape:
                 raise ValueError(f"shape mismatch {self.shape} {other.shape}")
-            generic_msg(cmd=f"opeqvv{self.ndim}D", args={"op": op, "a": self, "b": other})
+            generic_msg(cmd=f"opeqvv{self.ndim}D", args={"op": op, "a": self, "b": other}, defer=True)
+            self._invalidate_reduction_cache()
             return self
         # pdarray binop scalar
         # opeq requires scalar to be cast as pdarray dtype
@@ -806,7 +929,9 @@ class pdarray:
         generic_msg(
             cmd=f"opeqvs{self.ndim}D",
             args={"op": op, "a": self, "dtype": self.dtype.name, "value": self.format_other(other)},
+            defer=True,
         )
+        self._invalidate_reduction_cache()
         return self
 
     # overload += pdarray, other can be {pdarray, int, float}
@@ -989,14 +1114,16 @@ class pdarray:
                 raise TypeError(f"unsupported pdarray index type {key.dtype}")
             if kind == "bool" and self.size != key.size:
                 raise ValueError(f"size mismatch {self.size} {key.size}")
+            # the size selected by a boolean index is not known until the command runs
             repMsg = generic_msg(
                 cmd="[pdarray]",
                 args={
                     "array": self,
                     "idx": key,
                 },
+                defer=kind != "bool",
             )
-            return create_pdarray(repMsg)
+            return create_pdarray(repMsg, shape=key.shape if kind != "bool" else None)
 
         if isinstance(key, slice):
             # handle the arr[:] case
@@ -1017,6 +1144,7 @@ class pdarray:
             _value = _to_pdarray(value)
         else:
             _value = value
+        self._invalidate_reduction_cache()
 
         if self.ndim == 1:
             if np.isscalar(key) and (resolve_scalar_dtype(key) in ["int64", "uint64"]):
@@ -1039,7 +1167,9 @@ class pdarray:
             elif isinstance(key, pdarray):
                 if isinstance(_value, pdarray):
                     generic_msg(
-                        cmd="[pdarray]=pdarray", args={"array": self, "idx": key, "value": _value}
+                        cmd="[pdarray]=pdarray",
+                        args={"array": self, "idx": key, "value": _value},
+                        defer=True,
                     )
                 else:
                     generic_msg(
@@ -1050,6 +1180,7 @@ class pdarray:
                             "dtype": self.dtype,
                             "value": self.format_other(_value),
                         },
+                        defer=True,
                     )
             elif isinstance(key, slice):
                 (start, stop, stride) = key.indices(self.size)
@@ -1253,6 +1384,7 @@ class pdarray:
         generic_msg(
             cmd=cmd, args={"array": self, "dtype": self.dtype.name, "val": self.format_other(value)}
         )
+        self._invalidate_reduction_cache()
 
     def any(self) -> np.bool_:
         """
@@ -1767,11 +1899,117 @@ class pdarray:
             shape = [i for i in shape]
         return ArrayView(base=self, shape=shape, order=order)
 
-    def to_ndarray(self) -> np.ndarray:
+    def _chunk_size(self, chunk_size: Optional[int]) -> int:
+        """
+        Validate a transfer chunk size (in elements), defaulting to the largest
+        chunk that fits within ``client.maxTransferBytes``.
+        """
+        from arkouda.client import maxTransferBytes
+
+        max_elements = builtins.max(maxTransferBytes // self.dtype.itemsize, 1)
+        if chunk_size is None:
+            return max_elements
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if chunk_size > max_elements:
+            raise RuntimeError(
+                "Chunk exceeds allowed size for transfer. Decrease chunk_size or increase "
+                "client.maxTransferBytes to allow"
+            )
+        return chunk_size
+
+    def _get_chunk(self, start: int, count: int) -> np.ndarray:
+        """
+        Transfer the flattened (row-major) elements [start, start + count) of
+        the array from the server.
+        """
+        dt = dtype(self.dtype)
+        data = cast(
+            memoryview,
+            generic_msg(
+                cmd=f"tondarrayChunk{self.ndim}D",
+                args={"array": self, "start": start, "count": count},
+                recv_binary=True,
+            ),
+        )
+        if len(data) != count * dt.itemsize:
+            raise RuntimeError(f"Expected {count * dt.itemsize} bytes but received {len(data)}")
+        # The server sends us native-endian data so we need to account for that
+        if get_server_byteorder() == "big":
+            dt = dt.newbyteorder(">")
+        else:
+            dt = dt.newbyteorder("<")
+        return np.frombuffer(data, dt)
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Iterate over the array data in bounded chunks, transferring one chunk
+        at a time from the Arkouda server to client-side Python.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The maximum number of elements per chunk. Defaults to the largest
+            number of elements fitting in ``client.maxTransferBytes``.
+
+        Yields
+        ------
+        np.ndarray
+            One-dimensional numpy arrays holding consecutive elements of the
+            array, in row-major order. The arrays are read-only views of the
+            received data.
+
+        Raises
+        ------
+        ValueError
+            Raised if chunk_size is not positive
+        RuntimeError
+            Raised if there is a server-side error thrown or if a single chunk
+            exceeds client.maxTransferBytes
+
+        See Also
+        --------
+        to_ndarray
+
+        Examples
+        --------
+        >>> a = ak.arange(5)
+        >>> [c for c in a.iter_chunks(2)]
+        [array([0, 1]), array([2, 3]), array([4])]
+        """
+        if self.dtype == bigint:
+            uint_arrays = self.bigint_to_uint_arrays()
+            nwords = len(uint_arrays)
+            chunk_size = uint_arrays[0]._chunk_size(chunk_size)
+            for start in range(0, self.size, chunk_size):
+                count = builtins.min(chunk_size, self.size - start)
+                words = [u._get_chunk(start, count).astype("O") for u in uint_arrays]
+                yield builtins.sum(w << (64 * (nwords - i - 1)) for i, w in enumerate(words))
+            return
+
+        chunk_size = self._chunk_size(chunk_size)
+        for start in range(0, self.size, chunk_size):
+            yield self._get_chunk(start, builtins.min(chunk_size, self.size - start))
+
+    def to_ndarray(
+        self, chunk_size: Optional[int] = None, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Convert the array to a np.ndarray, transferring array data from the
         Arkouda server to client-side Python. Note: if the pdarray size exceeds
-        client.maxTransferBytes, a RuntimeError is raised.
+        client.maxTransferBytes, a RuntimeError is raised, unless the transfer
+        is chunked by passing chunk_size or out.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            If given, transfer the array in chunks of at most this many
+            elements, each of which must fit in client.maxTransferBytes. The
+            total size of the array is then not limited by client.maxTransferBytes.
+        out : np.ndarray, optional
+            A preallocated, C-contiguous array (e.g. a ``np.memmap``) with the
+            same shape and dtype as the pdarray, into which the data is streamed
+            chunk by chunk. Implies a chunked transfer.
 
         Returns
         -------
@@ -1780,10 +2018,14 @@ class pdarray:
 
         Raises
         ------
+        ValueError
+            Raised if out does not match the shape and dtype of the pdarray, or
+            if out is given for a bigint pdarray
         RuntimeError
             Raised if there is a server-side error thrown, if the pdarray size
-            exceeds the built-in client.maxTransferBytes size limit, or if the bytes
-            received does not match expected number of bytes
+            (or, for a chunked transfer, the chunk size) exceeds the built-in
+            client.maxTransferBytes size limit, or if the bytes received does
+            not match expected number of bytes
         Notes
         -----
         The number of bytes in the array cannot exceed ``client.maxTransferBytes``,
@@ -1792,12 +2034,15 @@ class pdarray:
         is running, under the assumption that the server is running on a
         distributed system with much more memory than the client. The user
         may override this limit by setting client.maxTransferBytes to a larger
-        value, but proceed with caution.
+        value, but proceed with caution. Alternatively, a chunked transfer into
+        ``out`` only holds one chunk of received data in memory at a time, so
+        arrays larger than client memory can be written to a ``np.memmap``.
 
         See Also
         --------
         array()
         to_list()
+        iter_chunks()
 
         Examples
         --------
@@ -1807,11 +2052,18 @@ class pdarray:
 
         >>> type(a.to_ndarray())
         numpy.ndarray
+
+        >>> out = np.memmap("a.dat", dtype=np.int64, mode="w+", shape=(5,))
+        >>> a.to_ndarray(chunk_size=2, out=out)
+        memmap([0, 1, 2, 3, 4])
         """
         from arkouda.client import maxTransferBytes
 
         dt = dtype(self.dtype)
 
+        if chunk_size is not None or out is not None:
+            return self._to_ndarray_chunked(chunk_size, out)
+
         if dt == bigint:
             # convert uint pdarrays into object ndarrays and recombine
             arrs = [n.to_ndarray().astype("O") for n in self.bigint_to_uint_arrays()]
@@ -1851,6 +2103,37 @@ class pdarray:
         else:
             return x.reshape(self.shape)
 
+    def _to_ndarray_chunked(
+        self, chunk_size: Optional[int] = None, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Transfer the array chunk by chunk, copying each chunk into ``out``
+        (allocated if not given) as soon as it is received.
+        """
+        if self.dtype == bigint:
+            if out is not None:
+                raise ValueError("out is not supported for bigint pdarrays")
+            out = np.empty(self.size, dtype="O")
+        elif out is None:
+            out = np.empty(self.shape, dtype=dtype(self.dtype))
+        else:
+            if tuple(out.shape) != tuple(self.shape) or out.dtype != dtype(self.dtype):
+                raise ValueError(
+                    f"out must have shape {self.shape} and dtype {self.dtype}, "
+                    f"got shape {out.shape} and dtype {out.dtype}"
+                )
+            if not out.flags.c_contiguous:
+                raise ValueError("out must be C-contiguous")
+
+        flat = out.reshape(-1)
+        start = 0
+        for chunk in self.iter_chunks(chunk_size):
+            flat[start : start + len(chunk)] = chunk
+            start += len(chunk)
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
     def to_list(self) -> List:
         """
         Convert the array to a list, transferring array data from the
@@ -2519,16 +2802,22 @@ class pdarray:
 #       all values have been checked by python module and...
 #       server has created pdarray already before this is called
 @typechecked
-def create_pdarray(repMsg: str, max_bits=None) -> pdarray:
+def create_pdarray(
+    repMsg: Union[str, BatchFuture], max_bits=None, shape: Optional[Sequence[int]] = None
+) -> pdarray:
     """
     Return a pdarray instance pointing to an array created by the arkouda server.
     The user should not call this function directly.
 
     Parameters
     ----------
-    repMsg : str
+    repMsg : Union[str, BatchFuture]
         space-delimited string containing the pdarray name, datatype, size
-        dimension, shape,and itemsize
+        dimension, shape,and itemsize, or the future for the reply to a
+        command queued in a batch
+    shape : Sequence[int], optional
+        The shape of the array, if known before the reply to a command
+        queued in a batch
 
     Returns
     -------
@@ -2544,6 +2833,24 @@ def create_pdarray(repMsg: str, max_bits=None) -> pdarray:
         Raised if a server-side error is thrown in the process of creating
         the pdarray instance
     """
+    if isinstance(repMsg, BatchFuture):
+        if max_bits is None and shape is not None:
+            return _batched_pdarray(repMsg, shape)
+        repMsg.wait()
+        repMsg = cast(str, repMsg.result())
+    name, mydtype, size, ndim, parsed_shape, itemsize = _parse_pdarray_msg(repMsg)
+    logger.debug(
+        f"created Chapel array with name: {name} dtype: {mydtype} size: {size} ndim: {ndim} "
+        + f"shape: {parsed_shape} itemsize: {itemsize}"
+    )
+    return pdarray(name, mydtype, size, ndim, parsed_shape, itemsize, max_bits)
+
+
+def _parse_pdarray_msg(repMsg: str) -> Tuple[str, np.dtype, int, int, List[int], int]:
+    """
+    Parse the name, dtype, size, ndim, shape and itemsize of a pdarray from
+    the reply to the command that created it
+    """
     try:
         fields = repMsg.split()
         name = fields[1]
@@ -2560,11 +2867,31 @@ def create_pdarray(repMsg: str, max_bits=None) -> pdarray:
         itemsize = int(fields[6])
     except Exception as e:
         raise ValueError(e)
-    logger.debug(
-        f"created Chapel array with name: {name} dtype: {mydtype} size: {size} ndim: {ndim} "
-        + f"shape: {shape} itemsize: {itemsize}"
-    )
-    return pdarray(name, dtype(mydtype), size, ndim, shape, itemsize, max_bits)
+    return name, dtype(mydtype), size, ndim, shape, itemsize
+
+
+def _batched_pdarray(future: BatchFuture, shape: Sequence[int]) -> pdarray:
+    """
+    Return a pdarray for the array a command queued in a batch will create.
+    Until the batch is flushed, its name refers to the command, and its dtype
+    and itemsize are fetched by flushing.
+    """
+    # the placeholder dtype and itemsize are replaced by those in the reply
+    pda = pdarray(future.name, "float64", int(np.prod(shape)), len(shape), list(shape), 0)
+    pda._batch_future = future
+    ref = weakref.ref(pda)
+
+    def resolve(repMsg: str) -> str:
+        resolved = ref()
+        if resolved is None:
+            # the array was dropped before the batch was flushed
+            _defer_delete(_parse_pdarray_msg(repMsg)[0])
+        else:
+            resolved._set_batch_reply(repMsg)
+        return repMsg
+
+    future._post = resolve
+    return pda
 
 
 @typechecked
@@ -2619,6 +2946,27 @@ def clear() -> None:
     generic_msg(cmd="clear")
 
 
+def _cached_reduction(func: Callable) -> Callable:
+    """
+    Decorates a scalar reduction of a pdarray so its result is stored in, and
+    returned from, the reduction cache of the pdarray if it is enabled
+    (see pdarray.cache_reductions).
+    """
+
+    @wraps(func)
+    def wrapper(pda, *args, **kwargs):
+        cache = getattr(pda, "_reduction_cache", None)
+        if cache is None:
+            return func(pda, *args, **kwargs)
+        key = (func.__name__, *args, *sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = func(pda, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+@_cached_reduction
 @typechecked
 def any(pda: pdarray) -> np.bool_:
     """
@@ -2646,6 +2994,7 @@ def any(pda: pdarray) -> np.bool_:
     )
 
 
+@_cached_reduction
 @typechecked
 def all(pda: pdarray) -> np.bool_:
     """
@@ -2673,6 +3022,7 @@ def all(pda: pdarray) -> np.bool_:
     )
 
 
+@_cached_reduction
 @typechecked
 def is_sorted(pda: pdarray) -> np.bool_:
     """
@@ -2702,6 +3052,7 @@ def is_sorted(pda: pdarray) -> np.bool_:
     )
 
 
+@_cached_reduction
 @typechecked
 def sum(pda: pdarray) -> numeric_and_bool_scalars:
     """
@@ -2781,6 +3132,7 @@ def dot(
         return pda1 * pda2
 
 
+@_cached_reduction
 @typechecked
 def prod(pda: pdarray) -> np.float64:
     """
@@ -2810,6 +3162,7 @@ def prod(pda: pdarray) -> np.float64:
     return np.float64(parse_single_value(cast(str, repMsg)))
 
 
+@_cached_reduction
 def min(pda: pdarray) -> numpy_scalars:
     """
     Return the minimum value of the array.
@@ -2837,6 +3190,7 @@ def min(pda: pdarray) -> numpy_scalars:
     return parse_single_value(cast(str, repMsg))
 
 
+@_cached_reduction
 @typechecked
 def max(pda: pdarray) -> numpy_scalars:
     """
@@ -2865,6 +3219,7 @@ def max(pda: pdarray) -> numpy_scalars:
     return parse_single_value(cast(str, repMsg))
 
 
+@_cached_reduction
 @typechecked
 def argmin(pda: pdarray) -> Union[np.int64, np.uint64]:
     """
@@ -2894,6 +3249,7 @@ def argmin(pda: pdarray) -> Union[np.int64, np.uint64]:
     )
 
 
+@_cached_reduction
 @typechecked
 def argmax(pda: pdarray) -> Union[np.int64, np.uint64]:
     """
@@ -2923,6 +3279,7 @@ def argmax(pda: pdarray) -> Union[np.int64, np.uint64]:
     )
 
 
+@_cached_reduction
 @typechecked
 def mean(pda: pdarray) -> np.float64:
     """
@@ -2953,6 +3310,7 @@ def mean(pda: pdarray) -> np.float64:
     )
 
 
+@_cached_reduction
 @typechecked
 def var(pda: pdarray, ddof: int_scalars = 0) -> np.float64:
     """
@@ -3005,6 +3363,7 @@ def var(pda: pdarray, ddof: int_scalars = 0) -> np.float64:
     )
 
 
+@_cached_reduction
 @typechecked
 def std(pda: pdarray, ddof: int_scalars = 0) -> np.float64:
     """
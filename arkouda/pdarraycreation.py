@@ -142,6 +142,7 @@ def array(
     a: Union[pdarray, np.ndarray, Iterable],
     dtype: Union[np.dtype, type, str, None] = None,
     max_bits: int = -1,
+    chunk_size: Optional[int] = None,
 ) -> Union[pdarray, Strings]:
     """
     Convert a Python or Numpy Iterable to a pdarray or Strings object, sending
@@ -155,6 +156,12 @@ def array(
         The target dtype to cast values to
     max_bits: int
         Specifies the maximum number of bits; only used for bigint pdarrays
+    chunk_size: int, optional
+        If given, upload a numeric array in chunks of at most this many
+        elements, each of which must fit in ``ak.client.maxTransferBytes``.
+        The chunks are sent straight from the input's buffer (which may be a
+        ``np.memmap``), so the total size of the array is then not limited
+        by ``ak.client.maxTransferBytes``.
 
     Returns
     -------
@@ -186,7 +193,8 @@ def array(
     from overwhelming the connection between the Python client and the arkouda
     server, under the assumption that it is a low-bandwidth connection. The user
     may override this limit by setting ak.client.maxTransferBytes to a larger value,
-    but should proceed with caution.
+    but should proceed with caution. Alternatively, a chunked upload (see
+    ``chunk_size``) only bounds the size of each message.
 
     If the pdrray or ndarray is of type U, this method is called twice recursively
     to create the Strings object and the two corresponding pdarrays for string
@@ -236,7 +244,10 @@ def array(
     if a.ndim != 1:
         # TODO add order
         if a.dtype.name in NumericDTypes:
-            flat_a = array(a.flatten(), dtype=dtype)
+            # a chunked upload avoids copying C-contiguous inputs
+            flat_a = array(
+                a.flatten() if chunk_size is None else a.reshape(-1), dtype=dtype, chunk_size=chunk_size
+            )
             if isinstance(flat_a, pdarray):
                 # break into parts so mypy doesn't think we're calling reshape on a Strings
                 return flat_a.reshape(a.shape)
@@ -284,6 +295,9 @@ def array(
             return bigint_from_uint_arrays(uint_arrays[::-1], max_bits=max_bits)
         except TypeError:
             raise RuntimeError(f"Unhandled dtype {a.dtype}")
+    elif chunk_size is not None:
+        pda = _array_chunked(a, chunk_size)
+        return pda if dtype is None else akcast(pda, dtype)
     else:
         # Do not allow arrays that are too large
         size = a.size
@@ -347,6 +361,34 @@ def promote_to_common_dtype(arrays: List[pdarray]) -> Tuple[Any, List[pdarray]]:
     return (akdtype(dt), arrays)
 
 
+def _array_chunked(a: np.ndarray, chunk_size: int) -> pdarray:
+    """
+    Upload a rank-1 numeric ndarray by creating the pdarray on the server and
+    then sending it chunk_size elements at a time. Each chunk is sent from the
+    input's own buffer when it is C-contiguous and in server byte order;
+    otherwise only the chunk being sent is copied.
+    """
+    from arkouda.client import maxTransferBytes
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if chunk_size * a.itemsize > maxTransferBytes:
+        raise RuntimeError(
+            "Chunk exceeds allowed transfer size. Decrease chunk_size or increase "
+            "ak.client.maxTransferBytes to allow"
+        )
+    pda = create_pdarray(generic_msg(cmd=f"create<{a.dtype.name},1>", args={"shape": a.size}))
+    for start in range(0, a.size, chunk_size):
+        chunk = np.ascontiguousarray(a[start : start + chunk_size])
+        generic_msg(
+            cmd="arrayChunk1D",
+            args={"array": pda, "start": start, "count": chunk.size},
+            payload=_array_memview(chunk),
+            send_binary=True,
+        )
+    return pda
+
+
 def _array_memview(a) -> memoryview:
     if (get_byteorder(a.dtype) == "<" and get_server_byteorder() == "big") or (
         get_byteorder(a.dtype) == ">" and get_server_byteorder() == "little"
@@ -13,10 +13,10 @@ from arkouda.accessor import CachedAccessor, DatetimeAccessor, StringAccessor
 from arkouda.alignment import lookup
 from arkouda.categorical import Categorical
 from arkouda.dtypes import dtype, float64, int64
-from arkouda.groupbyclass import GroupBy, groupable_element_type
+from arkouda.groupbyclass import GroupBy, _GroupByCache, groupable_element_type
 from arkouda.index import Index, MultiIndex
 from arkouda.numeric import cast as akcast
-from arkouda.numeric import isnan, value_counts
+from arkouda.numeric import isnan
 from arkouda.pdarrayclass import (
     RegistrationError,
     any,
@@ -27,6 +27,7 @@ from arkouda.pdarrayclass import (
 from arkouda.pdarraycreation import arange, array, full, zeros
 from arkouda.pdarraysetops import argsort, concatenate, in1d, indexof1d
 from arkouda.segarray import SegArray
+from arkouda.sorting import argtopk
 from arkouda.strings import Strings
 from arkouda.util import get_callback, is_float
 
@@ -142,6 +143,8 @@ class Series:
             data = Categorical(data)
 
         self.registered_name: Optional[str] = None
+        # the grouping of the values, reused by value_counts
+        self._groupby_cache = _GroupByCache()
 
         if index is None and isinstance(data, (tuple, list)) and len(data) == 2:
             # handles the previous `ar_tuple` case
@@ -392,6 +395,7 @@ class Series:
         """
         val = self.validate_val(val)
         key = self.validate_key(key)
+        self._groupby_cache.invalidate(self.values)
 
         if isinstance(key, (pdarray, Strings)) and len(key) > 1 and self.has_repeat_labels():
             raise ValueError("Cannot set with multiple keys for Series with repeated labels.")
@@ -676,6 +680,36 @@ class Series:
 
         return Series(index=k.index[idx], data=v[idx])
 
+    @typechecked
+    def nlargest(self, n: int = 5) -> Series:
+        """Return the n largest values of the series, without sorting it
+
+        Parameters
+        ----------
+        n: Number of values to return
+
+        Returns
+        -------
+        A new Series with the n largest values in descending order. Equal
+        values are kept in the order they appear in the series.
+        """
+        return self._reindex(argtopk(self.values, n, ascending=False))
+
+    @typechecked
+    def nsmallest(self, n: int = 5) -> Series:
+        """Return the n smallest values of the series, without sorting it
+
+        Parameters
+        ----------
+        n: Number of values to return
+
+        Returns
+        -------
+        A new Series with the n smallest values in ascending order. Equal
+        values are kept in the order they appear in the series.
+        """
+        return self._reindex(argtopk(self.values, n, ascending=True))
+
     def _reindex(self, idx):
         if isinstance(self.index, MultiIndex):
             new_index = MultiIndex(self.index[idx].levels, name=self.index.name, names=self.index.names)
@@ -849,7 +883,7 @@ class Series:
         """
 
         dtype = get_callback(self.values)
-        idx, vals = value_counts(self.values)
+        idx, vals = self._groupby_cache.get([self.values]).size()
         s = Series(index=idx, data=vals)
         if sort:
             s = s.sort_values(ascending=False)
@@ -13,9 +13,14 @@ from arkouda.strings import Strings
 
 numeric_dtypes = {dtype(int64), dtype(uint64), dtype(float64)}
 
-__all__ = ["argsort", "coargsort", "sort"]
+__all__ = ["argpartition", "argsort", "argtopk", "coargsort", "sort"]
 
-SortingAlgorithm = Enum("SortingAlgorithm", ["RadixSortLSD", "TwoArrayRadixSort"])
+SortingAlgorithm = Enum("SortingAlgorithm", ["RadixSortLSD", "TwoArrayRadixSort", "PrefixRadixSort"])
+
+# The largest number of values argpartition and argtopk select with mink or maxk,
+# which keep that many values per task and merge them on one locale. Beyond it
+# they sort instead.
+max_select_k = 100000
 
 
 def argsort(
@@ -30,6 +35,12 @@ def argsort(
     ----------
     pda : pdarray or Strings or Categorical
         The array to sort (int64, uint64, or float64)
+    algorithm : SortingAlgorithm
+        The sorting algorithm to use. SortingAlgorithm.PrefixRadixSort sorts
+        Strings by their prefixes packed into uint64 keys, 8 bytes at a time,
+        and only sorts the strings still tied on the bytes compared so far by
+        their next bytes. It is usually fastest for strings that differ within
+        their first few bytes. For numeric arrays it is the same as RadixSortLSD.
 
     Returns
     -------
@@ -56,6 +67,9 @@ def argsort(
     >>> perm = ak.argsort(a)
     >>> a[perm]
     array([0, 1, 1, 3, 4, 5, 7, 8, 8, 9])
+    >>> s = ak.array(['banana', 'apple', 'bandana', 'apples'])
+    >>> s[ak.argsort(s, ak.sorting.SortingAlgorithm.PrefixRadixSort)]
+    array(['apple', 'apples', 'banana', 'bandana'])
     """
     from arkouda.categorical import Categorical
 
@@ -235,3 +249,241 @@ def sort(pda: pdarray, algorithm: SortingAlgorithm = SortingAlgorithm.RadixSortL
         cmd=f"sort{pda.ndim}D", args={"alg": algorithm.name, "array": pda, "axis": axis}
     )
     return create_pdarray(cast(str, repMsg))
+
+
+def _order_key(x: Union[pdarray, Strings, "Categorical"]) -> pdarray:  # type: ignore # noqa
+    """
+    Return a numeric pdarray ordered like the values of x. The order is exact
+    for pdarrays and Categoricals, but Strings are only ordered by their first
+    8 bytes, packed big-endian into a uint64, so strings sharing those are tied.
+    """
+    from arkouda.categorical import Categorical
+    from arkouda.numeric import cast as akcast
+    from arkouda.pdarraycreation import arange
+
+    if isinstance(x, Strings):
+        repMsg = generic_msg(cmd="segmentPrefixKeys", args={"objType": x.objType, "obj": x.entry})
+        return create_pdarray(cast(str, repMsg))
+    if isinstance(x, Categorical):
+        # the rank of each category in sorted order, as in Categorical.argsort
+        idxperm = argsort(x.categories)
+        inverse = zeros(idxperm.size, dtype=int64)
+        inverse[idxperm] = arange(idxperm.size)
+        return inverse[x.codes]
+    if x.dtype == bool_:
+        return akcast(x, "int")
+    return x
+
+
+def _dense_ranks(x: Union[pdarray, Strings]) -> pdarray:
+    """
+    Return the rank of each value of x among its distinct values in sorted order
+    """
+    from arkouda.numeric import cumsum
+
+    perm = argsort(x)
+    sorted_x = x[perm]
+    is_new = zeros(x.size, dtype=bool_)
+    is_new[0] = True
+    is_new[1:] = sorted_x[1:] != sorted_x[:-1]
+    ranks = zeros(x.size, dtype=int64)
+    ranks[perm] = cumsum(is_new)
+    return ranks
+
+
+def argpartition(
+    pda: Union[pdarray, Strings, "Categorical"], kth: int_scalars  # type: ignore # noqa
+) -> pdarray:
+    """
+    Return the indices that partition the array around its `kth` element in
+    sorted order, without sorting the whole array.
+
+    Parameters
+    ----------
+    pda : pdarray or Strings or Categorical
+        The array to partition
+    kth : int_scalars
+        The position in sorted order of the element to partition by. Negative
+        values count from the end of the array.
+
+    Returns
+    -------
+    pdarray, int64
+        The indices such that ``pda[indices][kth]`` is the element that would be
+        at position `kth` if the array were sorted, all the elements before it
+        are less than or equal to it and all the elements after it are greater
+        than or equal to it
+
+    Raises
+    ------
+    TypeError
+        Raised if the parameter is other than a pdarray, Strings or Categorical
+    ValueError
+        Raised if `kth` is out of bounds
+
+    See Also
+    --------
+    argsort, argtopk, mink, maxk
+
+    Notes
+    -----
+    The `kth` element is found with ``mink`` or ``maxk``, whichever keeps
+    fewer values, which select candidates on each locale before merging them.
+    The elements are then split into those less than, equal to and greater
+    than it, none of which are sorted. Strings are compared by their first 8
+    bytes and only the strings sharing those with the `kth` one are sorted.
+    NaNs are placed last, as by ``argsort``.
+
+    ``mink`` and ``maxk`` keep the values they select on every task, so when
+    `kth` is more than ``ak.sorting.max_select_k`` from both ends of the
+    array, the array is sorted with ``argsort`` instead.
+
+    Examples
+    --------
+    >>> a = ak.array([7, 1, 9, 4, 2, 8])
+    >>> perm = ak.argpartition(a, 2)
+    >>> a[perm][2]
+    4
+    >>> (a[perm][:2] <= 4).all() and (a[perm][3:] >= 4).all()
+    True
+    """
+    from arkouda.categorical import Categorical
+    from arkouda.numeric import isnan
+    from arkouda.pdarrayclass import maxk, mink
+    from arkouda.pdarraycreation import arange
+    from arkouda.pdarraysetops import concatenate
+
+    check_type(argname="argpartition", value=pda, expected_type=Union[pdarray, Strings, Categorical])
+    n = pda.size
+    if kth < 0:
+        kth += n
+    if kth < 0 or kth >= n:
+        raise ValueError(f"kth must be between {-n} and {n - 1}, not {kth}")
+    if isinstance(pda, pdarray) and pda.dtype == bigint:
+        return argsort(pda)
+
+    key = _order_key(pda)
+    idx = arange(n)
+    nans = None
+    if key.dtype == float64:
+        is_nan = isnan(key)
+        if is_nan.any():
+            # NaNs compare false to every pivot, so they are set aside and placed last
+            nans = idx[is_nan]
+            idx = idx[~is_nan]
+            key = key[idx]
+    m = key.size
+    if kth >= m:
+        # the kth element is a NaN, and any order of the others partitions them
+        return concatenate([idx, nans])
+    if min(kth + 1, m - kth) > max_select_k:
+        return argsort(pda)
+
+    pivot = mink(key, kth + 1)[-1] if kth < m // 2 else maxk(key, m - kth)[0]
+    band = idx[key == pivot]
+    if isinstance(pda, Strings):
+        band = band[argsort(pda[band])]
+    parts = [idx[key < pivot], band, idx[key > pivot]]
+    return concatenate(parts if nans is None else parts + [nans])
+
+
+def argtopk(
+    arrays: Union[pdarray, Strings, "Categorical", Sequence[Union[pdarray, Strings, "Categorical"]]],  # type: ignore # noqa
+    k: int_scalars,
+    ascending: bool = True,
+) -> pdarray:
+    """
+    Return the indices of the first `k` rows in sorted order, if the input
+    arrays are treated as columns, without sorting all the rows.
+
+    Parameters
+    ----------
+    arrays : pdarray, Strings, Categorical or Sequence of them
+        The columns (int64, uint64, float64, bool, Strings or Categorical) to
+        sort by, compared left to right
+    k : int_scalars
+        The number of rows to return the indices of. If it is more than the
+        number of rows, the indices of all the rows are returned.
+    ascending : bool
+        If True (default) the indices of the smallest rows are returned, else
+        those of the largest
+
+    Returns
+    -------
+    pdarray, int64
+        The indices of the first `k` rows in sorted order. Rows that are equal
+        are kept in the order they appear in the arrays.
+
+    Raises
+    ------
+    TypeError
+        Raised if the arrays are other than pdarrays, Strings or Categoricals
+    ValueError
+        Raised if `k` is negative or the arrays are not all of the same size
+
+    See Also
+    --------
+    argpartition, coargsort, argmink, argmaxk
+
+    Notes
+    -----
+    Unlike ``coargsort``, Strings and Categoricals are ordered by their values.
+
+    NaNs are placed last, whether ascending or not.
+
+    Candidates are selected with ``mink`` or ``maxk`` on the first column,
+    which keep `k` values per locale before merging them, and only the rows
+    tied with or ahead of the `k`-th candidate are sorted. Strings are compared
+    by their first 8 bytes to select candidates, so when most strings share
+    those, most rows are sorted. When `k` is more than ``ak.sorting.max_select_k``,
+    all the rows are sorted instead.
+
+    Examples
+    --------
+    >>> a = ak.array([3, 1, 3, 2, 3])
+    >>> s = ak.array(['b', 'z', 'a', 'q', 'c'])
+    >>> ak.argtopk([a, s], 3, ascending=False)
+    array([4, 0, 2])
+    """
+    from arkouda.categorical import Categorical
+    from arkouda.numeric import isnan, where
+    from arkouda.pdarrayclass import maxk, mink
+    from arkouda.pdarraycreation import arange
+
+    if isinstance(arrays, (pdarray, Strings, Categorical)):
+        arrays = [arrays]
+    check_type(
+        argname="argtopk", value=arrays, expected_type=Sequence[Union[pdarray, Strings, Categorical]]
+    )
+    if k < 0:
+        raise ValueError("k must be 0 or greater")
+    n = arrays[0].size
+    if any(a.size != n for a in arrays):
+        raise ValueError("All pdarrays, Strings, or Categoricals must be of the same size")
+    k = min(k, n)
+    if k == 0:
+        return zeros(0, dtype=int64)
+
+    first = arrays[0]
+    candidates = arange(n)
+    if k <= max_select_k and not (isinstance(first, pdarray) and first.dtype == bigint):
+        full_key = _order_key(first)
+        # NaNs are last, so they are only candidates if there are fewer than k other values
+        key = full_key[~isnan(full_key)] if full_key.dtype == float64 else full_key
+        if key.size >= k:
+            if ascending:
+                candidates = candidates[full_key <= mink(key, k)[-1]]
+            else:
+                candidates = candidates[full_key >= maxk(key, k)[0]]
+
+    ranks = []
+    for a in arrays:
+        c = a[candidates]
+        key = c if isinstance(c, Strings) else _order_key(c)
+        r = _dense_ranks(key)
+        r = r if ascending else -r
+        if isinstance(key, pdarray) and key.dtype == float64:
+            r = where(isnan(key), key.size + 1, r)
+        ranks.append(r)
+    # coargsort is stable, so tied rows stay in the order of the candidates
+    return candidates[coargsort(ranks)[:k]]
@@ -6,7 +6,7 @@ from typing import Optional, Sequence, Union
 import numpy as np
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda.client import _defer_delete, generic_msg
 from arkouda.dtypes import dtype, int_scalars
 from arkouda.logger import getArkoudaLogger
 
@@ -66,7 +66,7 @@ class sparray:
     def __del__(self):
         try:
             logger.debug(f"deleting pdarray with name {self.name}")
-            generic_msg(cmd="delete", args={"name": self.name})
+            _defer_delete(self.name)
         except (RuntimeError, AttributeError):
             pass
 
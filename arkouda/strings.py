@@ -3,7 +3,8 @@ from __future__ import annotations
 import codecs
 import itertools
 import re
-from typing import Dict, List, Optional, Tuple, Union, cast
+import weakref
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 from typeguard import typechecked
@@ -22,15 +23,21 @@ from arkouda.dtypes import (
 from arkouda.infoclass import information, list_symbol_table
 from arkouda.logger import getArkoudaLogger
 from arkouda.match import Match, MatchType
+from arkouda.matcher import _cached_patterns, _get_cached_matcher, _purge_matchers
 from arkouda.pdarrayclass import RegistrationError
 from arkouda.pdarrayclass import all as akall
 from arkouda.pdarrayclass import create_pdarray, parse_single_value, pdarray
 
+if TYPE_CHECKING:
+    from arkouda.categorical import Categorical
+    from arkouda.segarray import SegArray
+
 __all__ = ["Strings"]
 
 # Command strings for message passing to arkouda server, specific to Strings
 CMD_ASSEMBLE = "segStr-assemble"
 CMD_TO_NDARRAY = "segStr-tondarray"
+CMD_TO_NDARRAY_CHUNK = "segStr-tondarrayChunk"
 
 
 class Strings:
@@ -185,7 +192,9 @@ class Strings:
         self._bytes: Optional[pdarray] = None
         self._offsets: Optional[pdarray] = None
         self.dtype = akdtype(str_)
-        self._regex_dict: Dict = dict()
+        if self.name is not None:
+            # the Matchers of a Strings entry are cached across objects until the entry is deleted
+            weakref.finalize(self.entry, _purge_matchers, self.name)
         self.logger = getArkoudaLogger(name=__class__.__name__)  # type: ignore
 
     """
@@ -1018,6 +1027,48 @@ class Strings:
             )
         )
 
+    def dictionary_encode(self, max_cardinality_ratio: float = 0.5) -> Union[Strings, Categorical]:
+        """
+        Dictionary-encode the strings if they are repetitive enough, storing each unique
+        string once along with the code of each element's string.
+
+        Parameters
+        ----------
+        max_cardinality_ratio : float
+            The largest ratio of unique strings to elements for which to encode the strings
+
+        Returns
+        -------
+        Union[Strings, Categorical]
+            A Categorical of the strings if the ratio of unique strings to elements is at most
+            max_cardinality_ratio, otherwise this Strings object
+
+        See Also
+        --------
+        Categorical
+
+        Notes
+        -----
+        Categorical methods like ``==``, ``contains``, ``lower`` and ``argsort`` operate on
+        the unique strings and broadcast the results to the elements by their codes,
+        and gathers only move the codes, so on low-cardinality strings they move much
+        less data than the corresponding Strings methods.
+
+        Examples
+        --------
+        >>> strings = ak.array(['host1', 'host2', 'host1', 'host1'])
+        >>> strings.dictionary_encode()
+        array(['host1', 'host2', 'host1', 'host1'])
+        >>> type(strings.dictionary_encode())
+        <class 'arkouda.categorical.Categorical'>
+        """
+        from arkouda.categorical import Categorical
+
+        cat = Categorical(self)
+        # categories also holds the N/A value when the strings do not
+        unique_count = cat._categories_used.size
+        return cat if unique_count <= max_cardinality_ratio * self.size else self
+
     @typechecked
     def strip(self, chars: Optional[Union[bytes, str_scalars]] = "") -> Strings:
         """
@@ -1066,14 +1117,14 @@ class Strings:
         """
         Returns the regex patterns for which Match objects have been cached
         """
-        return list(self._regex_dict.keys())
+        return _cached_patterns(self.entry.name)
 
     @typechecked
     def purge_cached_regex_patterns(self) -> None:
         """
         purges cached regex patterns
         """
-        self._regex_dict = dict()
+        _purge_matchers(self.entry.name)
 
     def _empty_pattern_verification(self, pattern):
         if pattern == "$" or (re.search(pattern, "") and (self == "").any()):  # type: ignore
@@ -1085,10 +1136,9 @@ class Strings:
 
     def _get_matcher(self, pattern: Union[bytes, str_scalars], create: bool = True):
         """
-        internal function to fetch cached Matcher objects
+        internal function to fetch cached Matcher objects, which are shared by all
+        Strings objects of the same server entry
         """
-        from arkouda.matcher import Matcher
-
         if isinstance(pattern, bytes):
             pattern = pattern.decode()
         try:
@@ -1096,13 +1146,7 @@ class Strings:
         except Exception as e:
             raise ValueError(e)
         self._empty_pattern_verification(pattern)
-        matcher = None
-        if pattern in self._regex_dict:
-            matcher = self._regex_dict[pattern]
-        elif create:
-            self._regex_dict[pattern] = Matcher(pattern=pattern, parent_entry_name=self.entry.name)
-            matcher = self._regex_dict[pattern]
-        return matcher
+        return _get_cached_matcher(self.entry.name, pattern, create)
 
     @typechecked
     def find_locations(self, pattern: Union[bytes, str_scalars]) -> Tuple[pdarray, pdarray, pdarray]:
@@ -1459,6 +1503,152 @@ class Strings:
             )
         )
 
+    def _prep_patterns(self, patterns: Sequence[Union[bytes, str_scalars]], regex: bool) -> List[str]:
+        """
+        internal function to decode, escape and verify a list of patterns
+        """
+        if isinstance(patterns, (str, bytes)):
+            raise TypeError("patterns must be a sequence of patterns, not a single pattern")
+        if len(patterns) == 0:
+            raise ValueError("At least one pattern is required")
+        prepped = []
+        for pattern in patterns:
+            if isinstance(pattern, bytes):
+                pattern = pattern.decode()
+            if not regex:
+                pattern = re.escape(pattern)
+            try:
+                re.compile(pattern)
+            except Exception as e:
+                raise ValueError(e)
+            self._empty_pattern_verification(pattern)
+            prepped.append(pattern)
+        return prepped
+
+    @typechecked
+    def contains_any(
+        self, patterns: Sequence[Union[bytes, str_scalars]], regex: bool = False
+    ) -> pdarray:
+        """
+        Check whether each element contains any of the given substrings, in a single
+        pass over the strings rather than one per substring.
+
+        Parameters
+        ----------
+        patterns: Sequence[str_scalars]
+            The substrings in the form of strings or byte arrays to search for
+        regex: bool
+            Indicates whether patterns are regular expressions
+            Note: only handles regular expressions supported by re2
+            (does not support lookaheads/lookbehinds)
+
+        Returns
+        -------
+        pdarray, bool
+            True for elements that contain any of the patterns, False otherwise
+
+        Raises
+        ------
+        TypeError
+            Raised if patterns is not a sequence of bytes or str_scalars
+        ValueError
+            Raised if patterns is empty or contains an invalid regex
+        RuntimeError
+            Raised if there is a server-side error thrown
+
+        See Also
+        --------
+        Strings.contains, Strings.match_set
+
+        Notes
+        -----
+        The patterns are combined into a single regular expression, which re2 compiles
+        into one automaton that checks all of them at once.
+
+        Examples
+        --------
+        >>> strings = ak.array(['GET /index', 'POST /login', 'GET /login', 'PUT /file'])
+        >>> strings.contains_any(['POST', 'PUT'])
+        array([False True False True])
+        """
+        pattern = "|".join(f"(?:{p})" for p in self._prep_patterns(patterns, regex))
+        return self.contains(pattern, regex=True)
+
+    def match_set(self, patterns: Sequence[Union[bytes, str_scalars]], regex: bool = False) -> SegArray:
+        """
+        Find which of the given substrings each element contains, in a single pass over
+        the strings rather than one per substring.
+
+        Parameters
+        ----------
+        patterns: Sequence[str_scalars]
+            The substrings in the form of strings or byte arrays to search for
+        regex: bool
+            Indicates whether patterns are regular expressions
+            Note: only handles regular expressions supported by re2
+            (does not support lookaheads/lookbehinds)
+
+        Returns
+        -------
+        SegArray
+            For each element, the indices into patterns of the patterns it contains,
+            in increasing order
+
+        Raises
+        ------
+        TypeError
+            Raised if patterns is not a sequence of bytes or str_scalars
+        ValueError
+            Raised if patterns is empty or contains an invalid regex
+        RuntimeError
+            Raised if there is a server-side error thrown
+
+        See Also
+        --------
+        Strings.contains, Strings.contains_any
+
+        Notes
+        -----
+        Literal patterns are compiled into an Aho-Corasick automaton, which finds
+        all of the patterns an element contains in one scan of its bytes, however
+        many patterns there are.
+
+        With ``regex=True``, elements that do not match the combined pattern, which
+        checks all of the patterns at once, are not checked against each pattern.
+        Those that match it are checked against each pattern once, so when most
+        elements match some pattern, this costs about as much as calling
+        ``contains`` for each.
+
+        Examples
+        --------
+        >>> strings = ak.array(['GET /index', 'POST /login', 'GET /login', 'PUT /file'])
+        >>> strings.match_set(['GET', 'login', 'PUT'])
+        SegArray([
+        [0]
+        [1]
+        [0 1]
+        [2]
+        ])
+        """
+        from arkouda.segarray import SegArray
+
+        prepped = self._prep_patterns(patterns, regex)
+        if not regex:
+            # the automaton matches literal bytes, so send the patterns unescaped
+            prepped = [p.decode() if isinstance(p, bytes) else p for p in patterns]
+        return SegArray.from_return_msg(
+            generic_msg(
+                cmd="segmentedMatchSet",
+                args={
+                    "objType": self.objType,
+                    "obj": self.entry,
+                    "n": len(prepped),
+                    "patterns": prepped,
+                    "regex": regex,
+                },
+            )
+        )
+
     @typechecked
     def startswith(self, substr: Union[bytes, str_scalars], regex: bool = False) -> pdarray:
         """
@@ -2089,11 +2279,18 @@ class Strings:
         """
         return [self]
 
-    def to_ndarray(self) -> np.ndarray:
+    def to_ndarray(self, chunk_size: Optional[int] = None) -> np.ndarray:
         """
         Convert the array to a np.ndarray, transferring array data from the
         arkouda server to Python. If the array exceeds a built-in size limit,
-        a RuntimeError is raised.
+        a RuntimeError is raised, unless chunk_size is given.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            If given, transfer the offsets and values in chunks of at most
+            this many elements, each of which must fit in
+            ``ak.client.maxTransferBytes``.
 
         Returns
         -------
@@ -2108,7 +2305,8 @@ class Strings:
         is running, under the assumption that the server is running on a
         distributed system with much more memory than the client. The user
         may override this limit by setting ak.client.maxTransferBytes to a larger
-        value, but proceed with caution.
+        value, but proceed with caution. A chunked transfer only bounds the
+        size of each chunk.
 
         See Also
         --------
@@ -2124,9 +2322,9 @@ class Strings:
         numpy.ndarray
         """
         # Get offsets and append total bytes for length calculation
-        npoffsets = np.hstack((self._comp_to_ndarray("offsets"), np.array([self.nbytes])))
+        npoffsets = np.hstack((self._comp_to_ndarray("offsets", chunk_size), np.array([self.nbytes])))
         # Get contents of strings (will error if too large)
-        npvalues = self._comp_to_ndarray("values")
+        npvalues = self._comp_to_ndarray("values", chunk_size)
         # Compute lengths, discounting null terminators
         lengths = np.diff(npoffsets) - 1
         # Numpy dtype is based on max string length
@@ -2172,7 +2370,7 @@ class Strings:
         """
         return self.to_ndarray().tolist()
 
-    def _comp_to_ndarray(self, comp: str) -> np.ndarray:
+    def _comp_to_ndarray(self, comp: str, chunk_size: Optional[int] = None) -> np.ndarray:
         """
         This is an internal helper function to perform the to_ndarray for one
         of the string components.
@@ -2181,6 +2379,10 @@ class Strings:
         ----------
         comp : str
             The strings component to request
+        chunk_size : int, optional
+            If given, stream the component into a preallocated array in chunks
+            of at most this many elements, so that only the size of each chunk
+            is limited by client.maxTransferBytes
 
         Returns
         -------
@@ -2205,6 +2407,9 @@ class Strings:
         """
         from arkouda.client import maxTransferBytes
 
+        if chunk_size is not None:
+            return self._comp_to_ndarray_chunked(comp, chunk_size)
+
         # Total number of bytes in the array data
         array_bytes = (
             self.size * arkouda.dtypes.dtype(arkouda.dtypes.int64).itemsize
@@ -2239,6 +2444,43 @@ class Strings:
             else np.frombuffer(rep_msg, dt).copy()
         )
 
+    def _comp_to_ndarray_chunked(self, comp: str, chunk_size: int) -> np.ndarray:
+        """
+        Transfer one of the string components in chunks of at most chunk_size
+        elements, copying each chunk into a preallocated array as it arrives.
+        """
+        from arkouda.client import maxTransferBytes
+
+        dt: np.dtype = np.dtype(np.int64) if comp == "offsets" else np.dtype(np.uint8)
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if chunk_size * dt.itemsize > maxTransferBytes:
+            raise RuntimeError(
+                "Chunk exceeds allowed size for transfer. Decrease chunk_size or increase "
+                "ak.client.maxTransferBytes to allow"
+            )
+        if arkouda.dtypes.get_server_byteorder() == "big":
+            dt = dt.newbyteorder(">")
+        else:
+            dt = dt.newbyteorder("<")
+
+        size = self.size if comp == "offsets" else self.nbytes
+        out = np.empty(size, dtype=dt)
+        for start in range(0, size, chunk_size):
+            count = min(chunk_size, size - start)
+            rep_msg = cast(
+                memoryview,
+                generic_msg(
+                    cmd=CMD_TO_NDARRAY_CHUNK,
+                    args={"obj": self.entry, "comp": comp, "start": start, "count": count},
+                    recv_binary=True,
+                ),
+            )
+            if len(rep_msg) != count * dt.itemsize:
+                raise RuntimeError(f"Expected {count * dt.itemsize} bytes but received {len(rep_msg)}")
+            out[start : start + count] = np.frombuffer(rep_msg, dt)
+        return out
+
     def astype(self, dtype) -> pdarray:
         """
         Cast values of Strings object to provided dtype
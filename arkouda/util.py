@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import builtins
 import json
-from typing import TYPE_CHECKING, Sequence, Tuple, Union, cast
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple, Union, cast
 from warnings import warn
 
 from typeguard import typechecked
@@ -188,12 +188,23 @@ def register(obj, name):
 
 @typechecked
 def attach(name: str):
+    rep_msg = json.loads(cast(str, generic_msg(cmd="attach", args={"name": name})))
+    rtn_obj = _build_registered_obj(rep_msg)
+    if rtn_obj is not None:
+        rtn_obj.registered_name = name
+    return rtn_obj
+
+
+def _build_registered_obj(rep_msg: Dict):
+    """
+    Build the object described by the objType and create message of a
+    registered object, as returned by the server's attach command
+    """
     from arkouda.dataframe import DataFrame
     from arkouda.index import Index, MultiIndex
     from arkouda.pdarrayclass import pdarray
     from arkouda.series import Series
 
-    rep_msg = json.loads(cast(str, generic_msg(cmd="attach", args={"name": name})))
     rtn_obj = None
     if rep_msg["objType"].lower() == pdarray.objType.lower():
         rtn_obj = create_pdarray(rep_msg["create"])
@@ -222,9 +233,6 @@ def attach(name: str):
         rtn_obj = Series.from_return_msg(rep_msg["create"])
     elif rep_msg["objType"].lower() == BitVector.special_objType.lower():
         rtn_obj = BitVector.from_return_msg(rep_msg["create"])
-
-    if rtn_obj is not None:
-        rtn_obj.registered_name = name
     return rtn_obj
 
 
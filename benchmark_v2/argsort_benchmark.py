@@ -1,5 +1,6 @@
 import arkouda as ak
 import pytest
+from arkouda.sorting import SortingAlgorithm
 
 TYPES = ("int64", "uint64", "float64", "str")
 
@@ -34,3 +35,41 @@ def bench_argsort(benchmark, dtype):
         benchmark.extra_info["problem_size"] = pytest.prob_size
         benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
             (nbytes / benchmark.stats["mean"]) / 2 ** 30)
+
+
+STRING_CASES = ("short-uniform", "lognormal", "shared-prefix")
+
+
+@pytest.mark.benchmark(group="AK_Argsort_Strings")
+@pytest.mark.parametrize("algo", SortingAlgorithm)
+@pytest.mark.parametrize("case", STRING_CASES)
+def bench_argsort_strings(benchmark, algo, case):
+    """
+    Measure string ArgSort performance of each SortingAlgorithm on string length
+    distributions like those of real string columns
+
+    Note
+    -----
+    short-uniform: 1 to 16 characters, like codes and hostnames
+    lognormal: lengths with a long tail, like user agents
+    shared-prefix: strings that only differ after a common 24-byte prefix, like URLs
+    """
+    if "str" in pytest.dtype:
+        cfg = ak.get_config()
+        N = pytest.prob_size * cfg["numLocales"]
+        if case == "short-uniform":
+            a = ak.random_strings_uniform(1, 16, N, seed=pytest.seed)
+        elif case == "lognormal":
+            a = ak.random_strings_lognormal(2, 0.5, N, seed=pytest.seed)
+        else:
+            a = ak.random_strings_uniform(1, 16, N, seed=pytest.seed).stick(
+                ak.full(N, "https://example.com/path"), delimiter="", toLeft=True
+            )
+        nbytes = a.nbytes * a.entry.itemsize
+
+        benchmark.pedantic(ak.argsort, args=[a, algo], rounds=pytest.trials)
+
+        benchmark.extra_info["description"] = "Measures the performance of ak.argsort on Strings"
+        benchmark.extra_info["problem_size"] = pytest.prob_size
+        benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+            (nbytes / benchmark.stats["mean"]) / 2 ** 30)
@@ -50,3 +50,21 @@ def bench_groupby(benchmark, numArrays, dtype):
         benchmark.extra_info["problem_size"] = pytest.prob_size
         benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
             (totalbytes / benchmark.stats["mean"]) / 2 ** 30)
+
+
+@pytest.mark.benchmark(group="GroupBy_Method")
+@pytest.mark.parametrize("cardinality", [2**4, 2**10, 2**16, 2**24])
+@pytest.mark.parametrize("method", ["sort", "hash"])
+def bench_groupby_method(benchmark, method, cardinality):
+    if "int64" in pytest.dtype:
+        cfg = ak.get_config()
+        N = pytest.prob_size * cfg["numLocales"]
+        a = ak.randint(0, cardinality, N, seed=pytest.seed)
+        benchmark.pedantic(ak.GroupBy, args=[a], kwargs={"method": method}, rounds=pytest.trials)
+
+        benchmark.extra_info["description"] = (
+            "Measures the performance of ak.GroupBy by sorting or hashing across key cardinalities"
+        )
+        benchmark.extra_info["problem_size"] = pytest.prob_size
+        benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+            (a.size * a.itemsize / benchmark.stats["mean"]) / 2 ** 30)
@@ -1,3 +1,5 @@
+import json
+
 import arkouda as ak
 import numpy as np
 import pytest
@@ -14,8 +16,8 @@ def bench_ak_noop(benchmark):
     benchmark.extra_info["description"] = \
         "Measures the performance of ak.client._no_op for a basic round-trip time"
     benchmark.extra_info["problem_size"] = "N/A"
-    benchmark.extra_info["transfer_rate"] = f"{benchmark.stats['rounds'] / benchmark.stats['total']:.4f} " \
-                                            f"operations per second"
+    rate = benchmark.stats["rounds"] / benchmark.stats["total"]
+    benchmark.extra_info["transfer_rate"] = f"{rate:.4f} operations per second"
 
 
 @pytest.mark.benchmark(group="Arkouda_No_Op",
@@ -29,5 +31,65 @@ def bench_np_noop(benchmark):
             "Measures the performance of np.get_include for a basic round-trip time comparison" \
             "with ak.client._no_op"
         benchmark.extra_info["problem_size"] = "N/A"
-        benchmark.extra_info["transfer_rate"] = f"{benchmark.stats['rounds'] / benchmark.stats['total']:.4f} " \
-                                                f"operations per second"
+        rate = benchmark.stats["rounds"] / benchmark.stats["total"]
+        benchmark.extra_info["transfer_rate"] = f"{rate:.4f} operations per second"
+
+
+def _encode_request(encoding, args):
+    from arkouda.message import MessageFormat, RequestMessage
+
+    if encoding == "packed":
+        size, msg_args = ak.client._packed_args(args)
+        return RequestMessage(user="user", cmd="noop", args=msg_args, size=size).pack()
+    size, msg_args = ak.client._json_args_to_str(args)
+    message = RequestMessage(
+        user="user", cmd="noop", format=MessageFormat.STRING, args=msg_args, size=size
+    )
+    return json.dumps(message.asdict()).encode()
+
+
+@pytest.mark.benchmark(group="Arkouda_No_Op_Args",
+                       max_time=SECONDS
+                       )
+@pytest.mark.parametrize("encoding", ["json", "packed"])
+def bench_ak_noop_args(benchmark, encoding):
+    """
+    Round trip of a no-op carrying the arguments of a typical scalar indexing
+    request, with the request and reply in the given encoding
+    """
+    from arkouda.message import MessageEncoding
+
+    channel = ak.client.channel
+    previous = channel.encoding
+    channel.encoding = ak.client._negotiate_encoding(MessageEncoding(encoding), channel)
+    a = ak.arange(10)
+    args = {"array": a, "idx": 3, "dtype": "int64", "names": ["a", "b"]}
+    try:
+        benchmark(ak.client.generic_msg, cmd="noop", args=args)
+    finally:
+        channel.encoding = previous
+
+    benchmark.extra_info["description"] = \
+        f"Measures the round-trip time of a noop with arguments using the {encoding} encoding"
+    benchmark.extra_info["problem_size"] = "N/A"
+    rate = benchmark.stats["rounds"] / benchmark.stats["total"]
+    benchmark.extra_info["transfer_rate"] = f"{rate:.4f} operations per second"
+
+
+@pytest.mark.benchmark(group="Arkouda_Request_Encoding",
+                       max_time=SECONDS
+                       )
+@pytest.mark.parametrize("encoding", ["json", "packed"])
+def bench_request_encoding(benchmark, encoding):
+    """
+    Client-side serialization of the request sent by bench_ak_noop_args
+    """
+    a = ak.arange(10)
+    args = {"array": a, "idx": 3, "dtype": "int64", "names": ["a", "b"]}
+    benchmark(_encode_request, encoding, args)
+
+    benchmark.extra_info["description"] = \
+        f"Measures the client-side cost of serializing a request using the {encoding} encoding"
+    benchmark.extra_info["problem_size"] = "N/A"
+    rate = benchmark.stats["rounds"] / benchmark.stats["total"]
+    benchmark.extra_info["transfer_rate"] = f"{rate:.4f} operations per second"
@@ -26,6 +26,7 @@ module ArgSortMsg
 
     use RadixSortLSD;
     use SegmentedString;
+    use SegStringSort only prefixStringSort;
     use Reflection;
     use ServerErrors;
     use Logging;
@@ -58,7 +59,9 @@ module ArgSortMsg
 
     enum SortingAlgorithm {
       RadixSortLSD,
-      TwoArrayRadixSort
+      TwoArrayRadixSort,
+      // sorts Strings by their prefixes packed into uint64 keys, see prefixStringSort
+      PrefixRadixSort
     };
     config const defaultSortAlgorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD;
 
@@ -330,7 +333,8 @@ module ArgSortMsg
           dynamicTwoArrayRadixSort(AI, comparator=myDefaultComparator);
           iv = [(a, i) in AI] i;
         }
-        when SortingAlgorithm.RadixSortLSD {
+        // numeric keys are already fixed width, so they are radix sorted whole
+        when SortingAlgorithm.RadixSortLSD, SortingAlgorithm.PrefixRadixSort {
           iv = radixSortLSD_ranks(A);
         }
         otherwise {
@@ -377,7 +381,7 @@ module ArgSortMsg
             }
           }
         }
-        when SortingAlgorithm.RadixSortLSD {
+        when SortingAlgorithm.RadixSortLSD, SortingAlgorithm.PrefixRadixSort {
           // TODO: make a version of radixSortLSD_ranks that does the sort on
           // slices of `A` directly instead of creating a copy for each slice
           for idx in DD {
@@ -478,7 +482,9 @@ module ArgSortMsg
             // check and throw if over memory limit
             overMemLimit((8 * strings.size * 8)
                          + (2 * here.maxTaskPar * numLocales * 2**16 * 8));
-            var iv = strings.argsort();
+            var iv = if algorithm == SortingAlgorithm.PrefixRadixSort
+                       then prefixStringSort(strings)
+                       else strings.argsort();
             st.addEntry(ivname, createSymEntry(iv));
           }
           otherwise {
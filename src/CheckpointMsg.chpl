@@ -0,0 +1,206 @@
+module CheckpointMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use RegistrationMsg;
+    use IOUtils;
+    use IO;
+    use FileSystem;
+    use List;
+    use Map;
+    use Set;
+    use Sort;
+    use Time;
+
+    import ParquetMsg;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const cpLogger = new Logger(logLevel, logChannel);
+
+    enum CheckpointState { idle, running, done, failed }
+
+    /*
+      The progress of the last background checkpoint. Its counters are
+      written by the checkpoint's task while requests read them.
+    */
+    class CheckpointStatus {
+        var path: string;
+        var state: atomic int = CheckpointState.idle: int;
+        var total: int;
+        var totalBytes: int;
+        var written: atomic int;
+        var bytesWritten: atomic int;
+        var startTime: real;
+        var endTime: atomic real;
+        var errors: list(string);
+    }
+
+    var checkpointStatus = new shared CheckpointStatus();
+
+    /*
+      Start writing the registered objects to Parquet files under a
+      directory in a task of its own and return right away, so requests
+      keep being served while they are written.
+
+      The checkpoint holds its own references to the symbol table entries
+      of the registered objects at the time it starts, so they are written
+      as they were even if the objects are deleted, unregistered or
+      replaced before they are. The manifest listing the objects is written
+      last, which marks the checkpoint as complete.
+    */
+    proc checkpointMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const path = msgArgs.getValueOf("path");
+        const compression = msgArgs.getValueOf("compression").toUpper(): ParquetMsg.CompressionType;
+
+        if checkpointStatus.state.read() == CheckpointState.running: int {
+            var errorMsg = "A checkpoint to %s is already running".format(checkpointStatus.path);
+            cpLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        // the create messages of the registered objects, to rebuild them from
+        var objects: map(string, string);
+        for name in st.registry.tab.keys() {
+            objects.add(name, formatJson(attachMap(name, st)));
+        }
+
+        // the entries of their components, held by the checkpoint's own table
+        var ckptSt = new shared SymTab();
+        var componentNames: set(string);
+        for name in st.registry.registered_entries do componentNames.add(name);
+        var components: map(string, string);
+        var componentBytes: map(string, int);
+        for name in componentNames {
+            const entry = st.lookup(name);
+            if entry.entryType == SymbolEntryType.SegStringSymEntry {
+                const e = toSegStringSymEntry(entry);
+                components.add(name, "strings");
+                componentBytes.add(name, e.offsetsEntry.size * e.offsetsEntry.itemsize + e.bytesEntry.size);
+            } else if entry.isAssignableTo(SymbolEntryType.TypedArraySymEntry) {
+                const e = toGenSymEntry(entry);
+                components.add(name, "pdarray");
+                componentBytes.add(name, e.size * e.itemsize);
+            } else {
+                var errorMsg = "Cannot checkpoint %s of entry type %s".format(name, entry.entryType: string);
+                cpLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            ckptSt.tab.addOrReplace(name, st.tab[name]);
+        }
+        const nbytes = + reduce componentBytes.values();
+
+        var manifest: map(string, string);
+        manifest.add("objects", formatJson(objects));
+        manifest.add("components", formatJson(components));
+
+        var status = new shared CheckpointStatus();
+        status.path = path;
+        status.total = components.size;
+        status.totalBytes = nbytes;
+        status.startTime = timeSinceEpoch().totalSeconds();
+        status.state.write(CheckpointState.running: int);
+        checkpointStatus = status;
+
+        begin with (in path, in compression, in ckptSt, in components, in componentBytes, in manifest, in status) {
+            try {
+                writeCheckpoint(path, ckptSt, components, componentBytes, formatJson(manifest), compression, status);
+            } catch e: Error {
+                status.errors.pushBack(e.message());
+            }
+            const failed = !status.errors.isEmpty();
+            cpLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                          "Checkpoint to %s %s".format(path, if failed then "failed" else "finished"));
+            status.endTime.write(timeSinceEpoch().totalSeconds());
+            status.state.write((if failed then CheckpointState.failed else CheckpointState.done): int);
+        }
+
+        var repMsg = "Checkpointing %i objects (%i bytes) to %s".format(objects.size, nbytes, path);
+        cpLogger.info(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+      Write each component to its own Parquet files, releasing the
+      checkpoint's reference to it once written, and then the manifest
+    */
+    proc writeCheckpoint(path: string, ckptSt: borrowed SymTab, const ref components: map(string, string),
+                         const ref componentBytes: map(string, int), manifest: string,
+                         compression: ParquetMsg.CompressionType, status: borrowed CheckpointStatus) throws {
+        if !isDir(path) then mkdir(path, parents=true);
+        var names = components.keysToArray();
+        sort(names);
+        for name in names {
+            const objType = components[name];
+            try {
+                const colNames = [name], objTypes = [objType];
+                var targetLocales = ParquetMsg.identifyTargetLocales(name, objType, ckptSt);
+                ParquetMsg.writeMultiColParquet("%s/%s.parquet".format(path, name), colNames, 1, colNames,
+                                                objTypes, targetLocales, compression: int, ckptSt);
+            } catch e: Error {
+                status.errors.pushBack("Failed to write %s: %s".format(name, e.message()));
+            }
+            ckptSt.deleteEntry(name);
+            status.written.add(1);
+            status.bytesWritten.add(componentBytes[name]);
+        }
+        if status.errors.isEmpty() {
+            var f = open("%s/manifest.json".format(path), ioMode.cw);
+            var w = f.writer(locking=false);
+            w.write(manifest);
+            w.close();
+            f.close();
+        }
+    }
+
+    /*
+      The progress of the last checkpoint started, as JSON
+    */
+    proc checkpointStatusMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const status = checkpointStatus;
+        const state = status.state.read(): CheckpointState;
+        const endTime = if state == CheckpointState.running
+                        then timeSinceEpoch().totalSeconds()
+                        else status.endTime.read();
+        var rtnMap: map(string, string);
+        rtnMap.add("state", state: string);
+        rtnMap.add("path", status.path);
+        rtnMap.add("total", status.total: string);
+        rtnMap.add("written", status.written.read(): string);
+        rtnMap.add("total_bytes", status.totalBytes: string);
+        rtnMap.add("bytes_written", status.bytesWritten.read(): string);
+        rtnMap.add("elapsed", (if state == CheckpointState.idle then 0.0 else endTime - status.startTime): string);
+        // errors are only added while the checkpoint is running
+        rtnMap.add("errors", if state == CheckpointState.running then "[]" else formatJson(status.errors.toArray()));
+        return new MsgTuple(formatJson(rtnMap), MsgType.NORMAL);
+    }
+
+    /*
+      The manifest of the checkpoint written to a directory, which is read by
+      the server since the client may not see the server's file system
+    */
+    proc checkpointManifestMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const path = msgArgs.getValueOf("path");
+        const manifestPath = "%s/manifest.json".format(path);
+        if !exists(manifestPath) {
+            var errorMsg = "No checkpoint manifest in %s, the checkpoint did not finish".format(path);
+            cpLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var f = open(manifestPath, ioMode.r);
+        const manifest = f.reader(locking=false).readAll(string);
+        f.close();
+        return new MsgTuple(manifest, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("checkpoint", checkpointMsg, getModuleName());
+    registerFunction("checkpointStatus", checkpointStatusMsg, getModuleName());
+    registerFunction("checkpointManifest", checkpointManifestMsg, getModuleName());
+}
@@ -88,4 +88,68 @@ module CommandMap {
     }
     return response;
   }
+
+  /**
+   * Placeholder token a batched request uses to refer to the symbol
+   * created by the request at position `idx` earlier in the same batch
+   */
+  proc batchRef(idx: int): string {
+    return "__batch_ref_%i__".format(idx);
+  }
+
+  /**
+   * Execute a sequence of requests submitted together in one message.
+   *
+   * The "requests" argument is a JSON list of serialized RequestMsg objects.
+   * Requests are executed in order; any occurrence of batchRef(i) in the
+   * arguments of a later request is replaced by the name of the symbol
+   * created by request i, so dependent commands can be chained without a
+   * round trip per command. Processing stops at the first error.
+   *
+   * Returns a JSON list containing the reply message of each request
+   */
+  proc batchMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+    const requests = msgArgs["requests"].toScalarList(string);
+    var responses: [0..#requests.size] MsgTuple;
+    var createdNames: [0..#requests.size] string;
+
+    for (raw, i) in zip(requests, 0..) {
+      var req: RequestMsg;
+      deserialize(req, raw);
+
+      if req.cmd == cmd {
+        return MsgTuple.error("Error: batch requests cannot be nested");
+      }
+
+      var args = req.args;
+      for j in 0..<i {
+        if !createdNames[j].isEmpty() then
+          args = args.replace(batchRef(j), createdNames[j]);
+      }
+
+      var subArgs: owned MessageArgs;
+      if req.size > 0 {
+        subArgs = parseMessageArgs(args, req.size);
+      } else {
+        subArgs = new owned MessageArgs();
+      }
+
+      responses[i] = executeCommand(req.cmd, subArgs, st);
+
+      if responses[i].msgType == MsgType.ERROR {
+        return MsgTuple.error("Error in batched request %i (%s): %s".format(i, req.cmd, responses[i].msg));
+      } else if responses[i].msgFormat == MsgFormat.BINARY {
+        return MsgTuple.error("Error: batched request %i (%s) returned binary data, which is not supported in a batch"
+                              .format(i, req.cmd));
+      }
+
+      if responses[i].msg.startsWith("created ") {
+        for (field, k) in zip(responses[i].msg.split(" ", 2), 0..) {
+          if k == 1 then createdNames[i] = field;
+        }
+      }
+    }
+
+    return MsgTuple.fromResponses(responses);
+  }
 }
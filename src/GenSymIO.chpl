@@ -100,6 +100,67 @@ module GenSymIO {
         return new MsgTuple(msg, MsgType.NORMAL);
     }
 
+    /*
+     * Copies the binary payload into the elements [start, start+count), in
+     * row-major order, of an existing pdarray. This lets the client upload a
+     * large array as a sequence of bounded chunks.
+     */
+    @arkouda.registerND
+    proc arrayChunkMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, param nd: int): MsgTuple throws {
+        const start = msgArgs["start"].toScalar(int),
+              count = msgArgs["count"].toScalar(int);
+        var abstractEntry = st.lookup(msgArgs.getValueOf("array"));
+        if !abstractEntry.isAssignableTo(SymbolEntryType.TypedArraySymEntry) {
+            var errorMsg = "Error: Unhandled SymbolEntryType %s".format(abstractEntry.entryType);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+        var entry:borrowed GenSymEntry = abstractEntry: borrowed GenSymEntry;
+
+        if start < 0 || count < 0 || start + count > entry.size {
+            var errorMsg = "Error: chunk [%i, %i) is out of bounds for array of size %i".format(
+                                                                start, start + count, entry.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+        if msgArgs.payload.size != count * entry.itemsize {
+            var errorMsg = "Error: expected %i bytes but received %i".format(
+                                                  count * entry.itemsize, msgArgs.payload.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        proc bytesToDistArr(ref A: [?D] ?t) throws {
+            var localA = makeArrayFromPtr(msgArgs.payload.c_str():c_ptr(void):c_ptr(t), num_elts=count:uint);
+            if nd == 1 {
+                A[start..#count] = localA;
+            } else {
+                forall (i, a) in zip(localA.domain, localA) with (var agg = newDstAggregator(t)) do
+                    agg.copy(A[D.orderToIndex(start + i)], a);
+            }
+        }
+
+        if entry.dtype == DType.Int64 {
+            bytesToDistArr(toSymEntry(entry, int, nd).a);
+        } else if entry.dtype == DType.UInt64 {
+            bytesToDistArr(toSymEntry(entry, uint, nd).a);
+        } else if entry.dtype == DType.Float64 {
+            bytesToDistArr(toSymEntry(entry, real, nd).a);
+        } else if entry.dtype == DType.Bool {
+            bytesToDistArr(toSymEntry(entry, bool, nd).a);
+        } else if entry.dtype == DType.UInt8 {
+            bytesToDistArr(toSymEntry(entry, uint(8), nd).a);
+        } else {
+            const errorMsg = "Error: Unhandled dtype %s".format(entry.dtype);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        const msg = "set %i elements of %s".format(count, msgArgs.getValueOf("array"));
+        gsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),msg);
+        return MsgTuple.success(msg);
+    }
+
     /**
      * For creating the Strings/SegString object we can calculate the offsets array on the server
      * by finding the null terminators given the values/bytes array which should have already been
@@ -164,6 +225,65 @@ module GenSymIO {
        return MsgTuple.payload(arrayBytes);
     }
 
+    /*
+     * Outputs the elements [start, start+count) of the pdarray, in row-major
+     * order, as a Numpy ndarray in the form of a Chapel Bytes object. This
+     * lets the client transfer a large array as a sequence of bounded chunks.
+     */
+    @arkouda.registerND
+    proc tondarrayChunkMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, param nd: int): MsgTuple throws {
+        var arrayBytes: bytes;
+        const start = msgArgs["start"].toScalar(int),
+              count = msgArgs["count"].toScalar(int);
+        var abstractEntry = st.lookup(msgArgs.getValueOf("array"));
+        if !abstractEntry.isAssignableTo(SymbolEntryType.TypedArraySymEntry) {
+            var errorMsg = "Error: Unhandled SymbolEntryType %s".format(abstractEntry.entryType);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+        var entry:borrowed GenSymEntry = abstractEntry: borrowed GenSymEntry;
+
+        if start < 0 || count < 0 || start + count > entry.size {
+            var errorMsg = "Error: chunk [%i, %i) is out of bounds for array of size %i".format(
+                                                                start, start + count, entry.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        overMemLimit(count * entry.itemsize);
+
+        proc distArrChunkToBytes(A: [?D] ?eltType) {
+            var ptr = allocate(eltType, count);
+            var localA = makeArrayFromPtr(ptr, count:uint);
+            if nd == 1 {
+                localA = A[start..#count];
+            } else {
+                forall (i, a) in zip(localA.domain, localA) with (var agg = newSrcAggregator(eltType)) do
+                    agg.copy(localA[i], A[D.orderToIndex(start + i)]);
+            }
+            const size = count*c_sizeof(eltType):int;
+            return bytes.createAdoptingBuffer(ptr:c_ptr(uint(8)), size, size);
+        }
+
+        if entry.dtype == DType.Int64 {
+            arrayBytes = distArrChunkToBytes(toSymEntry(entry, int, nd).a);
+        } else if entry.dtype == DType.UInt64 {
+            arrayBytes = distArrChunkToBytes(toSymEntry(entry, uint, nd).a);
+        } else if entry.dtype == DType.Float64 {
+            arrayBytes = distArrChunkToBytes(toSymEntry(entry, real, nd).a);
+        } else if entry.dtype == DType.Bool {
+            arrayBytes = distArrChunkToBytes(toSymEntry(entry, bool, nd).a);
+        } else if entry.dtype == DType.UInt8 {
+            arrayBytes = distArrChunkToBytes(toSymEntry(entry, uint(8), nd).a);
+        } else {
+            const errorMsg = "Error: Unhandled dtype %s".format(entry.dtype);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+       return MsgTuple.payload(arrayBytes);
+    }
+
     /*
      * Utility proc to test casting a string to a specified type
      * :arg c: String to cast
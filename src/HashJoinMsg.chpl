@@ -0,0 +1,392 @@
+module HashJoinMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use AryUtil;
+    use CommAggregation;
+    use RadixSortLSD;
+    use UniqueMsg;
+    use Map;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const hjLogger = new Logger(logLevel, logChannel);
+
+    /*
+      Right tables with at most this many distinct keys are copied to every
+      locale and probed locally (a broadcast join), instead of being matched
+      by sorting them together with the left keys
+    */
+    private config const joinBroadcastLimit = getEnvInt("ARKOUDA_SERVER_JOIN_BROADCAST_LIMIT", 1_000_000);
+
+    /*
+      Join the rows of two sets of key arrays on equal keys in one command.
+      Returns the index of the left and right row of each joined pair, with
+      -1 on the side without a row for the unmatched rows kept by left, right
+      and outer joins.
+    */
+    proc hashJoinMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const n = msgArgs.get("nkeys").getIntValue();
+        const how = msgArgs.getValueOf("how");
+        if how != "inner" && how != "left" && how != "right" && how != "outer" {
+            var errorMsg = "Unrecognized join type: %s".format(how);
+            hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const leftHashes = keyHashes(n, msgArgs.get("leftnames").getList(n),
+                                     msgArgs.get("lefttypes").getList(n), st);
+        const rightHashes = keyHashes(n, msgArgs.get("rightnames").getList(n),
+                                      msgArgs.get("righttypes").getList(n), st);
+        var (leftInds, rightInds) = hashJoin(leftHashes, rightHashes,
+                                             keepLeft=(how == "left" || how == "outer"),
+                                             keepRight=(how == "right" || how == "outer"));
+
+        var lname = st.nextName();
+        st.addEntry(lname, createSymEntry(leftInds));
+        var rname = st.nextName();
+        st.addEntry(rname, createSymEntry(rightInds));
+        var repMsg = "created " + st.attrib(lname) + "+created " + st.attrib(rname);
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    proc keyHashes(n: int, namesList: [] string, typesList: [] string, st: borrowed SymTab) throws {
+        var (size, _, _, _, _, names, types) = validateArraysSameLength(n, namesList, typesList, st);
+        return hashArrays(size, names, types, st);
+    }
+
+    /*
+      The right rows are sorted by hash into runs of equal keys, the run
+      matching each left row is found, and each left row is expanded into
+      one output row per right row of its run. The output is ordered by left
+      row, then by right row, followed by the unmatched right rows if kept.
+      As with unique, keys are compared by their 128-bit hash.
+    */
+    proc hashJoin(leftHashes: [?lD] 2*uint, rightHashes: [?rD] 2*uint,
+                  keepLeft: bool, keepRight: bool) throws {
+        const nR = rD.size;
+
+        // group the right rows into runs of equal hashes
+        const rightPerm = radixSortLSD_ranks(rightHashes);
+        var sortedRight = makeDistArray(rD, 2*uint);
+        forall (h, i) in zip(sortedRight, rightPerm) with (var agg = newSrcAggregator(2*uint)) {
+            agg.copy(h, rightHashes[i]);
+        }
+        var isStart = makeDistArray(rD, bool);
+        forall (s, h, i) in zip(isStart, sortedRight, rD) {
+            s = i == rD.low || sortedRight[i-1] != h;
+        }
+        // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+        overMemLimit(numBytes(int) * nR);
+        const runOf = (+ scan isStart) - 1;
+        const nRuns = if nR > 0 then runOf[rD.high] + 1 else 0;
+        const uD = makeDistDom(nRuns);
+        var runHashes = makeDistArray(uD, 2*uint);
+        var runStarts = makeDistArray(uD, int);
+        forall (s, h, r, i) in zip(isStart, sortedRight, runOf, rD)
+          with (var hashAgg = newDstAggregator(2*uint), var startAgg = newDstAggregator(int)) {
+            if s {
+                hashAgg.copy(runHashes[r], h);
+                startAgg.copy(runStarts[r], i);
+            }
+        }
+        var runLens = makeDistArray(uD, int);
+        forall (l, s, r) in zip(runLens, runStarts, uD) {
+            l = (if r < uD.high then runStarts[r+1] else nR) - s;
+        }
+
+        // the run matching each left row, or -1
+        const leftRun = if nRuns <= joinBroadcastLimit then broadcastProbe(leftHashes, runHashes)
+                                                       else sortProbe(leftHashes, runHashes);
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "%i distinct right keys, %s join".format(nRuns,
+                       if nRuns <= joinBroadcastLimit then "broadcast" else "partitioned"));
+
+        // the number of output rows of each left row
+        var leftStarts = makeDistArray(lD, int);
+        var counts = makeDistArray(lD, int);
+        forall (r, s, c) in zip(leftRun, leftStarts, counts)
+          with (var startAgg = newSrcAggregator(int), var lenAgg = newSrcAggregator(int)) {
+            if r >= 0 {
+                startAgg.copy(s, runStarts[r]);
+                lenAgg.copy(c, runLens[r]);
+            } else if keepLeft {
+                c = 1;
+            }
+        }
+        overMemLimit(numBytes(int) * lD.size);
+        const offsets = (+ scan counts) - counts;
+        const nLeftOut = + reduce counts;
+
+        // the right rows matched by no left row, in right row order
+        var unmatchedRight = makeDistArray(rD, int);
+        var nRightOut = 0;
+        if keepRight {
+            var runMatched = makeDistArray(uD, bool);
+            forall r in leftRun with (var agg = newDstAggregator(bool)) {
+                if r >= 0 then agg.copy(runMatched[r], true);
+            }
+            var sortedMatched = makeDistArray(rD, bool);
+            forall (m, r) in zip(sortedMatched, runOf) with (var agg = newSrcAggregator(bool)) {
+                agg.copy(m, runMatched[r]);
+            }
+            forall (m, i) in zip(sortedMatched, rightPerm) with (var agg = newDstAggregator(int)) {
+                agg.copy(unmatchedRight[i], if m then 0 else 1);
+            }
+            nRightOut = + reduce unmatchedRight;
+        }
+
+        overMemLimit(3 * numBytes(int) * (nLeftOut + nRightOut));
+        const oD = makeDistDom(nLeftOut + nRightOut);
+        var leftInds = makeDistArray(oD, int);
+        var rightInds = makeDistArray(oD, int);
+        // the position of each right row in sorted order, gathered into rightInds below
+        var rightPos = makeDistArray(oD, int);
+        forall (i, r, s, c, o) in zip(lD, leftRun, leftStarts, counts, offsets)
+          with (var leftAgg = newDstAggregator(int), var posAgg = newDstAggregator(int)) {
+            for j in 0..<c {
+                leftAgg.copy(leftInds[o + j], i);
+                posAgg.copy(rightPos[o + j], if r >= 0 then s + j else -1);
+            }
+        }
+        forall (ri, p, k) in zip(rightInds, rightPos, oD) with (var agg = newSrcAggregator(int)) {
+            if k < nLeftOut {
+                if p >= 0 then agg.copy(ri, rightPerm[p]); else ri = -1;
+            }
+        }
+        if keepRight {
+            overMemLimit(numBytes(int) * nR);
+            const rightOffsets = (+ scan unmatchedRight) - unmatchedRight;
+            forall (u, o, i) in zip(unmatchedRight, rightOffsets, rD)
+              with (var leftAgg = newDstAggregator(int), var rightAgg = newDstAggregator(int)) {
+                if u == 1 {
+                    leftAgg.copy(leftInds[nLeftOut + o], -1);
+                    rightAgg.copy(rightInds[nLeftOut + o], i);
+                }
+            }
+        }
+        return (leftInds, rightInds);
+    }
+
+    /*
+      Find each left hash among the distinct right hashes by copying them to
+      every locale in a map
+    */
+    proc broadcastProbe(leftHashes: [?lD] 2*uint, runHashes: [?uD] 2*uint) throws {
+        var runIds = new map(2*uint, int);
+        for (h, r) in zip(runHashes, uD) do runIds.add(h, r);
+        var leftRun = makeDistArray(lD, int);
+        coforall loc in Locales with (ref leftRun) do on loc {
+            const localRunIds = runIds;
+            forall i in leftRun.localSubdomain() with (ref leftRun) {
+                leftRun[i] = localRunIds.get(leftHashes[i], -1);
+            }
+        }
+        return leftRun;
+    }
+
+    /*
+      Find each left hash among the sorted, distinct right hashes by sorting
+      them together, so that each left hash follows the equal right hash
+    */
+    proc sortProbe(leftHashes: [?lD] 2*uint, runHashes: [?uD] 2*uint) throws {
+        const nU = uD.size;
+        const cD = makeDistDom(nU + lD.size);
+        var combined = makeDistArray(cD, 2*uint);
+        forall (h, r) in zip(runHashes, uD) with (var agg = newDstAggregator(2*uint)) {
+            agg.copy(combined[r], h);
+        }
+        forall (h, i) in zip(leftHashes, lD) with (var agg = newDstAggregator(2*uint)) {
+            agg.copy(combined[nU + i], h);
+        }
+        // the sort is stable, so each right hash precedes the equal left hashes
+        const perm = radixSortLSD_ranks(combined);
+        var runs = makeDistArray(cD, int);
+        forall (r, i) in zip(runs, perm) {
+            r = if i < nU then i else -1;
+        }
+        // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+        overMemLimit(numBytes(int) * cD.size);
+        // the last right hash at or before each position in sorted order
+        const lastRuns = max scan runs;
+        var sortedHashes = makeDistArray(cD, 2*uint);
+        forall (h, i) in zip(sortedHashes, perm) with (var agg = newSrcAggregator(2*uint)) {
+            agg.copy(h, combined[i]);
+        }
+        var lastHashes = makeDistArray(cD, 2*uint);
+        forall (h, r) in zip(lastHashes, lastRuns) with (var agg = newSrcAggregator(2*uint)) {
+            if r >= 0 then agg.copy(h, runHashes[r]);
+        }
+        var leftRun = makeDistArray(lD, int);
+        forall (i, r, h, lh) in zip(perm, lastRuns, sortedHashes, lastHashes)
+          with (var agg = newDstAggregator(int)) {
+            if i >= nU then agg.copy(leftRun[i - nU], if r >= 0 && lh == h then r else -1);
+        }
+        return leftRun;
+    }
+
+    /*
+      Join two sorted key arrays by merging them, returning the same index
+      arrays as hashJoinMsg. The output is ordered by key, including the
+      unmatched rows of left, right and outer joins.
+    */
+    proc mergeJoinMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const how = msgArgs.getValueOf("how");
+        if how != "inner" && how != "left" && how != "right" && how != "outer" {
+            var errorMsg = "Unrecognized join type: %s".format(how);
+            hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const keepLeft = how == "left" || how == "outer",
+              keepRight = how == "right" || how == "outer";
+        var gLeft: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("left"), st);
+        var gRight: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("right"), st);
+        if gLeft.dtype != gRight.dtype {
+            var errorMsg = "Cannot merge join %s keys with %s keys".format(dtype2str(gLeft.dtype),
+                                                                          dtype2str(gRight.dtype));
+            hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        proc addJoin(type t) throws {
+            var (leftInds, rightInds) = mergeJoin(toSymEntry(gLeft, t).a, toSymEntry(gRight, t).a,
+                                                  keepLeft, keepRight);
+            var lname = st.nextName();
+            st.addEntry(lname, createSymEntry(leftInds));
+            var rname = st.nextName();
+            st.addEntry(rname, createSymEntry(rightInds));
+            return "created " + st.attrib(lname) + "+created " + st.attrib(rname);
+        }
+        var repMsg: string;
+        select gLeft.dtype {
+            when DType.Int64 do repMsg = addJoin(int);
+            when DType.UInt64 do repMsg = addJoin(uint);
+            otherwise {
+                var errorMsg = notImplementedError(getRoutineName(), gLeft.dtype);
+                hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+      For sorted left and right keys, the range of right rows matching each
+      left row is found by a merge, without sorting or hashing. Each output
+      row is then placed at its final position in key order: a left row's
+      rows follow those of the smaller left keys and the unmatched right rows
+      with smaller keys, and similarly for the unmatched right rows.
+    */
+    proc mergeJoin(left: [?lD] ?t, right: [?rD] t, keepLeft: bool, keepRight: bool) throws {
+        const nL = lD.size, nR = rD.size;
+        // the range of right rows equal to each left row
+        const lo = searchSorted(left, right, upper=false),
+              hi = searchSorted(left, right, upper=true);
+        var counts = makeDistArray(lD, int);
+        forall (c, l, h) in zip(counts, lo, hi) {
+            c = if h > l then h - l else if keepLeft then 1 else 0;
+        }
+        // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+        overMemLimit(numBytes(int) * nL);
+        const offsets = (+ scan counts) - counts;
+        const nLeftOut = + reduce counts;
+
+        // the right rows equal to no left row, and how many precede each right row
+        var unmatchedRight = makeDistArray(rD, int);
+        var unmatchedBefore = makeDistArray(rD, int);
+        var leftAfter = makeDistArray(rD, int);
+        var nRightOut = 0;
+        if keepRight {
+            const rightLo = searchSorted(right, left, upper=false),
+                  rightHi = searchSorted(right, left, upper=true);
+            forall (u, l, h) in zip(unmatchedRight, rightLo, rightHi) do u = if h > l then 0 else 1;
+            overMemLimit(numBytes(int) * nR);
+            unmatchedBefore = (+ scan unmatchedRight) - unmatchedRight;
+            nRightOut = + reduce unmatchedRight;
+            // the number of output rows of the left rows before each unmatched right row
+            forall (a, l) in zip(leftAfter, rightLo) with (var agg = newSrcAggregator(int)) {
+                if l < nL then agg.copy(a, offsets[l]); else a = nLeftOut;
+            }
+        }
+        // the number of unmatched right rows before each left row
+        var leftShift = makeDistArray(lD, int);
+        if keepRight {
+            forall (s, l) in zip(leftShift, lo) with (var agg = newSrcAggregator(int)) {
+                if l < nR then agg.copy(s, unmatchedBefore[l]); else s = nRightOut;
+            }
+        }
+
+        overMemLimit(2 * numBytes(int) * (nLeftOut + nRightOut));
+        const oD = makeDistDom(nLeftOut + nRightOut);
+        var leftInds = makeDistArray(oD, int);
+        var rightInds = makeDistArray(oD, int);
+        forall (i, l, h, c, o, s) in zip(lD, lo, hi, counts, offsets, leftShift)
+          with (var leftAgg = newDstAggregator(int), var rightAgg = newDstAggregator(int)) {
+            for j in 0..<c {
+                leftAgg.copy(leftInds[o + s + j], i);
+                rightAgg.copy(rightInds[o + s + j], if h > l then l + j else -1);
+            }
+        }
+        if keepRight {
+            forall (u, a, b, r) in zip(unmatchedRight, leftAfter, unmatchedBefore, rD)
+              with (var leftAgg = newDstAggregator(int), var rightAgg = newDstAggregator(int)) {
+                if u == 1 {
+                    leftAgg.copy(leftInds[a + b], -1);
+                    rightAgg.copy(rightInds[a + b], r);
+                }
+            }
+        }
+        return (leftInds, rightInds);
+    }
+
+    /*
+      For each value of the sorted array a, the index of the first value of
+      the sorted array b that is greater than or equal to it (or greater than
+      it, if upper). Each task binary searches b for the first and last of
+      its values, copies that window of b locally, and merges it with its
+      values.
+    */
+    proc searchSorted(a: [?aD] ?t, b: [?bD] t, param upper: bool) throws {
+        var res = makeDistArray(aD, int);
+        if aD.size == 0 then return res;
+        const nTasksPerLoc = here.maxTaskPar;
+        proc bound(x: t) {
+            var l = 0, r = bD.size;
+            while l < r {
+                const mid = l + (r - l) / 2;
+                if (if upper then b[mid] <= x else b[mid] < x) then l = mid + 1; else r = mid;
+            }
+            return l;
+        }
+        coforall loc in Locales with (ref res) do on loc {
+            const lsd = res.localSubdomain();
+            coforall tid in 0..<nTasksPerLoc with (ref res) {
+                const perTask = lsd.size / nTasksPerLoc,
+                      first = lsd.low + tid * perTask,
+                      block = first..(if tid == nTasksPerLoc - 1 then lsd.high else first + perTask - 1);
+                if block.size > 0 {
+                    const lo = bound(a[block.low]), hi = bound(a[block.high]);
+                    const window: [lo..<hi] t = b[lo..<hi];
+                    var j = lo;
+                    for i in block {
+                        const x = a[i];
+                        while j < hi && (if upper then window[j] <= x else window[j] < x) do j += 1;
+                        res[i] = j;
+                    }
+                }
+            }
+        }
+        return res;
+    }
+
+    use CommandMap;
+    registerFunction("hashJoin", hashJoinMsg, getModuleName());
+    registerFunction("mergeJoin", mergeJoinMsg, getModuleName());
+}
@@ -10,6 +10,7 @@ module Message {
     use BigInteger;
     use MultiTypeSymEntry;
     use Map;
+    use CTypes;
 
     enum MsgType {NORMAL,WARNING,ERROR}
     enum MsgFormat {STRING,BINARY}
@@ -23,6 +24,8 @@ module Message {
         var msgFormat: MsgFormat;
         var user: string;
         var payload: bytes;
+        var request_id: string; // echoed from the corresponding RequestMsg
+        var exec_time: real; // seconds the server spent executing the command
     }
 
     /*
@@ -35,6 +38,8 @@ module Message {
         var format: string;
         var args: string;
         var size: int; // currently unused, but wired for once all functionality moved to json
+        var request_id: string; // client-assigned identifier echoed back in the reply
+        var deletes: string; // space-delimited names of symbols to delete before executing cmd
     }
 
     proc MsgTuple.init() {
@@ -144,11 +149,29 @@ module Message {
         );
     }
 
-    proc ref MsgTuple.serialize(user: string) throws {
+    proc ref MsgTuple.serialize(user: string, requestId: string = "") throws {
         this.user = user;
+        this.request_id = requestId;
         return formatJson(this);
     }
 
+    /*
+     * Serializes a string reply in the packed encoding: the packed magic bytes,
+     * one byte for the message type, user, request id and execution time as
+     * length-prefixed strings, and the message bytes.
+     */
+    proc ref MsgTuple.pack(user: string, requestId: string = ""): bytes throws {
+        this.user = user;
+        this.request_id = requestId;
+        var msgTypeByte: c_array(uint(8), 1);
+        msgTypeByte[0] = if this.msgType == MsgType.NORMAL then 0
+                         else if this.msgType == MsgType.WARNING then 1
+                         else 2;
+        return packedMagic + bytes.createCopyingBuffer(c_ptrTo(msgTypeByte[0]), 1)
+               + packString(user) + packString(requestId)
+               + packString("%.9dr".format(this.exec_time)) + this.msg: bytes;
+    }
+
     /*
     * Encapsulate parameter for a request sent to the Arkouda server
     * Note - Only used when args is in JSON format. 
@@ -566,11 +589,94 @@ module Message {
         return new owned MessageArgs(param_list);
     }
 
+    /*
+     * Magic bytes prefixing requests and replies in the packed encoding, which
+     * the client uses instead of JSON when the server advertises support for it
+     */
+    const packedMagic = b"AKPK";
+
+    /*
+     * Encodes the length of a packed string or list as a little-endian uint32
+     */
+    proc packLength(n: int): bytes throws {
+        var buf: c_array(uint(8), 4);
+        for i in 0..<4 do buf[i] = ((n >> (8*i)) & 0xff): uint(8);
+        return bytes.createCopyingBuffer(c_ptrTo(buf[0]), 4);
+    }
+
+    /*
+     * Encodes a string for the packed encoding as its length followed by its bytes
+     */
+    proc packString(s: string): bytes throws {
+        return packLength(s.numBytes) + s: bytes;
+    }
+
+    /*
+     * Decodes the little-endian uint32 length at pos, advancing pos past it
+     */
+    proc unpackLength(const ref request: bytes, ref pos: int): int throws {
+        if pos + 4 > request.size then
+            throw new owned ErrorWithContext("Truncated packed request",
+                                             getLineNumber(),
+                                             getRoutineName(),
+                                             getModuleName(),
+                                             "ValueError");
+        var n = 0;
+        for i in 0..<4 do n |= request.byte(pos + i): int << (8*i);
+        pos += 4;
+        return n;
+    }
+
+    /*
+     * Decodes the length-prefixed string at pos, advancing pos past it
+     */
+    proc unpackString(const ref request: bytes, ref pos: int): string throws {
+        const n = unpackLength(request, pos);
+        if pos + n > request.size then
+            throw new owned ErrorWithContext("Truncated packed request",
+                                             getLineNumber(),
+                                             getRoutineName(),
+                                             getModuleName(),
+                                             "ValueError");
+        const s = if n == 0 then "" else request[pos..#n].decode();
+        pos += n;
+        return s;
+    }
+
+    /*
+     * Deserializes a request in the packed encoding into msg and returns its
+     * arguments. The packed format is the magic bytes followed by the user,
+     * token, cmd, format, request_id and deletes as length-prefixed strings, then the
+     * number of parameters and the key, dtype and val of each parameter as
+     * length-prefixed strings. Unlike the JSON encoding, parameters are not
+     * themselves JSON-encoded, so no per-parameter JSON parsing is required.
+     */
+    proc unpackRequest(request: bytes, ref msg: RequestMsg): owned MessageArgs throws {
+        var pos = packedMagic.size;
+        msg.user = unpackString(request, pos);
+        msg.token = unpackString(request, pos);
+        msg.cmd = unpackString(request, pos);
+        msg.format = unpackString(request, pos);
+        msg.request_id = unpackString(request, pos);
+        msg.deletes = unpackString(request, pos);
+        msg.size = unpackLength(request, pos);
+
+        var param_list = new list(ParameterObj);
+        for 0..<msg.size {
+            const key = unpackString(request, pos),
+                  dtype = unpackString(request, pos),
+                  val = unpackString(request, pos);
+            param_list.pushBack(new ParameterObj(key, val, dtype));
+        }
+        return new owned MessageArgs(param_list);
+    }
+
     /*
      * Deserializes a JSON-formatted string to a RequestMsg object, where the
      * JSON format is as follows (size is only set for json args. Otherwise, -1):
      *
-     * {"user": "user", "token": "token", "cmd": "cmd", "format": "STRING", "args": "arg1 arg2", "size": "-1"}
+     * {"user": "user", "token": "token", "cmd": "cmd", "format": "STRING", "args": "arg1 arg2", "size": "-1",
+     *  "request_id": "", "deletes": ""}
      *
      */
     proc deserialize(ref msg: RequestMsg, request: string) throws {
@@ -66,10 +66,33 @@ module MsgProcessing
         return st.insert(e);
     }
 
+    /*
+    Delete the unregistered symbols among a space-delimited list of names.
+    Names that are not in the symbol table (e.g., because it was cleared
+    after their deletion was deferred by the client) are skipped.
+
+    :arg names: space-delimited symbol names
+    :type names: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: number of symbols deleted
+    */
+    proc deleteNames(names: string, st: borrowed SymTab): int throws {
+        var numDeleted = 0;
+        for name in names.split() {
+            if st.contains(name) && st.deleteEntry(name) then numDeleted += 1;
+        }
+        mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                     "deleted %i of the deferred deletions %s".format(numDeleted, names));
+        return numDeleted;
+    }
+
     /* 
     Parse, execute, and respond to a delete message 
 
-    :arg reqMsg: request containing (cmd,name)
+    :arg reqMsg: request containing (cmd,name) or, for a bulk delete, (cmd,names)
     :type reqMsg: string 
 
     :arg st: SymTab to act on
@@ -79,6 +102,11 @@ module MsgProcessing
     */
     proc deleteMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
         var repMsg: string; // response message
+        if msgArgs.contains("names") {
+            repMsg = "deleted %i symbols".format(deleteNames(msgArgs.getValueOf("names"), st));
+            mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+        }
         const name = msgArgs.getValueOf("name");
         mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), 
                                      "cmd: %s array: %s".format(cmd,st.attrib(name)));
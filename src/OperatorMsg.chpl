@@ -2262,4 +2262,224 @@ module OperatorMsg
         omLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
         return new MsgTuple(repMsg, MsgType.NORMAL);
     }
+
+    /*
+      Maximum depth of the operand stack used to evaluate a fused expression
+    */
+    param fusedMaxDepth = 16;
+
+    /*
+      Number of elements each task evaluates at a time, so that a block of
+      intermediate values stays in cache between operators
+    */
+    private config const fusedBlockSize = 1024;
+
+    // opcodes of a compiled fused expression; binary operators are >= fusedAdd
+    private param fusedPushInt = 0,
+                  fusedPushReal = 1,
+                  fusedPushScalar = 2,
+                  fusedNeg = 3,
+                  fusedAdd = 4,
+                  fusedSub = 5,
+                  fusedMul = 6,
+                  fusedDiv = 7,
+                  fusedFloorDiv = 8,
+                  fusedMod = 9,
+                  fusedPow = 10;
+
+    /*
+      Parse and respond to fusedEval message.
+
+      Evaluates an elementwise arithmetic expression over 1..n pdarrays in a
+      single pass, without creating an intermediate array per operator.
+      The expression is given in postfix order as a list of tokens, where
+      "a<i>" refers to the i-th entry of "arrays", "s<i>" refers to the i-th
+      entry of "scalars", "neg" is unary negation, and any other token is one
+      of the binary operators +, -, *, /, //, % or **. The expression is
+      computed in the result dtype, which must be int64 or float64.
+
+      :arg msgArgs: contains expr, arrays, scalars, dtype
+      :type msgArgs: borrowed MessageArgs
+
+      :arg st: SymTab to act on
+      :type st: borrowed SymTab
+
+      :returns: (MsgTuple)
+      :throws: `UndefinedSymbolError(name)`
+    */
+    proc fusedEvalMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const dtype = str2dtype(msgArgs["dtype"].toScalar(string));
+
+        select dtype {
+            when DType.Int64 do return fusedEval(int, msgArgs, st);
+            when DType.Float64 do return fusedEval(real, msgArgs, st);
+            otherwise {
+                const errorMsg = notImplementedError(Reflection.getRoutineName(), dtype);
+                omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return MsgTuple.error(errorMsg);
+            }
+        }
+    }
+
+    private proc fusedEval(type t, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const tokens = msgArgs["expr"].toScalarList(string),
+              names = msgArgs["arrays"].toScalarList(string),
+              scalarList = msgArgs["scalars"].toScalarList(t);
+        const scalars: [0..#scalarList.size] t = [i in 0..#scalarList.size] scalarList[i];
+
+        // look up the operands, casting is deferred to evaluation time
+        var intArrs: [0..#names.size] borrowed SymEntry(int, 1)?,
+            realArrs: [0..#names.size] borrowed SymEntry(real, 1)?,
+            isReal: [0..#names.size] bool;
+        var size = -1;
+        for (name, i) in zip(names, 0..) {
+            var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+            if size == -1 then size = gEnt.size;
+            if gEnt.size != size || gEnt.ndim != 1 then
+                return MsgTuple.error("Error: fusedEval operands must be 1D arrays of the same size");
+            select gEnt.dtype {
+                when DType.Int64 do intArrs[i] = toSymEntry(gEnt, int);
+                when DType.Float64 {
+                    if t == int then
+                        return MsgTuple.error("Error: fusedEval cannot compute a float64 operand as int64");
+                    realArrs[i] = toSymEntry(gEnt, real);
+                    isReal[i] = true;
+                }
+                otherwise {
+                    const errorMsg = notImplementedError(Reflection.getRoutineName(), gEnt.dtype);
+                    omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return MsgTuple.error(errorMsg);
+                }
+            }
+        }
+        if size == -1 then
+            return MsgTuple.error("Error: fusedEval requires at least one array operand");
+
+        // compile the tokens to (opcode, operand) pairs, checking the stack depth
+        var program: [0..#tokens.size] (int, int);
+        var depth = 0;
+        for (tok, i) in zip(tokens, 0..) {
+            if tok.startsWith("a") && tok.size > 1 {
+                const k = tok[1..]: int;
+                program[i] = (if isReal[k] then fusedPushReal else fusedPushInt, k);
+                depth += 1;
+            } else if tok.startsWith("s") && tok.size > 1 {
+                program[i] = (fusedPushScalar, tok[1..]: int);
+                depth += 1;
+            } else if tok == "neg" {
+                program[i] = (fusedNeg, -1);
+                if depth < 1 then
+                    return MsgTuple.error("Error: malformed fusedEval expression");
+            } else {
+                var op: int;
+                select tok {
+                    when "+" do op = fusedAdd;
+                    when "-" do op = fusedSub;
+                    when "*" do op = fusedMul;
+                    when "/" do op = fusedDiv;
+                    when "//" do op = fusedFloorDiv;
+                    when "%" do op = fusedMod;
+                    when "**" do op = fusedPow;
+                    otherwise {
+                        const errorMsg = notImplementedError(Reflection.getRoutineName(), tok);
+                        omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                        return MsgTuple.error(errorMsg);
+                    }
+                }
+                if (op == fusedDiv || op == fusedPow) && t == int then
+                    return MsgTuple.error("Error: fusedEval operator %s requires a float64 result".format(tok));
+                program[i] = (op, -1);
+                depth -= 1;
+                if depth < 1 then
+                    return MsgTuple.error("Error: malformed fusedEval expression");
+            }
+            if depth > fusedMaxDepth then
+                return MsgTuple.error("Error: fusedEval expression exceeds the maximum depth of %i".format(fusedMaxDepth));
+        }
+        if depth != 1 then
+            return MsgTuple.error("Error: malformed fusedEval expression");
+
+        const rname = st.nextName();
+        var e = st.addEntry(rname, size, t);
+        ref ea = e.a;
+        const blockSize = fusedBlockSize;
+
+        coforall loc in Locales with (ref ea) do on loc {
+            const myD = ea.localSubdomain(),
+                  nBlocks = (myD.size + blockSize - 1) / blockSize;
+
+            forall b in 0..#nBlocks with (in program, in scalars, in intArrs, in realArrs,
+                                          var stack: [0..#fusedMaxDepth, 0..#blockSize] t) {
+                const lo = myD.low + b * blockSize,
+                      n = min(blockSize, myD.high - lo + 1);
+                var sp = 0;
+
+                for (op, k) in program {
+                    select op {
+                        when fusedPushInt {
+                            ref A = intArrs[k]!.a;
+                            for j in 0..#n do stack[sp, j] = A.localAccess[lo + j]: t;
+                            sp += 1;
+                        }
+                        when fusedPushReal {
+                            ref A = realArrs[k]!.a;
+                            for j in 0..#n do stack[sp, j] = A.localAccess[lo + j]: t;
+                            sp += 1;
+                        }
+                        when fusedPushScalar {
+                            const s = scalars[k];
+                            for j in 0..#n do stack[sp, j] = s;
+                            sp += 1;
+                        }
+                        when fusedNeg {
+                            for j in 0..#n do stack[sp-1, j] = -stack[sp-1, j];
+                        }
+                        otherwise {
+                            fusedApply(op, stack, sp-2, sp-1, n);
+                            sp -= 1;
+                        }
+                    }
+                }
+
+                for j in 0..#n do ea.localAccess[lo + j] = stack[0, j];
+            }
+        }
+
+        omLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "fusedEval of %i tokens over %i arrays created %s".format(tokens.size, names.size, rname));
+        return MsgTuple.newSymbol(rname, e);
+    }
+
+    /*
+      Apply the binary operator `op` to rows `l` and `r` of the operand stack,
+      storing the result in row `l`, matching the semantics of binopvv
+    */
+    private inline proc fusedApply(op: int, ref stack: [?D] ?t, l: int, r: int, n: int) {
+        select op {
+            when fusedAdd do for j in 0..#n do stack[l, j] += stack[r, j];
+            when fusedSub do for j in 0..#n do stack[l, j] -= stack[r, j];
+            when fusedMul do for j in 0..#n do stack[l, j] *= stack[r, j];
+            when fusedDiv do for j in 0..#n do stack[l, j] /= stack[r, j];
+            when fusedFloorDiv {
+                if t == int {
+                    for j in 0..#n do
+                        stack[l, j] = if stack[r, j] != 0 then stack[l, j] / stack[r, j] else 0;
+                } else {
+                    for j in 0..#n do stack[l, j] = floorDivisionHelper(stack[l, j], stack[r, j]);
+                }
+            }
+            when fusedMod {
+                if t == int {
+                    for j in 0..#n do
+                        stack[l, j] = if stack[r, j] != 0 then stack[l, j] % stack[r, j] else 0;
+                } else {
+                    for j in 0..#n do stack[l, j] = modHelper(stack[l, j], stack[r, j]);
+                }
+            }
+            when fusedPow do for j in 0..#n do stack[l, j] = stack[l, j] ** stack[r, j];
+        }
+    }
+
+    use CommandMap;
+    registerFunction("fusedEval", fusedEvalMsg, getModuleName());
 }
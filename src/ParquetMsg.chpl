@@ -17,6 +17,8 @@ module ParquetMsg {
   use Map;
   use SegmentedString;
   use IOUtils;
+  use Indexing;
+  use Path;
 
   enum CompressionType {
     NONE=0,
@@ -143,7 +145,11 @@ module ParquetMsg {
     return (rgSubdomains, offset);
   }
 
-  proc readFilesByName(ref A: [] ?t, ref whereNull: [] bool, filenames: [] string, sizes: [] int, dsetname: string, ty, byteLength=-1, hasNonFloatNulls=false) throws {
+  /*
+    Read the rows of the files into A, where sizes are the numbers of rows
+    to read from each file and starts the first row of each to read
+  */
+  proc readFilesByName(ref A: [] ?t, ref whereNull: [] bool, filenames: [] string, sizes: [] int, starts: [] int, dsetname: string, ty, byteLength=-1, hasNonFloatNulls=false) throws {
     extern proc c_readColumnByName(filename, arr_chpl, where_null_chpl, colNum, numElems, startIdx, batchSize, byteLength, hasNonFloatNulls, errMsg): int;
 
     var (subdoms, length) = getSubdomains(sizes);
@@ -153,14 +159,15 @@ module ParquetMsg {
       var locFiles = filenames;
       var locFiledoms = subdoms;
       var locOffsets = fileOffsets;
+      var locStarts = starts;
       
-      forall (off, filedom, filename) in zip(locOffsets, locFiledoms, locFiles) {
+      forall (off, start, filedom, filename) in zip(locOffsets, locStarts, locFiledoms, locFiles) {
         for locdom in A.localSubdomains() {
           const intersection = domain_intersection(locdom, filedom);
           if intersection.size > 0 {
             var pqErr = new parquetErrorMsg();
             if c_readColumnByName(filename.localize().c_str(), c_ptrTo(A[intersection.low]), c_ptrTo(whereNull[intersection.low]),
-                                  dsetname.localize().c_str(), intersection.size, intersection.low - off,
+                                  dsetname.localize().c_str(), intersection.size, start + intersection.low - off,
                                   batchSize, byteLength, hasNonFloatNulls,
                                   c_ptrTo(pqErr.errMsg)) == ARROWERROR {
               pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
@@ -171,15 +178,22 @@ module ParquetMsg {
     }
   }
 
-  proc readStrFilesByName(ref A: [] ?t, filenames: [] string, sizes: [] int, dsetname: string) throws {
-    extern proc c_readStrColumnByName(filename, arr_chpl, colname, batchSize, errMsg): int;
+  /*
+    Read the bytes of the strings of the files into A, where sizes are the
+    numbers of bytes read from each file, and numRows and starts the number
+    of rows to read from each file and the first of them
+  */
+  proc readStrFilesByName(ref A: [] ?t, filenames: [] string, sizes: [] int, numRows: [] int, starts: [] int, dsetname: string) throws {
+    extern proc c_readStrColumnByName(filename, arr_chpl, colname, numElems, startIdx, batchSize, errMsg): int;
     var (subdoms, length) = getSubdomains(sizes);
     
     coforall loc in A.targetLocales() do on loc {
       var locFiles = filenames;
       var locFiledoms = subdoms;
+      var locNumRows = numRows;
+      var locStarts = starts;
 
-      forall (filedom, filename) in zip(locFiledoms, locFiles) {
+      forall (filedom, filename, n, start) in zip(locFiledoms, locFiles, locNumRows, locStarts) {
         for locdom in A.localSubdomains() {
           const intersection = domain_intersection(locdom, filedom);
 
@@ -188,7 +202,7 @@ module ParquetMsg {
             var col: [filedom] t;
 
             if c_readStrColumnByName(filename.localize().c_str(), c_ptrTo(col),
-                                     dsetname.localize().c_str(),
+                                     dsetname.localize().c_str(), n, start,
                                      batchSize, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
               pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
             }
@@ -253,7 +267,7 @@ module ParquetMsg {
     return listSizes;
   }
 
-  proc calcStrSizesAndOffset(offsets: [] ?t, filenames: [] string, sizes: [] int, dsetname: string) throws {
+  proc calcStrSizesAndOffset(offsets: [] ?t, filenames: [] string, sizes: [] int, starts: [] int, dsetname: string) throws {
     var (subdoms, length) = getSubdomains(sizes);
 
     var byteSizes: [filenames.domain] int;
@@ -261,13 +275,14 @@ module ParquetMsg {
     coforall loc in offsets.targetLocales() with (ref byteSizes) do on loc {
       var locFiles = filenames;
       var locFiledoms = subdoms;
+      var locStarts = starts;
       
-      forall (i, filedom, filename) in zip(sizes.domain, locFiledoms, locFiles) {
+      forall (i, filedom, filename, start) in zip(sizes.domain, locFiledoms, locFiles, locStarts) {
         for locdom in offsets.localSubdomains() {
           const intersection = domain_intersection(locdom, filedom);
           if intersection.size > 0 {
             var col: [filedom] t;
-            byteSizes[i] = getStrColSize(filename, dsetname, col);
+            byteSizes[i] = getStrColSize(filename, dsetname, col, start);
             offsets[filedom] = col;
           }
         }
@@ -325,14 +340,14 @@ module ParquetMsg {
     }
   }
 
-  proc getStrColSize(filename: string, dsetname: string, ref offsets: [] int) throws {
+  proc getStrColSize(filename: string, dsetname: string, ref offsets: [] int, start: int = 0) throws {
     extern proc c_getStringColumnNumBytes(filename, colname, offsets, numElems, startIdx, batchSize, errMsg): int;
     var pqErr = new parquetErrorMsg();
 
     var byteSize = c_getStringColumnNumBytes(filename.localize().c_str(),
                                              dsetname.localize().c_str(),
                                              c_ptrTo(offsets),
-                                             offsets.size, 0, 256,
+                                             offsets.size, start, 256,
                                              c_ptrTo(pqErr.errMsg));
     
     if byteSize == ARROWERROR then
@@ -726,17 +741,20 @@ module ParquetMsg {
     return formatJson(rtnmap);
   }
 
-  proc populateTagData(A, filenames: [?fD] string, sizes) throws {
+  /*
+    Tag the rows read from each file with the given code of the file
+  */
+  proc populateTagData(A, tags: [?fD] int, sizes) throws {
     var (subdoms, length) = getSubdomains(sizes);
     var fileOffsets = (+ scan sizes) - sizes;
     
     coforall loc in A.targetLocales() do on loc {
-      var locFiles = filenames;
+      var locTags = tags;
       var locFiledoms = subdoms;
       var locOffsets = fileOffsets;
       
       try {
-        forall (off, filedom, filename, tag) in zip(locOffsets, locFiledoms, locFiles, 0..) {
+        forall (off, filedom, tag) in zip(locOffsets, locFiledoms, locTags) {
           for locdom in A.localSubdomains() {
             const intersection = domain_intersection(locdom, filedom);
 
@@ -846,6 +864,302 @@ module ParquetMsg {
     }
   }
 
+  /*
+    A condition on the values of a column, like ("ts", ">=", ["100"]),
+    that the rows read must satisfy
+  */
+  record parquetFilter {
+    var col: string;
+    var op: string;
+    var vals: list(string);
+
+    proc values(type t) throws {
+      var res: [0..#vals.size] t;
+      for (r, v) in zip(res, vals) {
+        try {
+          r = v: t;
+        } catch {
+          throw getErrorWithContext(
+                     msg="Filter value %s is not a valid %s for column %s".format(v, t:string, col),
+                     getLineNumber(),
+                     getRoutineName(),
+                     getModuleName(),
+                     errorClass="IllegalArgumentError");
+        }
+      }
+      return res;
+    }
+  }
+
+  proc getFilters(msgArgs: borrowed MessageArgs) throws {
+    var filters: list(parquetFilter);
+    const nfilters = msgArgs.get("num_filters").getIntValue();
+    if nfilters > 0 {
+      const cols = msgArgs.get("filter_cols").getList(nfilters),
+            ops = msgArgs.get("filter_ops").getList(nfilters),
+            counts = msgArgs.get("filter_counts").getList(nfilters): int,
+            vals = msgArgs.get("filter_values").getList(+ reduce counts);
+      var v = 0;
+      for (col, op, count) in zip(cols, ops, counts) {
+        var f = new parquetFilter(col, op);
+        for 0..#count {
+          f.vals.pushBack(vals[v]);
+          v += 1;
+        }
+        filters.pushBack(f);
+      }
+    }
+    return filters;
+  }
+
+  /*
+    Whether any row of a row group whose values lie between lo and hi may
+    satisfy a filter. The rows of "!=" and "not in" filters may be nulls,
+    which the statistics do not describe, so they are never ruled out.
+  */
+  proc rowGroupMayMatch(lo: ?t, hi: t, op: string, const ref vals: [] t): bool {
+    select op {
+      when "==", "in" {
+        for v in vals do if lo <= v && v <= hi then return true;
+        return false;
+      }
+      when "<" do return lo < vals[0];
+      when "<=" do return lo <= vals[0];
+      when ">" do return hi > vals[0];
+      when ">=" do return hi >= vals[0];
+      otherwise do return true;
+    }
+  }
+
+  /*
+    Drop the row groups of a file whose statistics for the filter's column
+    show that none of their rows can satisfy it, filling in the number of
+    rows of each row group
+  */
+  proc pruneRowGroups(type t, filename: string, const ref f: parquetFilter, ref rgRows: [?D] int, ref keep: [D] bool) throws {
+    extern proc c_getRowGroupStats(filename, colname, num_rows, mins, maxs, has_stats, errMsg): c_int;
+    if D.size == 0 then return;
+    var mins, maxs: [D] t;
+    var hasStats: [D] bool;
+    var pqErr = new parquetErrorMsg();
+    if c_getRowGroupStats(filename.localize().c_str(), f.col.localize().c_str(),
+                          c_ptrTo(rgRows), c_ptrTo(mins), c_ptrTo(maxs), c_ptrTo(hasStats),
+                          c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    }
+    const vals = f.values(t);
+    for rg in D {
+      if hasStats[rg] && !rowGroupMayMatch(mins[rg], maxs[rg], f.op, vals) then keep[rg] = false;
+    }
+  }
+
+  /*
+    Split the files into the pieces to read, each a run of row groups of
+    one file given by the file, its first row, its number of rows and the
+    index of the file. Row groups that the statistics of the filtered
+    numeric columns rule out are left out so they are never read. Without
+    filters each file is one piece.
+  */
+  proc getFilePieces(filenames: [?fD] string, sizes: [fD] int, const ref filters: list(parquetFilter)) throws {
+    extern proc c_getNumRowGroupsByName(filename, errMsg): c_int;
+    var pieceFiles: list(string);
+    var pieceStarts, pieceSizes, pieceTags: list(int);
+    proc addPiece(filename: string, start: int, size: int, tag: int) {
+      pieceFiles.pushBack(filename);
+      pieceStarts.pushBack(start);
+      pieceSizes.pushBack(size);
+      pieceTags.pushBack(tag);
+    }
+
+    for (i, fname) in zip(fD, filenames) {
+      // a file without rows has nothing to read
+      if sizes[i] == 0 then continue;
+      var rgDom = {0..#0};
+      var rgRows: [rgDom] int;
+      var keep: [rgDom] bool;
+      if filters.size > 0 && sizes[i] > 0 {
+        var pqErr = new parquetErrorMsg();
+        const nRowGroups = c_getNumRowGroupsByName(fname.localize().c_str(), c_ptrTo(pqErr.errMsg));
+        if nRowGroups == ARROWERROR {
+          pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+        }
+        rgDom = {0..#(nRowGroups: int)};
+        keep = true;
+        for f in filters {
+          select getArrType(fname, f.col) {
+            when ArrowTypes.int64, ArrowTypes.int32, ArrowTypes.boolean do pruneRowGroups(int, fname, f, rgRows, keep);
+            when ArrowTypes.uint64, ArrowTypes.uint32 do pruneRowGroups(uint, fname, f, rgRows, keep);
+            when ArrowTypes.double, ArrowTypes.float do pruneRowGroups(real, fname, f, rgRows, keep);
+            // other columns have no statistics to prune by
+            otherwise {}
+          }
+        }
+      }
+      if && reduce keep {
+        addPiece(fname, 0, sizes[i], i);
+      } else {
+        var row = 0, runStart = -1;
+        for rg in rgDom {
+          if keep[rg] && runStart < 0 then runStart = row;
+          if !keep[rg] && runStart >= 0 {
+            addPiece(fname, runStart, row - runStart, i);
+            runStart = -1;
+          }
+          row += rgRows[rg];
+        }
+        if runStart >= 0 then addPiece(fname, runStart, row - runStart, i);
+      }
+    }
+    return (pieceFiles.toArray(), pieceStarts.toArray(), pieceSizes.toArray(), pieceTags.toArray());
+  }
+
+  proc filterMask(const ref a: [?D] ?t, op: string, const ref vals: [] t) throws {
+    var m = makeDistArray(D, bool);
+    select op {
+      when "==" do m = a == vals[0];
+      when "!=" do m = a != vals[0];
+      when "<" do m = a < vals[0];
+      when "<=" do m = a <= vals[0];
+      when ">" do m = a > vals[0];
+      when ">=" do m = a >= vals[0];
+      when "in", "not in" {
+        const invert = op == "not in";
+        forall (mi, x) in zip(m, a) with (var vs = vals) {
+          var found = false;
+          for v in vs {
+            if x == v {
+              found = true;
+              break;
+            }
+          }
+          mi = found != invert;
+        }
+      }
+      otherwise {
+        throw getErrorWithContext(
+                   msg="Unrecognized filter operator %s".format(op),
+                   getLineNumber(),
+                   getRoutineName(),
+                   getModuleName(),
+                   errorClass="IllegalArgumentError");
+      }
+    }
+    return m;
+  }
+
+  /*
+    Which rows of a column read from the files satisfy a filter
+  */
+  proc filterRows(const ref f: parquetFilter, objType: ObjType, id: string, st: borrowed SymTab) throws {
+    if objType == ObjType.STRINGS {
+      var ss = getSegString(id.partition("+")[0], st);
+      var m = makeDistArray(ss.size, bool);
+      select f.op {
+        when "==" do m = ss == f.vals[0];
+        when "!=" do m = ss != f.vals[0];
+        when "in" {
+          for v in f.vals do m |= (ss == v);
+        }
+        when "not in" {
+          m = true;
+          for v in f.vals do m &= (ss != v);
+        }
+        otherwise {
+          throw getErrorWithContext(
+                     msg="Filter operator %s is not supported for string column %s".format(f.op, f.col),
+                     getLineNumber(),
+                     getRoutineName(),
+                     getModuleName(),
+                     errorClass="IllegalArgumentError");
+        }
+      }
+      return m;
+    }
+    var gEnt = getGenericTypedArrayEntry(id, st);
+    select gEnt.dtype {
+      when DType.Int64 do return filterMask(toSymEntry(gEnt, int).a, f.op, f.values(int));
+      when DType.UInt64 do return filterMask(toSymEntry(gEnt, uint).a, f.op, f.values(uint));
+      when DType.Float64 do return filterMask(toSymEntry(gEnt, real).a, f.op, f.values(real));
+      when DType.Bool {
+        var ints = makeDistArray(gEnt.size, int);
+        ints = toSymEntry(gEnt, bool).a: int;
+        return filterMask(ints, f.op, f.values(int));
+      }
+      otherwise {
+        throw getErrorWithContext(
+                   msg="Cannot filter column %s of type %s".format(f.col, dtype2str(gEnt.dtype)),
+                   getLineNumber(),
+                   getRoutineName(),
+                   getModuleName(),
+                   errorClass="TypeError");
+      }
+    }
+  }
+
+  /*
+    Keep only the rows of the columns read that satisfy all the filters,
+    replacing the entries of the columns
+  */
+  proc applyFilters(ref rnames: list((string, ObjType, string)), const ref filters: list(parquetFilter), len: int, st: borrowed SymTab) throws {
+    // nothing to filter when every row group was pruned
+    if len == 0 then return;
+    var keep = makeDistArray(len, bool);
+    keep = true;
+    for f in filters {
+      var found = false;
+      for (dsetname, objType, id) in rnames {
+        if dsetname == f.col {
+          keep &= filterRows(f, objType, id, st);
+          found = true;
+          break;
+        }
+      }
+      if !found {
+        throw getErrorWithContext(
+                   msg="Filtered column %s was not read".format(f.col),
+                   getLineNumber(),
+                   getRoutineName(),
+                   getModuleName(),
+                   errorClass="IllegalArgumentError");
+      }
+    }
+    for i in 0..<rnames.size {
+      const (dsetname, objType, id) = rnames[i];
+      if objType == ObjType.STRINGS {
+        const name = id.partition("+")[0];
+        var ss = getSegString(name, st);
+        var (offsets, vals) = ss[keep];
+        var filtered = getSegString(offsets, vals, st);
+        st.deleteEntry(name);
+        rnames[i] = (dsetname, objType, "%s+%?".format(filtered.name, filtered.nBytes));
+      } else {
+        var gEnt = getGenericTypedArrayEntry(id, st);
+        proc keepRows(type t) throws {
+          var name = st.nextName();
+          st.addEntry(name, createSymEntry(boolIndexer(toSymEntry(gEnt, t).a, keep)));
+          return name;
+        }
+        var name: string;
+        select gEnt.dtype {
+          when DType.Int64 do name = keepRows(int);
+          when DType.UInt64 do name = keepRows(uint);
+          when DType.Float64 do name = keepRows(real);
+          when DType.Bool do name = keepRows(bool);
+          otherwise {
+            throw getErrorWithContext(
+                       msg="Cannot filter column %s of type %s".format(dsetname, dtype2str(gEnt.dtype)),
+                       getLineNumber(),
+                       getRoutineName(),
+                       getModuleName(),
+                       errorClass="TypeError");
+          }
+        }
+        st.deleteEntry(id);
+        rnames[i] = (dsetname, objType, name);
+      }
+    }
+  }
+
   proc readAllParquetMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
     var repMsg: string;
     var tagData: bool = msgArgs.get("tag_data").getBoolValue();
@@ -855,6 +1169,9 @@ module ParquetMsg {
 
     var allowErrors: bool = msgArgs.get("allow_errors").getBoolValue(); // default is false
     var hasNonFloatNulls: bool = msgArgs.get("has_non_float_nulls").getBoolValue();
+    const filters = getFilters(msgArgs);
+    // read only the types of the datasets, creating them empty
+    const schemaOnly = msgArgs.contains("schema_only") && msgArgs.get("schema_only").getBoolValue();
     if allowErrors {
         pqLogger.warn(getModuleName(), getRoutineName(), getLineNumber(), "Allowing file read errors");
     }
@@ -922,7 +1239,12 @@ module ParquetMsg {
     var fileErrorMsg:string = "";
     var sizes: [filedom] int;
     var types: [dsetdom] ArrowTypes;
-    var byteSizes: [filedom] int;
+
+    // the runs of rows read from the files, the same for every dataset
+    var piecedom: domain(1);
+    var pieceFiles: [piecedom] string;
+    var pieceStarts, pieceSizes, pieceTags, byteSizes: [piecedom] int;
+    var nRows = 0;
     
     var rnames: list((string, ObjType, string)); // tuple (dsetName, item type, id)
     
@@ -949,15 +1271,30 @@ module ParquetMsg {
               fileErrorCount += 1;
             }
         }
+        if schemaOnly then sizes = 0;
         
-        var len = + reduce sizes;
+        if dsetidx == dsetdom.low {
+          const (files, starts, lens, tags) = getFilePieces(filenames, sizes, filters);
+          piecedom = files.domain;
+          pieceFiles = files;
+          pieceStarts = starts;
+          pieceSizes = lens;
+          pieceTags = tags;
+          if filters.size > 0 {
+            pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                           "Reading %i of %i rows in row groups that may satisfy the filters".format(
+                           + reduce pieceSizes, + reduce sizes));
+          }
+        }
+        var len = + reduce pieceSizes;
+        nRows = len;
         var ty = types[dsetidx];
 
         // If tagging is turned on, tag the data
         if tagData {
           pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), "Tagging Data with File Code");
           var tagEntry = createSymEntry(len, int);
-          populateTagData(tagEntry.a, filenames, sizes);
+          populateTagData(tagEntry.a, pieceTags, pieceSizes);
           var rname = st.nextName();
           st.addEntry(rname, tagEntry);
           rnames.pushBack(("Filename_Codes", ObjType.PDARRAY, rname));
@@ -969,7 +1306,7 @@ module ParquetMsg {
         // file has a different type
         if ty == ArrowTypes.int64 || ty == ArrowTypes.int32 {
           var entryVal = createSymEntry(len, int);
-          readFilesByName(entryVal.a, whereNull, filenames, sizes, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
+          readFilesByName(entryVal.a, whereNull, pieceFiles, pieceSizes, pieceStarts, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
           var valName = st.nextName();
           if hasNonFloatNulls && (|| reduce whereNull) {
             // if we have non-float nulls and there's at least one null
@@ -985,7 +1322,7 @@ module ParquetMsg {
           rnames.pushBack((dsetname, ObjType.PDARRAY, valName));
         } else if ty == ArrowTypes.uint64 || ty == ArrowTypes.uint32 {
           var entryVal = createSymEntry(len, uint);
-          readFilesByName(entryVal.a, whereNull, filenames, sizes, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
+          readFilesByName(entryVal.a, whereNull, pieceFiles, pieceSizes, pieceStarts, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
           if (ty == ArrowTypes.uint32){ // correction for high bit 
             ref ea = entryVal.a;
             // Access the high bit (64th bit) and shift it into the high bit for uint32 (32nd bit)
@@ -1007,7 +1344,7 @@ module ParquetMsg {
           rnames.pushBack((dsetname, ObjType.PDARRAY, valName));
         } else if ty == ArrowTypes.boolean {
           var entryVal = createSymEntry(len, bool);
-          readFilesByName(entryVal.a, whereNull, filenames, sizes, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
+          readFilesByName(entryVal.a, whereNull, pieceFiles, pieceSizes, pieceStarts, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
           var valName = st.nextName();
           if hasNonFloatNulls && (|| reduce whereNull) {
             // if we have non-float nulls and there's at least one null
@@ -1026,7 +1363,7 @@ module ParquetMsg {
 
           // Calculate byte sizes by reading or fixed length
           if fixedLen < 2 {
-            byteSizes = calcStrSizesAndOffset(entrySeg.a, filenames, sizes, dsetname);
+            byteSizes = calcStrSizesAndOffset(entrySeg.a, pieceFiles, pieceSizes, pieceStarts, dsetname);
           } else {
             entrySeg.a = fixedLen;
             byteSizes = fixedLen*len;
@@ -1035,17 +1372,22 @@ module ParquetMsg {
 
           // Read into distributed array
           var entryVal = new shared SymEntry((+ reduce byteSizes), uint(8));
-          readStrFilesByName(entryVal.a, filenames, byteSizes, dsetname);
+          readStrFilesByName(entryVal.a, pieceFiles, byteSizes, pieceSizes, pieceStarts, dsetname);
           
           var stringsEntry = assembleSegStringFromParts(entrySeg, entryVal, st);
           rnames.pushBack((dsetname, ObjType.STRINGS, "%s+%?".format(stringsEntry.name, stringsEntry.nBytes)));
         } else if ty == ArrowTypes.double || ty == ArrowTypes.float {
           var entryVal = createSymEntry(len, real);
-          readFilesByName(entryVal.a, whereNull, filenames, sizes, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
+          readFilesByName(entryVal.a, whereNull, pieceFiles, pieceSizes, pieceStarts, dsetname, ty, hasNonFloatNulls=hasNonFloatNulls);
           var valName = st.nextName();
           st.addEntry(valName, entryVal);
           rnames.pushBack((dsetname, ObjType.PDARRAY, valName));
         } else if ty == ArrowTypes.list {
+          if filters.size > 0 {
+            var errorMsg = "Filters are not supported when reading list dataset %s".format(dsetname);
+            pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+          }
           var list_ty = getListData(filenames[0], dsetname);
           if list_ty == ArrowTypes.notimplemented { // check for and skip further nested datasets
             pqLogger.info(getModuleName(),getRoutineName(),getLineNumber(),"Invalid list datatype found in %s. Skipping.".format(dsetname));
@@ -1057,7 +1399,7 @@ module ParquetMsg {
         } else if ty == ArrowTypes.decimal {
           var byteLength = getByteLength(filenames[0], dsetname);
           var entryVal = createSymEntry(len, real);
-          readFilesByName(entryVal.a, whereNull, filenames, sizes, dsetname, ty, byteLength);
+          readFilesByName(entryVal.a, whereNull, pieceFiles, pieceSizes, pieceStarts, dsetname, ty, byteLength);
           var valName = st.nextName();
           st.addEntry(valName, entryVal);
           rnames.pushBack((dsetname, ObjType.PDARRAY, valName));
@@ -1068,6 +1410,8 @@ module ParquetMsg {
         }
     }
 
+    if filters.size > 0 then applyFilters(rnames, filters, nRows, st);
+
     repMsg = buildReadAllMsgJson(rnames, false, 0, fileErrors, st);
     pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
     return new MsgTuple(repMsg,MsgType.NORMAL);
@@ -1487,9 +1831,23 @@ module ParquetMsg {
     }
   }
 
+  /*
+    Create the directory a file is written to, and its parents, if it does
+    not exist yet
+  */
+  proc makeParentDir(filename: string) throws {
+    const dir = dirname(filename);
+    if dir.isEmpty() || isDir(dir) then return;
+    try {
+      mkdir(dir, parents=true);
+    } catch e: FileExistsError {
+      // another locale sharing the file system created it first
+    }
+  }
+
   proc writeMultiColParquet(filename: string, col_names: [] string, 
                               ncols: int, sym_names: [] string, col_objTypes: [] string, targetLocales: [] locale, 
-                              compression: int, st: borrowed SymTab): bool throws {
+                              compression: int, st: borrowed SymTab, createDirs: bool = false): bool throws {
 
     extern proc c_writeMultiColToParquet(filename, column_names, ptr_arr, offset_arr, objTypes,
                                       datatypes, segArr_sizes, colnum, numelems, rowGroupSize, compression, errMsg): int;
@@ -1510,6 +1868,7 @@ module ParquetMsg {
     coforall (loc, idx) in zip(targetLocales, filenames.domain) do on loc {
       var pqErr = new parquetErrorMsg();
       const fname = filenames[idx];
+      if createDirs then makeParentDir(fname);
 
       var ptrList: [0..#ncols] c_ptr(void);
       var segmentPtr: [0..#ncols] c_ptr(void); // ptrs to offsets for SegArray. Know number of rows so we know where to stop
@@ -1883,6 +2242,154 @@ module ParquetMsg {
     return filesExist;
   }
 
+  /*
+    Write each partition of the rows of the columns to a single file of its
+    own. perm orders the rows by partition and segments holds the position in
+    perm of the first row of each partition. Each partition is gathered to and
+    written by the locale holding its first row in perm.
+  */
+  proc writePartitionedParquet(filenames: [] string, col_names: [] string, ncols: int,
+                               sym_names: [] string, col_objTypes: [] string, ref perm: [?pD] int,
+                               ref segments: [?sD] int, compression: int, st: borrowed SymTab) throws {
+    extern proc c_writeMultiColToParquet(filename, column_names, ptr_arr, offset_arr, objTypes,
+                                      datatypes, segArr_sizes, colnum, numelems, rowGroupSize, compression, errMsg): int;
+
+    const nParts = sD.size;
+    var bounds: [0..nParts] int;
+    bounds[0..<nParts] = segments;
+    bounds[nParts] = pD.size;
+
+    // the dtype of each column, and its place among the columns of that dtype
+    var dtypes: [0..#ncols] DType;
+    var slots: [0..#ncols] int;
+    var dtypeCounts: map(DType, int);
+    for i in 0..#ncols {
+      select col_objTypes[i].toUpper(): ObjType {
+        when ObjType.STRINGS do dtypes[i] = DType.Strings;
+        when ObjType.PDARRAY do dtypes[i] = getGenericTypedArrayEntry(sym_names[i], st).dtype;
+        otherwise {
+          throw getErrorWithContext(
+            msg="Partitioned Parquet writes do not support %s columns".format(col_objTypes[i]),
+            lineNumber=getLineNumber(),
+            routineName=getRoutineName(),
+            moduleName=getModuleName(),
+            errorClass='DataTypeError'
+          );
+        }
+      }
+      if !dtypeCounts.contains(dtypes[i]) then dtypeCounts.add(dtypes[i], 0);
+      slots[i] = dtypeCounts[dtypes[i]];
+      dtypeCounts[dtypes[i]] += 1;
+    }
+    proc numCols(dt: DType): int {
+      return if dtypeCounts.contains(dt) then dtypeCounts[dt] else 0;
+    }
+    const nInt = numCols(DType.Int64), nUInt = numCols(DType.UInt64), nReal = numCols(DType.Float64),
+          nBool = numCols(DType.Bool), nStr = numCols(DType.Strings);
+
+    coforall loc in Locales with (ref perm) do on loc {
+      const myBounds = bounds;
+      const myRows = pD.localSubdomain();
+      for p in 0..<nParts {
+        const lo = myBounds[p];
+        if !myRows.contains(lo) then continue;
+        const n = myBounds[p+1] - lo;
+        const rows: [0..#n] int = perm[lo..#n];
+        const fname = filenames[p];
+        makeParentDir(fname);
+
+        var pqErr = new parquetErrorMsg();
+        var ptrList: [0..#ncols] c_ptr(void);
+        var segmentPtr: [0..#ncols] c_ptr(void);
+        var objTypes: [0..#ncols] int;
+        var datatypes: [0..#ncols] int;
+        var segarray_sizes: [0..#ncols] int;
+        var my_column_names = col_names;
+        var c_names: [0..#ncols] c_ptrConst(c_char);
+
+        var int_vals: [0..#nInt*n] int;
+        var uint_vals: [0..#nUInt*n] uint;
+        var real_vals: [0..#nReal*n] real;
+        var bool_vals: [0..#nBool*n] bool;
+        // the offsets and lengths, with null terminators, of the strings of each string column
+        var str_starts, str_lens: [0..#nStr*n] int;
+        var str_bytes: [0..#nStr] int;
+
+        for i in 0..#ncols {
+          c_names[i] = my_column_names[i].localize().c_str();
+          const k = slots[i] * n;
+          select dtypes[i] {
+            when DType.Int64 {
+              const e = toSymEntry(getGenericTypedArrayEntry(sym_names[i], st), int);
+              forall (v, r) in zip(int_vals[k..#n], rows) with (var agg = newSrcAggregator(int)) do agg.copy(v, e.a[r]);
+              ptrList[i] = c_ptrTo(int_vals[k]): c_ptr(void);
+              datatypes[i] = ARROWINT64;
+            }
+            when DType.UInt64 {
+              const e = toSymEntry(getGenericTypedArrayEntry(sym_names[i], st), uint);
+              forall (v, r) in zip(uint_vals[k..#n], rows) with (var agg = newSrcAggregator(uint)) do agg.copy(v, e.a[r]);
+              ptrList[i] = c_ptrTo(uint_vals[k]): c_ptr(void);
+              datatypes[i] = ARROWUINT64;
+            }
+            when DType.Float64 {
+              const e = toSymEntry(getGenericTypedArrayEntry(sym_names[i], st), real);
+              forall (v, r) in zip(real_vals[k..#n], rows) with (var agg = newSrcAggregator(real)) do agg.copy(v, e.a[r]);
+              ptrList[i] = c_ptrTo(real_vals[k]): c_ptr(void);
+              datatypes[i] = ARROWDOUBLE;
+            }
+            when DType.Bool {
+              const e = toSymEntry(getGenericTypedArrayEntry(sym_names[i], st), bool);
+              forall (v, r) in zip(bool_vals[k..#n], rows) with (var agg = newSrcAggregator(bool)) do agg.copy(v, e.a[r]);
+              ptrList[i] = c_ptrTo(bool_vals[k]): c_ptr(void);
+              datatypes[i] = ARROWBOOLEAN;
+            }
+            when DType.Strings {
+              const e = toSegStringSymEntry(st.lookup(sym_names[i]));
+              ref offs = e.offsetsEntry.a;
+              const high = offs.domain.high, nBytes = e.bytesEntry.size;
+              var ends: [0..#n] int;
+              forall (s, en, r) in zip(str_starts[k..#n], ends, rows) with (var agg = newSrcAggregator(int)) {
+                agg.copy(s, offs[r]);
+                if r < high then agg.copy(en, offs[r+1]); else en = nBytes;
+              }
+              str_lens[k..#n] = ends - str_starts[k..#n];
+              str_bytes[slots[i]] = + reduce str_lens[k..#n];
+              datatypes[i] = ARROWSTRING;
+            }
+            otherwise {
+              throw getErrorWithContext(
+                msg="Unsupported PDArray DType for writing to Parquet, %s".format(dtypes[i]: string),
+                lineNumber=getLineNumber(),
+                routineName=getRoutineName(),
+                moduleName=getModuleName(),
+                errorClass='DataTypeError'
+              );
+            }
+          }
+          objTypes[i] = (if dtypes[i] == DType.Strings then ObjType.STRINGS else ObjType.PDARRAY): int;
+        }
+
+        // the null terminated bytes of the strings of each string column, one column after the other
+        const str_idx = (+ scan str_bytes) - str_bytes;
+        var str_vals: [0..#(+ reduce str_bytes)] uint(8);
+        for i in 0..#ncols {
+          if dtypes[i] != DType.Strings then continue;
+          const e = toSegStringSymEntry(st.lookup(sym_names[i]));
+          ref vals = e.bytesEntry.a;
+          const k = slots[i] * n;
+          const dests = (+ scan str_lens[k..#n]) - str_lens[k..#n] + str_idx[slots[i]];
+          forall (s, l, d) in zip(str_starts[k..#n], str_lens[k..#n], dests) do str_vals[d..#l] = vals[s..#l];
+          if str_vals.size > 0 then ptrList[i] = c_ptrTo(str_vals[str_idx[slots[i]]]): c_ptr(void);
+        }
+
+        var result: int = c_writeMultiColToParquet(fname.localize().c_str(), c_ptrTo(c_names), c_ptrTo(ptrList), c_ptrTo(segmentPtr), c_ptrTo(objTypes), c_ptrTo(datatypes), c_ptrTo(segarray_sizes), ncols, n, ROWGROUPS, compression, c_ptrTo(pqErr.errMsg));
+        if result == ARROWERROR {
+          pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+        }
+      }
+    }
+  }
+
   proc identifyTargetLocales(name: string, objType: string, st: borrowed SymTab) throws {
     var targetLocales;
     select objType.toUpper(): ObjType {
@@ -1961,12 +2468,15 @@ module ParquetMsg {
     // compression format as integer
     const compression = msgArgs.getValueOf("compression").toUpper(): CompressionType;
 
+    // create the directory of the files, as for the partitions of a dataset
+    const createDirs = msgArgs.contains("create_dirs") && msgArgs.get("create_dirs").getBoolValue();
+
     // use the first entry to identify target locales. Assuming all have same distribution
     var targetLocales = identifyTargetLocales(sym_names[0], col_objType_strs[0], st);
     
     var warnFlag: bool;
     try {
-      warnFlag = writeMultiColParquet(filename, col_names, ncols, sym_names, col_objType_strs, targetLocales, compression:int, st);
+      warnFlag = writeMultiColParquet(filename, col_names, ncols, sym_names, col_objType_strs, targetLocales, compression:int, st, createDirs);
     } catch e: FileNotFoundError {
       var errorMsg = "Unable to open %s for writing: %s".format(filename,e.message());
       pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -1991,6 +2501,55 @@ module ParquetMsg {
     }
   }
 
+  proc toParquetPartitionedMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+    const ncols: int = msgArgs.get("num_cols").getIntValue();
+    const col_names: [0..#ncols] string = msgArgs.get("col_names").getList(ncols);
+    const sym_names: [0..#ncols] string = msgArgs.get("columns").getList(ncols);
+    const col_objType_strs: [0..#ncols] string = msgArgs.get("col_objtypes").getList(ncols);
+    const compression = msgArgs.getValueOf("compression").toUpper(): CompressionType;
+
+    // the rows ordered by partition, the start of each partition and the file it is written to
+    var perm = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("perm"), st), int);
+    var segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int);
+    const filenames: [0..#segments.size] string = msgArgs.get("filenames").getList(segments.size);
+
+    try {
+      writePartitionedParquet(filenames, col_names, ncols, sym_names, col_objType_strs,
+                              perm.a, segments.a, compression:int, st);
+    } catch e: Error {
+      var errorMsg = "problem writing to file %s".format(e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+
+    var repMsg = "Wrote %i partitions".format(segments.size);
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+    return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
+  /*
+    List the data files under a directory, like the partitions of a Hive
+    partitioned dataset, skipping the files whose names start with "." or
+    "_", such as _SUCCESS and _common_metadata. The list is empty if the
+    path is not a directory.
+  */
+  proc lspqDirMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+    const path: string = msgArgs.getValueOf("path");
+    var files: list(string);
+    if isDir(path) {
+      for f in findFiles(path, recursive=true) {
+        const base = basename(f);
+        if !base.startsWith(".") && !base.startsWith("_") then files.pushBack(f);
+      }
+    }
+    var fileArr = files.toArray();
+    sort(fileArr);
+    var repMsg = formatJson(fileArr);
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                   "Found %i files under %s".format(fileArr.size, path));
+    return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
   proc lspqMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
     // reqMsg: "lshdf [<json_filename>]"
     var repMsg: string;
@@ -2164,8 +2723,10 @@ module ParquetMsg {
   use CommandMap;
   registerFunction("readAllParquet", readAllParquetMsg, getModuleName());
   registerFunction("toParquet_multi", toParquetMultiColMsg, getModuleName());
+  registerFunction("toParquetPartitioned", toParquetPartitionedMsg, getModuleName());
   registerFunction("writeParquet", toparquetMsg, getModuleName());
   registerFunction("lspq", lspqMsg, getModuleName());
+  registerFunction("lspqDir", lspqDirMsg, getModuleName());
   registerFunction("getnullparquet", nullIndicesMsg, getModuleName());
   ServerConfig.appendToConfigStr("ARROW_VERSION", getVersionInfo());
 }
@@ -15,6 +15,7 @@ module ReductionMsg
     use ServerErrors;
     use Logging;
     use Message;
+    use List;
 
     use KReduce;
     use AryUtil;
@@ -660,6 +661,17 @@ module ReductionMsg
                         var res = segNumUnique(values.a, segments.a);
                         st.addEntry(rname, createSymEntry(res));
                     }
+                    when "first" {
+                        var res = segFirst(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "mode" {
+                        var res = segMode(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "unique" {
+                        return segUniqueMsg(values.a, segments.a, st);
+                    }
                     when "count" {
                         var res = segCount(segments.a, values.size);
                         st.addEntry(rname, createSymEntry(res));
@@ -740,6 +752,17 @@ module ReductionMsg
                         var res = segNumUnique(values.a, segments.a);
                         st.addEntry(rname, createSymEntry(res));
                     }
+                    when "first" {
+                        var res = segFirst(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "mode" {
+                        var res = segMode(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "unique" {
+                        return segUniqueMsg(values.a, segments.a, st);
+                    }
                     when "count" {
                         var res = segCount(segments.a, values.size);
                         st.addEntry(rname, createSymEntry(res));
@@ -794,6 +817,21 @@ module ReductionMsg
                         var (vals, locs) = segArgmax(values.a, segments.a);
                         st.addEntry(rname, createSymEntry(locs));
                     }
+                    when "nunique" {
+                        var res = segNumUnique(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "first" {
+                        var res = segFirst(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "mode" {
+                        var res = segMode(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "unique" {
+                        return segUniqueMsg(values.a, segments.a, st);
+                    }
                     when "count" {
                         var res = segCount(segments.a, values.size) - nanCounts(values.a, segments.a);
                         st.addEntry(rname, createSymEntry(res));
@@ -844,6 +882,21 @@ module ReductionMsg
                         var (vals, locs) = segArgmax(values.a, segments.a);
                         st.addEntry(rname, createSymEntry(locs));
                     }
+                    when "nunique" {
+                        var res = segNumUnique(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "first" {
+                        var res = segFirst(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "mode" {
+                        var res = segMode(values.a, segments.a);
+                        st.addEntry(rname, createSymEntry(res));
+                    }
+                    when "unique" {
+                        return segUniqueMsg(values.a, segments.a, st);
+                    }
                     when "count" {
                         var res = segCount(segments.a, values.size);
                         st.addEntry(rname, createSymEntry(res));
@@ -914,6 +967,54 @@ module ReductionMsg
        return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+    /*
+      Compute several segmented reductions over the same segments in a single
+      request. 'values' and 'ops' are parallel lists of the (grouped) arrays to
+      reduce and the reduction operators to apply to them, so an array appears
+      once for each operator applied to it. 'skip_nan' and 'ddof' apply to all
+      of the reductions.
+
+      Returns the created messages of the reductions, in order, joined by "+"
+    */
+    proc multiSegmentedReductionMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const values = msgArgs["values"].toScalarList(string),
+              ops = msgArgs["ops"].toScalarList(string);
+        if values.size != ops.size {
+            var errorMsg = "Error: values and ops must have the same length";
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s values: %? operators: %?".format(cmd, values, ops));
+
+        var replies: [0..#values.size] string;
+        // deletes the results of the reductions preceding a failed reduction
+        proc deleteReplies(failed: int) throws {
+            for j in 0..<failed do st.deleteEntry(replies[j].split()[1]);
+        }
+        for i in 0..#values.size {
+            var params = new list(ParameterObj);
+            params.pushBack(new ParameterObj("values", values[i], ""));
+            params.pushBack(new ParameterObj("op", ops[i], "str"));
+            params.pushBack(msgArgs.get("segments"));
+            params.pushBack(msgArgs.get("skip_nan"));
+            params.pushBack(msgArgs.get("ddof"));
+            var reply: MsgTuple;
+            try {
+                reply = segmentedReductionMsg(cmd, new MessageArgs(params), st);
+            } catch e {
+                deleteReplies(i);
+                throw e;
+            }
+            if reply.msgType == MsgType.ERROR {
+                deleteReplies(i);
+                return reply;
+            }
+            replies[i] = reply.msg;
+        }
+        return new MsgTuple("+".join(replies), MsgType.NORMAL);
+    }
+
 
     /*  Compute the maximum/minimum of a vector and a scalar.
     */
@@ -1664,105 +1765,157 @@ module ReductionMsg
       return keys;
     }
 
-    proc segNumUnique(values: [?kD] ?t, segments: [?sD] int) throws {
-      var res = makeDistArray(sD, int);
-      if (sD.size == 0) {
-        return res;
+    /*
+      Sorts the values within each segment and finds the runs of equal values
+      in the sorted order. Segments keep their positions when sorted, so this
+      takes two stable radix sorts and a scan, however many segments there
+      are. Returns the offsets of each segment's runs and, for each run, its
+      segment, its length, the index in values of its first value (runs of
+      equal values keep their original order), and the value.
+    */
+    proc segValueRuns(values: [?vD] ?t, segments: [?sD] int) throws {
+      const keys = expandKeys(vD, segments);
+      proc valueRanks() throws {
+        if t == bool {
+          var asInt = makeDistArray(vD, int);
+          asInt = values:int;
+          return radixSortLSD_ranks(asInt);
+        } else {
+          return radixSortLSD_ranks(values);
+        }
       }
-      var keys = expandKeys(kD, segments);
-      // sort keys and values together
-      var t1 = Time.timeSinceEpoch().totalSeconds();
-      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), 
-                                                         "Sorting keys and values...");
-      /* var toSort = [(k, v) in zip(keys, values)] (k, v); */
-      /* Sort.TwoArrayRadixSort.twoArrayRadixSort(toSort); */
-      var firstIV = radixSortLSD_ranks(values);
-      var intermediate = makeDistArray(kD, int);
+      // sort by value, then stably by segment
+      const firstIV = valueRanks();
+      var intermediate = makeDistArray(vD, int);
       forall (ii, idx) in zip(intermediate, firstIV) with (var agg = newSrcAggregator(int)) {
           agg.copy(ii, keys[idx]);
       }
-      var deltaIV = radixSortLSD_ranks(intermediate);
-      var IV = makeDistArray(kD, int);
+      const deltaIV = radixSortLSD_ranks(intermediate);
+      var IV = makeDistArray(vD, int);
       forall (IVi, idx) in zip(IV, deltaIV) with (var agg = newSrcAggregator(int)) {
           agg.copy(IVi, firstIV[idx]);
       }
-      var sortedKV = makeDistArray(kD, (int,t));
-      forall ((kvi0,kvi1), idx) in zip(sortedKV, IV) with (var keysAgg = newSrcAggregator(int),
-                                                           var valsAgg = newSrcAggregator(t)) {
-        keysAgg.copy(kvi0, keys[idx]);
-        valsAgg.copy(kvi1, values[idx]);
+      var sortedVals = makeDistArray(vD, t);
+      forall (v, idx) in zip(sortedVals, IV) with (var agg = newSrcAggregator(t)) {
+          agg.copy(v, values[idx]);
       }
-      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                                           "sort time = %i".format(Time.timeSinceEpoch().totalSeconds() - t1));
-      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                                           "Finding unique (key, value) pairs...");
-      var truth = makeDistArray(kD, bool);
-      // true where new (k, v) pair appears
-      [(tr, (_,val), i) in zip(truth, sortedKV, kD)] if i > kD.low {
-        const (_,sortedVal) = sortedKV[i-1];
-        tr = (sortedVal != val);
+      // true where a new run of equal values starts
+      var isStart = makeDistArray(vD, bool);
+      forall (s, v, i) in zip(isStart, sortedVals, vD) {
+        s = i == vD.low || !sameValue(sortedVals[i-1], v);
       }
-      // first value of every segment is automatically new
-      [s in segments] truth[s] = true;
-      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
-      overMemLimit(numBytes(int) * truth.size);
-      // count cumulative new values and take diffs at segment boundaries
-      var count: [kD] int = (+ scan truth);
-      var pop = count[kD.high];
-      // find steps to get unique (key, val) pairs
-      var hD = makeDistDom(pop);
-      // save off only the key from each pair (now there will be nunique of each key)
-      var keyhits = makeDistArray(hD, int);
-      forall i in truth.domain with (var agg = newDstAggregator(int)) {
-        if (truth[i]) {
-          var (key,_) = sortedKV[i];
-          agg.copy(keyhits[count[i]-1], key);
-        }
+      // the first value of every segment starts a run
+      forall s in segments with (var agg = newDstAggregator(bool)) {
+        if s < vD.size then agg.copy(isStart[s], true);
       }
-      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                                       "time = %i".format(Time.timeSinceEpoch().totalSeconds() - t1));
-      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                                       "Finding unique keys and num unique vals per key.");
-      // find steps in keys
-      var truth2 = makeDistArray(hD, bool);
-      truth2[0] = true;
-      [(tr, k, i) in zip(truth2, keyhits, hD)] if (i > hD.low) { tr = (keyhits[i-1] != k); }
       // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
-      overMemLimit(numBytes(int) * truth2.size);
-      var kiv: [hD] int = (+ scan truth2);
-      var nKeysPresent = kiv[hD.high];
-      var nD = makeDistDom(nKeysPresent+1);
-      // get step indices and take diff to get number of times each key appears
-      var stepInds = makeDistArray(nD, int);
-      stepInds[nKeysPresent] = keyhits.size;
-      forall i in hD with (var agg = newDstAggregator(int)) {
-        if (truth2[i]) {
-          var idx = i;
-          agg.copy(stepInds[kiv[i]-1], idx);
+      overMemLimit(numBytes(int) * isStart.size);
+      const runIds = (+ scan isStart) - 1;
+      const nRuns = runIds[vD.high] + 1;
+      const rD = makeDistDom(nRuns);
+      var runKeys = makeDistArray(rD, int);
+      var runStarts = makeDistArray(rD, int);
+      var runFirsts = makeDistArray(rD, int);
+      var runVals = makeDistArray(rD, t);
+      forall i in vD with (var keyAgg = newDstAggregator(int), var startAgg = newDstAggregator(int),
+                           var firstAgg = newDstAggregator(int), var valAgg = newDstAggregator(t)) {
+        if isStart[i] {
+          const r = runIds[i];
+          keyAgg.copy(runKeys[r], keys[i]);
+          startAgg.copy(runStarts[r], i);
+          firstAgg.copy(runFirsts[r], IV[i]);
+          valAgg.copy(runVals[r], sortedVals[i]);
         }
       }
-      var nunique = stepInds[1..#nKeysPresent] - stepInds[0..#nKeysPresent];
-      // if every key is present, we're done
-      if (nKeysPresent == sD.size) {
-        res = nunique;
-      } else { // need to skip over non-present keys
-        var segSizes = makeDistArray(sD, int);
-        segSizes[sD.low..sD.high-1] = segments[sD.low+1..sD.high] - segments[sD.low..sD.high-1];
-        segSizes[sD.high] = kD.high - segments[sD.high] + 1;
-        var idx = 0;
-        for (r, s) in zip(res, segSizes) {
-          if (s > 0) {
-            r = nunique[idx];
-            idx += 1;
-          }
-        }
+      var runLens = makeDistArray(rD, int);
+      forall (l, s, r) in zip(runLens, runStarts, rD) {
+        l = (if r < rD.high then runStarts[r+1] else vD.size) - s;
+      }
+      var runSegments = makeDistArray(sD, int);
+      forall (rs, s) in zip(runSegments, segments) {
+        rs = if s < vD.size then runIds[s] else nRuns;
+      }
+      return (runSegments, runKeys, runLens, runFirsts, runVals);
+    }
+
+    inline proc sameValue(a: real, b: real): bool {
+      return a == b || (isNan(a) && isNan(b));
+    }
+
+    inline proc sameValue(a, b): bool {
+      return a == b;
+    }
+
+    proc segNumUnique(values: [?vD] ?t, segments: [?sD] int) throws {
+      var res = makeDistArray(sD, int);
+      if (sD.size == 0 || vD.size == 0) {
+        return res;
+      }
+      const (runSegments, runKeys, _, _, _) = segValueRuns(values, segments);
+      res = segCount(runSegments, runKeys.size);
+      return res;
+    }
+
+    /*
+      The most common value of each non-empty segment. Of several equally
+      common values, the one that occurs first in values is returned.
+    */
+    proc segMode(values: [?vD] ?t, segments: [?sD] int) throws {
+      var res = makeDistArray(sD, t);
+      if (sD.size == 0 || vD.size == 0) {
+        return res;
+      }
+      const (runSegments, runKeys, runLens, runFirsts, _) = segValueRuns(values, segments);
+      const maxLens = segMax(runLens, runSegments);
+      // the first occurrence of each of the longest runs of each segment
+      var cands = makeDistArray(runFirsts.domain, int);
+      forall (c, k, l, f) in zip(cands, runKeys, runLens, runFirsts) {
+        c = if l == maxLens[k] then f else max(int);
+      }
+      const modeInds = segMin(cands, runSegments);
+      // empty segments have no runs, so they are left at the default value
+      const counts = segCount(segments, vD.size);
+      forall (r, i, c) in zip(res, modeInds, counts) with (var agg = newSrcAggregator(t)) {
+        if c > 0 then agg.copy(r, values[i]);
+      }
+      return res;
+    }
+
+    /* The first value of each non-empty segment */
+    proc segFirst(values: [?vD] ?t, segments: [?sD] int) throws {
+      var res = makeDistArray(sD, t);
+      if (sD.size == 0) {
+        return res;
+      }
+      const counts = segCount(segments, vD.size);
+      forall (r, s, c) in zip(res, segments, counts) with (var agg = newSrcAggregator(t)) {
+        if c > 0 then agg.copy(r, values[s]);
       }
-      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                                                   "time = %i".format(Time.timeSinceEpoch().totalSeconds() - t1));
       return res;
     }
 
+    /*
+      Add the sorted unique values of each segment to the symbol table,
+      returning the reply naming their segments and the values
+    */
+    proc segUniqueMsg(values: [?vD] ?t, segments: [?sD] int, st: borrowed SymTab): MsgTuple throws {
+      var sname = st.nextName();
+      var vname = st.nextName();
+      if (vD.size == 0) {
+        st.addEntry(sname, createSymEntry(makeDistArray(sD, int)));
+        st.addEntry(vname, createSymEntry(0, t));
+      } else {
+        const (runSegments, _, _, _, runVals) = segValueRuns(values, segments);
+        st.addEntry(sname, createSymEntry(runSegments));
+        st.addEntry(vname, createSymEntry(runVals));
+      }
+      var repMsg = "created " + st.attrib(sname) + "+created " + st.attrib(vname);
+      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     use CommandMap;
     registerFunction("segmentedReduction", segmentedReductionMsg, getModuleName());
+    registerFunction("multiSegmentedReduction", multiSegmentedReductionMsg, getModuleName());
     registerFunction("sizeReduction", sizeReductionMsg, getModuleName());
 }
@@ -371,6 +371,14 @@ module RegistrationMsg {
     proc attachMsg(cmd: string, msgArgs: borrowed MessageArgs,
                         st: borrowed SymTab): MsgTuple throws {
         var name = msgArgs.getValueOf("name");
+        return new MsgTuple(formatJson(attachMap(name, st)), MsgType.NORMAL);
+    }
+
+    /*
+      The objType of a registered object and the create message of its
+      components, from which the client rebuilds the object
+    */
+    proc attachMap(name: string, st: borrowed SymTab): map(string, string) throws {
         var gre = st.registry.lookup(name): shared GenRegEntry;
         var rtnMap: map(string, string);
         select gre.objType {
@@ -436,7 +444,7 @@ module RegistrationMsg {
                     errorClass="TypeError");
             }
         }
-        return new MsgTuple(formatJson(rtnMap), MsgType.NORMAL);
+        return rtnMap;
     }
 
     proc listRegistryMsg(cmd: string, msgArgs: borrowed MessageArgs,
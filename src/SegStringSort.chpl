@@ -10,6 +10,7 @@ module SegStringSort {
   use Logging;
   use ServerConfig;
   use BlockDist;
+  use RadixSortLSD only radixSortLSD_ranks;
 
   private config const SSS_v = false;
   private const vv = SSS_v;
@@ -96,6 +97,102 @@ module SegStringSort {
     return ranks;
   }
   
+  /*
+    Sort strings by their prefixes packed into uint64 keys, 8 bytes at a time.
+    The first 8 bytes of every string are packed big-endian and zero padded,
+    so the keys order like the strings, and radix sorted. Only the runs of
+    strings with equal keys that are at least as long as the bytes compared so
+    far are then sorted again, within their run, by their next 8 bytes, until
+    no ties are left. The sort is stable.
+  */
+  proc prefixStringSort(ss: SegString): [ss.offsets.a.domain] int throws {
+    const ref D = ss.offsets.a.domain;
+    ref oa = ss.offsets.a;
+    ref va = ss.values.a;
+    const lengths = ss.getLengths() - 1;
+    // the string at each position of the sorted order
+    var perm = makeDistArray(D, int);
+    forall (p, i) in zip(perm, D) do p = i;
+    // the positions whose strings are still tied, and the position their run of ties starts at
+    var activeDom = makeDistDom(D.size);
+    var active: [activeDom] int;
+    var runs: [activeDom] int;
+    forall (a, i) in zip(active, activeDom) do a = D.low + i;
+    var depth = 0;
+    while activeDom.size > 0 {
+      var t = timeSinceEpoch().totalSeconds();
+      const start = depth * 8;
+      // the temporary arrays are declared over a copy of the active domain, which is resized below
+      const aD = makeDistDom(activeDom.size);
+      var strs, offs, lens = makeDistArray(aD, int);
+      forall (s, pos) in zip(strs, active) with (var agg = newSrcAggregator(int)) {
+        agg.copy(s, perm[pos]);
+      }
+      forall (o, l, s) in zip(offs, lens, strs) with (var agg = newSrcAggregator(int)) {
+        agg.copy(o, oa[s]);
+        agg.copy(l, lengths[s]);
+      }
+      var chunks = makeDistArray(aD, 8*uint(8));
+      forall (c, o, l) in zip(chunks, offs, lens) with (var agg = newSrcAggregator(uint(8))) {
+        for j in 0..<min(8, l - start) do agg.copy(c[j], va[o + start + j]);
+      }
+      // sort by run first, keeping the runs in place, and then by the packed bytes
+      var keys = makeDistArray(aD, (uint, uint));
+      forall (k, c, r) in zip(keys, chunks, runs) {
+        var key: uint;
+        for param j in 0..<8 do key = (key << 8) | c[j];
+        k = (r: uint, key);
+      }
+      const ranks = radixSortLSD_ranks(keys);
+      var sortedKeys = makeDistArray(aD, (uint, uint));
+      var sortedStrs, sortedLens = makeDistArray(aD, int);
+      forall (sk, sstr, sl, r) in zip(sortedKeys, sortedStrs, sortedLens, ranks) with (var keyAgg = newSrcAggregator((uint, uint)),
+                                                                                     var agg = newSrcAggregator(int)) {
+        keyAgg.copy(sk, keys[r]);
+        agg.copy(sstr, strs[r]);
+        agg.copy(sl, lens[r]);
+      }
+      // the active positions are increasing, so the runs are written back in place
+      forall (pos, s) in zip(active, sortedStrs) with (var agg = newDstAggregator(int)) {
+        agg.copy(perm[pos], s);
+      }
+
+      // strings equal to their neighbor in all the bytes compared are still tied, unless
+      // they ended before the last byte compared, where the zero padding tells them apart
+      var isStart = makeDistArray(aD, bool);
+      forall (j, k) in zip(aD, sortedKeys) do isStart[j] = j == aD.low || sortedKeys[j-1] != k;
+      var tied = makeDistArray(aD, bool);
+      forall (j, l) in zip(aD, sortedLens) {
+        const hasTie = !isStart[j] || (j < aD.high && !isStart[j+1]);
+        tied[j] = hasTie && l >= start + 8;
+      }
+      var runStarts = makeDistArray(aD, int);
+      forall (rs, s, pos) in zip(runStarts, isStart, active) do rs = if s then pos else -1;
+      runStarts = max scan runStarts;
+
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit(numBytes(int) * tied.size);
+      const dests = (+ scan tied) - tied;
+      const nTied = + reduce tied;
+      var nextActive = makeDistArray(nTied, int);
+      var nextRuns = makeDistArray(nTied, int);
+      forall (tie, d, pos, rs) in zip(tied, dests, active, runStarts) with (var agg = newDstAggregator(int)) {
+        if tie {
+          agg.copy(nextActive[d], pos);
+          agg.copy(nextRuns[d], rs);
+        }
+      }
+      activeDom = makeDistDom(nTied);
+      active = nextActive;
+      runs = nextRuns;
+      ssLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                     "Sorted bytes %i..%i in %? seconds, %i strings still tied".format(
+                       start, start + 7, timeSinceEpoch().totalSeconds() - t, nTied));
+      depth += 1;
+    }
+    return perm;
+  }
+
   proc getPivot(lengths: [?D] int): 2*int throws {
     if !PARTITION_LONG_STRING {
       var pivot = max reduce lengths + 1;
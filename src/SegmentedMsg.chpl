@@ -65,6 +65,42 @@ module SegmentedMsg {
       }
   }
 
+  /*
+   * Outputs the elements [start, start+count) of the offsets or values of a
+   * SegString as a Numpy ndarray in the form of a Chapel Bytes object
+   */
+  proc segStrTondarrayChunkMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      var entry = getSegString(msgArgs.getValueOf("obj"), st);
+      const comp = msgArgs.getValueOf("comp"),
+            start = msgArgs["start"].toScalar(int),
+            count = msgArgs["count"].toScalar(int);
+
+      proc chunkToBytes(A: [?D] ?eltType): bytes throws {
+          if start < 0 || count < 0 || start + count > D.size then
+              throw getErrorWithContext(
+                  msg="chunk [%i, %i) is out of bounds for component of size %i".format(start, start + count, D.size),
+                  lineNumber=getLineNumber(),
+                  routineName=getRoutineName(),
+                  moduleName=getModuleName(),
+                  errorClass="IndexError");
+          var ptr = allocate(eltType, count);
+          var localA = makeArrayFromPtr(ptr, count:uint);
+          localA = A[start..#count];
+          const size = count*c_sizeof(eltType):int;
+          return bytes.createAdoptingBuffer(ptr:c_ptr(uint(8)), size, size);
+      }
+
+      if comp == "offsets" {
+          return MsgTuple.payload(chunkToBytes(entry.offsets.a));
+      } else if (comp == "values") {
+          return MsgTuple.payload(chunkToBytes(entry.values.a));
+      } else {
+          const msg = "Unrecognized component: %s".format(comp);
+          smLogger.error(getModuleName(),getRoutineName(),getLineNumber(), msg);
+          return MsgTuple.error(msg);
+      }
+  }
+
   /*
      * Outputs the pdarray as a Numpy ndarray in the form of a 
      * Chapel Bytes object
@@ -169,6 +205,37 @@ module SegmentedMsg {
     return new MsgTuple(repMsg, MsgType.NORMAL);
   }
 
+  proc segmentPrefixKeysMsg(cmd: string, msgArgs: borrowed MessageArgs,
+                                          st: borrowed SymTab): MsgTuple throws {
+    var pn = Reflection.getRoutineName();
+    const objtype = msgArgs.getValueOf("objType").toUpper(): ObjType;
+    const name = msgArgs.getValueOf("obj");
+
+    // check to make sure symbols defined
+    st.checkTable(name);
+
+    var rname = st.nextName();
+    smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+            "cmd: %s objtype: %? name: %?".format(
+                   cmd,objtype,name));
+
+    select objtype {
+      when ObjType.STRINGS {
+        var strings = getSegString(name, st);
+        st.addEntry(rname, createSymEntry(strings.prefixKeys()));
+      }
+      otherwise {
+          var errorMsg = notImplementedError(pn, "%s".format(objtype));
+          smLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
+    }
+
+    var repMsg = "created "+st.attrib(rname);
+    smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+    return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
   proc getSegStringPropertyMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
     var pn = Reflection.getRoutineName();
     const property = msgArgs.getValueOf("property");
@@ -362,6 +429,44 @@ module SegmentedMsg {
       return new MsgTuple(repMsg, MsgType.NORMAL);
   }
 
+  proc segmentedMatchSetMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      var pn = Reflection.getRoutineName();
+      var repMsg: string;
+      const objtype = msgArgs.getValueOf("objType").toUpper(): ObjType;
+      const name = msgArgs.getValueOf("obj");
+      const n = msgArgs.get("n").getIntValue();
+      const patterns = msgArgs.get("patterns").toScalarArray(string, n);
+      const regex = msgArgs.get("regex").getBoolValue();
+
+      // check to make sure symbols defined
+      st.checkTable(name);
+
+      smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                         "cmd: %s objtype: %? patterns: %i regex: %?".format(cmd,objtype,n,regex));
+
+      select objtype {
+          when ObjType.STRINGS {
+              var strings = getSegString(name, st);
+              var (segments, matches) = strings.matchSet(patterns, regex);
+              const segName = st.nextName();
+              const valName = st.nextName();
+              st.addEntry(segName, createSymEntry(segments));
+              st.addEntry(valName, createSymEntry(matches));
+              var createdMap = new map(keyType=string,valType=string);
+              createdMap.add("segments", "created %s".format(st.attrib(segName)));
+              createdMap.add("values", "created %s".format(st.attrib(valName)));
+              repMsg = formatJson(createdMap);
+          }
+          otherwise {
+            var errorMsg = "%s".format(objtype);
+            smLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(notImplementedError(pn, errorMsg), MsgType.ERROR);
+          }
+      }
+      smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
   proc checkMatchStrings(name: string, st: borrowed SymTab) throws {
     try {
       st.checkTable(name);
@@ -1188,10 +1293,12 @@ module SegmentedMsg {
 
   use CommandMap;
   registerFunction("segmentLengths", segmentLengthsMsg, getModuleName());
+  registerFunction("segmentPrefixKeys", segmentPrefixKeysMsg, getModuleName());
   registerFunction("caseChange", caseChangeMsg, getModuleName());
   registerFunction("checkChars", checkCharsMsg, getModuleName());
   registerFunction("segmentedHash", segmentedHashMsg, getModuleName());
   registerFunction("segmentedSearch", segmentedSearchMsg, getModuleName());
+  registerFunction("segmentedMatchSet", segmentedMatchSetMsg, getModuleName());
   registerFunction("segmentedFindLoc", segmentedFindLocMsg, getModuleName());
   registerFunction("segmentedFindAll", segmentedFindAllMsg, getModuleName());
   registerFunction("segmentedPeel", segmentedPeelMsg, getModuleName());
@@ -1206,6 +1313,7 @@ module SegmentedMsg {
   registerFunction("segStr-assemble", assembleStringsMsg, getModuleName());
   registerFunction("stringsToJSON", stringsToJSONMsg, getModuleName());
   registerFunction("segStr-tondarray", segStrTondarrayMsg, getModuleName());
+  registerFunction("segStr-tondarrayChunk", segStrTondarrayChunkMsg, getModuleName());
   registerFunction("segmentedSubstring", segmentedSubstringMsg, getModuleName());
   registerFunction("segmentedWhere", segmentedWhereMsg, getModuleName());
   registerFunction("segmentedFull", segmentedFullMsg, getModuleName());
@@ -17,6 +17,8 @@ module SegmentedString {
   use ServerErrors;
   use SegmentedComputation;
   use Regex;
+  use Map;
+  use BitOps;
 
   use Subprocess;
   use Path;
@@ -408,6 +410,25 @@ module SegmentedString {
       return lengths;
     }
 
+    /*
+      Return the first 8 bytes of each string packed big-endian into a uint and
+      zero padded, so the keys are ordered like the strings up to their 8th byte
+    */
+    proc prefixKeys() throws {
+      var keys = makeDistArray(offsets.a.domain, uint);
+      if (size == 0) {
+        return keys;
+      }
+      ref va = values.a;
+      const lengths = getLengths() - 1;
+      forall (k, o, l) in zip(keys, offsets.a, lengths) {
+        var key: uint;
+        for j in 0..<8 do key = (key << 8) | (if j < l then va[o + j]: uint else 0);
+        k = key;
+      }
+      return keys;
+    }
+
     /*
       Given a SegString, return a new SegString with all uppercase characters from the original replaced with their lowercase equivalent
       :returns: Strings – Substrings with uppercase characters replaced with lowercase equivalent
@@ -945,6 +966,115 @@ module SegmentedString {
       return computeOnSegments(offsets.a, values.a, SegFunction.StringSearch, bool, pattern);
     }
 
+    /*
+      Returns the indices of the patterns each string matches, in a single pass over the strings.
+      Literal patterns are compiled into an Aho-Corasick automaton, which finds every pattern a
+      string contains in one scan of its bytes. Regex patterns are combined into one regex, whose
+      automaton checks a string against all the patterns at once, and only the strings it matches
+      are checked against each pattern, once. The patterns each string matches are kept as a
+      bitmask, from which the indices are filled in.
+
+      Note: the regular expression engine used, re2, does not support lookahead/lookbehind
+
+      :arg patterns: literal substrings or regex patterns to be applied to strings in SegString
+      :type patterns: [] string
+
+      :arg regex: whether the patterns are regular expressions
+      :type regex: bool
+
+      :returns: Components of a SegArray (segments, values) where the values of segment i are the
+                indices of the patterns matching string i of the SegString
+    */
+    proc matchSet(const ref patterns: [] string, regex: bool) throws {
+      const D = this.offsets.a.domain;
+      // the patterns each string matches, as nWords 64-bit words per string
+      const nWords = (patterns.size + 63) / 64;
+      var masks = makeDistArray(D.size * nWords, uint);
+      var counts = makeDistArray(D, int);
+      ref origVals = this.values.a;
+      const lengths = this.getLengths();
+
+      if regex {
+        for pattern in patterns do checkCompile(pattern);
+        const anyPattern = "|".join([pattern in patterns] "(?:%s)".format(pattern));
+        checkCompile(anyPattern);
+        forall (i, off, len) in zip(D, this.offsets.a, lengths) with (var anyRegex = unsafeCompileRegex(anyPattern),
+                                                                    var myRegexes = for pattern in patterns do unsafeCompileRegex(pattern),
+                                                                    var agg = newDstAggregator(uint)) {
+          const str = interpretAsString(origVals, off..#len, borrow=true);
+          if anyRegex.search(str).matched {
+            var n = 0;
+            var word: uint;
+            for (r, k) in zip(myRegexes, 0..) {
+              if r.search(str).matched {
+                word |= 1:uint << (k % 64);
+                n += 1;
+              }
+              if k % 64 == 63 || k == patterns.size - 1 {
+                agg.copy(masks[(i - D.low) * nWords + k / 64], word);
+                word = 0;
+              }
+            }
+            counts[i] = n;
+          }
+        }
+      } else {
+        const (nStates, delta, firstMatch, nextMatch, outLink) = buildPatternAutomaton(patterns);
+        const nPatterns = patterns.size;
+        coforall loc in Locales with (ref masks, ref counts) do on loc {
+          // each locale scans with its own copy of the automaton
+          const myDelta: [0..<nStates, 0..255] int(32) = delta;
+          const myFirst: [0..<nStates] int = firstMatch;
+          const myOut: [0..<nStates] int = outLink;
+          const myNext: [0..<nPatterns] int = nextMatch;
+          forall i in D.localSubdomain() with (var mask: [0..<nWords] uint,
+                                               var agg = newDstAggregator(uint)) {
+            var state = 0, n = 0;
+            // the last byte of each string is its null terminator
+            for j in this.offsets.a[i]..#(lengths[i] - 1) {
+              state = myDelta[state, origVals[j]: int];
+              // the patterns ending here are those of the state and of its output links
+              var t = if myFirst[state] >= 0 then state else myOut[state];
+              while t >= 0 {
+                var k = myFirst[t];
+                while k >= 0 {
+                  const bit = 1:uint << (k % 64);
+                  if mask[k / 64] & bit == 0 {
+                    mask[k / 64] |= bit;
+                    n += 1;
+                  }
+                  k = myNext[k];
+                }
+                t = myOut[t];
+              }
+            }
+            if n > 0 {
+              for w in 0..<nWords do agg.copy(masks[(i - D.low) * nWords + w], mask[w]);
+              mask = 0;
+              counts[i] = n;
+            }
+          }
+        }
+      }
+
+      const segments = (+ scan counts) - counts;
+      var matches = makeDistArray(+ reduce counts, int);
+      forall (i, seg, n) in zip(D, segments, counts) with (var agg = newDstAggregator(int)) {
+        if n > 0 {
+          var j = seg;
+          for w in 0..<nWords {
+            var word = masks[(i - D.low) * nWords + w];
+            while word != 0 {
+              agg.copy(matches[j], w * 64 + ctz(word): int);
+              j += 1;
+              word &= word - 1;
+            }
+          }
+        }
+      }
+      return (segments, matches);
+    }
+
     /*
       Peel off one or more fields matching the regular expression, delimiter, from each string (similar
       to string.partition), returning two new arrays of strings.
@@ -1464,12 +1594,69 @@ module SegmentedString {
     return computeOnSegments(ss.offsets.a, ss.values.a, function, bool, testStr);
   }
 
+  /*
+    Maximum number of compiled regular expressions cached on each locale,
+    for string and for bytes patterns each. 0 disables the cache.
+  */
+  config const regexCacheSize = 64;
+
+  /*
+    Compiled regular expressions keyed by their pattern, evicting the least
+    recently used pattern when full. Every locale has its own, since a
+    compiled regex is only used on the locale that compiled it, and tasks
+    on a locale share the compiled regex rather than each compiling it.
+  */
+  class RegexCache {
+    type t;
+    var lock: sync bool = true;
+    var regexes: map(t, regex(t));
+    var lastUsed: map(t, int);
+    var clock: int;
+
+    proc get(const pattern: t): regex(t) throws {
+      lock.readFE();
+      defer lock.writeEF(true);
+      if regexCacheSize <= 0 then return new regex(pattern);
+      clock += 1;
+      if !regexes.contains(pattern) {
+        const r = new regex(pattern);
+        if regexes.size >= regexCacheSize {
+          var oldest: t, oldestUse = max(int);
+          for p in lastUsed.keys() {
+            if lastUsed[p] < oldestUse then (oldest, oldestUse) = (p, lastUsed[p]);
+          }
+          regexes.remove(oldest);
+          lastUsed.remove(oldest);
+        }
+        regexes.add(pattern, r);
+      }
+      lastUsed.addOrReplace(pattern, clock);
+      return regexes[pattern];
+    }
+  }
+
+  private var stringRegexCaches: [PrivateSpace] owned RegexCache(string)?;
+  private var bytesRegexCaches: [PrivateSpace] owned RegexCache(bytes)?;
+  forall (sc, bc) in zip(stringRegexCaches, bytesRegexCaches) {
+    sc = new RegexCache(string);
+    bc = new RegexCache(bytes);
+  }
+
+  /*
+    Returns the compiled pattern from this locale's cache, compiling it if
+    it is not cached
+  */
+  proc compileCached(const pattern: ?t): regex(t) throws where t == bytes || t == string {
+    if t == string then return stringRegexCaches[here.id]!.get(pattern);
+    else return bytesRegexCaches[here.id]!.get(pattern);
+  }
+
   /*
     Returns Regexp.compile if pattern can be compiled without an error
   */
   proc checkCompile(const pattern: ?t) throws where t == bytes || t == string {
     try {
-      return new regex(pattern);
+      return compileCached(pattern);
     }
     catch {
       var errorMsg = "re2 could not compile pattern: %s".format(pattern);
@@ -1484,7 +1671,7 @@ module SegmentedString {
     // This proc is a workaound to allow declaring regexps using a with clause in forall loops
     // since using declarations with throws are illegal
     // It is only called after checkCompile so the try! will not result in a server crash
-    return try! new regex(pattern);
+    return try! compileCached(pattern);
   }
 
   inline proc stringSearch(ref values, rng, myRegex) throws {
@@ -1713,6 +1900,73 @@ module SegmentedString {
     return (offsets, values);
   }
 
+  /*
+     Build an Aho-Corasick automaton over the bytes of the literal patterns, as
+     (nStates, delta, firstMatch, nextMatch, outLink). delta[s, b] is the state
+     reached from state s on byte b, firstMatch[s] is a pattern ending at state s
+     and nextMatch[k] the next pattern ending where pattern k does (-1 for none),
+     and outLink[s] is the nearest state on the failure path of s at which a
+     pattern ends (-1 for none).
+   */
+  proc buildPatternAutomaton(const ref patterns: [] string) {
+    const maxStates = 1 + (+ reduce [pattern in patterns] pattern.numBytes);
+    var delta: [0..<maxStates, 0..255] int(32) = -1;
+    var firstMatch: [0..<maxStates] int = -1;
+    var nextMatch: [0..<patterns.size] int = -1;
+    var fail: [0..<maxStates] int;
+    var outLink: [0..<maxStates] int = -1;
+
+    // the trie of the patterns
+    var nStates = 1;
+    for (pattern, k) in zip(patterns, 0..) {
+      var s = 0;
+      for c in pattern.bytes() {
+        const b = c: int;
+        if delta[s, b] < 0 {
+          delta[s, b] = nStates: int(32);
+          nStates += 1;
+        }
+        s = delta[s, b];
+      }
+      nextMatch[k] = firstMatch[s];
+      firstMatch[s] = k;
+    }
+
+    // failure links in breadth-first order, completing delta into a DFA
+    var queue: [0..<nStates] int;
+    var head = 0, tail = 0;
+    for b in 0..255 {
+      if delta[0, b] < 0 {
+        delta[0, b] = 0;
+      } else {
+        fail[delta[0, b]] = 0;
+        queue[tail] = delta[0, b];
+        tail += 1;
+      }
+    }
+    while head < tail {
+      const s = queue[head];
+      head += 1;
+      outLink[s] = if firstMatch[fail[s]] >= 0 then fail[s] else outLink[fail[s]];
+      for b in 0..255 {
+        const t = delta[s, b];
+        if t < 0 {
+          delta[s, b] = delta[fail[s], b];
+        } else {
+          fail[t] = delta[fail[s], b];
+          queue[tail] = t;
+          tail += 1;
+        }
+      }
+    }
+
+    const states = 0..<nStates;
+    const trimmedDelta: [states, 0..255] int(32) = delta[states, 0..255];
+    const trimmedFirst: [states] int = firstMatch[states];
+    const trimmedOut: [states] int = outLink[states];
+    return (nStates, trimmedDelta, trimmedFirst, nextMatch, trimmedOut);
+  }
+
   /*
      Interpret a region of a byte array as a Chapel string. If `borrow=false` a
      new string is returned, otherwise the string borrows memory from the array
@@ -201,6 +201,7 @@ module ServerConfig
             const autoShutdown: bool;
             const serverInfoNoSplash: bool;
             const maxArrayDims: int;
+            const requestEncodings: [0..<2] string;
         }
 
         var (Zmajor, Zminor, Zmicro) = ZMQ.version;
@@ -227,7 +228,8 @@ module ServerConfig
             byteorder = try! getByteorder(),
             autoShutdown = autoShutdown,
             serverInfoNoSplash = serverInfoNoSplash,
-            maxArrayDims = MaxArrayDims
+            maxArrayDims = MaxArrayDims,
+            requestEncodings = ["json", "packed"]
         );
         return try! formatJson(cfg);
 
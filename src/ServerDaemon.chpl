@@ -295,17 +295,22 @@ module ServerDaemon {
 
         /*
         Following processing of incoming message, sends a message back to the client.
-
+        String replies carry the request id, if any, submitted with the request, and
+        are packed if the request was.
         */
-        proc sendRepMsg(in response: MsgTuple, user: string) throws {
+        proc sendRepMsg(in response: MsgTuple, user: string, requestId: string = "", packed: bool = false) throws {
             this.repCount += 1;
 
             if response.msgFormat == MsgFormat.BINARY {
                 if trace then sdLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
                                            "repMsg: <binary-data>");
                 this.socket.send(response.payload);
+            } else if packed {
+                if trace then sdLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                                           "repMsg: " + response.msg);
+                this.socket.send(response.pack(user, requestId));
             } else {
-                const repMsg = response.serialize(user);
+                const repMsg = response.serialize(user, requestId);
                 if trace then sdLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
                                           "repMsg: " + repMsg);
                 this.socket.send(repMsg);
@@ -361,6 +366,7 @@ module ServerDaemon {
             registerFunction("lsany", lsAnyMsg);
             registerFunction("getfiletype", getFileTypeMsg);
             registerFunction("globExpansion", globExpansionMsg);
+            registerFunction("batch", batchMsg);
 
             // For a few specialized cmds we're going to add dummy functions, so they
             // get added to the client listing of available commands. They will be
@@ -521,56 +527,67 @@ module ServerDaemon {
                 var s0 = timeSinceEpoch().totalSeconds();
 
                 /*
-                 * Separate the first tuple, which is a string binary containing the JSON binary
-                 * string encapsulating user, token, cmd, message format and args from the 
-                 * remaining payload.
+                 * Requests in the packed encoding are decoded directly into the RequestMsg
+                 * and its MessageArgs. Otherwise, separate the first tuple, which is a string
+                 * binary containing the JSON binary string encapsulating user, token, cmd,
+                 * message format and args from the remaining payload.
                  */
-                var (rawRequest, _) = reqMsgRaw.splitMsgToTuple(b"BINARY_PAYLOAD",2);
+                const packed = reqMsgRaw.startsWith(packedMagic);
                 var user, token, cmd: string;
+                var msg: RequestMsg;
+                var msgArgs: owned MessageArgs;
 
-                // parse requests, execute requests, format responses
-                /*
-                    * Decode the string binary containing the JSON-formatted request string. 
-                    * If there is an error, discontinue processing message and send an error
-                    * message back to the client.
-                    */
-                var request : string;
+                if packed {
+                    msgArgs = unpackRequest(reqMsgRaw, msg);
+                } else {
+                    var (rawRequest, _) = reqMsgRaw.splitMsgToTuple(b"BINARY_PAYLOAD",2);
+
+                    // parse requests, execute requests, format responses
+                    /*
+                        * Decode the string binary containing the JSON-formatted request string. 
+                        * If there is an error, discontinue processing message and send an error
+                        * message back to the client.
+                        */
+                    var request : string;
+
+                    try! {
+                        request = rawRequest.decode();
+                    } catch e: DecodeError {
+                        sdLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
+                            "illegal byte sequence in command: %?".format(
+                                            rawRequest.decode(decodePolicy.replace)));
+                        sendRepMsg(MsgTuple.error(e.message()), "Unknown");
+                    }
 
-                try! {
-                    request = rawRequest.decode();
-                } catch e: DecodeError {
-                    sdLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
-                        "illegal byte sequence in command: %?".format(
-                                        rawRequest.decode(decodePolicy.replace)));
-                    sendRepMsg(MsgTuple.error(e.message()), "Unknown");
+                    // deserialize the decoded, JSON-formatted cmdStr into a RequestMsg
+                    msg = extractRequest(request);
+                    var size: int;
+                    try {
+                            size = msg.size: int;
+                    }
+                    catch e {
+                        sdLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
+                                "Argument List size is not an integer. %s cannot be cast".format(msg.size));
+                        sendRepMsg(MsgTuple.error(e.message()), "Unknown");
+                    }
+
+                    if size > 0 {
+                        msgArgs = parseMessageArgs(msg.args, size);
+                    }
+                    else {
+                        msgArgs = new owned MessageArgs();
+                    }
                 }
 
-                // deserialize the decoded, JSON-formatted cmdStr into a RequestMsg
-                var msg: RequestMsg  = extractRequest(request);
                 user   = msg.user;
                 token  = msg.token;
                 cmd    = msg.cmd;
+                const requestId = msg.request_id;
                 var format = msg.format;
                 var args   = msg.args;
-                var size: int;
-                try {
-                        size = msg.size: int;
-                }
-                catch e {
-                    sdLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
-                            "Argument List size is not an integer. %s cannot be cast".format(msg.size));
-                    sendRepMsg(MsgTuple.error(e.message()), "Unknown");
-                }
 
-                var msgArgs: owned MessageArgs;
-                if size > 0 {
-                    msgArgs = parseMessageArgs(args, size);
-                }
-                else {
-                    msgArgs = new owned MessageArgs();
-                }
-
-                const payload = if reqMsgRaw.endsWith(b"BINARY_PAYLOAD") then socket.recv(bytes) else b"";
+                const hasPayload = if packed then format == "BINARY" else reqMsgRaw.endsWith(b"BINARY_PAYLOAD");
+                const payload = if hasPayload then socket.recv(bytes) else b"";
                 msgArgs.addPayload(payload);
 
                 sdLogger.info(getModuleName(),
@@ -587,6 +604,14 @@ module ServerDaemon {
                     authenticateUser(token);
                 }
 
+                /*
+                 * Delete the symbols whose deletion was deferred by the client and
+                 * piggybacked on this request before executing the command
+                 */
+                if !msg.deletes.isEmpty() {
+                    deleteNames(msg.deletes, st);
+                }
+
                 if (trace) {
                     try {
                         if (cmd != "array") {
@@ -628,6 +653,7 @@ module ServerDaemon {
                 * messages the message is sent directly to minimize copies.
                 */
                 var repMsg: MsgTuple;
+                const execStart = timeSinceEpoch().totalSeconds();
 
                 /**
                 * Command processing: Look for our specialized, default commands first, then check the command maps
@@ -683,8 +709,11 @@ module ServerDaemon {
                     }
                 }
 
+                // report the command execution time to the client with the response
+                repMsg.exec_time = timeSinceEpoch().totalSeconds() - execStart;
+
                 // send response message
-                sendRepMsg(repMsg, user);
+                sendRepMsg(repMsg, user, requestId, packed);
 
                     var elapsedTime = timeSinceEpoch().totalSeconds() - s0;
 
@@ -32,11 +32,17 @@ module UniqueMsg
     use CommAggregation;
     use SegmentedArray;
     use HashMsg;
+    use List;
+    use Map;
+    use Broadcast;
     
     private config const logLevel = ServerConfig.logLevel;
     private config const logChannel = ServerConfig.logChannel;
     const umLogger = new Logger(logLevel, logChannel);
 
+    /* Group by sorting in hashGroups when a locale has more distinct keys than this */
+    private config const hashGroupByMaxGroups = getEnvInt("ARKOUDA_SERVER_HASH_GROUPBY_MAX_GROUPS", 2**16);
+
     proc uniqueMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
         // flag to return segments and permutation for GroupBy
         const returnGroups = msgArgs.get("returnGroupStr").getBoolValue();
@@ -77,6 +83,293 @@ module UniqueMsg
         return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+    /*
+      Group the rows of the key arrays by hashing rather than sorting them, so
+      the groups are ordered by first occurrence rather than by key. Returns
+      the permutation that groups the rows, the segments of the groups and the
+      index of the first row of each group, like unique with returnGroups.
+    */
+    proc hashGroupByMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        var n = msgArgs.get("nstr").getIntValue();
+        var keynames = msgArgs.get("keynames").getList(n);
+        var keytypes = msgArgs.get("keytypes").getList(n);
+        var (permutation, segments, uniqueKeyInds) = hashGroups(n, keynames, keytypes, st);
+
+        var pname = st.nextName();
+        st.addEntry(pname, permutation);
+        var sname = st.nextName();
+        st.addEntry(sname, segments);
+        var iname = st.nextName();
+        st.addEntry(iname, uniqueKeyInds);
+        var repMsg = "created " + st.attrib(pname) + "+created " + st.attrib(sname) +
+                     "+created " + st.attrib(iname);
+        umLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+      Each locale builds a table of the distinct row hashes of its rows, with
+      the first row and number of rows of each, and sends it to the owners of
+      the hashes, so that each locale merges the tables for the hashes it owns
+      into groups. The groups are numbered in order of first occurrence with
+      a distributed sort of their first rows, the start of each locale's rows
+      in every group is sent back to it, and every task then places its rows
+      into their groups with a counting sort. Only the tables and per-locale
+      counts are communicated, which makes this faster than sorting when the
+      number of groups is small.
+
+      Each task counts the rows of every distinct hash of its locale, so when
+      the rows of a locale have more than hashGroupByMaxGroups distinct
+      hashes, the rows are grouped by sorting instead.
+
+      As with the sort-based unique, rows are compared by their 128-bit hash.
+    */
+    proc hashGroups(n, namesList: [] string, typesList: [] string, st) throws {
+      if (n > 128) {
+        throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
+                                         getLineNumber(),
+                                         getRoutineName(),
+                                         getModuleName(),
+                                         "ArgumentError");
+      }
+      var (size, _, _, _, _, names, types) = validateArraysSameLength(n, namesList, typesList, st);
+      if size == 0 {
+        return (createSymEntry(0, int), createSymEntry(0, int), createSymEntry(0, int));
+      }
+      const hashes = hashArrays(size, names, types, st);
+      const nTasksPerLoc = here.maxTaskPar;
+
+      // the indices of the locally owned rows processed by task tid
+      proc taskRange(lsd, tid) {
+        const perTask = lsd.size / nTasksPerLoc,
+              lo = lsd.low + tid * perTask;
+        return lo..(if tid == nTasksPerLoc - 1 then lsd.high else lo + perTask - 1);
+      }
+
+      // the locale that merges the rows of a hash from every locale
+      inline proc owner(h: 2*uint): int {
+        return (h[0] % numLocales:uint): int;
+      }
+
+      // build the table of distinct hashes of each locale, stored at the start of its block
+      overMemLimit(numBytes(int) * size * 6);
+      var localKeys = makeDistArray(hashes.domain, int);
+      var keyHashes = makeDistArray(hashes.domain, 2*uint);
+      var keyFirsts = makeDistArray(hashes.domain, int);
+      var keyCounts = makeDistArray(hashes.domain, int);
+      var numKeys: [PrivateSpace] int;
+      var sendCounts: [0..<numLocales] [0..<numLocales] int;
+      coforall loc in Locales with (ref localKeys, ref keyHashes, ref keyFirsts, ref keyCounts,
+                                    ref numKeys, ref sendCounts) do on loc {
+        const lsd = hashes.localSubdomain();
+        var taskFirsts: [0..<nTasksPerLoc] list((2*uint, int));
+        coforall tid in 0..<nTasksPerLoc with (ref taskFirsts) {
+          var firsts = new map(2*uint, int);
+          for i in taskRange(lsd, tid) do firsts.add(hashes[i], i);
+          var l = new list((2*uint, int));
+          for (h, i) in firsts.items() do l.pushBack((h, i));
+          taskFirsts[tid] = l;
+        }
+        // the tasks' rows are in order, so the first task with a hash has its first row
+        var keys = new map(2*uint, int);
+        var counts: [0..<numLocales] int;
+        for l in taskFirsts {
+          for (h, i) in l {
+            if !keys.contains(h) {
+              const k = keys.size;
+              keys.add(h, k);
+              keyHashes[lsd.low + k] = h;
+              keyFirsts[lsd.low + k] = i;
+              counts[owner(h)] += 1;
+            }
+          }
+        }
+        const nKeys = keys.size;
+        numKeys[here.id] = nKeys;
+        sendCounts[here.id] = counts;
+        if nKeys <= hashGroupByMaxGroups {
+          var taskCounts: [0..<nTasksPerLoc] [0..<nKeys] int;
+          coforall tid in 0..<nTasksPerLoc with (ref taskCounts, ref localKeys) {
+            for i in taskRange(lsd, tid) {
+              const k = keys[hashes[i]];
+              localKeys[i] = k;
+              taskCounts[tid][k] += 1;
+            }
+          }
+          for c in taskCounts do keyCounts[lsd.low..#nKeys] += c;
+        }
+      }
+      if max reduce numKeys > hashGroupByMaxGroups {
+        umLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "%i distinct keys on a locale, grouping by sorting".format(max reduce numKeys));
+        return sortGroups(n, namesList, typesList, st);
+      }
+
+      // send each locale's table to the owners, in order of locale so that
+      // the rows of a group on lower locales are counted first
+      var recvOffsets: [0..<numLocales] [0..<numLocales] int;
+      var recvSizes: [0..<numLocales] int;
+      for s in 0..<numLocales {
+        recvOffsets[s] = recvSizes;
+        recvSizes += sendCounts[s];
+      }
+      const recvDom = makeDistDom(numLocales * max reduce recvSizes);
+      const recvLows = [loc in Locales] recvDom.localSubdomain(loc).low;
+      var recvHashes = makeDistArray(recvDom, 2*uint);
+      var recvFirsts = makeDistArray(recvDom, int);
+      var recvCounts = makeDistArray(recvDom, int);
+      var recvKeys = makeDistArray(recvDom, int);
+      coforall loc in Locales with (ref recvHashes, ref recvFirsts, ref recvCounts, ref recvKeys) do on loc {
+        const lo = hashes.localSubdomain().low;
+        var pos: [0..<numLocales] int = recvLows + recvOffsets[here.id];
+        var hashAgg = newDstAggregator(2*uint);
+        var agg = newDstAggregator(int);
+        for k in lo..#numKeys[here.id] {
+          const h = keyHashes[k], o = owner(h);
+          hashAgg.copy(recvHashes[pos[o]], h);
+          agg.copy(recvFirsts[pos[o]], keyFirsts[k]);
+          agg.copy(recvCounts[pos[o]], keyCounts[k]);
+          agg.copy(recvKeys[pos[o]], k);
+          pos[o] += 1;
+        }
+        hashAgg.flush();
+        agg.flush();
+      }
+
+      // merge the received tables into groups, recording how many rows of its
+      // group the locales before it have for each received hash
+      var recvGroups = makeDistArray(recvDom, int);
+      var recvStarts = makeDistArray(recvDom, int);
+      var ownerFirsts = makeDistArray(recvDom, int);
+      var ownerSizes = makeDistArray(recvDom, int);
+      var numOwnerGroups: [PrivateSpace] int;
+      coforall loc in Locales with (ref recvGroups, ref recvStarts, ref ownerFirsts, ref ownerSizes,
+                                    ref numOwnerGroups) do on loc {
+        const lo = recvLows[here.id];
+        var groups = new map(2*uint, int);
+        for j in lo..#recvSizes[here.id] {
+          const h = recvHashes[j];
+          if !groups.contains(h) {
+            const g = groups.size;
+            groups.add(h, g);
+            ownerFirsts[lo + g] = recvFirsts[j];
+          }
+          const g = groups[h];
+          recvGroups[j] = g;
+          recvStarts[j] = ownerSizes[lo + g];
+          ownerSizes[lo + g] += recvCounts[j];
+        }
+        numOwnerGroups[here.id] = groups.size;
+      }
+
+      // gather the groups of all owners and number them in order of first occurrence
+      const ngroups = + reduce numOwnerGroups;
+      const groupOffsets: [PrivateSpace] int = (+ scan numOwnerGroups) - numOwnerGroups;
+      var firsts = makeDistArray(ngroups, int);
+      var sizes = makeDistArray(ngroups, int);
+      coforall loc in Locales with (ref firsts, ref sizes) do on loc {
+        const lo = recvLows[here.id], offset = groupOffsets[here.id];
+        var agg = newDstAggregator(int);
+        for g in 0..<numOwnerGroups[here.id] {
+          agg.copy(firsts[offset + g], ownerFirsts[lo + g]);
+          agg.copy(sizes[offset + g], ownerSizes[lo + g]);
+        }
+        agg.flush();
+      }
+      var (segments, uniqueKeyInds, groupStarts) = orderByFirst(firsts, sizes);
+
+      // send each locale the start of its rows in every group
+      var keyStarts = makeDistArray(hashes.domain, int);
+      coforall loc in Locales with (ref keyStarts) do on loc {
+        const lo = recvLows[here.id], m = recvSizes[here.id], offset = groupOffsets[here.id];
+        var starts: [0..<m] int;
+        var srcAgg = newSrcAggregator(int);
+        for (s, g) in zip(starts, recvGroups[lo..#m]) do srcAgg.copy(s, groupStarts[offset + g]);
+        srcAgg.flush();
+        var dstAgg = newDstAggregator(int);
+        for (j, s) in zip(lo..#m, starts) do dstAgg.copy(keyStarts[recvKeys[j]], s + recvStarts[j]);
+        dstAgg.flush();
+      }
+
+      // place the rows into their groups
+      var permutation = createSymEntry(size, int);
+      ref perm = permutation.a;
+      coforall loc in Locales with (ref perm) do on loc {
+        const lsd = hashes.localSubdomain(), nKeys = numKeys[here.id];
+        var taskStarts: [0..<nTasksPerLoc] [0..<nKeys] int;
+        coforall tid in 0..<nTasksPerLoc with (ref taskStarts) {
+          for i in taskRange(lsd, tid) do taskStarts[tid][localKeys[i]] += 1;
+        }
+        var next: [0..<nKeys] int = keyStarts[lsd.low..#nKeys];
+        for starts in taskStarts {
+          const counts = starts;
+          starts = next;
+          next += counts;
+        }
+        coforall tid in 0..<nTasksPerLoc with (ref perm) {
+          var pos = taskStarts[tid];
+          var agg = newDstAggregator(int);
+          for i in taskRange(lsd, tid) {
+            const k = localKeys[i];
+            agg.copy(perm[pos[k]], i);
+            pos[k] += 1;
+          }
+          agg.flush();
+        }
+      }
+      return (permutation, segments, uniqueKeyInds);
+    }
+
+    /*
+      Group the rows by sorting them, numbering the groups in order of first
+      occurrence like hashGroups.
+    */
+    proc sortGroups(n, namesList: [] string, typesList: [] string, st) throws {
+      var (sortedPerm, sortedSegments) = uniqueAndCount(n, namesList, typesList, false, st);
+      const size = sortedPerm.size, ngroups = sortedSegments.size;
+      ref segs = sortedSegments.a;
+      // the sort is stable, so the first row in each group is its first occurrence
+      var firsts = makeDistArray(ngroups, int);
+      var sizes = makeDistArray(ngroups, int);
+      forall (f, s, i) in zip(firsts, sizes, segs.domain) with (var agg = newSrcAggregator(int)) {
+        agg.copy(f, sortedPerm.a[segs[i]]);
+        s = (if i == ngroups - 1 then size else segs[i+1]) - segs[i];
+      }
+      var (segments, uniqueKeyInds, groupStarts) = orderByFirst(firsts, sizes);
+
+      // move the rows of each group by the change in its start
+      var groupShifts = makeDistArray(segs.domain, int);
+      groupShifts = groupStarts - segs;
+      const shifts = broadcast(segs, groupShifts, size);
+      var permutation = createSymEntry(size, int);
+      ref perm = permutation.a;
+      forall (i, p, s) in zip(sortedPerm.a.domain, sortedPerm.a, shifts) with (var agg = newDstAggregator(int)) {
+        agg.copy(perm[i + s], p);
+      }
+      return (permutation, segments, uniqueKeyInds);
+    }
+
+    /*
+      Number groups in order of their first rows. Returns the segments and
+      first rows of the numbered groups, and the start of each given group.
+    */
+    proc orderByFirst(firsts: [?D] int, sizes: [D] int) throws {
+      const order = radixSortLSD_ranks(firsts);
+      var segments = createSymEntry(D.size, int);
+      var uniqueKeyInds = createSymEntry(D.size, int);
+      var groupSizes = makeDistArray(D, int);
+      forall (u, s, i) in zip(uniqueKeyInds.a, groupSizes, order) with (var agg = newSrcAggregator(int)) {
+        agg.copy(u, firsts[i]);
+        agg.copy(s, sizes[i]);
+      }
+      segments.a = (+ scan groupSizes) - groupSizes;
+      var groupStarts = makeDistArray(D, int);
+      forall (s, i) in zip(segments.a, order) with (var agg = newDstAggregator(int)) {
+        agg.copy(groupStarts[i], s);
+      }
+      return (segments, uniqueKeyInds, groupStarts);
+    }
+
     proc storeUniqueKeys(n, names: [] string, types: [] string, gatherInds, st): string throws {
       // Number of unique keys
       const size = gatherInds.size;
@@ -347,4 +640,5 @@ module UniqueMsg
 
     use CommandMap;
     registerFunction("unique", uniqueMsg, getModuleName());
+    registerFunction("hashGroupBy", hashGroupByMsg, getModuleName());
 }
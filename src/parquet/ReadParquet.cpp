@@ -2,8 +2,8 @@
 #include "UtilParquet.h"
 
 template <typename ReaderType, typename ChplType>
-void readColumn(void* chpl_arr, int startIdx, std::shared_ptr<parquet::ColumnReader> column_reader,
-                bool hasNonFloatNulls, int64_t i, int64_t numElems, int64_t batchSize,
+void readColumn(void* chpl_arr, int64_t& startIdx, std::shared_ptr<parquet::ColumnReader> column_reader,
+                bool hasNonFloatNulls, int64_t& i, int64_t numElems, int64_t batchSize,
                 int64_t values_read, bool* where_null_chpl) {
   int16_t definition_level; // nullable type and only reading single records in batch
   auto chpl_ptr = (ChplType*)chpl_arr;
@@ -32,8 +32,8 @@ void readColumn(void* chpl_arr, int startIdx, std::shared_ptr<parquet::ColumnRea
 }
 
 template <typename ReaderType, typename ChplType, typename PqType>
-void readColumnDbFl(void* chpl_arr, int startIdx, std::shared_ptr<parquet::ColumnReader> column_reader,
-                    bool hasNonFloatNulls, int64_t i, int64_t numElems, int64_t batchSize,
+void readColumnDbFl(void* chpl_arr, int64_t& startIdx, std::shared_ptr<parquet::ColumnReader> column_reader,
+                    bool hasNonFloatNulls, int64_t& i, int64_t numElems, int64_t batchSize,
                     int64_t values_read, bool* where_null_chpl) {
   int16_t definition_level; // nullable type and only reading single records in batch
   auto chpl_ptr = (ChplType*)chpl_arr;
@@ -56,8 +56,8 @@ void readColumnDbFl(void* chpl_arr, int startIdx, std::shared_ptr<parquet::Colum
 }
 
 template <typename ReaderType, typename ChplType, typename PqType>
-void readColumnIrregularBitWidth(void* chpl_arr, int startIdx, std::shared_ptr<parquet::ColumnReader> column_reader,
-                                 bool hasNonFloatNulls, int64_t i, int64_t numElems, int64_t batchSize,
+void readColumnIrregularBitWidth(void* chpl_arr, int64_t& startIdx, std::shared_ptr<parquet::ColumnReader> column_reader,
+                                 bool hasNonFloatNulls, int64_t& i, int64_t numElems, int64_t batchSize,
                                  int64_t values_read, bool* where_null_chpl) {
   int16_t definition_level; // nullable type and only reading single records in batch
   auto chpl_ptr = (ChplType*)chpl_arr;
@@ -95,7 +95,7 @@ void readColumnIrregularBitWidth(void* chpl_arr, int startIdx, std::shared_ptr<p
   }
 }
 
-int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t batchSize, char** errMsg) {
+int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg) {
   try {
     int64_t ty = cpp_getType(filename, colname, errMsg);
   
@@ -106,7 +106,14 @@ int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* co
     int num_row_groups = file_metadata->num_row_groups();
 
     int64_t i = 0;
-    for (int r = 0; r < num_row_groups; r++) {
+    int64_t numRead = 0;
+    for (int r = 0; r < num_row_groups && numRead < numElems; r++) {
+      // skip the row groups before the first row without reading them
+      int64_t rg_rows = file_metadata->RowGroup(r)->num_rows();
+      if (startIdx >= rg_rows) {
+        startIdx -= rg_rows;
+        continue;
+      }
       std::shared_ptr<parquet::RowGroupReader> row_group_reader =
         parquet_reader->RowGroup(r);
 
@@ -132,8 +139,9 @@ int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* co
         auto chpl_ptr = (unsigned char*)chpl_arr;
         parquet::ByteArrayReader* reader =
           static_cast<parquet::ByteArrayReader*>(column_reader.get());
+        startIdx -= reader->Skip(startIdx);
 
-        while (reader->HasNext()) {
+        while (reader->HasNext() && numRead < numElems) {
           parquet::ByteArray value;
           (void)reader->ReadBatch(1, &definition_level, nullptr, &value, &values_read);
           // if values_read is 0, that means that it was a null value
@@ -144,6 +152,7 @@ int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* co
             }
           }
           i++; // skip one space so the strings are null terminated with a 0
+          numRead++;
         }        
       }
     }
@@ -165,7 +174,13 @@ int cpp_readColumnByName(const char* filename, void* chpl_arr, bool* where_null_
     int num_row_groups = file_metadata->num_row_groups();
 
     int64_t i = 0;
-    for (int r = 0; r < num_row_groups; r++) {
+    for (int r = 0; r < num_row_groups && i < numElems; r++) {
+      // skip the row groups before the first row without reading them
+      int64_t rg_rows = file_metadata->RowGroup(r)->num_rows();
+      if (startIdx >= rg_rows) {
+        startIdx -= rg_rows;
+        continue;
+      }
       std::shared_ptr<parquet::RowGroupReader> row_group_reader =
         parquet_reader->RowGroup(r);
 
@@ -412,7 +427,14 @@ int64_t cpp_getStringColumnNumBytes(const char* filename, const char* colname, v
       int num_row_groups = file_metadata->num_row_groups();
 
       int64_t i = 0;
-      for (int r = 0; r < num_row_groups; r++) {
+      int64_t numRead = 0;
+      for (int r = 0; r < num_row_groups && numRead < numElems; r++) {
+        // skip the row groups before the first row without reading them
+        int64_t rg_rows = file_metadata->RowGroup(r)->num_rows();
+        if (startIdx >= rg_rows) {
+          startIdx -= rg_rows;
+          continue;
+        }
         std::shared_ptr<parquet::RowGroupReader> row_group_reader =
           parquet_reader->RowGroup(r);
 
@@ -435,8 +457,8 @@ int64_t cpp_getStringColumnNumBytes(const char* filename, const char* colname, v
         int16_t definition_level;
         parquet::ByteArrayReader* ba_reader =
           static_cast<parquet::ByteArrayReader*>(column_reader.get());
+        startIdx -= ba_reader->Skip(startIdx);
 
-        int64_t numRead = 0;
         while (ba_reader->HasNext() && numRead < numElems) {
           parquet::ByteArray value;
           (void)ba_reader->ReadBatch(1, &definition_level, nullptr, &value, &values_read);
@@ -727,9 +749,96 @@ int64_t cpp_getListColumnSize(const char* filename, const char* colname, void* c
   }
 }
 
+int cpp_getNumRowGroupsByName(const char* filename, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+    return parquet_reader->metadata()->num_row_groups();
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+// Read the number of rows of each row group of a file, and the minimum and
+// maximum of a column in each row group that has them in its statistics.
+// Integer and boolean columns write their statistics to int64 arrays, and
+// floating point columns to double arrays. Other columns have no usable
+// statistics, so their row groups are all marked as having none.
+int cpp_getRowGroupStats(const char* filename, const char* colname, void* chpl_num_rows,
+                         void* chpl_mins, void* chpl_maxs, bool* chpl_has_stats, char** errMsg) {
+  try {
+    int64_t ty = cpp_getType(filename, colname, errMsg);
+
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+
+    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
+    int num_row_groups = file_metadata->num_row_groups();
+
+    auto idx = file_metadata -> schema() -> ColumnIndex(colname);
+    if(idx < 0) {
+      std::string dname(colname);
+      std::string fname(filename);
+      std::string msg = "Dataset: " + dname + " does not exist in file: " + fname; 
+      *errMsg = strdup(msg.c_str());
+      return ARROWERROR;
+    }
+
+    auto num_rows = (int64_t*)chpl_num_rows;
+    for (int r = 0; r < num_row_groups; r++) {
+      std::unique_ptr<parquet::RowGroupMetaData> rg_metadata = file_metadata->RowGroup(r);
+      num_rows[r] = rg_metadata->num_rows();
+      chpl_has_stats[r] = false;
+
+      std::unique_ptr<parquet::ColumnChunkMetaData> col_metadata = rg_metadata->ColumnChunk(idx);
+      if (!col_metadata->is_stats_set())
+        continue;
+      std::shared_ptr<parquet::Statistics> stats = col_metadata->statistics();
+      if (!stats || !stats->HasMinMax())
+        continue;
+
+      // int64 and uint64 share a physical type, and the unsigned statistics
+      // keep the bits of the unsigned values
+      if(ty == ARROWINT64 || ty == ARROWUINT64) {
+        auto typed = std::static_pointer_cast<parquet::Int64Statistics>(stats);
+        ((int64_t*)chpl_mins)[r] = typed->min();
+        ((int64_t*)chpl_maxs)[r] = typed->max();
+      } else if(ty == ARROWINT32) {
+        auto typed = std::static_pointer_cast<parquet::Int32Statistics>(stats);
+        ((int64_t*)chpl_mins)[r] = (int64_t)typed->min();
+        ((int64_t*)chpl_maxs)[r] = (int64_t)typed->max();
+      } else if(ty == ARROWUINT32) {
+        auto typed = std::static_pointer_cast<parquet::Int32Statistics>(stats);
+        ((int64_t*)chpl_mins)[r] = (int64_t)(uint32_t)typed->min();
+        ((int64_t*)chpl_maxs)[r] = (int64_t)(uint32_t)typed->max();
+      } else if(ty == ARROWBOOLEAN) {
+        auto typed = std::static_pointer_cast<parquet::BoolStatistics>(stats);
+        ((int64_t*)chpl_mins)[r] = (int64_t)typed->min();
+        ((int64_t*)chpl_maxs)[r] = (int64_t)typed->max();
+      } else if(ty == ARROWFLOAT) {
+        auto typed = std::static_pointer_cast<parquet::FloatStatistics>(stats);
+        ((double*)chpl_mins)[r] = (double)typed->min();
+        ((double*)chpl_maxs)[r] = (double)typed->max();
+      } else if(ty == ARROWDOUBLE) {
+        auto typed = std::static_pointer_cast<parquet::DoubleStatistics>(stats);
+        ((double*)chpl_mins)[r] = typed->min();
+        ((double*)chpl_maxs)[r] = typed->max();
+      } else {
+        continue;
+      }
+      chpl_has_stats[r] = true;
+    }
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
 extern "C" {
-  int c_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t batchSize, char** errMsg) {
-    return cpp_readStrColumnByName(filename, chpl_arr, colname, batchSize, errMsg);
+  int c_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg) {
+    return cpp_readStrColumnByName(filename, chpl_arr, colname, numElems, startIdx, batchSize, errMsg);
   }
   
   int c_readColumnByName(const char* filename, void* chpl_arr, bool* where_null_chpl, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, int64_t byteLength, bool hasNonFloatNulls, char** errMsg) {
@@ -751,4 +860,13 @@ extern "C" {
   int64_t c_getStringListColumnNumBytes(const char* filename, const char* colname, void* chpl_offsets, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg) {
     return cpp_getStringListColumnNumBytes(filename, colname, chpl_offsets, numElems, startIdx, batchSize, errMsg);
   }
+
+  int c_getNumRowGroupsByName(const char* filename, char** errMsg) {
+    return cpp_getNumRowGroupsByName(filename, errMsg);
+  }
+
+  int c_getRowGroupStats(const char* filename, const char* colname, void* chpl_num_rows,
+                         void* chpl_mins, void* chpl_maxs, bool* chpl_has_stats, char** errMsg) {
+    return cpp_getRowGroupStats(filename, colname, chpl_num_rows, chpl_mins, chpl_maxs, chpl_has_stats, errMsg);
+  }
 }
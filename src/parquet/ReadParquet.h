@@ -11,13 +11,14 @@
 #include <parquet/column_reader.h>
 #include <parquet/api/writer.h>
 #include <parquet/schema.h>
+#include <parquet/statistics.h>
 #include <cmath>
 #include <queue>
 extern "C" {
 #endif
-  int c_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t batchSize, char** errMsg);
+  int c_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg);
   
-  int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t batchSize, char** errMsg);
+  int cpp_readStrColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg);
 
   int c_readColumnByName(const char* filename, void* chpl_arr, bool* where_null_chpl,
                          const char* colname, int64_t numElems, int64_t startIdx,
@@ -45,6 +46,14 @@ extern "C" {
 
   int64_t c_getStringListColumnNumBytes(const char* filename, const char* colname, void* chpl_offsets, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg);
   int64_t cpp_getStringListColumnNumBytes(const char* filename, const char* colname, void* chpl_offsets, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg);
+
+  int c_getNumRowGroupsByName(const char* filename, char** errMsg);
+  int cpp_getNumRowGroupsByName(const char* filename, char** errMsg);
+
+  int c_getRowGroupStats(const char* filename, const char* colname, void* chpl_num_rows,
+                         void* chpl_mins, void* chpl_maxs, bool* chpl_has_stats, char** errMsg);
+  int cpp_getRowGroupStats(const char* filename, const char* colname, void* chpl_num_rows,
+                           void* chpl_mins, void* chpl_maxs, bool* chpl_has_stats, char** errMsg);
    
 #ifdef __cplusplus
 }
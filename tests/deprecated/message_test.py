@@ -63,7 +63,7 @@ class MessageTest(unittest.TestCase):
         )
 
         self.assertEqual(
-            '{"user": "user1", "token": "token", "cmd": "connect", "format": "STRING", "args": "", "size": -1}',
+            '{"user": "user1", "token": "token", "cmd": "connect", "format": "STRING", "args": "", "size": -1, "request_id": "", "deletes": ""}',
             json.dumps(msg.asdict()),
         )
 
@@ -81,7 +81,7 @@ class MessageTest(unittest.TestCase):
             repr(minMsg),
         )
         self.assertEqual(
-            '{"user": "user1", "token": "", "cmd": "connect", "format": "STRING", "args": "", "size": -1}',
+            '{"user": "user1", "token": "", "cmd": "connect", "format": "STRING", "args": "", "size": -1, "request_id": "", "deletes": ""}',
             json.dumps(minMsg.asdict()),
         )
 